@@ -0,0 +1,68 @@
+"""Micro-benchmark: NDJSON decoding of Ollama-style token streams up to 1M lines.
+
+    python benchmarks/ndjson_parse.py
+
+Each line is one ``/api/chat`` streaming frame. Streams are parsed with
+``slimx.utils.ndjson.iter_ndjson`` and with the previous ``buf += chunk`` /
+``split(b"\\n", 1)`` loop, under two chunkings: 64 KiB socket reads (hundreds of
+lines per read) and one read per line. A linear decoder shows a flat ns/line
+column as the stream grows.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+from slimx.utils.ndjson import iter_ndjson
+
+
+def legacy_iter_ndjson(byte_iter):
+    buf = b""
+    for chunk in byte_iter:
+        buf += chunk
+        while b"\n" in buf:
+            line, buf = buf.split(b"\n", 1)
+            s = line.strip()
+            if not s:
+                continue
+            try:
+                yield json.loads(s.decode("utf-8", errors="replace"))
+            except Exception:
+                pass
+
+
+def frame() -> bytes:
+    return json.dumps({
+        "model": "llama3.2",
+        "created_at": "2026-01-01T00:00:00Z",
+        "message": {"role": "assistant", "content": "tok"},
+        "done": False,
+    }).encode() + b"\n"
+
+
+def measure(parse, chunks, lines: int) -> float:
+    started = time.perf_counter()
+    for _ in parse(iter(chunks)):
+        pass
+    return (time.perf_counter() - started) * 1e9 / lines
+
+
+def main() -> None:
+    line = frame()
+    print(f"{'lines':>10}{'chunking':>10}{'slimx ns/line':>16}{'legacy ns/line':>16}")
+    for n in (10_000, 100_000, 1_000_000):
+        data = line * n
+        for label, chunks in (
+            ("64KiB", [data[i : i + 65536] for i in range(0, len(data), 65536)]),
+            ("line", [line] * n),
+        ):
+            print(
+                f"{n:>10}{label:>10}"
+                f"{measure(iter_ndjson, chunks, n):>16.0f}"
+                f"{measure(legacy_iter_ndjson, chunks, n):>16.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
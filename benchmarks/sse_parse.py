@@ -0,0 +1,71 @@
+"""Micro-benchmark: per-byte cost of SSE parsing as streams grow.
+
+    python benchmarks/sse_parse.py
+
+Builds OpenAI-style chat-completion streams of 10k–100k deltas and parses them with
+``slimx.utils.sse.iter_sse_data`` and with the previous ``buf += chunk`` /
+``split(b"\\n", 1)`` loop, under two chunkings:
+
+- ``64KiB``: large socket reads holding hundreds of lines each;
+- ``image``: one 8 MiB base64 event trickling in as 4 KiB reads.
+
+A linear parser shows a flat ns/byte column as the stream grows.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+from slimx.utils.sse import iter_sse_data
+
+
+def legacy_iter_sse_data(byte_iter):
+    buf = b""
+    for chunk in byte_iter:
+        buf += chunk
+        while b"\n" in buf:
+            line, buf = buf.split(b"\n", 1)
+            line = line.decode("utf-8", errors="replace").strip()
+            if line.startswith("data:"):
+                yield line[len("data:"):].strip()
+
+
+def delta_stream(n: int) -> bytes:
+    frame = {"choices": [{"delta": {"content": "tok"}}]}
+    return b"".join(b"data: " + json.dumps(frame).encode() + b"\n\n" for _ in range(n))
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def measure(parse, chunks, total: int) -> float:
+    started = time.perf_counter()
+    for _ in parse(iter(chunks)):
+        pass
+    return (time.perf_counter() - started) * 1e9 / total
+
+
+def main() -> None:
+    print(f"{'case':<18}{'bytes':>12}{'slimx ns/B':>13}{'legacy ns/B':>13}")
+    for n in (10_000, 50_000, 100_000):
+        data = delta_stream(n)
+        chunks = chunked(data, 64 * 1024)
+        print(
+            f"{f'{n} deltas/64KiB':<18}{len(data):>12}"
+            f"{measure(iter_sse_data, chunks, len(data)):>13.1f}"
+            f"{measure(legacy_iter_sse_data, chunks, len(data)):>13.1f}"
+        )
+    for mib in (2, 4, 8):
+        data = b"data: " + b"A" * (mib * 1024 * 1024) + b"\n\n"
+        chunks = chunked(data, 4096)
+        print(
+            f"{f'{mib}MiB image/4KiB':<18}{len(data):>12}"
+            f"{measure(iter_sse_data, chunks, len(data)):>13.1f}"
+            f"{measure(legacy_iter_sse_data, chunks, len(data)):>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,14 @@ _LAZY: dict[str, tuple[str, str]] = {
     "Parallel": ("slimx._parallel", "Parallel"),
     "ParallelResult": ("slimx._parallel", "ParallelResult"),
     "ParallelItem": ("slimx._parallel", "ParallelItem"),
+    "MapItem": ("slimx._map", "MapItem"),
+    "aparallel": ("slimx._parallel", "aparallel"),
+    "AsyncParallel": ("slimx._parallel", "AsyncParallel"),
+    "FanoutExecutor": ("slimx.utils.executor", "FanoutExecutor"),
+    "fallback": ("slimx._fallback", "fallback"),
+    "afallback": ("slimx._fallback", "afallback"),
+    "Fallback": ("slimx._fallback", "Fallback"),
+    "AsyncFallback": ("slimx._fallback", "AsyncFallback"),
 
     # Messages & core types
     "Message": ("slimx.messages", "Message"),
@@ -62,6 +70,12 @@ _LAZY: dict[str, tuple[str, str]] = {
     "ChatRequest": ("slimx.low.types", "ChatRequest"),
     "ImageRequest": ("slimx.low.types", "ImageRequest"),
     "ImageEditRequest": ("slimx.low.types", "ImageEditRequest"),
+    "RetryPolicy": ("slimx.utils.retry", "RetryPolicy"),
+    "RetryBudget": ("slimx.utils.retry", "RetryBudget"),
+    "CircuitBreaker": ("slimx.utils.breaker", "CircuitBreaker"),
+    "ResponseCache": ("slimx.cache", "ResponseCache"),
+    "RateLimiter": ("slimx.utils.ratelimit", "RateLimiter"),
+    "AdaptiveConcurrency": ("slimx.utils.concurrency", "AdaptiveConcurrency"),
 
     # Providers
     "get_provider": ("slimx.providers.registry", "get_provider"),
@@ -70,6 +84,10 @@ _LAZY: dict[str, tuple[str, str]] = {
     "list_models": ("slimx.discovery", "list_models"),
 }
 
+# Submodules reachable as attributes (``slimx.transport.stats()``) without an
+# explicit import; also loaded lazily.
+_SUBMODULES = ("stats", "transport")
+
 __all__ = [
     # High-level
     "llm",
@@ -86,6 +104,14 @@ __all__ = [
     "Parallel",
     "ParallelResult",
     "ParallelItem",
+    "MapItem",
+    "aparallel",
+    "AsyncParallel",
+    "FanoutExecutor",
+    "fallback",
+    "afallback",
+    "Fallback",
+    "AsyncFallback",
 
     # Messages & core types
     "Message",
@@ -113,6 +139,12 @@ __all__ = [
     "ChatRequest",
     "ImageRequest",
     "ImageEditRequest",
+    "RetryPolicy",
+    "RetryBudget",
+    "CircuitBreaker",
+    "ResponseCache",
+    "RateLimiter",
+    "AdaptiveConcurrency",
 
     # Providers
     "get_provider",
@@ -130,11 +162,19 @@ if TYPE_CHECKING:
     from slimx.low.client import Client
     from slimx.low.types import ChatRequest, ImageEditRequest, ImageRequest
     from slimx.messages import Message
-    from slimx._parallel import Parallel, ParallelItem, ParallelResult, parallel
+    from slimx._parallel import AsyncParallel, Parallel, ParallelItem, ParallelResult, aparallel, parallel
+    from slimx._map import MapItem
+    from slimx.utils.executor import FanoutExecutor
+    from slimx._fallback import AsyncFallback, Fallback, afallback, fallback
     from slimx.discovery import list_models
     from slimx.providers.registry import describe_provider, get_provider, list_providers
     from slimx.record import CallRecord
     from slimx.tooling import ToolSpec, tool
+    from slimx.utils.breaker import CircuitBreaker
+    from slimx.cache import ResponseCache
+    from slimx.utils.ratelimit import RateLimiter
+    from slimx.utils.concurrency import AdaptiveConcurrency
+    from slimx.utils.retry import RetryBudget, RetryPolicy
     from slimx.types import (
         GeneratedImage,
         ImageGenerationOptions,
@@ -161,8 +201,10 @@ def __getattr__(name: str) -> Any:
         module_name, attr = _LAZY[name]
         mod = import_module(module_name)
         return getattr(mod, attr)
+    if name in _SUBMODULES:
+        return import_module(f"slimx.{name}")
     raise AttributeError(f"module 'slimx' has no attribute {name!r}")
 
 
 def __dir__() -> list[str]:
-    return sorted(list(globals().keys()) + list(_LAZY.keys()))
+    return sorted(list(globals().keys()) + list(_LAZY.keys()) + list(_SUBMODULES))
@@ -0,0 +1,352 @@
+"""Fallback chains: try models in order, moving on when one is down or too slow.
+
+``fallback([...])`` builds a composite that is called exactly like a ``Model``
+(``__call__``, ``stream``, ``json``, ``inspect``). Each call goes to the first model;
+on a transient failure — a timeout, a 429, a 5xx, a transport error, an open circuit,
+an attempt out of its ``deadline`` / ``total_timeout`` — or when the attempt runs past
+``slo_ms``, the next model is tried. A stream given up on is closed before the next
+model is tried, so its connection goes back at once. Deterministic
+errors (a bad key, a bad request, a schema mismatch) are raised at once: another
+provider would not fix them.
+
+Unlike ``parallel(mode="race")`` only one request is in flight at a time, so a
+healthy primary costs exactly one call. The last model in the chain is never cut
+off by ``slo_ms`` — it is the answer of last resort — and is bounded only by its own
+``timeout``. An attempt that overruns ``slo_ms`` is cancelled: a sync one runs in
+its own ``CancelScope`` (``slimx.utils.cancel``) on a long-lived helper pool, and
+its connection is shut down; an async one is cancelled as a task.
+
+The answering model and every attempt land in ``Result.trace``:
+``answered_by``, ``slo_ms`` and ``fallback_attempts`` (``model``, ``ok``,
+``elapsed_ms``, ``error``). If every model fails, ``FallbackError`` carries the same
+``attempts`` list.
+
+With ``adaptive=True`` the chain is reordered on every call by recent health
+(``slimx.stats``): models whose recent error rate crosses ``stats.UNHEALTHY`` move
+to the back, the rest keep their configured order. ``trace["fallback_order"]``
+shows the order that call used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from . import stats
+from .errors import (
+    CircuitOpenError,
+    DeadlineExceeded,
+    FallbackError,
+    ProviderServerError,
+    ProviderTimeoutError,
+    RateLimitExceeded,
+)
+from .high.api import AsyncModel, Model, allm, llm
+from .types import Result, StreamEvent
+from .utils.cancel import nested_scope, run_in_scope
+from .utils.executor import helper_pool, submit_started
+from .utils.retry import TRANSIENT_ERRORS
+
+T = TypeVar("T")
+M = TypeVar("M", Model, AsyncModel)
+
+# Errors that move a call on to the next model. A ``DeadlineExceeded`` does too: with a
+# per-call ``total_timeout`` the next model gets a budget of its own, and with a shared
+# ``deadline`` that has passed the next models refuse before sending anything.
+FAILOVER_ERRORS = TRANSIENT_ERRORS + (
+    ProviderServerError,
+    CircuitOpenError,
+    RateLimitExceeded,
+    DeadlineExceeded,
+)
+
+
+class _Attempts:
+    """Per-call attempt log shared by the sync and async chains."""
+
+    def __init__(self, slo_ms: Optional[float], order: Optional[List[str]] = None):
+        self.slo_ms = slo_ms
+        self.order = order  # the adaptive chain's order for this call
+        self.items: List[Dict[str, Any]] = []
+
+    def failed(self, model: str, started: float, exc: BaseException) -> None:
+        self.items.append({
+            "model": model,
+            "ok": False,
+            "elapsed_ms": int((time.perf_counter() - started) * 1000),
+            "error": f"{type(exc).__name__}: {exc}",
+        })
+
+    def succeeded(self, model: str, started: float, res: Optional[Result] = None) -> None:
+        self.items.append({
+            "model": model,
+            "ok": True,
+            "elapsed_ms": int((time.perf_counter() - started) * 1000),
+            "error": None,
+        })
+        if res is not None:
+            res.trace.update(self.trace(model))
+
+    def trace(self, model: str) -> Dict[str, Any]:
+        trace = {"answered_by": model, "slo_ms": self.slo_ms, "fallback_attempts": self.items}
+        if self.order is not None:
+            trace["fallback_order"] = self.order
+        return trace
+
+    def exhausted(self) -> FallbackError:
+        summary = "; ".join(f"{a['model']}: {a['error']}" for a in self.items)
+        return FallbackError(f"every model in the fallback chain failed ({summary})", attempts=self.items)
+
+
+def _chain(models: List[Tuple[str, M]], adaptive: bool) -> List[Tuple[str, M]]:
+    """``models`` in the order this call tries them."""
+    if not adaptive:
+        return models
+    return [models[i] for i in stats.rank_healthy([stats.key_of(m) for _, m in models])]
+
+
+def _first_event(
+    events: Iterator[StreamEvent], abandoned: threading.Event
+) -> Optional[StreamEvent]:
+    first = next(events, None)
+    if abandoned.is_set():  # given up on while it ran: release it here
+        _close(events)
+    return first
+
+
+def _close(events: Iterator[StreamEvent]) -> None:
+    close = getattr(events, "close", None)
+    if close is None:
+        return
+    try:
+        close()
+    except ValueError:  # still running on the helper thread, which closes it when done
+        pass
+
+
+async def _aclose(events: AsyncIterator[StreamEvent]) -> None:
+    aclose = getattr(events, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+def _slo_timeout(model: str, slo_ms: float) -> ProviderTimeoutError:
+    return ProviderTimeoutError(f"{model} did not answer within slo_ms={slo_ms:g}")
+
+
+class Fallback:
+    def __init__(
+        self, models: Sequence[str], *, slo_ms: Optional[float] = None, adaptive: bool = False, **model_kwargs: Any
+    ):
+        self._model_strings: List[str] = list(models)
+        if not self._model_strings:
+            raise ValueError("fallback() requires at least one model")
+        self._models: List[Tuple[str, Model]] = [(m, llm(m, **model_kwargs)) for m in self._model_strings]
+        self.slo_ms = slo_ms
+        self.adaptive = adaptive
+
+    @property
+    def models(self) -> List[str]:
+        return list(self._model_strings)
+
+    @property
+    def capabilities(self):
+        """The primary model's capabilities."""
+        return self._models[0][1].capabilities
+
+    def inspect(self, prompt: Any, *, stream: bool = False, **overrides: Any):
+        """Dry-run of the request the primary model would send."""
+        return self._models[0][1].inspect(prompt, stream=stream, **overrides)
+
+    def __call__(self, prompt: Any, **overrides: Any) -> Result:
+        return self._run(lambda m: m(prompt, **overrides))
+
+    def json(self, prompt: Any, *, schema: Any, repair: int = 0, **overrides: Any) -> Result:
+        return self._run(lambda m: m.json(prompt, schema=schema, repair=repair, **overrides))
+
+    def stream(self, prompt: Any, **overrides: Any) -> Iterator[StreamEvent]:
+        """Stream from the first model that produces an event in time. Once an event
+        has been yielded the chain is committed: later errors propagate."""
+        chain = _chain(self._models, self.adaptive)
+        attempts = _Attempts(self.slo_ms, [name for name, _ in chain] if self.adaptive else None)
+        last: Optional[BaseException] = None
+        for i, (name, model) in enumerate(chain):
+            started = time.perf_counter()
+            events = iter(model.stream(prompt, **overrides))
+            abandoned = threading.Event()
+            try:
+                first = self._within(
+                    lambda it=events, gone=abandoned: _first_event(it, gone), name, i
+                )
+            except FAILOVER_ERRORS as e:
+                abandoned.set()
+                _close(events)
+                attempts.failed(name, started, e)
+                last = e
+                continue
+            attempts.succeeded(name, started)
+            if first is not None:
+                yield first
+            yield from events
+            return
+        raise attempts.exhausted() from last
+
+    def close(self) -> None:
+        for _, model in self._models:
+            model.close()
+
+    def __enter__(self) -> "Fallback":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self, fn: Callable[[Model], Result]) -> Result:
+        chain = _chain(self._models, self.adaptive)
+        attempts = _Attempts(self.slo_ms, [name for name, _ in chain] if self.adaptive else None)
+        last: Optional[BaseException] = None
+        for i, (name, model) in enumerate(chain):
+            started = time.perf_counter()
+            try:
+                res = self._within(lambda m=model: fn(m), name, i)
+            except FAILOVER_ERRORS as e:
+                attempts.failed(name, started, e)
+                last = e
+                continue
+            attempts.succeeded(name, started, res)
+            return res
+        raise attempts.exhausted() from last
+
+    def _within(self, fn: Callable[[], T], name: str, index: int) -> T:
+        if self.slo_ms is None or index == len(self._models) - 1:
+            return fn()
+        scope = nested_scope()
+        fut, started = submit_started(
+            helper_pool("fallback"), contextvars.copy_context().run, run_in_scope, scope, fn
+        )
+        started.wait()  # the SLO bounds the call, not its wait for a free helper thread
+        try:
+            return fut.result(timeout=self.slo_ms / 1000.0)
+        except FutureTimeout:
+            if fut.done():  # the call itself raised a TimeoutError
+                raise
+            fut.cancel()
+            scope.cancel()
+            raise _slo_timeout(name, self.slo_ms) from None
+
+
+class AsyncFallback:
+    def __init__(
+        self, models: Sequence[str], *, slo_ms: Optional[float] = None, adaptive: bool = False, **model_kwargs: Any
+    ):
+        self._model_strings: List[str] = list(models)
+        if not self._model_strings:
+            raise ValueError("afallback() requires at least one model")
+        self._models: List[Tuple[str, AsyncModel]] = [(m, allm(m, **model_kwargs)) for m in self._model_strings]
+        self.slo_ms = slo_ms
+        self.adaptive = adaptive
+
+    @property
+    def models(self) -> List[str]:
+        return list(self._model_strings)
+
+    @property
+    def capabilities(self):
+        return self._models[0][1].capabilities
+
+    def inspect(self, prompt: Any, *, stream: bool = False, **overrides: Any):
+        return self._models[0][1].inspect(prompt, stream=stream, **overrides)
+
+    async def __call__(self, prompt: Any, **overrides: Any) -> Result:
+        return await self._run(lambda m: m(prompt, **overrides))
+
+    async def json(self, prompt: Any, *, schema: Any, repair: int = 0, **overrides: Any) -> Result:
+        return await self._run(lambda m: m.json(prompt, schema=schema, repair=repair, **overrides))
+
+    async def astream(self, prompt: Any, **overrides: Any) -> AsyncIterator[StreamEvent]:
+        chain = _chain(self._models, self.adaptive)
+        attempts = _Attempts(self.slo_ms, [name for name, _ in chain] if self.adaptive else None)
+        last: Optional[BaseException] = None
+        for i, (name, model) in enumerate(chain):
+            started = time.perf_counter()
+            events = model.astream(prompt, **overrides).__aiter__()
+            first: Optional[StreamEvent]
+            try:
+                first = await self._within(events.__anext__(), name, i)
+            except StopAsyncIteration:
+                first = None
+            except FAILOVER_ERRORS as e:
+                await _aclose(events)
+                attempts.failed(name, started, e)
+                last = e
+                continue
+            attempts.succeeded(name, started)
+            if first is not None:
+                yield first
+                async for ev in events:
+                    yield ev
+            return
+        raise attempts.exhausted() from last
+
+    async def aclose(self) -> None:
+        for _, model in self._models:
+            await model.aclose()
+
+    async def __aenter__(self) -> "AsyncFallback":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def _run(self, fn: Callable[[AsyncModel], Awaitable[Result]]) -> Result:
+        chain = _chain(self._models, self.adaptive)
+        attempts = _Attempts(self.slo_ms, [name for name, _ in chain] if self.adaptive else None)
+        last: Optional[BaseException] = None
+        for i, (name, model) in enumerate(chain):
+            started = time.perf_counter()
+            try:
+                res = await self._within(fn(model), name, i)
+            except FAILOVER_ERRORS as e:
+                attempts.failed(name, started, e)
+                last = e
+                continue
+            attempts.succeeded(name, started, res)
+            return res
+        raise attempts.exhausted() from last
+
+    async def _within(self, aw: Awaitable[T], name: str, index: int) -> T:
+        if self.slo_ms is None or index == len(self._models) - 1:
+            return await aw
+        try:
+            return await asyncio.wait_for(aw, self.slo_ms / 1000.0)
+        except asyncio.TimeoutError:
+            raise _slo_timeout(name, self.slo_ms) from None
+
+
+def fallback(
+    models: Sequence[str], *, slo_ms: Optional[float] = None, adaptive: bool = False, **model_kwargs: Any
+) -> Fallback:
+    """Try ``models`` in order, failing over on transient errors or a blown SLO.
+
+    Example:
+        >>> m = fallback(["anthropic:claude-haiku-4-5", "openai:gpt-4.1-mini", "ollama:llama3.2"], slo_ms=4000)
+        >>> res = m("Summarize this ticket.")
+        >>> res.trace["answered_by"], [a["elapsed_ms"] for a in res.trace["fallback_attempts"]]
+
+    ``slo_ms`` bounds every attempt but the last. Extra keyword arguments (e.g.
+    ``temperature``, ``timeout``, ``retries``) are forwarded to each underlying model;
+    keep ``retries`` low so a struggling provider is left quickly. ``adaptive=True``
+    moves models that have been failing lately to the back of the chain.
+    """
+    return Fallback(models, slo_ms=slo_ms, adaptive=adaptive, **model_kwargs)
+
+
+def afallback(
+    models: Sequence[str], *, slo_ms: Optional[float] = None, adaptive: bool = False, **model_kwargs: Any
+) -> AsyncFallback:
+    """Async sibling of :func:`fallback`; a slow attempt is cancelled as a task."""
+    return AsyncFallback(models, slo_ms=slo_ms, adaptive=adaptive, **model_kwargs)
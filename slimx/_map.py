@@ -0,0 +1,314 @@
+"""Bulk calls: one model, many prompts (``Model.map`` / ``AsyncModel.amap``).
+
+``m.map(prompts, concurrency=8)`` runs ``m(prompt)`` for every prompt, at most
+``concurrency`` at a time, and yields a ``MapItem`` per prompt: in input order
+(``ordered=True``, each item as soon as every earlier one is out) or as each call
+completes (``ordered=False``). Prompts are read lazily, so a generator of 50k
+prompts never sits in memory. A failed call does not stop the run; its item carries
+the error instead. Each call goes through the model's ``Client`` as usual: retries,
+circuit breaker, cache, ``rate_limiter`` and ``concurrency_limiter`` all apply.
+
+In input order, items that finish ahead of a slow earlier one wait for it; at most
+``concurrency`` of them are held, and no new call starts while the hold is full.
+
+``on_progress(item, done, total)`` is called after each item (``total`` is ``None``
+for prompts without a length). ``checkpoint=`` names a JSONL file. Each success is
+appended to it as a ``CallRecord``, and a later run over the same prompts serves
+those from the file (``MapItem.resumed``) instead of calling the model again. A
+failed call is not recorded, so it runs again on resume. Resuming reads only the
+index and prompt digest of each line up front; a record is read back when its item
+comes up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .cache import _canonical
+from .record import CallRecord
+from .types import Result
+
+DEFAULT_MAP_CONCURRENCY = 8
+
+Progress = Callable[["MapItem", int, Optional[int]], None]
+
+
+@dataclass
+class MapItem:
+    """One prompt's outcome within a ``map`` run."""
+
+    index: int
+    prompt: Any
+    result: Optional[Result] = None
+    error: Optional[str] = None
+    exception: Optional[BaseException] = None
+    elapsed_ms: Optional[int] = None
+    # True when the result came from the checkpoint file, not a model call.
+    resumed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None
+
+
+def _prompt_key(prompt: Any) -> str:
+    """A digest of ``prompt`` (a string or a message list), to match checkpoint lines.
+    Messages are keyed with their media parts, as digests (see ``cache._canonical``)."""
+    if isinstance(prompt, str):
+        body = prompt
+    else:
+        messages = _canonical([m.to_dict() for m in prompt])
+        body = json.dumps(messages, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
+
+
+class _Checkpoint:
+    """Completed items of a run, appended one JSON line each."""
+
+    def __init__(self, path: Optional[str]) -> None:
+        self.path = path
+        # index -> (prompt digest, byte offset of its line)
+        self.done: Dict[int, Tuple[str, int]] = {}
+        self._reader: Optional[BinaryIO] = None
+        if path is None or not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self.done[entry["index"]] = (entry["key"], offset)
+                except (ValueError, KeyError, TypeError):  # a blank line, or one cut off by a crash
+                    pass
+                offset += len(line)
+
+    def restore(self, index: int, prompt: Any) -> Optional[MapItem]:
+        entry = self.done.pop(index, None)
+        if entry is None or entry[0] != _prompt_key(prompt):
+            return None
+        if self._reader is None:
+            self._reader = open(self.path or "", "rb")
+        self._reader.seek(entry[1])
+        record = json.loads(self._reader.readline())["record"]
+        result = CallRecord.from_dict(record).to_result()
+        return MapItem(index, prompt, result=result, elapsed_ms=0, resumed=True)
+
+    def save(self, item: MapItem) -> None:
+        if self.path is None or item.result is None or item.resumed:
+            return
+        entry = {"index": item.index, "key": _prompt_key(item.prompt), "record": item.result.to_record().to_dict()}
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+
+def _check(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+
+def _total(prompts: Iterable[Any]) -> Optional[int]:
+    try:
+        return len(prompts)  # type: ignore[arg-type]
+    except TypeError:
+        return None
+
+
+class _Collector:
+    """Turns completed items into output order, saves and reports them."""
+
+    def __init__(self, ordered: bool, checkpoint: _Checkpoint, on_progress: Optional[Progress], total: Optional[int]):
+        self.ordered = ordered
+        self.checkpoint = checkpoint
+        self.on_progress = on_progress
+        self.total = total
+        self.done = 0
+        self._next = 0
+        self._held: Dict[int, MapItem] = {}
+
+    def has_room(self, window: int) -> bool:
+        """False while ``window`` finished items wait on an earlier one."""
+        return len(self._held) < window
+
+    def add(self, item: MapItem) -> List[MapItem]:
+        """Record ``item``; returns the items now ready to be yielded."""
+        self.checkpoint.save(item)
+        self.done += 1
+        if self.on_progress is not None:
+            self.on_progress(item, self.done, self.total)
+        if not self.ordered:
+            return [item]
+        self._held[item.index] = item
+        ready = []
+        while self._next in self._held:
+            ready.append(self._held.pop(self._next))
+            self._next += 1
+        return ready
+
+
+def _run_one(call: Callable[[Any], Result], index: int, prompt: Any) -> MapItem:
+    started = time.perf_counter()
+    try:
+        result = call(prompt)
+    except Exception as e:
+        return MapItem(index, prompt, error=f"{type(e).__name__}: {e}", exception=e, elapsed_ms=_since(started))
+    return MapItem(index, prompt, result=result, elapsed_ms=_since(started))
+
+
+async def _arun_one(call: Callable[[Any], Awaitable[Result]], index: int, prompt: Any) -> MapItem:
+    started = time.perf_counter()
+    try:
+        result = await call(prompt)
+    except Exception as e:
+        return MapItem(index, prompt, error=f"{type(e).__name__}: {e}", exception=e, elapsed_ms=_since(started))
+    return MapItem(index, prompt, result=result, elapsed_ms=_since(started))
+
+
+def _since(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
+
+
+def map_calls(
+    call: Callable[[Any], Result],
+    prompts: Iterable[Any],
+    *,
+    concurrency: int = DEFAULT_MAP_CONCURRENCY,
+    ordered: bool = True,
+    on_progress: Optional[Progress] = None,
+    checkpoint: Optional[str] = None,
+) -> Generator[MapItem, None, None]:
+    """Run ``call`` over ``prompts`` on ``concurrency`` threads (see module docs).
+
+    Stopping the iteration early cancels the calls not yet started.
+    """
+    _check(concurrency)
+    collector = _Collector(ordered, _Checkpoint(checkpoint), on_progress, _total(prompts))
+    return _map_items(call, prompts, concurrency, collector)
+
+
+def _map_items(
+    call: Callable[[Any], Result], prompts: Iterable[Any], concurrency: int, collector: _Collector
+) -> Generator[MapItem, None, None]:
+    source = enumerate(prompts)
+    running: Set["Future[MapItem]"] = set()
+    pool = ThreadPoolExecutor(concurrency, thread_name_prefix="slimx-map")
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(running) < concurrency and collector.has_room(concurrency):
+                nxt = next(source, None)
+                if nxt is None:
+                    exhausted = True
+                    break
+                index, prompt = nxt
+                restored = collector.checkpoint.restore(index, prompt)
+                if restored is not None:
+                    yield from collector.add(restored)
+                    continue
+                running.add(pool.submit(_run_one, call, index, prompt))
+            if not running:
+                return
+            finished, running = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                yield from collector.add(fut.result())
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        collector.checkpoint.close()
+
+
+class AsyncMapRun:
+    """The running ``amap``: iterate it with ``async for`` (items as they are ready),
+    or ``await`` it for the list of every item."""
+
+    def __init__(self, items: AsyncGenerator[MapItem, None]) -> None:
+        self._items = items
+
+    def __aiter__(self) -> AsyncIterator[MapItem]:
+        return self._items
+
+    def __await__(self):
+        return self._collect().__await__()
+
+    async def _collect(self) -> List[MapItem]:
+        return [item async for item in self._items]
+
+    async def aclose(self) -> None:
+        """Stop early: cancel the calls still running."""
+        await self._items.aclose()
+
+
+async def _amap_items(
+    call: Callable[[Any], Awaitable[Result]],
+    prompts: Iterable[Any],
+    concurrency: int,
+    collector: _Collector,
+) -> AsyncGenerator[MapItem, None]:
+    source = enumerate(prompts)
+    running: Set["asyncio.Task[MapItem]"] = set()
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(running) < concurrency and collector.has_room(concurrency):
+                nxt = next(source, None)
+                if nxt is None:
+                    exhausted = True
+                    break
+                index, prompt = nxt
+                restored = collector.checkpoint.restore(index, prompt)
+                if restored is not None:
+                    for item in collector.add(restored):
+                        yield item
+                    continue
+                running.add(asyncio.ensure_future(_arun_one(call, index, prompt)))
+            if not running:
+                return
+            finished, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                for item in collector.add(task.result()):
+                    yield item
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        collector.checkpoint.close()
+
+
+def amap_calls(
+    call: Callable[[Any], Awaitable[Result]],
+    prompts: Iterable[Any],
+    *,
+    concurrency: int = DEFAULT_MAP_CONCURRENCY,
+    ordered: bool = True,
+    on_progress: Optional[Progress] = None,
+    checkpoint: Optional[str] = None,
+) -> AsyncMapRun:
+    """Async ``map_calls``: at most ``concurrency`` calls run as tasks on the loop."""
+    _check(concurrency)
+    collector = _Collector(ordered, _Checkpoint(checkpoint), on_progress, _total(prompts))
+    return AsyncMapRun(_amap_items(call, prompts, concurrency, collector))
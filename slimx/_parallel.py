@@ -1,29 +1,60 @@
 """Parallel (ensemble) execution: fan one SlimX call out to multiple models.
 
 This sits ABOVE the Model/Client layer and composes them — it never reaches into
-provider internals. v1 supports two modes:
+provider internals. Modes:
 
-- ``all``  — run every model concurrently, return every result (and every error).
-- ``race`` — return the first successful result; the rest are abandoned.
+- ``all``     — run every model concurrently, return every result (and every error).
+- ``race``    — return the first successful result; the rest are cancelled.
+- ``compare`` — run all; ``text`` is a side-by-side of every answer.
+- ``judge``   — run all, then a judge model picks or synthesizes the best answer.
+- ``consensus`` — return as soon as ``quorum`` answers agree; the rest are cancelled.
+
+Each model call runs inside its own ``CancelScope`` (``slimx.utils.cancel``). When a
+race is won, or a ``cancel_event`` is set mid-call, the scopes of the calls still in
+flight are cancelled: their sockets are shut down, so the provider stops generating
+and the worker threads return at once with ``CallCancelled`` instead of running the
+request to completion in the background.
+
+``aparallel`` is the asyncio engine: the same modes and ``ParallelResult``, with
+each model call an ``AsyncModel`` task instead of a worker thread. Race losers are
+cancelled as tasks, which closes their requests, and ``model_timeout`` bounds each
+call.
 
 Inspectability is the contract: failures are surfaced in ``errors`` (never
 swallowed), every attempt keeps its full ``Result`` (including ``raw``), and
-``trace`` records timings and counts. Tools, streaming, and the judge/consensus
-modes are intentionally out of scope for v1.
+``trace`` records timings and counts (including what was cancelled). ``stream``
+(``astream``) merges every model's events as they arrive, tagged with their model,
+or races them on first token. Tools are out of scope for now.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import queue
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Sequence
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from . import stats
+from .errors import CallCancelled, ProviderTimeoutError
+from .high.api import AsyncModel, Model, _parse_model, allm, llm
+from .types import Result, StreamEvent
+from .utils.cancel import CancelScope, cancel_scope
+from .utils.executor import FanoutExecutor, shared_executor
+from .utils.hedge import observed_ms
+
+_MODES = ("all", "race", "compare", "judge", "consensus")
+
+# How often a running fan-out checks its ``cancel_event``.
+_CANCEL_POLL_S = 0.05
 
-from .high.api import Model, _parse_model, llm
-from .types import Result
+# Events that count as a model's first token when a stream races.
+_TOKEN_EVENTS = ("text_delta", "tool_call")
 
-_MODES = ("all", "race", "compare", "judge")
+_END = object()
 
 
 @dataclass
@@ -35,8 +66,12 @@ class ParallelItem:
     result: Optional[Result] = None
     error: Optional[str] = None
     elapsed_ms: Optional[int] = None
-    # True when the call never started because a ``cancel_event`` was set (additive;
-    # ``ok`` stays False and ``error`` carries the human-readable reason).
+    # Time spent waiting for a worker (and under a provider cap) before the call
+    # started; not part of ``elapsed_ms``. ``None`` for asyncio calls, which never queue.
+    queue_ms: Optional[int] = None
+    # True when the call was cancelled — before it started (``cancel_event`` already set)
+    # or mid-request (race lost, ``cancel_event`` set). ``ok`` stays False and ``error``
+    # carries the human-readable reason.
     cancelled: bool = False
 
     @property
@@ -50,9 +85,16 @@ class ParallelResult:
 
     - ``results``: every attempt, in input order (successes and failures).
     - ``errors``: the failed subset of ``results`` (convenience view).
-    - ``winner``: the chosen attempt for single-answer modes (``race``).
+    - ``winner``: the chosen attempt for single-answer modes (``race``, ``judge``,
+      ``consensus``).
     - ``text``: the winner's text when a mode yields one answer, else ``None``.
     - ``trace``: mode, model list, per-call elapsed time, and ok/error counts.
+      ``queue_ms`` is the longest any call waited for a worker before it started.
+      When
+      in-flight calls were cancelled it also has ``abandoned_count`` (calls cut off
+      mid-request), ``connections_closed`` (sockets shut down) and ``time_saved_ms``
+      (an estimate from each cut-off model's recent median latency; calls without
+      enough history count as zero).
     """
 
     text: Optional[str]
@@ -67,6 +109,257 @@ class ParallelResult:
         return self.results
 
 
+@dataclass
+class _Flight:
+    """Cancellation handle and timing for one model call of a fan-out."""
+
+    model: Union[Model, AsyncModel]
+    scope: CancelScope = field(default_factory=CancelScope)
+    submitted: float = field(default_factory=time.perf_counter)
+    started: Optional[float] = None
+    done: bool = False
+    cut_ms: Optional[int] = None  # how long it had run when cancelled mid-request
+
+    def cut(self) -> None:
+        if self.started is not None and not self.done:
+            self.cut_ms = int((time.perf_counter() - self.started) * 1000)
+
+
+def _cut_stats(flights: Sequence[_Flight], closed: Optional[int] = None) -> Dict[str, int]:
+    """Trace counts for the calls that were cut off mid-request. A cancelled asyncio
+    task always closes its request, so ``closed`` defaults to the abandoned count."""
+    abandoned = saved = 0
+    for fl in flights:
+        if fl.cut_ms is None:
+            continue
+        abandoned += 1
+        client = fl.model._client
+        p50 = observed_ms(client.provider_name, client._endpoint, fl.model._model, 0.5)
+        if p50 is not None:
+            saved += max(0, int(p50) - fl.cut_ms)
+    closed = abandoned if closed is None else closed
+    return {"abandoned_count": abandoned, "connections_closed": closed, "time_saved_ms": saved}
+
+
+def _cancel_flights(flights: Sequence[_Flight]) -> Dict[str, int]:
+    """Cancel every unfinished call; report what that cut off."""
+    closed = 0
+    for fl in flights:
+        if fl.done:
+            continue
+        fl.cut()
+        closed += fl.scope.cancel()
+    return _cut_stats(flights, closed)
+
+
+def _cancelled_item(model_string: str, flight: _Flight) -> ParallelItem:
+    """The item of an async call whose task was cancelled by a ``cancel_event``."""
+    return ParallelItem(
+        provider=_parse_model(model_string)[0],
+        model=model_string,
+        error="CallCancelled: cancelled while in flight (cancel_event set)",
+        elapsed_ms=flight.cut_ms,
+        cancelled=True,
+    )
+
+
+class _Merge:
+    """Interleaves the events of several model streams, tagging each with its model.
+
+    With ``race`` only the stream whose first token arrives first is kept: ``on_win``
+    is told its index (to cancel the others), the events it produced before that
+    token are released, and the other streams' events are dropped. Error events are
+    always passed through while no stream has won.
+    """
+
+    def __init__(self, models: List[str], race: bool, on_win: Callable[[int], Any]):
+        self.models = models
+        self.race = race
+        self.on_win = on_win
+        self.live = len(models)
+        self.winner: Optional[int] = None
+        self._held: Dict[int, List[StreamEvent]] = {i: [] for i in range(len(models))}
+
+    def event(self, i: int, ev: StreamEvent) -> List[StreamEvent]:
+        tagged = replace(ev, model=self.models[i])
+        if not self.race or i == self.winner:
+            return [tagged]
+        if self.winner is not None:
+            return []  # a cancelled loser
+        if ev.type == "error":
+            return [tagged]
+        if ev.type not in _TOKEN_EVENTS:
+            self._held[i].append(tagged)
+            return []
+        self.winner = i
+        self.on_win(i)
+        return self._held.pop(i) + [tagged]
+
+    def end(self, i: int) -> bool:
+        """Stream ``i`` finished; True once the merged stream is complete."""
+        self.live -= 1
+        return self.live == 0 or i == self.winner
+
+
+def _stream_error(e: BaseException) -> StreamEvent:
+    return StreamEvent.err(f"{type(e).__name__}: {e}")
+
+
+def _compare_text(items: List[ParallelItem]) -> str:
+    """A readable side-by-side of every answer (``compare`` mode)."""
+    blocks = []
+    for it in items:
+        body = it.result.text if it.ok and it.result else f"[error] {it.error}"
+        blocks.append(f"### {it.model}\n{body}")
+    return "\n\n".join(blocks)
+
+
+def _judge_prompt(prompt: str, ok: List[ParallelItem]) -> str:
+    listing = "\n\n".join(
+        f"[{i + 1}] (from {it.model})\n{it.result.text}" for i, it in enumerate(ok)  # type: ignore[union-attr]
+    )
+    return (
+        f"You are judging candidate answers to the request below.\n\n"
+        f"REQUEST:\n{prompt}\n\nCANDIDATES:\n{listing}\n\n"
+        "Choose the single best answer, or synthesize a better one by combining their "
+        "strengths. Reply with ONLY the final answer — no commentary, no numbering."
+    )
+
+
+def _normalized(text: str) -> str:
+    """Default consensus key: case-folded, whitespace collapsed, trailing period dropped."""
+    return " ".join(text.split()).casefold().rstrip(".")
+
+
+def _hashable(key: Any) -> Any:
+    try:
+        hash(key)
+        return key
+    except TypeError:  # e.g. a JSON list/object pulled out by a key function
+        return json.dumps(key, sort_keys=True, default=str)
+
+
+class _Tally:
+    """Consensus votes: answers grouped by ``key`` until one group reaches ``quorum``."""
+
+    def __init__(self, key: Optional[Callable[[str], Any]], quorum: int):
+        self.key = key or _normalized
+        self.quorum = quorum
+        self.counts: Dict[Any, int] = {}
+        self.voters = 0
+        self.winner: Optional[ParallelItem] = None
+        self._first: Dict[Any, ParallelItem] = {}
+
+    def add(self, item: ParallelItem) -> None:
+        if self.winner is not None or not item.ok or item.result is None:
+            return
+        try:
+            key = _hashable(self.key(item.result.text or ""))
+        except Exception:
+            return  # an answer the key function cannot read casts no vote
+        self.voters += 1
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self._first.setdefault(key, item)
+        if self.counts[key] >= self.quorum:
+            self.winner = self._first[key]
+
+    def settled(self, outstanding: int) -> bool:
+        """True once a group has won, or none can win with ``outstanding`` calls left."""
+        top = max(self.counts.values(), default=0)
+        return self.winner is not None or top + outstanding < self.quorum
+
+    def trace(self, total: int, completed: int) -> Dict[str, Any]:
+        top = max(self.counts.values(), default=0)
+        return {
+            "quorum": self.quorum,
+            "consensus": self.winner is not None,
+            "votes": top,
+            "agreement": round(top / self.voters, 3) if self.voters else 0.0,
+            "calls_saved": total - completed,
+        }
+
+
+def _quorum(quorum: Optional[int], n: int) -> int:
+    """``quorum`` checked against ``n`` models; defaults to a strict majority."""
+    if quorum is None:
+        return n // 2 + 1
+    if not 1 <= quorum <= n:
+        raise ValueError(f"quorum must be between 1 and the number of models ({n}), got {quorum}")
+    return quorum
+
+
+@dataclass
+class _RacePlan:
+    """Which race candidates start first, and when the rest join.
+
+    ``order`` ranks the models by their recent expected latency (``slimx.stats``);
+    the first ``k`` start at once. A reserve starts whenever a running call fails, and
+    (with ``stagger_s``) one more every ``stagger_s`` while nothing has won yet.
+    """
+
+    order: List[int]
+    k: int
+    stagger_s: Optional[float]
+
+    @classmethod
+    def build(cls, models: Sequence[Any], top_k: Optional[int], stagger_ms: Optional[float]) -> "_RacePlan":
+        n = len(models)
+        if top_k is None and stagger_ms is None:
+            return cls(list(range(n)), n, None)
+        order = stats.rank_fastest([stats.key_of(m) for m in models])
+        k = min(top_k or 1, n)
+        return cls(order, k, None if stagger_ms is None else stagger_ms / 1000)
+
+    @property
+    def adaptive(self) -> bool:
+        return self.k < len(self.order)
+
+    def trace(self, model_strings: List[str], launched: int) -> Dict[str, Any]:
+        if not self.adaptive:
+            return {}
+        return {"race_order": [model_strings[i] for i in self.order], "race_started": launched}
+
+
+def _check_race_start(mode: str, top_k: Optional[int], stagger_ms: Optional[float]) -> None:
+    if (top_k is not None or stagger_ms is not None) and mode != "race":
+        raise ValueError("top_k and stagger_ms only apply to mode='race'")
+    if top_k is not None and top_k < 1:
+        raise ValueError(f"top_k must be >= 1, got {top_k}")
+    if stagger_ms is not None and stagger_ms < 0:
+        raise ValueError(f"stagger_ms must be >= 0, got {stagger_ms}")
+
+
+def _validate(models: List[str], mode: str, judge: Optional[str], fn: str) -> None:
+    if mode not in _MODES:
+        raise ValueError(f"mode must be one of {_MODES}, got {mode!r}")
+    if mode == "judge" and not judge:
+        raise ValueError("mode='judge' requires a judge model, e.g. judge='openai:gpt-4.1-mini'")
+    if not models:
+        raise ValueError(f"{fn}() requires at least one model")
+
+
+def _trace(
+    mode: str,
+    models: List[str],
+    items: List[ParallelItem],
+    started: float,
+    cancelled: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
+    trace: Dict[str, Any] = {
+        "mode": mode,
+        "models": models,
+        "model_count": len(models),
+        "elapsed_ms": int((time.perf_counter() - started) * 1000),
+        "ok_count": sum(1 for it in items if it.ok),
+        "error_count": sum(1 for it in items if not it.ok),
+    }
+    queued = [it.queue_ms for it in items if it.queue_ms is not None]
+    if queued:
+        trace["queue_ms"] = max(queued)
+    trace.update(cancelled or {})
+    return trace
+
+
 class Parallel:
     def __init__(
         self,
@@ -76,16 +369,21 @@ class Parallel:
         judge: Optional[str] = None,
         max_workers: Optional[int] = None,
         cancel_event: Optional[threading.Event] = None,
+        executor: Optional[FanoutExecutor] = None,
+        quorum: Optional[int] = None,
+        key: Optional[Callable[[str], Any]] = None,
+        top_k: Optional[int] = None,
+        stagger_ms: Optional[float] = None,
         **model_kwargs: Any,
     ):
-        if mode not in _MODES:
-            raise ValueError(f"mode must be one of {_MODES}, got {mode!r}")
-        if mode == "judge" and not judge:
-            raise ValueError("mode='judge' requires a judge model, e.g. judge='openai:gpt-4.1-mini'")
-        self.mode = mode
         self._model_strings: List[str] = list(models)
-        if not self._model_strings:
-            raise ValueError("parallel() requires at least one model")
+        _validate(self._model_strings, mode, judge, "parallel")
+        _check_race_start(mode, top_k, stagger_ms)
+        self.mode = mode
+        self._quorum = _quorum(quorum, len(self._model_strings))
+        self._key = key
+        self._top_k = top_k
+        self._stagger_ms = stagger_ms
         # Resolve providers once, up front, so missing keys / unknown providers
         # fail fast rather than inside a worker thread.
         self._models: List[tuple[str, Model]] = [
@@ -93,10 +391,14 @@ class Parallel:
         ]
         self._judge_string = judge
         self._judge_model: Optional[Model] = llm(judge, **model_kwargs) if judge else None
-        self._max_workers = max_workers or len(self._models)
-        # Cooperative cancellation: checked before each model call starts (and before the
-        # judge synthesis). An in-flight provider request is NOT aborted mid-HTTP — the
-        # guarantee is "no NEW work begins after the event is set".
+        # Calls run on a long-lived executor: the one passed in, a private one sized by
+        # ``max_workers``, or (by default) the process-wide shared executor.
+        self._owns_executor = False
+        if executor is None and max_workers is not None:
+            executor, self._owns_executor = FanoutExecutor(max_workers), True
+        self._executor = executor
+        # Cancellation: checked before each model call starts (and before the judge
+        # synthesis); once set mid-call, requests already in flight are aborted too.
         self._cancel_event = cancel_event
 
     def __call__(self, prompt: str, **overrides: Any) -> ParallelResult:
@@ -109,8 +411,90 @@ class Parallel:
             return self._compare(prompt, overrides, cancel_event)
         if self.mode == "judge":
             return self._judge(prompt, overrides, cancel_event)
+        if self.mode == "consensus":
+            return self._consensus(prompt, overrides, cancel_event)
         return self._all(prompt, overrides, cancel_event)
 
+    def close(self) -> None:
+        """Close every model (and a private executor, if this ensemble owns one)."""
+        for _, model in self._models:
+            model.close()
+        if self._judge_model is not None:
+            self._judge_model.close()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def __enter__(self) -> "Parallel":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def stream(
+        self, prompt: str, *, race: Optional[bool] = None, **overrides: Any
+    ) -> Iterator[StreamEvent]:
+        """Stream every model at once. Events are yielded as they arrive, interleaved,
+        and each carries its source in ``event.model``.
+
+        ``race=True`` (the default when ``mode="race"``) keeps only the stream whose
+        first token (``text_delta``/``tool_call``) arrives first and cancels the
+        others. A model whose stream fails yields one ``error`` event; the rest
+        carry on. Closing the iterator early cancels every stream still running.
+        """
+        cancel_event = overrides.pop("cancel_event", None) or self._cancel_event
+        race = self.mode == "race" if race is None else race
+        events: "queue.Queue[Tuple[int, Any]]" = queue.Queue()
+        flights = [_Flight(m) for _, m in self._models]
+
+        def pump(i: int, model: Model, flight: _Flight) -> None:
+            flight.started = time.perf_counter()
+            try:
+                with cancel_scope(flight.scope):
+                    for ev in model.stream(prompt, **overrides):
+                        if flight.scope.cancelled:
+                            break
+                        events.put((i, ev))
+            except Exception as e:
+                if not flight.scope.cancelled:
+                    events.put((i, _stream_error(e)))
+            finally:
+                flight.done = True
+                events.put((i, _END))
+
+        merge = _Merge(
+            self._model_strings,
+            race,
+            lambda won: _cancel_flights([fl for j, fl in enumerate(flights) if j != won]),
+        )
+        futures = [
+            self._submit(ms, pump, i, m, fl)
+            for i, ((ms, m), fl) in enumerate(zip(self._models, flights))
+        ]
+        poll = _CANCEL_POLL_S if cancel_event is not None else None
+        try:
+            while True:
+                try:
+                    i, ev = events.get(timeout=poll)
+                except queue.Empty:
+                    i, ev = -1, None
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                if ev is None:
+                    continue
+                if ev is _END:
+                    if merge.end(i):
+                        return
+                    continue
+                yield from merge.event(i, ev)
+        finally:
+            for fut in futures:
+                fut.cancel()
+            _cancel_flights(flights)
+
+    def _submit(self, model_string: str, fn: Callable[..., Any], *args: Any) -> Future:
+        executor = self._executor or shared_executor()
+        return executor.submit(_parse_model(model_string)[0], fn, *args)
+
     def _invoke(
         self,
         model_string: str,
@@ -118,23 +502,30 @@ class Parallel:
         prompt: str,
         overrides: Dict[str, Any],
         cancel_event: Optional[threading.Event] = None,
+        flight: Optional[_Flight] = None,
     ) -> ParallelItem:
         provider = _parse_model(model_string)[0]
+        flight = flight or _Flight(model)
+        start = time.perf_counter()
+        queue_ms = int((start - flight.submitted) * 1000)
         if cancel_event is not None and cancel_event.is_set():
             return ParallelItem(
                 provider=provider,
                 model=model_string,
                 error="Cancelled before this model call started (cancel_event set)",
+                queue_ms=queue_ms,
                 cancelled=True,
             )
-        start = time.perf_counter()
+        flight.started = start
         try:
-            res = model(prompt, **overrides)
+            with cancel_scope(flight.scope):
+                res = model(prompt, **overrides)
             return ParallelItem(
                 provider=provider,
                 model=model_string,
                 result=res,
                 elapsed_ms=int((time.perf_counter() - start) * 1000),
+                queue_ms=queue_ms,
             )
         except Exception as e:
             return ParallelItem(
@@ -142,20 +533,45 @@ class Parallel:
                 model=model_string,
                 error=f"{type(e).__name__}: {e}",
                 elapsed_ms=int((time.perf_counter() - start) * 1000),
+                queue_ms=queue_ms,
+                cancelled=isinstance(e, CallCancelled),
             )
+        finally:
+            flight.done = True
 
     def _gather(
         self,
         prompt: str,
         overrides: Dict[str, Any],
         cancel_event: Optional[threading.Event] = None,
-    ) -> List[ParallelItem]:
-        with ThreadPoolExecutor(max_workers=self._max_workers) as ex:
-            futures = [
-                ex.submit(self._invoke, ms, m, prompt, overrides, cancel_event)
-                for ms, m in self._models
-            ]
-            return [f.result() for f in futures]  # preserve input order
+    ) -> tuple[List[ParallelItem], Dict[str, int]]:
+        flights = [_Flight(m) for _, m in self._models]
+        futures = [
+            self._submit(ms, self._invoke, ms, m, prompt, overrides, cancel_event, fl)
+            for (ms, m), fl in zip(self._models, flights)
+        ]
+        cancelled: Dict[str, int] = {}
+        if cancel_event is not None:
+            cancelled = self._watch(cancel_event, futures, flights)
+        return [f.result() for f in futures], cancelled  # preserve input order
+
+    @staticmethod
+    def _settle(futures: List[Future], pending: Set[Future]) -> List[ParallelItem]:
+        """The items of the ``pending`` calls, in launch order, once they return. Call
+        after cancelling them: they end at once, as cancelled items."""
+        return [fut.result() for fut in futures if fut in pending]
+
+    @staticmethod
+    def _watch(
+        cancel_event: threading.Event, futures: List[Future], flights: List[_Flight]
+    ) -> Dict[str, int]:
+        """Wait for ``futures``, cancelling the unfinished calls if the event is set."""
+        pending = set(futures)
+        while pending:
+            if cancel_event.is_set():
+                return _cancel_flights(flights)
+            _, pending = wait(pending, timeout=_CANCEL_POLL_S, return_when=ALL_COMPLETED)
+        return {}
 
     def _all(
         self,
@@ -164,13 +580,13 @@ class Parallel:
         cancel_event: Optional[threading.Event] = None,
     ) -> ParallelResult:
         started = time.perf_counter()
-        items = self._gather(prompt, overrides, cancel_event)
+        items, cancelled = self._gather(prompt, overrides, cancel_event)
         return ParallelResult(
             text=None,
             results=items,
             errors=[it for it in items if not it.ok],
             winner=None,
-            trace=self._trace("all", items, started),
+            trace=self._trace("all", items, started, cancelled),
         )
 
     def _compare(
@@ -180,17 +596,13 @@ class Parallel:
         cancel_event: Optional[threading.Event] = None,
     ) -> ParallelResult:
         started = time.perf_counter()
-        items = self._gather(prompt, overrides, cancel_event)
-        blocks = []
-        for it in items:
-            body = it.result.text if it.ok and it.result else f"[error] {it.error}"
-            blocks.append(f"### {it.model}\n{body}")
+        items, cancelled = self._gather(prompt, overrides, cancel_event)
         return ParallelResult(
-            text="\n\n".join(blocks),  # a readable side-by-side comparison
+            text=_compare_text(items),
             results=items,
             errors=[it for it in items if not it.ok],
             winner=None,
-            trace=self._trace("compare", items, started),
+            trace=self._trace("compare", items, started, cancelled),
         )
 
     def _judge(
@@ -200,9 +612,9 @@ class Parallel:
         cancel_event: Optional[threading.Event] = None,
     ) -> ParallelResult:
         started = time.perf_counter()
-        candidates = self._gather(prompt, overrides, cancel_event)
+        candidates, cancelled = self._gather(prompt, overrides, cancel_event)
         ok = [it for it in candidates if it.ok and it.result]
-        trace = self._trace("judge", candidates, started)
+        trace = self._trace("judge", candidates, started, cancelled)
         trace["judge"] = self._judge_string
 
         # Cancellation between the fan-out and the synthesis: return the candidates that
@@ -226,15 +638,7 @@ class Parallel:
                 trace=trace,
             )
 
-        listing = "\n\n".join(
-            f"[{i + 1}] (from {it.model})\n{it.result.text}" for i, it in enumerate(ok)  # type: ignore[union-attr]
-        )
-        judge_prompt = (
-            f"You are judging candidate answers to the request below.\n\n"
-            f"REQUEST:\n{prompt}\n\nCANDIDATES:\n{listing}\n\n"
-            "Choose the single best answer, or synthesize a better one by combining their "
-            "strengths. Reply with ONLY the final answer — no commentary, no numbering."
-        )
+        judge_prompt = _judge_prompt(prompt, ok)
         jstart = time.perf_counter()
         judge_str = self._judge_string or ""
         jprovider = _parse_model(judge_str)[0]
@@ -273,41 +677,512 @@ class Parallel:
         started = time.perf_counter()
         items: List[ParallelItem] = []
         winner: Optional[ParallelItem] = None
-        # Manage the executor manually so a win returns immediately: queued calls
-        # are cancelled and already-running calls are abandoned (not awaited).
-        ex = ThreadPoolExecutor(max_workers=self._max_workers)
+        plan = _RacePlan.build([m for _, m in self._models], self._top_k, self._stagger_ms)
+        flights: List[_Flight] = []
+        futures: List[Future] = []
+        cancelled: Dict[str, int] = {}
+
+        def launch() -> Future:
+            ms, m = self._models[plan.order[len(futures)]]
+            flights.append(_Flight(m))
+            futures.append(self._submit(ms, self._invoke, ms, m, prompt, overrides, cancel_event, flights[-1]))
+            return futures[-1]
+
+        pending = {launch() for _ in range(plan.k)}
+        stagger = plan.stagger_s
+        next_at = time.perf_counter() + stagger if stagger is not None else None
+        poll = _CANCEL_POLL_S if cancel_event is not None else None
         try:
-            futures = {
-                ex.submit(self._invoke, ms, m, prompt, overrides, cancel_event): ms
-                for ms, m in self._models
-            }
-            for fut in as_completed(futures):
-                item = fut.result()
-                items.append(item)
-                if item.ok:
-                    winner = item
+            while pending and winner is None:
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = _cancel_flights(flights)
+                    items.extend(self._settle(futures, pending))
                     break
+                reserves = len(futures) < len(self._models)
+                timeout = poll
+                if reserves and next_at is not None:
+                    until_next = max(0.0, next_at - time.perf_counter())
+                    timeout = until_next if timeout is None else min(timeout, until_next)
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                # Every call that finished in this batch is recorded, in launch order;
+                # the first success among them wins.
+                for fut in sorted(done, key=futures.index):
+                    item = fut.result()
+                    items.append(item)
+                    if winner is None and item.ok:
+                        winner = item
+                if winner is None:
+                    for _ in done:  # keep k candidates running
+                        if len(futures) < len(self._models):
+                            pending.add(launch())
+                due = next_at is not None and time.perf_counter() >= next_at
+                if winner is None and stagger is not None and due:
+                    if len(futures) < len(self._models):
+                        pending.add(launch())
+                    next_at = time.perf_counter() + stagger
         finally:
-            ex.shutdown(wait=False, cancel_futures=True)
+            # A win returns immediately: queued calls are dropped and running calls
+            # are cancelled mid-request (not awaited).
+            for fut in futures:
+                fut.cancel()
+            if winner is not None:
+                cancelled = _cancel_flights(flights)
         errors = [it for it in items if not it.ok]
         text = winner.result.text if winner is not None and winner.result is not None else None
+        trace = self._trace("race", items, started, cancelled)
+        trace.update(plan.trace(self._model_strings, len(futures)))
         return ParallelResult(
             text=text,
             results=items,
             errors=errors,
             winner=winner,
-            trace=self._trace("race", items, started),
+            trace=trace,
         )
 
-    def _trace(self, mode: str, items: List[ParallelItem], started: float) -> Dict[str, Any]:
-        return {
-            "mode": mode,
-            "models": self._model_strings,
-            "model_count": len(self._model_strings),
-            "elapsed_ms": int((time.perf_counter() - started) * 1000),
-            "ok_count": sum(1 for it in items if it.ok),
-            "error_count": sum(1 for it in items if not it.ok),
-        }
+    def _consensus(
+        self,
+        prompt: str,
+        overrides: Dict[str, Any],
+        cancel_event: Optional[threading.Event] = None,
+    ) -> ParallelResult:
+        started = time.perf_counter()
+        flights = [_Flight(m) for _, m in self._models]
+        futures = [
+            self._submit(ms, self._invoke, ms, m, prompt, overrides, cancel_event, fl)
+            for (ms, m), fl in zip(self._models, flights)
+        ]
+        index = {fut: i for i, fut in enumerate(futures)}
+        tally = _Tally(self._key, self._quorum)
+        finished: Dict[int, ParallelItem] = {}
+        cancelled: Optional[Dict[str, int]] = None
+        poll = _CANCEL_POLL_S if cancel_event is not None else None
+        pending = set(futures)
+        try:
+            while pending and not tally.settled(len(pending)):
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = _cancel_flights(flights)
+                    for fut in sorted(pending, key=index.__getitem__):
+                        finished[index[fut]] = fut.result()
+                    break
+                done, pending = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+                for fut in sorted(done, key=index.__getitem__):
+                    finished[index[fut]] = item = fut.result()
+                    tally.add(item)
+        finally:
+            # Agreement (or a quorum no longer reachable) ends the call: drop queued
+            # calls and cancel the ones in flight.
+            for fut in futures:
+                fut.cancel()
+            if cancelled is None:
+                cancelled = _cancel_flights(flights)
+        items = [finished[i] for i in sorted(finished)]
+        trace = self._trace("consensus", items, started, cancelled)
+        trace.update(tally.trace(len(futures), len(items)))
+        winner = tally.winner
+        return ParallelResult(
+            text=winner.result.text if winner is not None and winner.result is not None else None,
+            results=items,
+            errors=[it for it in items if not it.ok],
+            winner=winner,
+            trace=trace,
+        )
+
+    def _trace(
+        self,
+        mode: str,
+        items: List[ParallelItem],
+        started: float,
+        cancelled: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Any]:
+        return _trace(mode, self._model_strings, items, started, cancelled)
+
+
+class _Failed(Exception):
+    """Carries a failed item out of an attempt task in async race mode."""
+
+    def __init__(self, item: ParallelItem):
+        super().__init__(item.error)
+        self.item = item
+
+
+class AsyncParallel:
+    def __init__(
+        self,
+        models: Sequence[str],
+        *,
+        mode: str = "all",
+        judge: Optional[str] = None,
+        model_timeout: Union[float, Mapping[str, float], None] = None,
+        cancel_event: Optional[Any] = None,
+        quorum: Optional[int] = None,
+        key: Optional[Callable[[str], Any]] = None,
+        top_k: Optional[int] = None,
+        stagger_ms: Optional[float] = None,
+        **model_kwargs: Any,
+    ):
+        self._model_strings: List[str] = list(models)
+        _validate(self._model_strings, mode, judge, "aparallel")
+        _check_race_start(mode, top_k, stagger_ms)
+        self.mode = mode
+        self._quorum = _quorum(quorum, len(self._model_strings))
+        self._key = key
+        self._top_k = top_k
+        self._stagger_ms = stagger_ms
+        self._models: List[tuple[str, AsyncModel]] = [
+            (m, allm(m, **model_kwargs)) for m in self._model_strings
+        ]
+        self._judge_string = judge
+        self._judge_model: Optional[AsyncModel] = allm(judge, **model_kwargs) if judge else None
+        # Wall-clock bound on each candidate call (seconds), one value or per model string.
+        self._model_timeout = model_timeout
+        # A threading.Event or asyncio.Event; polled while the candidates run.
+        self._cancel_event = cancel_event
+
+    async def __call__(self, prompt: str, **overrides: Any) -> ParallelResult:
+        cancel_event = overrides.pop("cancel_event", None) or self._cancel_event
+        if self.mode == "race":
+            return await self._race(prompt, overrides, cancel_event)
+        if self.mode == "consensus":
+            return await self._consensus(prompt, overrides, cancel_event)
+        started = time.perf_counter()
+        items, cancelled = await self._gather(prompt, overrides, cancel_event)
+        trace = _trace(self.mode, self._model_strings, items, started, cancelled)
+        if self.mode == "judge":
+            return await self._judge(prompt, items, trace, cancel_event)
+        return ParallelResult(
+            text=_compare_text(items) if self.mode == "compare" else None,
+            results=items,
+            errors=[it for it in items if not it.ok],
+            winner=None,
+            trace=trace,
+        )
+
+    async def aclose(self) -> None:
+        for _, model in self._models:
+            await model.aclose()
+        if self._judge_model is not None:
+            await self._judge_model.aclose()
+
+    async def __aenter__(self) -> "AsyncParallel":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def astream(
+        self, prompt: str, *, race: Optional[bool] = None, **overrides: Any
+    ) -> AsyncIterator[StreamEvent]:
+        """Async :meth:`Parallel.stream`: interleaved events tagged with ``event.model``;
+        with ``race`` the streams that lose on first token are cancelled."""
+        cancel_event = overrides.pop("cancel_event", None) or self._cancel_event
+        race = self.mode == "race" if race is None else race
+        events: "asyncio.Queue[Tuple[int, Any]]" = asyncio.Queue()
+
+        async def pump(i: int, model: AsyncModel) -> None:
+            try:
+                async for ev in model.astream(prompt, **overrides):
+                    await events.put((i, ev))
+            except Exception as e:
+                await events.put((i, _stream_error(e)))
+            finally:
+                events.put_nowait((i, _END))
+
+        tasks = [asyncio.ensure_future(pump(i, m)) for i, (_, m) in enumerate(self._models)]
+
+        def cancel_losers(won: int) -> None:
+            for j, task in enumerate(tasks):
+                if j != won:
+                    task.cancel()
+
+        merge = _Merge(self._model_strings, race, cancel_losers)
+        poll = _CANCEL_POLL_S if cancel_event is not None else None
+        try:
+            while True:
+                try:
+                    i, ev = await asyncio.wait_for(events.get(), poll)
+                except asyncio.TimeoutError:
+                    i, ev = -1, None
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                if ev is None:
+                    continue
+                if ev is _END:
+                    if merge.end(i):
+                        return
+                    continue
+                for out in merge.event(i, ev):
+                    yield out
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _timeout_for(self, model_string: str) -> Optional[float]:
+        if isinstance(self._model_timeout, Mapping):
+            return self._model_timeout.get(model_string)
+        return self._model_timeout
+
+    async def _ainvoke(
+        self,
+        model_string: str,
+        model: AsyncModel,
+        prompt: str,
+        overrides: Dict[str, Any],
+        cancel_event: Optional[Any],
+        flight: _Flight,
+    ) -> ParallelItem:
+        provider = _parse_model(model_string)[0]
+        if cancel_event is not None and cancel_event.is_set():
+            return ParallelItem(
+                provider=provider,
+                model=model_string,
+                error="Cancelled before this model call started (cancel_event set)",
+                cancelled=True,
+            )
+        timeout = self._timeout_for(model_string)
+        start = flight.started = time.perf_counter()
+        try:
+            try:
+                res = await asyncio.wait_for(model(prompt, **overrides), timeout)
+            except asyncio.TimeoutError:
+                raise ProviderTimeoutError(
+                    f"{model_string} did not answer within model_timeout={timeout:g}s"
+                ) from None
+            return ParallelItem(
+                provider=provider,
+                model=model_string,
+                result=res,
+                elapsed_ms=int((time.perf_counter() - start) * 1000),
+            )
+        except asyncio.CancelledError:
+            flight.cut()
+            raise
+        except Exception as e:
+            return ParallelItem(
+                provider=provider,
+                model=model_string,
+                error=f"{type(e).__name__}: {e}",
+                elapsed_ms=int((time.perf_counter() - start) * 1000),
+            )
+        finally:
+            flight.done = True
+
+    async def _gather(
+        self,
+        prompt: str,
+        overrides: Dict[str, Any],
+        cancel_event: Optional[Any],
+    ) -> tuple[List[ParallelItem], Dict[str, int]]:
+        flights = [_Flight(m) for _, m in self._models]
+        tasks = [
+            asyncio.ensure_future(self._ainvoke(ms, m, prompt, overrides, cancel_event, fl))
+            for (ms, m), fl in zip(self._models, flights)
+        ]
+        cancelled: Dict[str, int] = {}
+        poll = _CANCEL_POLL_S if cancel_event is not None else None
+        pending = set(tasks)
+        try:
+            while pending:
+                if cancel_event is not None and cancel_event.is_set():
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.wait(pending)
+                    cancelled = _cut_stats(flights)
+                    break
+                _, pending = await asyncio.wait(pending, timeout=poll)
+        finally:
+            for task in tasks:
+                task.cancel()  # no-op once done; cleans up if this call is cancelled
+        items = [
+            _cancelled_item(ms, fl) if task.cancelled() else task.result()
+            for (ms, _), fl, task in zip(self._models, flights, tasks)
+        ]
+        return items, cancelled
+
+    async def _judge(
+        self,
+        prompt: str,
+        candidates: List[ParallelItem],
+        trace: Dict[str, Any],
+        cancel_event: Optional[Any],
+    ) -> ParallelResult:
+        ok = [it for it in candidates if it.ok and it.result]
+        trace["judge"] = self._judge_string
+        errors = [it for it in candidates if not it.ok]
+        if cancel_event is not None and cancel_event.is_set():
+            trace["judge_cancelled"] = True
+            return ParallelResult(text=None, results=candidates, errors=errors, winner=None, trace=trace)
+        if not ok or self._judge_model is None:
+            return ParallelResult(text=None, results=candidates, errors=errors, winner=None, trace=trace)
+
+        jstart = time.perf_counter()
+        judge_str = self._judge_string or ""
+        jprovider = _parse_model(judge_str)[0]
+        try:
+            jres = await self._judge_model(_judge_prompt(prompt, ok))
+            winner = ParallelItem(
+                provider=jprovider,
+                model=judge_str,
+                result=jres,
+                elapsed_ms=int((time.perf_counter() - jstart) * 1000),
+            )
+            text = jres.text
+        except Exception as e:
+            winner = ParallelItem(
+                provider=jprovider,
+                model=judge_str,
+                error=f"{type(e).__name__}: {e}",
+                elapsed_ms=int((time.perf_counter() - jstart) * 1000),
+            )
+            text = None
+        return ParallelResult(text=text, results=candidates, errors=errors, winner=winner, trace=trace)
+
+    async def _consensus(
+        self,
+        prompt: str,
+        overrides: Dict[str, Any],
+        cancel_event: Optional[Any],
+    ) -> ParallelResult:
+        started = time.perf_counter()
+        flights = [_Flight(m) for _, m in self._models]
+        tasks = [
+            asyncio.ensure_future(self._ainvoke(ms, m, prompt, overrides, cancel_event, fl))
+            for (ms, m), fl in zip(self._models, flights)
+        ]
+        index = {task: i for i, task in enumerate(tasks)}
+        tally = _Tally(self._key, self._quorum)
+        finished: Dict[int, ParallelItem] = {}
+        poll = _CANCEL_POLL_S if cancel_event is not None else None
+        pending = set(tasks)
+        try:
+            while pending and not tally.settled(len(pending)):
+                if cancel_event is not None and cancel_event.is_set():
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.wait(pending)
+                    for task in pending:
+                        i = index[task]
+                        cut = task.cancelled()
+                        finished[i] = _cancelled_item(self._model_strings[i], flights[i]) if cut else task.result()
+                    pending = set()
+                    break
+                done, pending = await asyncio.wait(pending, timeout=poll, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=index.__getitem__):
+                    finished[index[task]] = item = task.result()
+                    tally.add(item)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        items = [finished[i] for i in sorted(finished)]
+        trace = _trace("consensus", self._model_strings, items, started, _cut_stats(flights))
+        trace.update(tally.trace(len(tasks), len(items)))
+        winner = tally.winner
+        return ParallelResult(
+            text=winner.result.text if winner is not None and winner.result is not None else None,
+            results=items,
+            errors=[it for it in items if not it.ok],
+            winner=winner,
+            trace=trace,
+        )
+
+    async def _race(
+        self,
+        prompt: str,
+        overrides: Dict[str, Any],
+        cancel_event: Optional[Any],
+    ) -> ParallelResult:
+        started = time.perf_counter()
+        flights = [_Flight(m) for _, m in self._models]
+        plan = _RacePlan.build([m for _, m in self._models], self._top_k, self._stagger_ms)
+        # Reserves wait on their gate; ``release`` opens the next one in ranked order.
+        gates = [asyncio.Event() for _ in plan.order]
+        launched = 0
+
+        def release() -> None:
+            nonlocal launched
+            if launched < len(gates):
+                gates[launched].set()
+                launched += 1
+
+        for _ in range(plan.k):
+            release()
+
+        async def attempt(rank: int) -> ParallelItem:
+            await gates[rank].wait()
+            i = plan.order[rank]
+            ms, m = self._models[i]
+            item = await self._ainvoke(ms, m, prompt, overrides, cancel_event, flights[i])
+            if not item.ok:
+                release()  # keep k candidates running
+                raise _Failed(item)
+            return item
+
+        async def stagger() -> None:
+            while launched < len(gates):
+                await asyncio.sleep(plan.stagger_s or 0.0)
+                release()
+
+        stagger_task = asyncio.ensure_future(stagger()) if plan.stagger_s is not None else None
+        tasks = [asyncio.ensure_future(attempt(r)) for r in range(len(plan.order))]
+        rank_of = {task: r for r, task in enumerate(tasks)}
+        rank: Optional[int] = None
+        winner: Optional[ParallelItem] = None
+        failures: Dict[int, BaseException] = {}
+        stopped = False
+        poll = _CANCEL_POLL_S if cancel_event is not None else None
+        pending = set(tasks)
+        # The losers still running when the winner arrives (or ``cancel_event`` is
+        # set) are cancelled (their HTTP requests closed) and awaited before this
+        # returns.
+        try:
+            while pending and winner is None:
+                if cancel_event is not None and cancel_event.is_set():
+                    stopped = True
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=poll, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=rank_of.__getitem__):
+                    exc = task.exception()
+                    if exc is not None:
+                        failures[rank_of[task]] = exc
+                    elif winner is None:
+                        rank, winner = rank_of[task], task.result()
+        finally:
+            if stagger_task is not None:
+                stagger_task.cancel()
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        by_index: Dict[int, ParallelItem] = {}
+        for r, e in failures.items():
+            i = plan.order[r]
+            by_index[i] = e.item if isinstance(e, _Failed) else ParallelItem(
+                provider=_parse_model(self._model_strings[i])[0],
+                model=self._model_strings[i],
+                error=f"{type(e).__name__}: {e}",
+            )
+        if stopped:
+            for task in pending:
+                i = plan.order[rank_of[task]]
+                if flights[i].cut_ms is not None:  # in flight when cancelled, not a held reserve
+                    by_index[i] = _cancelled_item(self._model_strings[i], flights[i])
+        if rank is not None and winner is not None:
+            by_index[plan.order[rank]] = winner
+        items = [by_index[i] for i in sorted(by_index)]
+        cut = _cut_stats(flights) if winner is not None or stopped else None
+        trace = _trace("race", self._model_strings, items, started, cut)
+        trace.update(plan.trace(self._model_strings, launched))
+        return ParallelResult(
+            text=winner.result.text if winner is not None and winner.result is not None else None,
+            results=items,
+            errors=[it for it in items if not it.ok],
+            winner=winner,
+            trace=trace,
+        )
 
 
 def parallel(
@@ -317,6 +1192,11 @@ def parallel(
     judge: Optional[str] = None,
     max_workers: Optional[int] = None,
     cancel_event: Optional[threading.Event] = None,
+    executor: Optional[FanoutExecutor] = None,
+    quorum: Optional[int] = None,
+    key: Optional[Callable[[str], Any]] = None,
+    top_k: Optional[int] = None,
+    stagger_ms: Optional[float] = None,
     **model_kwargs: Any,
 ) -> Parallel:
     """Fan a single prompt out to multiple models concurrently.
@@ -327,6 +1207,17 @@ def parallel(
         - ``"compare"`` : run all; ``text`` is a readable side-by-side of every answer.
         - ``"judge"``   : run all candidates, then a ``judge`` model picks or synthesizes
           the best answer (``text``/``winner``); candidates stay in ``results``.
+        - ``"consensus"``: return as soon as ``quorum`` answers agree (default: a strict
+          majority) and cancel the rest. Answers agree when ``key(text)`` is equal;
+          the default key is the case-folded, whitespace-normalized text. Repeat a
+          model string to sample one model N times. ``trace`` gains ``quorum``,
+          ``consensus``, ``votes``, ``agreement`` and ``calls_saved``.
+
+    Adaptive race: with ``top_k`` and/or ``stagger_ms``, ``race`` ranks the models by
+    their recent latency and error rate (``slimx.stats``; unmeasured models first)
+    and starts only the ``top_k`` fastest (default 1). The others are held back: one
+    starts whenever a running call fails, and one more every ``stagger_ms`` while
+    nothing has won. ``trace`` gains ``race_order`` and ``race_started``.
 
     Example:
         >>> m = parallel(["google:gemini-3.5-flash", "openai:gpt-4.1-nano"])
@@ -337,10 +1228,19 @@ def parallel(
     Extra keyword arguments (e.g. ``temperature``, ``timeout``, ``retries``) are
     forwarded to each underlying model.
 
-    Cooperative cancellation: pass ``cancel_event`` (a ``threading.Event``) here or per
-    call (``p(prompt, cancel_event=evt)``). Once set, no NEW model call starts — pending
-    items return ``cancelled=True`` with an explanatory ``error`` — and judge synthesis is
-    skipped. An already-in-flight provider request is not aborted mid-HTTP.
+    Calls run on the process-wide ``FanoutExecutor`` (``slimx.utils.executor``) unless
+    ``executor=`` injects another (e.g. one with ``provider_limits``); ``max_workers``
+    gives this ensemble a private executor of that size instead. Either way the
+    threads outlive the call. Each item's ``queue_ms`` is its wait for a worker,
+    kept apart from its ``elapsed_ms``.
+
+    Cancellation: pass ``cancel_event`` (a ``threading.Event``) here or per call
+    (``p(prompt, cancel_event=evt)``). Once set, no new model call starts, requests
+    already in flight are aborted (their connections are closed), and judge synthesis
+    is skipped; the affected items return ``cancelled=True`` with an explanatory
+    ``error``. The losers of a ``race`` are aborted the same way. What was cut off is
+    counted in ``trace`` (``abandoned_count``, ``connections_closed``,
+    ``time_saved_ms``).
     """
     return Parallel(
         models,
@@ -348,5 +1248,56 @@ def parallel(
         judge=judge,
         max_workers=max_workers,
         cancel_event=cancel_event,
+        executor=executor,
+        quorum=quorum,
+        key=key,
+        top_k=top_k,
+        stagger_ms=stagger_ms,
+        **model_kwargs,
+    )
+
+
+
+def aparallel(
+    models: Sequence[str],
+    *,
+    mode: str = "all",
+    judge: Optional[str] = None,
+    model_timeout: Union[float, Mapping[str, float], None] = None,
+    cancel_event: Optional[Any] = None,
+    quorum: Optional[int] = None,
+    key: Optional[Callable[[str], Any]] = None,
+    top_k: Optional[int] = None,
+    stagger_ms: Optional[float] = None,
+    **model_kwargs: Any,
+) -> AsyncParallel:
+    """Async sibling of :func:`parallel`, built on ``AsyncModel`` and asyncio tasks.
+
+    Same modes and the same ``ParallelResult``; every call is a task on the running
+    event loop, so a process can hold thousands of fan-outs without a thread each.
+
+    Example:
+        >>> ens = aparallel(["openai:gpt-4.1-nano", "anthropic:claude-haiku-4-5"], mode="race")
+        >>> res = await ens("Explain SlimX in one paragraph.")
+
+    ``model_timeout`` bounds each candidate call in seconds: one value for every
+    model, or a mapping keyed by model string. A call that runs over becomes an item
+    with a ``ProviderTimeoutError`` error. In ``race`` mode the losers are cancelled
+    as soon as a model succeeds. ``cancel_event`` (a ``threading.Event`` or
+    ``asyncio.Event``, here or per call) cancels the calls still running and skips
+    judge synthesis. The ``cancel_event`` kwarg is never forwarded to a model.
+    ``top_k`` / ``stagger_ms`` hold back the historically slower models in ``race``
+    mode, as in :func:`parallel`.
+    """
+    return AsyncParallel(
+        models,
+        mode=mode,
+        judge=judge,
+        model_timeout=model_timeout,
+        cancel_event=cancel_event,
+        quorum=quorum,
+        key=key,
+        top_k=top_k,
+        stagger_ms=stagger_ms,
         **model_kwargs,
     )
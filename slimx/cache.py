@@ -0,0 +1,194 @@
+"""Exact-match response cache.
+
+``ResponseCache`` stores model responses keyed by a canonical hash of the request:
+provider, endpoint, model, messages (media as SHA-256 digests), tools, temperature,
+``max_tokens``, ``response_format``, ``extra``, and ``tool_choice``,
+``previous_response_id`` and ``image_generation`` when set. A ``Client`` given a cache checks
+it before every model request, including each step of the auto tool loop. A hit is
+served without a network call. Tools still run, because only model responses are
+cached.
+
+Two tiers:
+
+- memory: an LRU of ``maxsize`` entries;
+- disk (optional, ``path=``): a SQLite file that outlives the process and can be
+  shared by the processes of one machine.
+
+``ttl`` (seconds) expires entries in both tiers. A hit is returned as a new
+``Result``, so callers may mutate it freely. Streams, and responses carrying
+generated images, are not cached.
+
+An exact-match cache returns the same answer for the same request, whatever the
+``temperature``: use it where that is what you want (evals, temperature-0 prompts).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .record import CallRecord
+from .types import Result
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+
+
+def _digest(data: bytes) -> Dict[str, str]:
+    return {"sha256": hashlib.sha256(data).hexdigest()}
+
+
+def _canonical(obj: Any) -> Any:
+    """``obj`` with bytes and base64 media replaced by their digests."""
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, (bytes, bytearray)):
+        return _digest(bytes(obj))
+    if isinstance(obj, str) and obj.startswith("data:") and ";base64," in obj:
+        head, b64 = obj.split(";base64,", 1)
+        return {"media": head[5:], **_digest(b64.encode())}
+    return obj
+
+
+def request_key(snapshot: Dict[str, Any], *, base_url: str = "", tools: Sequence[Any] = ()) -> str:
+    """The cache key of a request: a SHA-256 of its canonical JSON.
+
+    ``snapshot`` is the request as ``Result.request`` records it
+    (``Client._request_snapshot``); ``tools`` are ``ToolSpec``s.
+    """
+    body = {
+        "request": _canonical(snapshot),
+        "base_url": base_url.rstrip("/"),
+        "tools": [{"name": t.name, "description": t.description, "parameters": t.parameters} for t in tools],
+    }
+    encoded = json.dumps(body, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _dump(res: Result) -> str:
+    record = CallRecord.from_result(res)
+    return json.dumps({"response": record.response, "raw": record.raw}, ensure_ascii=False, default=_json_default)
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(bytes(obj)).decode("ascii")
+    return str(obj)
+
+
+def _load(value: str) -> Result:
+    stored = json.loads(value)
+    record = CallRecord(slimx_version="", provider="", model="", response=stored["response"], raw=stored.get("raw"))
+    return record.to_result()
+
+
+class ResponseCache:
+    """An in-memory LRU with an optional SQLite tier (see module docs).
+
+    Args:
+        maxsize: Entries kept in memory (least recently used dropped first).
+        ttl: Seconds an entry stays valid (``None``: until evicted).
+        path: SQLite file for the disk tier (``None``: memory only).
+    """
+
+    def __init__(self, maxsize: int = 1024, *, ttl: Optional[float] = None, path: Optional[str] = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_SCHEMA)
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+
+    def get(self, key: str) -> Optional[Result]:
+        """The stored response for ``key`` as a new ``Result``, or ``None``."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._fresh(entry[0], now):
+                self._memory.move_to_end(key)
+                self._stats["hits"] += 1
+                return _load(entry[1])
+            if entry is not None:
+                del self._memory[key]
+            row = None
+            if self._db is not None:
+                row = self._db.execute("SELECT value, stored_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or not self._fresh(row[1], now):
+                self._stats["misses"] += 1
+                return None
+            self._remember(key, row[1], row[0])
+            self._stats["hits"] += 1
+            self._stats["disk_hits"] += 1
+            return _load(row[0])
+
+    def set(self, key: str, res: Result) -> None:
+        """Store ``res`` (its text, tool calls, usage, data and raw payload).
+
+        A result carrying generated images is not stored: a hit could not give
+        the images back.
+        """
+        if res.images:
+            return
+        value = _dump(res)
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, stored_at) VALUES (?, ?, ?)", (key, value, now)
+                )
+            self._stats["stores"] += 1
+
+    async def aget(self, key: str) -> Optional[Result]:
+        """``get`` for async callers; disk lookups run on a worker thread."""
+        if self._db is None:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, res: Result) -> None:
+        if self._db is None:
+            self.set(key, res)
+            return
+        await asyncio.to_thread(self.set, key, res)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and store counts since creation, and the memory tier's size."""
+        with self._lock:
+            return {**self._stats, "size": len(self._memory)}
+
+    def clear(self) -> None:
+        """Drop every entry, on disk too."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _fresh(self, stored_at: float, now: float) -> bool:
+        return self.ttl is None or now - stored_at < self.ttl
+
+    def _remember(self, key: str, stored_at: float, value: str) -> None:
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
@@ -1,8 +1,85 @@
+from typing import Any, Dict, List, Mapping, Optional
+
+
 class SlimXError(Exception): ...
 class ProviderError(SlimXError): ...
 class ProviderAuthError(ProviderError): ...
-class ProviderRateLimitError(ProviderError): ...
+
+
+class ProviderRateLimitError(ProviderError):
+    """A 429. ``retry_after`` is the server's own wait hint in seconds (from
+    ``Retry-After`` or the provider's rate-limit reset headers), ``None`` if it sent
+    none; ``headers`` keeps the raw rate-limit headers for inspection."""
+
+    def __init__(
+        self,
+        message: str = "",
+        *,
+        retry_after: Optional[float] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.headers = dict(headers or {})
+
+
+class ProviderServerError(ProviderError):
+    """A 5xx: the provider failed (or is overloaded), not the request."""
+
+
 class ProviderTimeoutError(ProviderError): ...
+
+
+class CircuitOpenError(ProviderError):
+    """Raised without sending a request: the circuit for this endpoint is open
+    because recent calls kept failing. ``retry_in`` is the number of seconds until a
+    trial call is allowed through again."""
+
+    def __init__(self, message: str = "", *, provider: str = "", base_url: str = "", retry_in: float = 0.0):
+        super().__init__(message)
+        self.provider = provider
+        self.base_url = base_url
+        self.retry_in = retry_in
+
+
+class RateLimitExceeded(ProviderError):
+    """Raised without sending a request: the client-side ``RateLimiter`` has no room
+    for it within the wait allowed (``max_wait``, or what is left of the call's
+    deadline). ``retry_in`` is the number of seconds until it would fit."""
+
+    def __init__(self, message: str = "", *, key: Any = None, retry_in: float = 0.0):
+        super().__init__(message)
+        self.key = key
+        self.retry_in = retry_in
+
+
+class FallbackError(ProviderError):
+    """Every model in a fallback chain failed. ``attempts`` lists each try
+    (``model``, ``ok``, ``elapsed_ms``, ``error``) in order."""
+
+    def __init__(self, message: str = "", *, attempts: Optional[List[Dict[str, Any]]] = None):
+        super().__init__(message)
+        self.attempts = list(attempts or [])
+
+
 class UnsupportedModalityError(ProviderError): ...
+class DeadlineExceeded(SlimXError):
+    """A call ran out of its ``deadline`` / ``total_timeout`` budget, across retries
+    and tool-loop steps. ``trace`` is the trace of the work done so far."""
+
+    def __init__(self, message: str = "", *, trace: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.trace = dict(trace or {})
+
+
+class CallCancelled(SlimXError):
+    """The call was cancelled (e.g. it lost a ``parallel`` race) while its request
+    was in flight; the connection was closed rather than left running."""
+
+
 class ToolExecutionError(SlimXError): ...
 class SchemaError(SlimXError): ...
+
+
+class ToolTimeoutError(ToolExecutionError):
+    """A tool ran past the ``timeout`` it declared with ``@tool(timeout=...)``."""
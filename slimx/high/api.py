@@ -1,12 +1,21 @@
-from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Union
+import time
+from typing import Any, Dict, Generator, Iterable, Mapping, Optional, Sequence, Union
 
+from .._map import DEFAULT_MAP_CONCURRENCY, AsyncMapRun, MapItem, Progress, amap_calls, map_calls
+from ..cache import ResponseCache
 from ..messages import Message
 from ..types import ImageGenerationOptions, ImageInput, Result, StreamEvent
 from ..errors import SchemaError, UnsupportedModalityError
 from ..schema import parse_json, schema_for, coerce_dataclass
-from ..tooling import ToolSpec
+from ..tooling import DEFAULT_TOOL_CONCURRENCY, ToolSpec
 from ..providers import get_provider
 from ..low import Client, ChatRequest, ImageEditRequest, ImageRequest
+from ..utils.breaker import DEFAULT_BREAKER, CircuitBreaker
+from ..utils.concurrency import AdaptiveConcurrency
+from ..utils.hedge import HedgeAfter
+from ..utils.ratelimit import RateLimiter
+from ..utils.retry import RetryPolicy
+from ..utils.singleflight import SingleFlight
 
 
 def _parse_model(model: str):
@@ -100,6 +109,17 @@ def _chat_request(
     )
 
 
+def _pop_deadline(overrides: Dict[str, Any]) -> Optional[float]:
+    """Per-call ``deadline=`` (a ``time.monotonic()`` value) and ``total_timeout=``
+    (seconds) overrides, folded into one absolute deadline."""
+    deadline = overrides.pop("deadline", None)
+    total_timeout = overrides.pop("total_timeout", None)
+    if total_timeout is not None:
+        until = time.monotonic() + total_timeout
+        deadline = until if deadline is None else min(deadline, until)
+    return deadline
+
+
 def _normalize_image_inputs(images: Any) -> list:
     """Coerce edit_image() source(s) into ImageInput list (bytes / ImagePart / dict)."""
     from ..content import ImagePart
@@ -167,19 +187,45 @@ class Model:
         max_tokens: Optional[int] = None,
         tools: Optional[Sequence[ToolSpec]] = None,
         tool_runtime: str = "none",
+        tool_concurrency: int = DEFAULT_TOOL_CONCURRENCY,
         timeout: Optional[float] = None,
         retries: int = 2,
         provider_kwargs: Optional[Dict[str, Any]] = None,
         hooks: Optional[Mapping[str, Any]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = DEFAULT_BREAKER,
+        hedge_after_ms: HedgeAfter = None,
+        hedge_model: Optional[str] = None,
+        total_timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: Union[bool, SingleFlight] = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrency] = None,
     ):
         provider_name, model_name = _parse_model(model)
         provider = get_provider(provider_name, async_mode=False, **(provider_kwargs or {}))
-        self._client = Client(provider, timeout=timeout, retries=retries, hooks=hooks)
+        self._client = Client(
+            provider,
+            timeout=timeout,
+            retries=retries,
+            hooks=hooks,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hedge_after_ms=hedge_after_ms,
+            hedge_model=hedge_model,
+            total_timeout=total_timeout,
+            cache=cache,
+            coalesce=coalesce,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+        )
         self._model = model_name
         self._temperature = temperature
         self._max_tokens = max_tokens
         self._tools = list(tools or [])
         self._tool_runtime = tool_runtime
+        # How many tool calls of one model turn the auto runtime runs at once.
+        self._tool_concurrency = tool_concurrency
 
     @property
     def capabilities(self):
@@ -199,7 +245,40 @@ class Model:
             self._model, prompt, overrides,
             temperature=self._temperature, max_tokens=self._max_tokens,
         )
-        return self._client.chat(req, tools=self._tools, tool_runtime=self._tool_runtime)
+        return self._client.chat(
+            req,
+            tools=self._tools,
+            tool_runtime=self._tool_runtime,
+            tool_concurrency=self._tool_concurrency,
+            deadline=_pop_deadline(overrides),
+        )
+
+    def map(
+        self,
+        prompts: Iterable[PromptInput],
+        *,
+        concurrency: int = DEFAULT_MAP_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[Progress] = None,
+        checkpoint: Optional[str] = None,
+        **overrides: Any,
+    ) -> Generator[MapItem, None, None]:
+        """Call the model once per prompt, ``concurrency`` calls at a time.
+
+        Yields a ``MapItem`` per prompt, in input order or (``ordered=False``) as the
+        calls complete; a failed call's item carries its ``error`` instead of
+        raising. ``on_progress(item, done, total)`` reports each item, and
+        ``checkpoint=`` (a JSONL path) lets a rerun skip the prompts already
+        answered. ``overrides`` apply to every call, as in ``__call__``.
+        """
+        return map_calls(
+            lambda prompt: self(prompt, **overrides),
+            prompts,
+            concurrency=concurrency,
+            ordered=ordered,
+            on_progress=on_progress,
+            checkpoint=checkpoint,
+        )
 
     def stream(self, prompt: PromptInput, **overrides: Any) -> Iterable[StreamEvent]:
         req = _chat_request(
@@ -210,6 +289,7 @@ class Model:
 
     def json(self, prompt: PromptInput, *, schema: Any, repair: int = 0, **overrides: Any) -> Result:
         schema_dict, schema_type = _json_schema_parts(schema)
+        deadline = _pop_deadline(overrides)  # one budget across every repair attempt
         messages = [Message.system(_json_system_prompt(schema_dict))] + _messages_from(prompt, overrides)
         for attempt in range(repair + 1):
             req = ChatRequest(
@@ -219,7 +299,13 @@ class Model:
                 max_tokens=overrides.get("max_tokens", self._max_tokens),
                 response_format="json_object",
             )
-            res = self._client.chat(req, tools=self._tools, tool_runtime=self._tool_runtime)
+            res = self._client.chat(
+                req,
+                tools=self._tools,
+                tool_runtime=self._tool_runtime,
+                tool_concurrency=self._tool_concurrency,
+                deadline=deadline,
+            )
             try:
                 res.data = _parse_into_schema(res.text, schema_type)
                 return res
@@ -257,6 +343,16 @@ class Model:
         overrides["image"] = image
         return self._client.edit_image(_image_edit_request(self._model, instruction, overrides))
 
+    def close(self) -> None:
+        """Release the provider's pooled HTTP connections (idempotent)."""
+        self._client.close()
+
+    def __enter__(self) -> "Model":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
 
 class AsyncModel:
     def __init__(
@@ -267,19 +363,45 @@ class AsyncModel:
         max_tokens: Optional[int] = None,
         tools: Optional[Sequence[ToolSpec]] = None,
         tool_runtime: str = "none",
+        tool_concurrency: int = DEFAULT_TOOL_CONCURRENCY,
         timeout: Optional[float] = None,
         retries: int = 2,
         provider_kwargs: Optional[Dict[str, Any]] = None,
         hooks: Optional[Mapping[str, Any]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = DEFAULT_BREAKER,
+        hedge_after_ms: HedgeAfter = None,
+        hedge_model: Optional[str] = None,
+        total_timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: Union[bool, SingleFlight] = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrency] = None,
     ):
         provider_name, model_name = _parse_model(model)
         provider = get_provider(provider_name, async_mode=True, **(provider_kwargs or {}))
-        self._client = Client(provider, timeout=timeout, retries=retries, hooks=hooks)
+        self._client = Client(
+            provider,
+            timeout=timeout,
+            retries=retries,
+            hooks=hooks,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hedge_after_ms=hedge_after_ms,
+            hedge_model=hedge_model,
+            total_timeout=total_timeout,
+            cache=cache,
+            coalesce=coalesce,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+        )
         self._model = model_name
         self._temperature = temperature
         self._max_tokens = max_tokens
         self._tools = list(tools or [])
         self._tool_runtime = tool_runtime
+        # How many tool calls of one model turn the auto runtime runs at once.
+        self._tool_concurrency = tool_concurrency
 
     @property
     def capabilities(self):
@@ -299,7 +421,34 @@ class AsyncModel:
             self._model, prompt, overrides,
             temperature=self._temperature, max_tokens=self._max_tokens,
         )
-        return await self._client.achat(req, tools=self._tools, tool_runtime=self._tool_runtime)
+        return await self._client.achat(
+            req,
+            tools=self._tools,
+            tool_runtime=self._tool_runtime,
+            tool_concurrency=self._tool_concurrency,
+            deadline=_pop_deadline(overrides),
+        )
+
+    def amap(
+        self,
+        prompts: Iterable[PromptInput],
+        *,
+        concurrency: int = DEFAULT_MAP_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[Progress] = None,
+        checkpoint: Optional[str] = None,
+        **overrides: Any,
+    ) -> AsyncMapRun:
+        """Async ``Model.map``: ``async for item in am.amap(prompts)`` streams the
+        items, ``await am.amap(prompts)`` returns them all as a list."""
+        return amap_calls(
+            lambda prompt: self(prompt, **overrides),
+            prompts,
+            concurrency=concurrency,
+            ordered=ordered,
+            on_progress=on_progress,
+            checkpoint=checkpoint,
+        )
 
     async def astream(self, prompt: PromptInput, **overrides: Any):
         req = _chat_request(
@@ -311,6 +460,7 @@ class AsyncModel:
 
     async def json(self, prompt: PromptInput, *, schema: Any, repair: int = 0, **overrides: Any) -> Result:
         schema_dict, schema_type = _json_schema_parts(schema)
+        deadline = _pop_deadline(overrides)  # one budget across every repair attempt
         messages = [Message.system(_json_system_prompt(schema_dict))] + _messages_from(prompt, overrides)
         for attempt in range(repair + 1):
             req = ChatRequest(
@@ -320,7 +470,13 @@ class AsyncModel:
                 max_tokens=overrides.get("max_tokens", self._max_tokens),
                 response_format="json_object",
             )
-            res = await self._client.achat(req, tools=self._tools, tool_runtime=self._tool_runtime)
+            res = await self._client.achat(
+                req,
+                tools=self._tools,
+                tool_runtime=self._tool_runtime,
+                tool_concurrency=self._tool_concurrency,
+                deadline=deadline,
+            )
             try:
                 res.data = _parse_into_schema(res.text, schema_type)
                 return res
@@ -351,6 +507,16 @@ class AsyncModel:
         overrides["image"] = image
         return await self._client.aedit_image(_image_edit_request(self._model, instruction, overrides))
 
+    async def aclose(self) -> None:
+        """Release the provider's pooled HTTP connections (idempotent)."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncModel":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
 
 def llm(model: str, **kwargs: Any) -> Model:
     return Model(model, **kwargs)
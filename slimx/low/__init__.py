@@ -13,14 +13,19 @@ _LAZY: dict[str, tuple[str, str]] = {
     "ChatRequest": ("slimx.low.types", "ChatRequest"),
     "ImageRequest": ("slimx.low.types", "ImageRequest"),
     "ImageEditRequest": ("slimx.low.types", "ImageEditRequest"),
+    "RetryPolicy": ("slimx.utils.retry", "RetryPolicy"),
+    "RetryBudget": ("slimx.utils.retry", "RetryBudget"),
+    "CircuitBreaker": ("slimx.utils.breaker", "CircuitBreaker"),
 }
 
-__all__ = ["Client", "ChatRequest", "ImageRequest", "ImageEditRequest"]
+__all__ = ["Client", "ChatRequest", "ImageRequest", "ImageEditRequest", "RetryPolicy", "RetryBudget", "CircuitBreaker"]
 
 
 if TYPE_CHECKING:
     from .client import Client
     from .types import ChatRequest, ImageEditRequest, ImageRequest
+    from ..utils.breaker import CircuitBreaker
+    from ..utils.retry import RetryBudget, RetryPolicy
 
 
 def __getattr__(name: str) -> Any:
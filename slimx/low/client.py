@@ -1,14 +1,71 @@
+import asyncio
 import json
 import time
-from typing import Callable, Iterable, Mapping, Optional, Sequence, Union
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+from .. import stats
+from ..cache import ResponseCache, request_key
+from ..errors import CircuitOpenError, DeadlineExceeded
 from ..messages import Message
-from ..types import Result, StreamEvent
-from ..tooling import ToolSpec, execute_tool
-from ..utils.retry import retry, async_retry
+from ..types import Result, StreamEvent, ToolCall, Usage
+from ..tooling import DEFAULT_TOOL_CONCURRENCY, ToolRun, ToolSpec, aexecute_tools, execute_tools
+from ..utils.breaker import DEFAULT_BREAKER, NEUTRAL_ERRORS, CircuitBreaker
+from ..utils.concurrency import AdaptiveConcurrency, Slot
+from ..utils.hedge import (
+    HedgeAfter,
+    ahedged_call,
+    atimed,
+    check_hedge_after,
+    hedged_call,
+    new_hedge_stats,
+    record_latency,
+    resolve_delay,
+    timed,
+)
+from ..utils.ratelimit import RateLimiter, Ticket
+from ..utils.retry import RetryPolicy, new_retry_stats
+from ..utils.singleflight import DEFAULT_GROUP, SingleFlight
+from ..providers._http import track_connections
 from ..providers.base import Provider
 from .types import ChatRequest, ImageEditRequest, ImageRequest
 
 Hooks = Mapping[str, Callable[[dict], None]]
+_AnyRequest = Union[ChatRequest, ImageRequest, ImageEditRequest]
+
+
+@dataclass
+class _CallState:
+    """Per-call counters that end up in `Result.trace` (and failure events)."""
+
+    connections: dict
+    retry: Dict[str, Any] = field(default_factory=new_retry_stats)
+    circuit: Optional[str] = None  # breaker state seen by the last attempt
+    hedge: Dict[str, Any] = field(default_factory=new_hedge_stats)
+    deadline: Optional[float] = None  # time.monotonic() by which the call must end
+    budget_ms: Optional[int] = None
+    steps: int = 0
+    tools: List[Dict[str, Any]] = field(default_factory=list)  # one entry per tool call run
+    cache_hits: int = 0
+    cache_misses: int = 0
+    coalesced: int = 0  # model requests answered by an identical one already in flight
+    rate_limit_wait_s: float = 0.0  # time spent waiting on the client-side rate limiter
+    concurrency_wait_s: float = 0.0  # time spent waiting for a concurrency slot
+    concurrency_limit: Optional[int] = None  # the adaptive limit after the last attempt
+
+
+@dataclass
+class _StreamTiming:
+    """Time to the first event and in total, for `slimx.stats`."""
+
+    started: float = field(default_factory=time.perf_counter)
+    ttfb_ms: Optional[float] = None
+
+    def event(self) -> None:
+        if self.ttfb_ms is None:
+            self.ttfb_ms = self.elapsed_ms()
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
 
 
 class Client:
@@ -19,56 +76,128 @@ class Client:
         timeout: Optional[float] = None,
         retries: int = 2,
         hooks: Optional[Hooks] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = DEFAULT_BREAKER,
+        hedge_after_ms: HedgeAfter = None,
+        hedge_model: Optional[str] = None,
+        total_timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: Union[bool, SingleFlight] = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrency] = None,
     ):
         self.provider = provider
         self.timeout = timeout
-        self.retries = retries
+        # Budget for a whole logical call (all retries, backoff and tool steps);
+        # `timeout` still bounds each HTTP attempt.
+        self.total_timeout = total_timeout
+        # `retries=` is shorthand for the default policy; an explicit policy wins.
+        self.retry_policy = retry_policy or RetryPolicy(retries=retries)
+        self.retries = self.retry_policy.retries
         self.hooks = hooks or {}
         self.provider_name = getattr(provider, "name", "provider")
-
-    def chat(self, req: ChatRequest, *, tools: Sequence[ToolSpec]=(), tool_runtime: str="none", max_steps: int=6) -> Result:
+        # Shared per (provider, base_url); ``None`` turns the breaker off.
+        self.circuit_breaker = circuit_breaker
+        self._endpoint = getattr(provider, "base_url", "") or ""
+        # Hedged chat requests: milliseconds, or "auto" for the model's observed p95.
+        self.hedge_after_ms = check_hedge_after(hedge_after_ms)
+        self.hedge_model = hedge_model
+        # Exact-match response cache, checked before every model request.
+        self.cache = cache
+        # Identical requests in flight at once share one call: True joins the
+        # process-wide group, a SingleFlight instance a group of your own.
+        self.single_flight: Optional[SingleFlight] = DEFAULT_GROUP if coalesce is True else (coalesce or None)
+        # Client-side RPM/TPM buckets; share one limiter across clients on the same quota.
+        self.rate_limiter = rate_limiter
+        # AIMD cap on attempts in flight; share one per endpoint.
+        self.concurrency_limiter = concurrency_limiter
+
+    def chat(
+        self,
+        req: ChatRequest,
+        *,
+        tools: Sequence[ToolSpec]=(),
+        tool_runtime: str="none",
+        tool_concurrency: int=DEFAULT_TOOL_CONCURRENCY,
+        max_steps: int=6,
+        deadline: Optional[float]=None,
+        total_timeout: Optional[float]=None,
+    ) -> Result:
         tool_map = {t.name: t for t in tools}
         started = time.perf_counter()
         snapshot = self._request_snapshot(req)
         self._fire("before_call", {"phase": "before_call", "provider": self.provider_name, "model": req.model})
 
-        try:
-            res = retry(lambda: self.provider.chat(req, tools=tools, timeout=self.timeout), retries=self.retries)
-
-            if tool_runtime != "auto" or not res.tool_calls or not tool_map:
-                return self._finish(res, req=req, started=started, steps=0, snapshot=snapshot)
-
-            # Auto tool loop (best-effort cross-provider)
-            messages = list(req.messages)
-            steps = 0
-            while res.tool_calls and steps < max_steps:
-                steps += 1
-                messages.append(Message.assistant("", tool_calls=[_tool_call_to_provider_dict(tc) for tc in res.tool_calls]))
-                for tc in res.tool_calls:
-                    spec = tool_map.get(tc.name)
-                    if not spec:
-                        continue
-                    out = execute_tool(spec, tc.arguments)
-                    messages.append(Message.tool(content=json.dumps(out), tool_call_id=tc.id or tc.name))
-
-                req = ChatRequest(
-                    model=req.model,
-                    messages=messages,
-                    temperature=req.temperature,
-                    max_tokens=req.max_tokens,
-                    response_format=req.response_format,
-                    extra=req.extra,
-                )
-                res = retry(lambda: self.provider.chat(req, tools=tools, timeout=self.timeout), retries=self.retries)
-                if not res.tool_calls:
-                    break
-            return self._finish(res, req=req, started=started, steps=steps, snapshot=snapshot)
-        except Exception as e:
-            self._fire_error(req, started, e)
-            raise
+        with track_connections() as conns:
+            call = self._new_call(conns, deadline, total_timeout)
+            try:
+                res = self._send(req, tools, call)
+
+                if tool_runtime != "auto" or not res.tool_calls or not tool_map:
+                    return self._finish(res, req=req, started=started, steps=0, snapshot=snapshot, call=call)
+
+                # Auto tool loop (best-effort cross-provider)
+                messages = list(req.messages)
+                steps = 0
+                while res.tool_calls and steps < max_steps:
+                    steps += 1
+                    call.steps = steps
+                    self._check_deadline(call)
+                    messages.append(Message.assistant("", tool_calls=[_tool_call_to_provider_dict(tc) for tc in res.tool_calls]))
+                    # Independent calls of one turn run concurrently; results keep their order.
+                    calls = [tc for tc in res.tool_calls if tc.name in tool_map]
+                    runs = execute_tools([(tool_map[tc.name], tc.arguments) for tc in calls], concurrency=tool_concurrency)
+                    messages.extend(self._tool_messages(calls, runs, call))
+
+                    req = ChatRequest(
+                        model=req.model,
+                        messages=messages,
+                        temperature=req.temperature,
+                        max_tokens=req.max_tokens,
+                        response_format=req.response_format,
+                        extra=req.extra,
+                    )
+                    res = self._send(req, tools, call)
+                    if not res.tool_calls:
+                        break
+                return self._finish(res, req=req, started=started, steps=steps, snapshot=snapshot, call=call)
+            except Exception as e:
+                err = self._deadline_error(e, req, started, call)
+                self._fire_error(req, started, err, call=call)
+                if err is e:
+                    raise
+                raise err from e
 
     def stream(self, req: ChatRequest, *, tools: Sequence[ToolSpec]=()) -> Iterable[StreamEvent]:
-        return self.provider.stream(req, tools=tools, timeout=self.timeout)
+        call = _CallState({})
+        limiter = self.rate_limiter
+        ticket = limiter.acquire(*self._rate_request(limiter, req)) if limiter is not None else None
+        slot: Optional[Slot] = None
+        try:
+            slot = self.concurrency_limiter.acquire() if self.concurrency_limiter is not None else None
+            self._admit(call)
+        except BaseException as e:
+            self._refund(ticket)
+            self._release_stream_slot(slot, call, e)
+            raise
+        timing = _StreamTiming()
+        usage: Optional[Usage] = None
+        try:
+            for ev in self.provider.stream(req, tools=tools, timeout=self.timeout):
+                timing.event()
+                usage = ev.usage or usage
+                yield ev
+        except BaseException as e:
+            if isinstance(e, Exception):
+                self._refund(ticket)
+            self._release_stream_slot(slot, call, e)
+            self._record(call, e)
+            self._record_stream(req.model, timing, e)
+            raise
+        self._settle(ticket, usage)
+        self._release_stream_slot(slot, call, None)
+        self._record(call, None)
+        self._record_stream(req.model, timing, None)
 
     def inspect(self, req: ChatRequest, *, tools: Sequence[ToolSpec]=(), stream: bool=False):
         """Dry-run: return the exact HTTP request the provider would send."""
@@ -82,120 +211,639 @@ class Client:
         started = time.perf_counter()
         snapshot = self._image_snapshot(req)
         self._fire("before_call", {"phase": "before_call", "provider": self.provider_name, "model": req.model})
-        try:
-            res = retry(lambda: self.provider.generate_image(req, timeout=self.timeout), retries=self.retries)
-            self._attach_trace(res, req=req, started=started, steps=0)
-            res.request = snapshot
-            self._fire("after_call", {**res.trace, "ok": True})
-            return res
-        except Exception as e:
-            self._fire_error(req, started, e)
-            raise
+        with track_connections() as conns:
+            call = self._new_call(conns)
+            try:
+                res = self.retry_policy.call(
+                    self._limited(self._throttled(self._guard(
+                        lambda: self.provider.generate_image(req, timeout=self._attempt_timeout(call)), call
+                    ), call), req, call),
+                    stats=call.retry,
+                    deadline=call.deadline,
+                )
+                self._attach_trace(res, req=req, started=started, steps=0, call=call)
+                res.request = snapshot
+                self._fire("after_call", {**res.trace, "ok": True})
+                return res
+            except Exception as e:
+                err = self._deadline_error(e, req, started, call)
+                self._fire_error(req, started, err, call=call)
+                if err is e:
+                    raise
+                raise err from e
 
     async def agenerate_image(self, req: ImageRequest) -> Result:
         started = time.perf_counter()
         snapshot = self._image_snapshot(req)
         self._fire("before_call", {"phase": "before_call", "provider": self.provider_name, "model": req.model})
-        try:
-            res = await async_retry(
-                lambda: self.provider.agenerate_image(req, timeout=self.timeout),
-                retries=self.retries,
-            )
-            self._attach_trace(res, req=req, started=started, steps=0)
-            res.request = snapshot
-            self._fire("after_call", {**res.trace, "ok": True})
-            return res
-        except Exception as e:
-            self._fire_error(req, started, e)
-            raise
+        with track_connections() as conns:
+            call = self._new_call(conns)
+            try:
+                res = await self.retry_policy.acall(
+                    self._alimited(self._athrottled(self._aguard(lambda: self._bounded(
+                        lambda: self.provider.agenerate_image(req, timeout=self._attempt_timeout(call)), call
+                    ), call), call), req, call),
+                    stats=call.retry,
+                    deadline=call.deadline,
+                )
+                self._attach_trace(res, req=req, started=started, steps=0, call=call)
+                res.request = snapshot
+                self._fire("after_call", {**res.trace, "ok": True})
+                return res
+            except Exception as e:
+                err = self._deadline_error(e, req, started, call)
+                self._fire_error(req, started, err, call=call)
+                if err is e:
+                    raise
+                raise err from e
 
     def edit_image(self, req: ImageEditRequest) -> Result:
         started = time.perf_counter()
         snapshot = self._edit_snapshot(req)
         self._fire("before_call", {"phase": "before_call", "provider": self.provider_name, "model": req.model})
-        try:
-            res = retry(lambda: self.provider.edit_image(req, timeout=self.timeout), retries=self.retries)
-            self._attach_trace(res, req=req, started=started, steps=0)
-            res.request = snapshot
-            self._fire("after_call", {**res.trace, "ok": True})
-            return res
-        except Exception as e:
-            self._fire_error(req, started, e)
-            raise
+        with track_connections() as conns:
+            call = self._new_call(conns)
+            try:
+                res = self.retry_policy.call(
+                    self._limited(self._throttled(self._guard(
+                        lambda: self.provider.edit_image(req, timeout=self._attempt_timeout(call)), call
+                    ), call), req, call),
+                    stats=call.retry,
+                    deadline=call.deadline,
+                )
+                self._attach_trace(res, req=req, started=started, steps=0, call=call)
+                res.request = snapshot
+                self._fire("after_call", {**res.trace, "ok": True})
+                return res
+            except Exception as e:
+                err = self._deadline_error(e, req, started, call)
+                self._fire_error(req, started, err, call=call)
+                if err is e:
+                    raise
+                raise err from e
 
     async def aedit_image(self, req: ImageEditRequest) -> Result:
         started = time.perf_counter()
         snapshot = self._edit_snapshot(req)
         self._fire("before_call", {"phase": "before_call", "provider": self.provider_name, "model": req.model})
-        try:
-            res = await async_retry(
-                lambda: self.provider.aedit_image(req, timeout=self.timeout),
-                retries=self.retries,
-            )
-            self._attach_trace(res, req=req, started=started, steps=0)
-            res.request = snapshot
-            self._fire("after_call", {**res.trace, "ok": True})
-            return res
-        except Exception as e:
-            self._fire_error(req, started, e)
-            raise
-
-    async def achat(self, req: ChatRequest, *, tools: Sequence[ToolSpec]=(), tool_runtime: str="none", max_steps: int=6) -> Result:
+        with track_connections() as conns:
+            call = self._new_call(conns)
+            try:
+                res = await self.retry_policy.acall(
+                    self._alimited(self._athrottled(self._aguard(lambda: self._bounded(
+                        lambda: self.provider.aedit_image(req, timeout=self._attempt_timeout(call)), call
+                    ), call), call), req, call),
+                    stats=call.retry,
+                    deadline=call.deadline,
+                )
+                self._attach_trace(res, req=req, started=started, steps=0, call=call)
+                res.request = snapshot
+                self._fire("after_call", {**res.trace, "ok": True})
+                return res
+            except Exception as e:
+                err = self._deadline_error(e, req, started, call)
+                self._fire_error(req, started, err, call=call)
+                if err is e:
+                    raise
+                raise err from e
+
+    async def achat(
+        self,
+        req: ChatRequest,
+        *,
+        tools: Sequence[ToolSpec]=(),
+        tool_runtime: str="none",
+        tool_concurrency: int=DEFAULT_TOOL_CONCURRENCY,
+        max_steps: int=6,
+        deadline: Optional[float]=None,
+        total_timeout: Optional[float]=None,
+    ) -> Result:
         started = time.perf_counter()
         snapshot = self._request_snapshot(req)
         self._fire("before_call", {"phase": "before_call", "provider": self.provider_name, "model": req.model})
 
+        with track_connections() as conns:
+            call = self._new_call(conns, deadline, total_timeout)
+            try:
+                res = await self._asend(req, tools, call)
+
+                tool_map = {t.name: t for t in tools}
+                if tool_runtime != "auto" or not res.tool_calls or not tool_map:
+                    return self._finish(res, req=req, started=started, steps=0, snapshot=snapshot, call=call)
+
+                messages = list(req.messages)
+                steps = 0
+                while res.tool_calls and steps < max_steps:
+                    steps += 1
+                    call.steps = steps
+                    self._check_deadline(call)
+                    messages.append(Message.assistant("", tool_calls=[_tool_call_to_provider_dict(tc) for tc in res.tool_calls]))
+                    calls = [tc for tc in res.tool_calls if tc.name in tool_map]
+                    runs = await aexecute_tools(
+                        [(tool_map[tc.name], tc.arguments) for tc in calls], concurrency=tool_concurrency
+                    )
+                    messages.extend(self._tool_messages(calls, runs, call))
+
+                    req = ChatRequest(
+                        model=req.model,
+                        messages=messages,
+                        temperature=req.temperature,
+                        max_tokens=req.max_tokens,
+                        response_format=req.response_format,
+                        extra=req.extra,
+                    )
+
+                    res = await self._asend(req, tools, call)
+
+                    if not res.tool_calls:
+                        break
+                return self._finish(res, req=req, started=started, steps=steps, snapshot=snapshot, call=call)
+            except Exception as e:
+                err = self._deadline_error(e, req, started, call)
+                self._fire_error(req, started, err, call=call)
+                if err is e:
+                    raise
+                raise err from e
+
+    async def astream(self, req: ChatRequest, *, tools: Sequence[ToolSpec]=()):
+        call = _CallState({})
+        limiter = self.rate_limiter
+        ticket = await limiter.aacquire(*self._rate_request(limiter, req)) if limiter is not None else None
+        slot: Optional[Slot] = None
         try:
-            res = await async_retry(
-                lambda: self.provider.achat(req, tools=tools, timeout=self.timeout),
-                retries=self.retries,
-            )
+            slot = await self.concurrency_limiter.aacquire() if self.concurrency_limiter is not None else None
+            self._admit(call)
+        except BaseException as e:
+            self._refund(ticket)
+            self._release_stream_slot(slot, call, e)
+            raise
+        timing = _StreamTiming()
+        usage: Optional[Usage] = None
+        try:
+            async for ev in self.provider.astream(req, tools=tools, timeout=self.timeout):
+                timing.event()
+                usage = ev.usage or usage
+                yield ev
+        except BaseException as e:
+            if isinstance(e, Exception):
+                self._refund(ticket)
+            self._release_stream_slot(slot, call, e)
+            self._record(call, e)
+            self._record_stream(req.model, timing, e)
+            raise
+        self._settle(ticket, usage)
+        self._release_stream_slot(slot, call, None)
+        self._record(call, None)
+        self._record_stream(req.model, timing, None)
 
-            tool_map = {t.name: t for t in tools}
-            if tool_runtime != "auto" or not res.tool_calls or not tool_map:
-                return self._finish(res, req=req, started=started, steps=0, snapshot=snapshot)
-
-            messages = list(req.messages)
-            steps = 0
-            while res.tool_calls and steps < max_steps:
-                steps += 1
-                messages.append(Message.assistant("", tool_calls=[_tool_call_to_provider_dict(tc) for tc in res.tool_calls]))
-                for tc in res.tool_calls:
-                    spec = tool_map.get(tc.name)
-                    if not spec:
-                        continue
-                    out = execute_tool(spec, tc.arguments)
-                    messages.append(Message.tool(content=json.dumps(out), tool_call_id=tc.id or tc.name))
-
-                req = ChatRequest(
-                    model=req.model,
-                    messages=messages,
-                    temperature=req.temperature,
-                    max_tokens=req.max_tokens,
-                    response_format=req.response_format,
-                    extra=req.extra,
-                )
+    # ---- lifecycle -------------------------------------------------------
 
-                res = await async_retry(
-                    lambda: self.provider.achat(req, tools=tools, timeout=self.timeout),
-                    retries=self.retries,
-                )
+    def close(self) -> None:
+        """Release the provider's pooled connections (idempotent)."""
+        self.provider.close()
 
-                if not res.tool_calls:
-                    break
-            return self._finish(res, req=req, started=started, steps=steps, snapshot=snapshot)
-        except Exception as e:
-            self._fire_error(req, started, e)
-            raise
+    def __enter__(self) -> "Client":
+        return self
 
-    async def astream(self, req: ChatRequest, *, tools: Sequence[ToolSpec]=()):
-        async for ev in self.provider.astream(req, tools=tools, timeout=self.timeout):
-            yield ev
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Release the provider's pooled connections, including the running loop's
+        ``AsyncClient`` (idempotent)."""
+        await self.provider.aclose()
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
 
     # ---- internals -------------------------------------------------------
 
-    def _finish(self, res: Result, *, req: ChatRequest, started: float, steps: int, snapshot: dict) -> Result:
-        self._attach_trace(res, req=req, started=started, steps=steps)
+    def _guard(self, fn: Callable[[], Result], call: _CallState) -> Callable[[], Result]:
+        """Wrap one attempt in the circuit breaker (admit, run, record)."""
+        if self.circuit_breaker is None:
+            return fn
+
+        def attempt() -> Result:
+            self._check_deadline(call)  # a spent deadline sends nothing: no trial used
+            self._admit(call)
+            try:
+                res = fn()
+            except BaseException as e:
+                self._record(call, e)
+                raise
+            self._record(call, None)
+            return res
+
+        return attempt
+
+    def _aguard(self, fn: Callable[[], Awaitable[Result]], call: _CallState) -> Callable[[], Awaitable[Result]]:
+        if self.circuit_breaker is None:
+            return fn
+
+        async def attempt() -> Result:
+            self._check_deadline(call)  # a spent deadline sends nothing: no trial used
+            self._admit(call)
+            try:
+                res = await fn()
+            except BaseException as e:
+                self._record(call, e)
+                raise
+            self._record(call, None)
+            return res
+
+        return attempt
+
+    def _new_call(
+        self, conns: dict, deadline: Optional[float] = None, total_timeout: Optional[float] = None
+    ) -> _CallState:
+        """Per-call state, with the tightest of ``deadline`` (a ``time.monotonic()``
+        value), the per-call ``total_timeout`` and the client's ``total_timeout``."""
+        call = _CallState(conns)
+        now = time.monotonic()
+        for budget in (total_timeout, self.total_timeout):
+            if budget is not None:
+                deadline = now + budget if deadline is None else min(deadline, now + budget)
+        if deadline is not None:
+            call.deadline = deadline
+            call.budget_ms = round(max(0.0, deadline - now) * 1000)
+        return call
+
+    def _attempt_timeout(self, call: _CallState) -> Optional[float]:
+        """The HTTP timeout for the next attempt: ``timeout``, cut to what is left."""
+        if call.deadline is None:
+            return self.timeout
+        remaining = self._check_deadline(call)
+        return remaining if self.timeout is None else min(self.timeout, remaining)
+
+    def _check_deadline(self, call: _CallState) -> float:
+        if call.deadline is None:
+            return float("inf")
+        remaining = call.deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"deadline of {call.budget_ms}ms exceeded")
+        return remaining
+
+    async def _bounded(self, fn: Callable[[], Awaitable[Result]], call: _CallState) -> Result:
+        """Await one async attempt, cancelling it if it outlives the deadline."""
+        if call.deadline is None:
+            return await fn()
+        remaining = self._check_deadline(call)
+        try:
+            return await asyncio.wait_for(fn(), remaining)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"deadline of {call.budget_ms}ms exceeded") from None
+
+    def _deadline_error(
+        self,
+        exc: BaseException,
+        req: Union[ChatRequest, ImageRequest, ImageEditRequest],
+        started: float,
+        call: _CallState,
+    ) -> BaseException:
+        """``exc`` as a ``DeadlineExceeded`` carrying the partial trace, if the call's
+        deadline is what ended it; otherwise ``exc`` unchanged."""
+        if call.deadline is None:
+            return exc
+        if not isinstance(exc, DeadlineExceeded):
+            if time.monotonic() < call.deadline:
+                return exc
+            exc = DeadlineExceeded(
+                f"deadline of {call.budget_ms}ms exceeded ({type(exc).__name__}: {exc})"
+            )
+        exc.trace = {
+            "provider": self.provider_name,
+            "model": req.model,
+            "elapsed_ms": int((time.perf_counter() - started) * 1000),
+            "tool_steps": call.steps,
+            "timeout": self.timeout,
+            **self._call_trace(call),
+        }
+        return exc
+
+    def _send(self, req: ChatRequest, tools: Sequence[ToolSpec], call: _CallState) -> Result:
+        """One model request: from the response cache, joined to an identical request
+        already in flight, or through the retry policy."""
+        if self.cache is None and self.single_flight is None:
+            return self._fetch(req, tools, call, None)
+        key = self._request_key(req, tools)
+        if self.cache is not None:
+            hit = self.cache.get(key)
+            if hit is not None:
+                call.cache_hits += 1
+                return hit
+            call.cache_misses += 1
+        if self.single_flight is None:
+            return self._fetch(req, tools, call, key)
+        res, shared = self.single_flight.do(
+            key, lambda: self._fetch(req, tools, call, key), deadline=call.deadline
+        )
+        if shared:
+            call.coalesced += 1
+        # Every caller gets its own copy: its trace is filled in per call.
+        return replace(res, trace=dict(res.trace))
+
+    async def _asend(self, req: ChatRequest, tools: Sequence[ToolSpec], call: _CallState) -> Result:
+        if self.cache is None and self.single_flight is None:
+            return await self._afetch(req, tools, call, None)
+        key = self._request_key(req, tools)
+        if self.cache is not None:
+            hit = await self.cache.aget(key)
+            if hit is not None:
+                call.cache_hits += 1
+                return hit
+            call.cache_misses += 1
+        if self.single_flight is None:
+            return await self._afetch(req, tools, call, key)
+        res, shared = await self.single_flight.ado(
+            key, lambda: self._afetch(req, tools, call, key), deadline=call.deadline
+        )
+        if shared:
+            call.coalesced += 1
+        return replace(res, trace=dict(res.trace))
+
+    def _fetch(self, req: ChatRequest, tools: Sequence[ToolSpec], call: _CallState, key: Optional[str]) -> Result:
+        res = self.retry_policy.call(self._chat_attempt(req, tools, call), stats=call.retry, deadline=call.deadline)
+        if self.cache is not None and key is not None:
+            self.cache.set(key, res)
+        return res
+
+    async def _afetch(self, req: ChatRequest, tools: Sequence[ToolSpec], call: _CallState, key: Optional[str]) -> Result:
+        res = await self.retry_policy.acall(self._achat_attempt(req, tools, call), stats=call.retry, deadline=call.deadline)
+        if self.cache is not None and key is not None:
+            await self.cache.aset(key, res)
+        return res
+
+    def _request_key(self, req: ChatRequest, tools: Sequence[ToolSpec]) -> str:
+        """The canonical request key shared by the cache and single-flight."""
+        return request_key(self._request_snapshot(req), base_url=self._endpoint, tools=tools)
+
+    def _chat_attempt(self, req: ChatRequest, tools: Sequence[ToolSpec], call: _CallState) -> Callable[[], Result]:
+        """One (possibly hedged) chat attempt, as the retry policy will call it."""
+
+        def send(r: ChatRequest) -> Callable[[], Result]:
+            return self._guard(lambda: self.provider.chat(r, tools=tools, timeout=self._attempt_timeout(call)), call)
+
+        def attempt(r: ChatRequest) -> Callable[[], Result]:
+            fn = timed(send(r), self._latency_recorder(r.model), self._error_recorder(r.model))
+            return self._limited(self._throttled(fn, call), r, call)
+
+        primary = attempt(req)
+        if self.hedge_after_ms is None:
+            return primary
+        delay = self._hedge_delay(req, call)
+        if delay is None:
+            return primary
+        hreq = replace(req, model=self.hedge_model) if self.hedge_model else req
+        hedge = attempt(hreq)
+        return lambda: hedged_call(primary, hedge, delay, call.hedge)
+
+    def _achat_attempt(
+        self, req: ChatRequest, tools: Sequence[ToolSpec], call: _CallState
+    ) -> Callable[[], Awaitable[Result]]:
+        def send(r: ChatRequest) -> Callable[[], Awaitable[Result]]:
+            return self._aguard(lambda: self._bounded(lambda: self.provider.achat(r, tools=tools, timeout=self._attempt_timeout(call)), call), call)
+
+        def attempt(r: ChatRequest) -> Callable[[], Awaitable[Result]]:
+            fn = atimed(send(r), self._latency_recorder(r.model), self._error_recorder(r.model))
+            return self._alimited(self._athrottled(fn, call), r, call)
+
+        primary = attempt(req)
+        if self.hedge_after_ms is None:
+            return primary
+        delay = self._hedge_delay(req, call)
+        if delay is None:
+            return primary
+        hreq = replace(req, model=self.hedge_model) if self.hedge_model else req
+        hedge = attempt(hreq)
+        return lambda: ahedged_call(primary, hedge, delay, call.hedge)
+
+    def _limited(self, fn: Callable[[], Result], req: _AnyRequest, call: _CallState) -> Callable[[], Result]:
+        """Take room from the rate limiter before each attempt, and correct it after.
+
+        Outside ``_guard`` and ``timed``: waiting for quota is neither a breaker
+        failure nor model latency."""
+        limiter = self.rate_limiter
+        if limiter is None:
+            return fn
+
+        def attempt() -> Result:
+            ticket = limiter.acquire(*self._rate_request(limiter, req), max_wait=self._wait_budget(call))
+            call.rate_limit_wait_s += ticket.waited_s
+            try:
+                res = fn()
+            except BaseException:
+                limiter.refund(ticket)
+                raise
+            limiter.settle(ticket, res.usage.total_tokens)
+            return res
+
+        return attempt
+
+    def _alimited(
+        self, fn: Callable[[], Awaitable[Result]], req: _AnyRequest, call: _CallState
+    ) -> Callable[[], Awaitable[Result]]:
+        limiter = self.rate_limiter
+        if limiter is None:
+            return fn
+
+        async def attempt() -> Result:
+            ticket = await limiter.aacquire(*self._rate_request(limiter, req), max_wait=self._wait_budget(call))
+            call.rate_limit_wait_s += ticket.waited_s
+            try:
+                res = await fn()
+            except BaseException:
+                limiter.refund(ticket)
+                raise
+            limiter.settle(ticket, res.usage.total_tokens)
+            return res
+
+        return attempt
+
+    def _rate_request(self, limiter: RateLimiter, req: _AnyRequest) -> Tuple[Tuple[str, ...], int]:
+        """The limiter key and token estimate for ``req``."""
+        return limiter.key_for(self.provider_name, self._endpoint, req.model), limiter.estimate(req)
+
+    def _refund(self, ticket: Optional[Ticket]) -> None:
+        """Give back a stream's reservation that was never used."""
+        if ticket is not None and self.rate_limiter is not None:
+            self.rate_limiter.refund(ticket)
+
+    def _settle(self, ticket: Optional[Ticket], usage: Optional[Usage]) -> None:
+        """Correct a finished stream's reservation to the usage its ``done`` event
+        reported (no usage: keep the estimate)."""
+        if ticket is None or self.rate_limiter is None or usage is None:
+            return
+        used = usage.total_tokens
+        if used is None and usage.prompt_tokens is not None and usage.completion_tokens is not None:
+            used = usage.prompt_tokens + usage.completion_tokens
+        self.rate_limiter.settle(ticket, used)
+
+    def _wait_budget(self, call: _CallState) -> Optional[float]:
+        """The longest an attempt may wait for quota or a slot: what is left of the deadline."""
+        return None if call.deadline is None else self._check_deadline(call)
+
+    def _throttled(self, fn: Callable[[], Result], call: _CallState) -> Callable[[], Result]:
+        """Hold a slot of the adaptive concurrency limit for the length of each attempt."""
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return fn
+
+        def attempt() -> Result:
+            slot = limiter.acquire(self._wait_budget(call))
+            if slot is None:
+                raise DeadlineExceeded(f"deadline of {call.budget_ms}ms exceeded waiting for a concurrency slot")
+            call.concurrency_wait_s += slot.waited_s
+            try:
+                res = fn()
+            except BaseException as e:
+                self._release_slot(limiter, slot, call, e)
+                raise
+            self._release_slot(limiter, slot, call, None)
+            return res
+
+        return attempt
+
+    def _athrottled(self, fn: Callable[[], Awaitable[Result]], call: _CallState) -> Callable[[], Awaitable[Result]]:
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return fn
+
+        async def attempt() -> Result:
+            slot = await limiter.aacquire(self._wait_budget(call))
+            if slot is None:
+                raise DeadlineExceeded(f"deadline of {call.budget_ms}ms exceeded waiting for a concurrency slot")
+            call.concurrency_wait_s += slot.waited_s
+            try:
+                res = await fn()
+            except BaseException as e:
+                self._release_slot(limiter, slot, call, e)
+                raise
+            self._release_slot(limiter, slot, call, None)
+            return res
+
+        return attempt
+
+    def _release_stream_slot(self, slot: Optional[Slot], call: _CallState, exc: Optional[BaseException]) -> None:
+        """Return the slot a stream held from its first byte to its last, if it took one."""
+        if slot is not None and self.concurrency_limiter is not None:
+            self._release_slot(self.concurrency_limiter, slot, call, exc)
+
+    def _release_slot(
+        self, limiter: AdaptiveConcurrency, slot: Slot, call: _CallState, exc: Optional[BaseException]
+    ) -> None:
+        latency_ms = None if exc is not None else (time.monotonic() - slot.started) * 1000
+        change = limiter.release(slot, latency_ms=latency_ms, error=exc)
+        call.concurrency_limit = limiter.limit
+        if not change:
+            return
+        if change[1] > change[0]:
+            reason = "increase"
+        elif exc is not None:
+            reason = type(exc).__name__
+        else:
+            reason = "latency"
+        self._fire("concurrency", {
+            "phase": "concurrency",
+            "provider": self.provider_name,
+            "base_url": self._endpoint,
+            "from": change[0],
+            "to": change[1],
+            "reason": reason,
+        })
+
+    def _hedge_delay(self, req: ChatRequest, call: _CallState) -> Optional[float]:
+        delay = resolve_delay(self.hedge_after_ms, self.provider_name, self._endpoint, req.model)
+        call.hedge["after_ms"] = None if delay is None else int(delay * 1000)
+        return delay
+
+    def _latency_recorder(self, model: str) -> Callable[[float], None]:
+        def on_success(ms: float) -> None:
+            record_latency(self.provider_name, self._endpoint, model, ms)
+            stats.record(self.provider_name, self._endpoint, model, latency_ms=ms)
+
+        return on_success
+
+    def _error_recorder(self, model: str) -> Callable[[Exception], None]:
+        def on_error(exc: Exception) -> None:
+            # Cancelled, refused by the breaker or the limiter, or out of time
+            # before it was sent: says nothing about the model.
+            if not isinstance(exc, NEUTRAL_ERRORS):
+                stats.record(self.provider_name, self._endpoint, model, error=exc)
+
+        return on_error
+
+    def _record_stream(self, model: str, timing: "_StreamTiming", exc: Optional[BaseException]) -> None:
+        if exc is not None:
+            if isinstance(exc, Exception):  # not a consumer that stopped early
+                self._error_recorder(model)(exc)
+            return
+        stats.record(self.provider_name, self._endpoint, model, latency_ms=timing.elapsed_ms(), ttfb_ms=timing.ttfb_ms)
+
+    def _admit(self, call: _CallState) -> None:
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return
+        try:
+            change = breaker.admit(self.provider_name, self._endpoint)
+        except CircuitOpenError:
+            call.circuit = "open"
+            raise
+        call.circuit = breaker.state(self.provider_name, self._endpoint)
+        if change:
+            self._fire_circuit(change)
+
+    def _record(self, call: _CallState, exc: Optional[BaseException]) -> None:
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return
+        change = breaker.record(self.provider_name, self._endpoint, exc)
+        call.circuit = breaker.state(self.provider_name, self._endpoint)
+        if change:
+            self._fire_circuit(change)
+
+    def _fire_circuit(self, change: tuple) -> None:
+        self._fire("circuit", {
+            "phase": "circuit",
+            "provider": self.provider_name,
+            "base_url": self._endpoint,
+            "from": change[0],
+            "to": change[1],
+        })
+
+    def _tool_messages(self, calls: Sequence[ToolCall], runs: Sequence[ToolRun], call: _CallState) -> List[Message]:
+        """Tool result messages for one turn, in the provider's call order; raises the
+        first failure once every run is logged."""
+        for tc, run in zip(calls, runs):
+            call.tools.append({
+                "step": call.steps,
+                "name": run.name,
+                "id": tc.id,
+                "elapsed_ms": run.elapsed_ms,
+                "ok": run.error is None,
+                "error": None if run.error is None else str(run.error),
+            })
+        for run in runs:
+            if run.error is not None:
+                raise run.error
+        return [
+            Message.tool(content=json.dumps(run.output), tool_call_id=tc.id or tc.name)
+            for tc, run in zip(calls, runs)
+        ]
+
+    def _finish(
+        self,
+        res: Result,
+        *,
+        req: ChatRequest,
+        started: float,
+        steps: int,
+        snapshot: dict,
+        call: Optional[_CallState] = None,
+    ) -> Result:
+        self._attach_trace(res, req=req, started=started, steps=steps, call=call)
         res.request = snapshot
         self._fire("after_call", {**res.trace, "ok": True})
         return res
@@ -213,7 +861,15 @@ class Client:
             "previous_response_id": req.previous_response_id,
         }
 
-    def _attach_trace(self, res: Result, *, req: Union[ChatRequest, ImageRequest, ImageEditRequest], started: float, steps: int) -> None:
+    def _attach_trace(
+        self,
+        res: Result,
+        *,
+        req: Union[ChatRequest, ImageRequest, ImageEditRequest],
+        started: float,
+        steps: int,
+        call: Optional[_CallState] = None,
+    ) -> None:
         res.trace.update({
             "provider": self.provider_name,
             "model": req.model,
@@ -223,9 +879,45 @@ class Client:
             "tool_call_count": len(res.tool_calls or []),
             "timeout": self.timeout,
         })
+        if call is not None:
+            res.trace.update(self._call_trace(call))
+
+    def _call_trace(self, call: _CallState) -> dict:
+        out = {
+            "retry_count": call.retry["retries"],
+            "retry_sleep_ms": int(call.retry["sleep_s"] * 1000),
+        }
+        if call.retry["gave_up"]:
+            out["retry_gave_up"] = call.retry["gave_up"]
+        if call.circuit is not None:
+            out["circuit_state"] = call.circuit
+        if call.budget_ms is not None:
+            out["deadline_ms"] = call.budget_ms
+        if self.hedge_after_ms is not None:
+            out["hedge_after_ms"] = call.hedge["after_ms"]
+            out["hedges_sent"] = call.hedge["sent"]
+            out["hedge_wins"] = call.hedge["won"]
+        if self.cache is not None:
+            # "hit": the call was answered without a model request reaching the network.
+            out["cache"] = "hit" if call.cache_hits and not call.cache_misses else "miss"
+            out["cache_hits"] = call.cache_hits
+            out["cache_misses"] = call.cache_misses
+        if self.single_flight is not None:
+            out["coalesced"] = call.coalesced
+        if self.rate_limiter is not None:
+            out["rate_limit_wait_ms"] = int(call.rate_limit_wait_s * 1000)
+        if self.concurrency_limiter is not None:
+            out["concurrency_limit"] = call.concurrency_limit or self.concurrency_limiter.limit
+            out["concurrency_wait_ms"] = int(call.concurrency_wait_s * 1000)
+        if call.tools:
+            out["tool_runs"] = list(call.tools)
+        # HTTP connection reuse for this call (pooled providers only).
+        if call.connections.get("requests"):
+            out["connections"] = dict(call.connections)
+        return out
 
     def _request_snapshot(self, req: ChatRequest) -> dict:
-        return {
+        snapshot: Dict[str, Any] = {
             "provider": self.provider_name,
             "model": req.model,
             "messages": [m.to_dict() for m in req.messages],
@@ -234,6 +926,15 @@ class Client:
             "response_format": req.response_format,
             "extra": req.extra,
         }
+        # Fields most requests leave unset join the snapshot only when set, so
+        # they still reach the cache key without reshaping every recorded request.
+        if req.tool_choice is not None:
+            snapshot["tool_choice"] = req.tool_choice
+        if req.previous_response_id is not None:
+            snapshot["previous_response_id"] = req.previous_response_id
+        if req.image_generation is not None:
+            snapshot["image_generation"] = asdict(req.image_generation)
+        return snapshot
 
     def _image_snapshot(self, req: ImageRequest) -> dict:
         return {
@@ -255,13 +956,21 @@ class Client:
             # A misbehaving hook must never break the underlying call.
             pass
 
-    def _fire_error(self, req: Union[ChatRequest, ImageRequest, ImageEditRequest], started: float, exc: BaseException) -> None:
+    def _fire_error(
+        self,
+        req: Union[ChatRequest, ImageRequest, ImageEditRequest],
+        started: float,
+        exc: BaseException,
+        *,
+        call: Optional[_CallState] = None,
+    ) -> None:
         self._fire("after_call", {
             "provider": self.provider_name,
             "model": req.model,
             "ok": False,
             "error": f"{type(exc).__name__}: {exc}",
             "elapsed_ms": int((time.perf_counter() - started) * 1000),
+            **(self._call_trace(call) if call is not None else {}),
         })
 
 
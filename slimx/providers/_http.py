@@ -0,0 +1,235 @@
+"""Pooled, long-lived HTTP clients for the built-in providers.
+
+Every provider instance owns one ``HTTPPool``: a keep-alive ``httpx.Client`` that is
+built lazily on first use and then reused for every call, so consecutive requests to
+the same host skip the TCP/TLS handshake. Timeouts are passed per request rather than
+baked into the client, so one pool serves calls with different timeouts.
+
+Async providers get the same treatment through ``aclient()``. An ``httpx.AsyncClient``
+is bound to the event loop it was first used on, so the pool keeps one per running
+loop (weakly keyed, so a finished ``asyncio.run`` does not pin its client).
+
+Clients are created on first use (not in ``__init__``) so constructing a provider
+stays free of I/O, and ``close()``/``aclose()`` are idempotent — a closed pool simply
+rebuilds its client if the provider is used again.
+
+After ``os.fork()`` every pool in the child drops (without closing) the clients it
+inherited, so a forked worker never writes to its parent's sockets.
+
+Connection reuse is observable: each request carries an httpcore ``trace`` callback
+that notes whether it had to open a new connection. The pool keeps cumulative counts
+(``stats()``), and ``track_connections()`` scopes per-call counts that the low-level
+``Client`` copies into ``Result.trace["connections"]``.
+
+Sync HTTP/1.1 connections go through ``utils.cancel``'s network backend, so a call
+running inside a cancelled ``CancelScope`` has its socket shut down mid-request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+import httpx
+
+from ..utils import cancel
+
+# Sized for typical LLM fan-out from one process; override per provider with
+# ``provider_kwargs={"limits": httpx.Limits(...)}``.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Opt-in HTTP/2 for the cloud providers when ``http2`` is not passed explicitly.
+HTTP2_ENV = "SLIMX_HTTP2"
+
+# Per-call connection counters, active while a `track_connections()` block runs.
+_CALL_CONNECTIONS: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "slimx_call_connections", default=None
+)
+
+
+def http2_from_env(overrides: Mapping[str, Any]) -> bool:
+    """Resolve the ``http2`` option: an explicit kwarg wins over ``SLIMX_HTTP2``."""
+    value = overrides.get("http2")
+    if value is not None:
+        return bool(value)
+    return os.environ.get(HTTP2_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@contextmanager
+def track_connections() -> Iterator[Dict[str, Any]]:
+    """Count the HTTP requests made (in this thread/task) inside the block.
+
+    Yields a dict that fills in as requests complete: ``requests``, ``opened`` (new
+    connections), ``reused`` (served by an already-open connection) and the last
+    ``http_version`` seen. Requests through a transport that does not report
+    connection events (e.g. ``httpx.MockTransport``) count as requests only.
+    """
+    counts: Dict[str, Any] = {"requests": 0, "opened": 0, "reused": 0, "http_version": None}
+    token = _CALL_CONNECTIONS.set(counts)
+    try:
+        yield counts
+    finally:
+        _CALL_CONNECTIONS.reset(token)
+
+
+class HTTPPool:
+    """Lazily-built keep-alive clients shared by a provider's calls: one
+    ``httpx.Client`` plus one ``httpx.AsyncClient`` per running event loop."""
+
+    def __init__(self, *, limits: Optional[httpx.Limits] = None, http2: bool = False) -> None:
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "http2=True requires the 'h2' package; install it with `pip install 'slimx[http2]'`"
+            )
+        self.limits = limits or DEFAULT_LIMITS
+        self.http2 = http2
+        self._client: Optional[httpx.Client] = None
+        self._aclients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "opened": 0, "reused": 0}
+        # Registry pools (``slimx.transport``) are shared by many providers; each
+        # provider that used one holds it until it closes, and the last one closes it.
+        self.shared = False
+        self._holders: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        _LIVE_POOLS.add(self)
+
+    def client(self) -> httpx.Client:
+        client = self._client
+        if client is None:
+            with self._lock:
+                if self._client is None:
+                    transport = httpx.HTTPTransport(limits=self.limits, http2=self.http2)
+                    if not self.http2:
+                        # HTTP/1.1 connections serve one request at a time, so a
+                        # cancelled call may shut its socket down (see utils.cancel).
+                        cancel.install(transport)
+                    self._client = httpx.Client(
+                        limits=self.limits,
+                        http2=self.http2,
+                        transport=transport,
+                        event_hooks={"request": [self._on_request], "response": [self._on_response]},
+                    )
+                client = self._client
+        return client
+
+    def aclient(self) -> httpx.AsyncClient:
+        """The ``AsyncClient`` for the running event loop (built on first use)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._aclients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    limits=self.limits,
+                    http2=self.http2,
+                    event_hooks={"request": [self._aon_request], "response": [self._aon_response]},
+                )
+                self._aclients[loop] = client
+        return client
+
+    def hold(self, owner: Any) -> None:
+        """Mark ``owner`` as a user of this shared pool."""
+        with self._lock:
+            self._holders.add(owner)
+
+    def release(self, owner: Any) -> bool:
+        """Drop ``owner``'s hold; ``True`` when nobody holds the pool any more."""
+        with self._lock:
+            self._holders.discard(owner)
+            return not self._holders
+
+    def stats(self) -> Dict[str, Any]:
+        """Cumulative request / new-connection / reused-connection counts."""
+        with self._lock:
+            return {**self._stats, "http2": self.http2}
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the running loop's ``AsyncClient`` (and the sync client, if any).
+
+        Clients bound to *other* loops are left alone: they can only be closed from
+        the loop that owns them.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            aclient = self._aclients.pop(loop, None)
+        if aclient is not None:
+            await aclient.aclose()
+        self.close()
+
+    def _forget_clients(self) -> None:
+        self._lock = threading.Lock()
+        self._client = None
+        self._aclients = weakref.WeakKeyDictionary()
+
+    # ---- connection accounting (httpx event hooks) ------------------------
+
+    def _on_request(self, request: httpx.Request) -> None:
+        seen = {"connect": False, "sent": False}
+
+        def trace(name: str, info: Dict[str, Any]) -> None:
+            _note(seen, name)
+
+        request.extensions = {**request.extensions, "trace": trace, "slimx_connection": seen}
+
+    async def _aon_request(self, request: httpx.Request) -> None:
+        seen = {"connect": False, "sent": False}
+
+        async def trace(name: str, info: Dict[str, Any]) -> None:
+            _note(seen, name)
+
+        request.extensions = {**request.extensions, "trace": trace, "slimx_connection": seen}
+
+    def _on_response(self, response: httpx.Response) -> None:
+        seen = response.request.extensions.get("slimx_connection") or {}
+        # Only count reuse when httpcore actually reported the send; transports
+        # that emit no connection events (mocks) are neither opened nor reused.
+        kind = ("opened" if seen.get("connect") else "reused") if seen.get("sent") else None
+        with self._lock:
+            self._stats["requests"] += 1
+            if kind:
+                self._stats[kind] += 1
+        counts = _CALL_CONNECTIONS.get()
+        if counts is not None:
+            counts["requests"] += 1
+            if kind:
+                counts[kind] += 1
+            counts["http_version"] = response.http_version
+
+    async def _aon_response(self, response: httpx.Response) -> None:
+        self._on_response(response)
+
+
+_LIVE_POOLS: "weakref.WeakSet[HTTPPool]" = weakref.WeakSet()
+
+
+def _after_fork_in_child() -> None:
+    for pool in list(_LIVE_POOLS):
+        pool._forget_clients()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _note(seen: Dict[str, bool], name: str) -> None:
+    if name.endswith((".connect_tcp.complete", ".connect_unix_socket.complete")):
+        seen["connect"] = True
+    elif name.endswith(".send_request_headers.started"):
+        seen["sent"] = True
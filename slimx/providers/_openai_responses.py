@@ -326,7 +326,7 @@ class ResponsesStreamTranslator:
         for i, img in enumerate(result.images):
             idx = img.output_index if img.output_index is not None else i
             events.append(StreamEvent.image_completed(img, index=idx, raw=None))
-        events.append(StreamEvent.done(raw=raw))
+        events.append(StreamEvent.done(raw=raw, usage=result.usage))
         self._completed = True
         return events
 
@@ -10,11 +10,12 @@ async paths from silently drifting apart.
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
-from ..errors import ProviderAuthError, ProviderError, ProviderRateLimitError
+from ..errors import ProviderAuthError, ProviderError, ProviderServerError
 from ..tooling import ToolSpec
 from ..types import GeneratedImage, Result, StreamEvent, ToolCall, Usage
+from ..utils.retry import rate_limit_error
 
 
 def tools_payload(tools: Sequence[ToolSpec]) -> List[Dict[str, Any]]:
@@ -50,14 +51,23 @@ def build_payload(
         payload["response_format"] = {"type": "json_object"}
     if stream:
         payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}  # a final chunk with the usage
     return payload
 
 
-def raise_for_status(status_code: int, body: str, *, provider: str = "OpenAI") -> None:
+def raise_for_status(
+    status_code: int,
+    body: str,
+    *,
+    provider: str = "OpenAI",
+    headers: Optional[Mapping[str, str]] = None,
+) -> None:
     if status_code == 401:
         raise ProviderAuthError(body)
     if status_code == 429:
-        raise ProviderRateLimitError(body)
+        raise rate_limit_error(body, headers)
+    if status_code >= 500:
+        raise ProviderServerError(f"{provider} error {status_code}: {body}")
     if status_code >= 400:
         raise ProviderError(f"{provider} error {status_code}: {body}")
 
@@ -148,6 +158,12 @@ class StreamToolAccumulator:
         return out
 
 
+def usage_from_chunk(obj: Dict[str, Any]) -> Optional[Usage]:
+    """The usage of a streamed completion, carried by its final chunk only."""
+    usage = obj.get("usage")
+    return Usage.from_openai(usage) if usage else None
+
+
 def text_delta_from_chunk(obj: Dict[str, Any], acc: StreamToolAccumulator) -> Optional[StreamEvent]:
     """Process one decoded SSE chunk.
 
@@ -3,16 +3,20 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import httpx
 
 from ..content import DocumentPart, ImagePart, TextPart, guard_modalities, to_base64
-from ..errors import ProviderAuthError, ProviderError, ProviderRateLimitError
+from ..errors import ProviderAuthError, ProviderError, ProviderServerError
 from ..messages import Message
 from ..tooling import ToolSpec
+from ..transport import pool_for
 from ..types import InspectedRequest, Result, StreamEvent, ToolCall, Usage, redact_headers
+from ..utils import jsonlib
+from ..utils.retry import rate_limit_error
 from ..utils.sse import iter_sse_data
+from ._http import HTTPPool, http2_from_env
 from .base import Provider, ProviderCapabilities
 
 DEFAULT_ANTHROPIC_BASE_URL = "https://api.anthropic.com"
@@ -34,10 +38,15 @@ class AnthropicProvider(Provider):
         api_key: str,
         base_url: str = DEFAULT_ANTHROPIC_BASE_URL,
         version: str = DEFAULT_ANTHROPIC_VERSION,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        pool: Optional[HTTPPool] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.version = version
+        self._pool = pool or HTTPPool(limits=limits, http2=http2)
 
     @classmethod
     def from_env(cls, **overrides):
@@ -49,12 +58,15 @@ class AnthropicProvider(Provider):
         api_key = overrides.get("api_key") or os.environ.get("ANTHROPIC_API_KEY")
         if not api_key:
             raise ProviderAuthError("ANTHROPIC_API_KEY is not set")
+        base_url = overrides.get("base_url") or os.environ.get(
+            "ANTHROPIC_BASE_URL", DEFAULT_ANTHROPIC_BASE_URL
+        )
         return cls(
             api_key=api_key,
-            base_url=overrides.get("base_url")
-            or os.environ.get("ANTHROPIC_BASE_URL", DEFAULT_ANTHROPIC_BASE_URL),
+            base_url=base_url,
             version=overrides.get("version")
             or os.environ.get("ANTHROPIC_VERSION", DEFAULT_ANTHROPIC_VERSION),
+            pool=pool_for(cls.name, base_url, api_key, overrides, http2=http2_from_env(overrides)),
         )
 
     def _headers(self) -> Dict[str, str]:
@@ -75,19 +87,17 @@ class AnthropicProvider(Provider):
 
     def list_models(self, *, timeout: Optional[float] = None) -> list:
         url = f"{self.base_url}/v1/models"
-        with httpx.Client(timeout=timeout or 10.0) as c:
-            r = c.get(url, headers=self._headers())
-        _raise_for_status(r.status_code, r.text)
-        data = r.json()
+        r = self._http().get(url, headers=self._headers(), timeout=timeout or 10.0)
+        _raise_for_status(r.status_code, r.text, headers=r.headers)
+        data = jsonlib.loads(r.content)
         return [m.get("id") for m in (data.get("data") or []) if m.get("id")]
 
     def chat(self, req, *, tools: Sequence[ToolSpec] = (), timeout: Optional[float] = None) -> Result:
         payload = _build_payload(req, tools)
         url = f"{self.base_url}/v1/messages"
-        with httpx.Client(timeout=timeout or 30.0) as c:
-            r = c.post(url, headers=self._headers(), json=payload)
-        _raise_for_status(r.status_code, r.text)
-        return _parse_response(r.json())
+        r = self._http().post(url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or 30.0)
+        _raise_for_status(r.status_code, r.text, headers=r.headers)
+        return _parse_response(jsonlib.loads(r.content))
 
     def stream(
         self, req, *, tools: Sequence[ToolSpec] = (), timeout: Optional[float] = None
@@ -95,21 +105,22 @@ class AnthropicProvider(Provider):
         payload = _build_payload(req, tools, stream=True)
         url = f"{self.base_url}/v1/messages"
         decoder = _StreamDecoder()
-        with httpx.Client(timeout=timeout or 30.0) as c:
-            with c.stream("POST", url, headers=self._headers(), json=payload) as r:
-                if r.status_code >= 400:
-                    body = r.read().decode("utf-8", errors="replace")
-                    _raise_for_status(r.status_code, body)
-                for chunk in iter_sse_data(r.iter_bytes()):
-                    try:
-                        obj = json.loads(chunk)
-                    except Exception:
-                        continue
-                    for event in decoder.feed(obj):
-                        yield event
-                    if _StreamDecoder.is_done(obj):
-                        break
-        yield StreamEvent.done()
+        with self._http().stream(
+            "POST", url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or 30.0
+        ) as r:
+            if r.status_code >= 400:
+                body = r.read().decode("utf-8", errors="replace")
+                _raise_for_status(r.status_code, body, headers=r.headers)
+            for chunk in iter_sse_data(r.iter_bytes()):
+                try:
+                    obj = jsonlib.loads(chunk)
+                except Exception:
+                    continue
+                for event in decoder.feed(obj):
+                    yield event
+                if _StreamDecoder.is_done(obj):
+                    break
+        yield StreamEvent.done(usage=decoder.usage)
 
 
 # --------------------------------------------------------------------------
@@ -183,14 +194,32 @@ class _StreamDecoder:
 
     Text arrives as ``content_block_delta`` / ``text_delta``; tool calls arrive as a
     ``tool_use`` block whose arguments stream in as ``input_json_delta`` fragments and
-    are emitted as one ToolCall when the block stops.
+    are emitted as one ToolCall when the block stops. Input tokens are reported by
+    ``message_start`` and output tokens by ``message_delta``; ``usage`` holds both.
     """
 
     def __init__(self) -> None:
         self._tool_blocks: Dict[Any, Dict[str, Any]] = {}
+        self._input_tokens: Optional[int] = None
+        self._output_tokens: Optional[int] = None
+
+    @property
+    def usage(self) -> Optional[Usage]:
+        if self._input_tokens is None and self._output_tokens is None:
+            return None
+        return Usage(prompt_tokens=self._input_tokens, completion_tokens=self._output_tokens)
 
     def feed(self, obj: Dict[str, Any]) -> List[StreamEvent]:
         kind = obj.get("type")
+        if kind == "message_start":
+            usage = (obj.get("message") or {}).get("usage") or {}
+            self._input_tokens = usage.get("input_tokens", self._input_tokens)
+            self._output_tokens = usage.get("output_tokens", self._output_tokens)
+            return []
+        if kind == "message_delta":
+            usage = obj.get("usage") or {}
+            self._output_tokens = usage.get("output_tokens", self._output_tokens)
+            return []
         if kind == "content_block_start":
             block = obj.get("content_block") or {}
             if block.get("type") == "tool_use":
@@ -360,10 +389,14 @@ def _safe_json_loads(value: Any) -> Any:
         return value
 
 
-def _raise_for_status(status_code: int, body: str) -> None:
+def _raise_for_status(
+    status_code: int, body: str, headers: Optional[Mapping[str, str]] = None
+) -> None:
     if status_code in (401, 403):
         raise ProviderAuthError(body)
     if status_code == 429:
-        raise ProviderRateLimitError(body)
+        raise rate_limit_error(body, headers)
+    if status_code >= 500:
+        raise ProviderServerError(f"Anthropic error {status_code}: {body}")
     if status_code >= 400:
         raise ProviderError(f"Anthropic error {status_code}: {body}")
@@ -1,7 +1,6 @@
 # slimx/providers/anthropic_async.py
 from __future__ import annotations
 
-import json
 import os
 from typing import Dict, Optional, Sequence
 
@@ -9,7 +8,9 @@ import httpx
 
 from ..errors import ProviderAuthError
 from ..tooling import ToolSpec
+from ..transport import pool_for
 from ..types import InspectedRequest, Result, StreamEvent, redact_headers
+from ..utils import jsonlib
 from ..utils.sse_async import aiter_sse_data
 from .anthropic import (
     DEFAULT_ANTHROPIC_BASE_URL,
@@ -19,6 +20,7 @@ from .anthropic import (
     _parse_response,
     _raise_for_status,
 )
+from ._http import HTTPPool, http2_from_env
 from .base import Provider, ProviderCapabilities
 
 
@@ -38,10 +40,15 @@ class AnthropicAsyncProvider(Provider):
         api_key: str,
         base_url: str = DEFAULT_ANTHROPIC_BASE_URL,
         version: str = DEFAULT_ANTHROPIC_VERSION,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        pool: Optional[HTTPPool] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.version = version
+        self._pool = pool or HTTPPool(limits=limits, http2=http2)
 
     @classmethod
     def from_env(cls, **overrides):
@@ -49,12 +56,15 @@ class AnthropicAsyncProvider(Provider):
         api_key = overrides.get("api_key") or os.environ.get("ANTHROPIC_API_KEY")
         if not api_key:
             raise ProviderAuthError("ANTHROPIC_API_KEY is not set")
+        base_url = overrides.get("base_url") or os.environ.get(
+            "ANTHROPIC_BASE_URL", DEFAULT_ANTHROPIC_BASE_URL
+        )
         return cls(
             api_key=api_key,
-            base_url=overrides.get("base_url")
-            or os.environ.get("ANTHROPIC_BASE_URL", DEFAULT_ANTHROPIC_BASE_URL),
+            base_url=base_url,
             version=overrides.get("version")
             or os.environ.get("ANTHROPIC_VERSION", DEFAULT_ANTHROPIC_VERSION),
+            pool=pool_for(cls.name, base_url, api_key, overrides, http2=http2_from_env(overrides)),
         )
 
     def _headers(self) -> Dict[str, str]:
@@ -84,27 +94,27 @@ class AnthropicAsyncProvider(Provider):
     ) -> Result:
         payload = _build_payload(req, tools)
         url = f"{self.base_url}/v1/messages"
-        async with httpx.AsyncClient(timeout=timeout or 30.0) as c:
-            r = await c.post(url, headers=self._headers(), json=payload)
-        _raise_for_status(r.status_code, r.text)
-        return _parse_response(r.json())
+        r = await self._ahttp().post(url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or 30.0)
+        _raise_for_status(r.status_code, r.text, headers=r.headers)
+        return _parse_response(jsonlib.loads(r.content))
 
     async def astream(self, req, *, tools: Sequence[ToolSpec] = (), timeout: Optional[float] = None):
         payload = _build_payload(req, tools, stream=True)
         url = f"{self.base_url}/v1/messages"
         decoder = _StreamDecoder()
-        async with httpx.AsyncClient(timeout=timeout or 30.0) as c:
-            async with c.stream("POST", url, headers=self._headers(), json=payload) as r:
-                if r.status_code >= 400:
-                    body = (await r.aread()).decode("utf-8", errors="replace")
-                    _raise_for_status(r.status_code, body)
-                async for chunk in aiter_sse_data(r.aiter_bytes()):
-                    try:
-                        obj = json.loads(chunk)
-                    except Exception:
-                        continue
-                    for event in decoder.feed(obj):
-                        yield event
-                    if _StreamDecoder.is_done(obj):
-                        break
-        yield StreamEvent.done()
+        async with self._ahttp().stream(
+            "POST", url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or 30.0
+        ) as r:
+            if r.status_code >= 400:
+                body = (await r.aread()).decode("utf-8", errors="replace")
+                _raise_for_status(r.status_code, body, headers=r.headers)
+            async for chunk in aiter_sse_data(r.aiter_bytes()):
+                try:
+                    obj = jsonlib.loads(chunk)
+                except Exception:
+                    continue
+                for event in decoder.feed(obj):
+                    yield event
+                if _StreamDecoder.is_done(obj):
+                    break
+        yield StreamEvent.done(usage=decoder.usage)
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import AsyncIterator, Awaitable, Iterable, Optional, Sequence
+
+import httpx
+
 from ..tooling import ToolSpec
 from ..low.types import ChatRequest, ImageEditRequest, ImageRequest
 from ..types import InspectedRequest, Result, StreamEvent
+from ._http import HTTPPool
 
 @dataclass(frozen=True)
 class ProviderCapabilities:
@@ -30,6 +34,9 @@ class ProviderCapabilities:
 class Provider(ABC):
     name: str
     capabilities: ProviderCapabilities = ProviderCapabilities()
+    # Built-in providers keep one pooled keep-alive HTTP client per instance (see
+    # `providers/_http.py`); providers without one leave this as None.
+    _pool: Optional[HTTPPool] = None
 
     @abstractmethod
     def chat(
@@ -111,3 +118,44 @@ class Provider(ABC):
     # Dry-run inspection for image generation (optional).
     def build_image_request(self, req: ImageRequest) -> InspectedRequest:
         raise NotImplementedError("Image-request inspection not implemented for this provider")
+
+    # The provider's pooled keep-alive client. Built-in providers create their pool
+    # in __init__ (with any configured limits); other subclasses get a default one.
+    def _http(self) -> httpx.Client:
+        return self._held_pool().client()
+
+    def _ahttp(self) -> httpx.AsyncClient:
+        return self._held_pool().aclient()
+
+    def _held_pool(self) -> HTTPPool:
+        pool = self._pool
+        if pool is None:
+            pool = self._pool = HTTPPool()
+        if pool.shared:
+            pool.hold(self)
+        return pool
+
+    # Connection lifecycle: release pooled connections. Idempotent; a closed
+    # provider reopens its pool lazily if it is used again. A shared registry pool
+    # is only closed by the last provider still holding it.
+    def close(self) -> None:
+        pool = self._pool
+        if pool is not None and (not pool.shared or pool.release(self)):
+            pool.close()
+
+    async def aclose(self) -> None:
+        pool = self._pool
+        if pool is not None and (not pool.shared or pool.release(self)):
+            await pool.aclose()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
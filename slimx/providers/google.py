@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict, Iterable, Optional, Sequence
+import re
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
 
 import httpx
 
@@ -15,10 +16,11 @@ from ..content import (
     guard_modalities,
     to_base64,
 )
-from ..errors import ProviderAuthError, ProviderError, ProviderRateLimitError
+from ..errors import ProviderAuthError, ProviderError, ProviderServerError
 from ..low.types import ChatRequest, ImageRequest
 from ..messages import Message
 from ..tooling import ToolSpec
+from ..transport import pool_for
 from ..types import (
     GeneratedImage,
     InspectedRequest,
@@ -28,7 +30,10 @@ from ..types import (
     Usage,
     redact_headers,
 )
+from ..utils import jsonlib
+from ..utils.retry import rate_limit_error
 from ..utils.sse import iter_sse_data
+from ._http import HTTPPool, http2_from_env
 from .base import Provider, ProviderCapabilities
 
 
@@ -51,11 +56,16 @@ class GoogleProvider(Provider):
         self,
         api_key: str,
         base_url: str = DEFAULT_GOOGLE_BASE_URL,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        pool: Optional[HTTPPool] = None,
     ):
         if not api_key:
             raise ProviderAuthError("GOOGLE_API_KEY or GEMINI_API_KEY is not set")
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._pool = pool or HTTPPool(limits=limits, http2=http2)
 
     @classmethod
     def from_env(cls, **overrides):
@@ -72,7 +82,11 @@ class GoogleProvider(Provider):
         base_url = overrides.get("base_url") or os.environ.get(
             "GOOGLE_BASE_URL", DEFAULT_GOOGLE_BASE_URL
         )
-        return cls(api_key=api_key, base_url=base_url)
+        return cls(
+            api_key=api_key,
+            base_url=base_url,
+            pool=pool_for(cls.name, base_url, api_key, overrides, http2=http2_from_env(overrides)),
+        )
 
     def _headers(self) -> Dict[str, str]:
         return {
@@ -118,11 +132,11 @@ class GoogleProvider(Provider):
         payload = _payload(req, tools=tools)
         url = f"{self.base_url}/{_model_path(req.model)}:generateContent"
 
-        with httpx.Client(timeout=timeout or 30.0) as client:
-            response = client.post(url, headers=self._headers(), json=payload)
-
-        _raise_for_status(response.status_code, response.text)
-        return _parse_response(response.json())
+        response = self._http().post(
+            url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or 30.0
+        )
+        _raise_for_status(response.status_code, response.text, headers=response.headers)
+        return _parse_response(jsonlib.loads(response.content))
 
     def stream(
         self,
@@ -134,30 +148,35 @@ class GoogleProvider(Provider):
         payload = _payload(req, tools=tools)
         url = f"{self.base_url}/{_model_path(req.model)}:streamGenerateContent?alt=sse"
 
-        with httpx.Client(timeout=timeout or 30.0) as client:
-            with client.stream("POST", url, headers=self._headers(), json=payload) as response:
-                if response.status_code >= 400:
-                    # Body must be read before access on a streamed response,
-                    # otherwise httpx raises ResponseNotRead.
-                    body = response.read().decode("utf-8", errors="replace")
-                    _raise_for_status(response.status_code, body)
+        usage = None
+        with self._http().stream(
+            "POST", url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or 30.0
+        ) as response:
+            if response.status_code >= 400:
+                # Body must be read before access on a streamed response,
+                # otherwise httpx raises ResponseNotRead.
+                body = response.read().decode("utf-8", errors="replace")
+                _raise_for_status(response.status_code, body, headers=response.headers)
 
-                for chunk in iter_sse_data(response.iter_bytes()):
-                    if not chunk or chunk == "[DONE]":
-                        continue
+            for chunk in iter_sse_data(response.iter_bytes()):
+                if not chunk or chunk == "[DONE]":
+                    continue
 
-                    try:
-                        data = json.loads(chunk)
-                    except Exception:
-                        continue
+                try:
+                    data = jsonlib.loads(chunk)
+                except Exception:
+                    continue
 
-                    for text in _extract_text_parts(data):
-                        yield StreamEvent.text_delta(text, raw=data)
+                if data.get("usageMetadata"):  # running totals; the last chunk's are final
+                    usage = _parse_usage(data)
 
-                    for tool_call in _extract_tool_calls(data):
-                        yield StreamEvent.tool(tool_call, raw=data)
+                for text in _extract_text_parts(data):
+                    yield StreamEvent.text_delta(text, raw=data)
 
-        yield StreamEvent.done()
+                for tool_call in _extract_tool_calls(data):
+                    yield StreamEvent.tool(tool_call, raw=data)
+
+        yield StreamEvent.done(usage=usage)
 
 
 def _model_path(model: str) -> str:
@@ -533,19 +552,32 @@ def _safe_json_loads(value: Any) -> Any:
         return value
 
 
-def _raise_for_status(status_code: int, text: str) -> None:
+def _raise_for_status(
+    status_code: int, text: str, headers: Optional[Mapping[str, str]] = None
+) -> None:
     safe_text = _redact_error_text(text)
 
     if status_code in (401, 403):
         raise ProviderAuthError(f"Google error {status_code}: {safe_text}")
 
     if status_code == 429:
-        raise ProviderRateLimitError(f"Google error {status_code}: {safe_text}")
-
+        error = rate_limit_error(f"Google error {status_code}: {safe_text}", headers)
+        if error.retry_after is None:
+            # Gemini puts its hint in the body: google.rpc.RetryInfo {"retryDelay": "30s"}.
+            match = _RETRY_DELAY.search(text or "")
+            if match:
+                error.retry_after = float(match.group(1))
+        raise error
+
+    if status_code >= 500:
+        raise ProviderServerError(f"Google error {status_code}: {safe_text}")
     if status_code >= 400:
         raise ProviderError(f"Google error {status_code}: {safe_text}")
 
 
+_RETRY_DELAY = re.compile(r'"retryDelay"\s*:\s*"(\d+(?:\.\d+)?)s"')
+
+
 def _redact_error_text(text: str) -> str:
     if not text:
         return ""
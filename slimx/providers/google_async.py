@@ -1,7 +1,6 @@
 # slimx/providers/google_async.py
 from __future__ import annotations
 
-import json
 import os
 from typing import Optional, Sequence
 
@@ -11,8 +10,11 @@ from ..errors import ProviderAuthError
 from ..low.types import ChatRequest, ImageRequest
 from ..messages import Message
 from ..tooling import ToolSpec
+from ..transport import pool_for
 from ..types import InspectedRequest, Result, StreamEvent, redact_headers
+from ..utils import jsonlib
 from ..utils.sse_async import aiter_sse_data
+from ._http import HTTPPool, http2_from_env
 from .base import Provider, ProviderCapabilities
 from .google import (
     DEFAULT_GOOGLE_BASE_URL,
@@ -20,6 +22,7 @@ from .google import (
     _extract_tool_calls,
     _model_path,
     _parse_response,
+    _parse_usage,
     _payload,
     _raise_for_status,
 )
@@ -43,11 +46,16 @@ class GoogleAsyncProvider(Provider):
         self,
         api_key: str,
         base_url: str = DEFAULT_GOOGLE_BASE_URL,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        pool: Optional[HTTPPool] = None,
     ):
         if not api_key:
             raise ProviderAuthError("GOOGLE_API_KEY or GEMINI_API_KEY is not set")
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._pool = pool or HTTPPool(limits=limits, http2=http2)
 
     @classmethod
     def from_env(cls, **overrides):
@@ -62,7 +70,11 @@ class GoogleAsyncProvider(Provider):
         base_url = overrides.get("base_url") or os.environ.get(
             "GOOGLE_BASE_URL", DEFAULT_GOOGLE_BASE_URL
         )
-        return cls(api_key=api_key, base_url=base_url)
+        return cls(
+            api_key=api_key,
+            base_url=base_url,
+            pool=pool_for(cls.name, base_url, api_key, overrides, http2=http2_from_env(overrides)),
+        )
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -114,11 +126,11 @@ class GoogleAsyncProvider(Provider):
         payload = _payload(req, tools=tools)
         url = f"{self.base_url}/{_model_path(req.model)}:generateContent"
 
-        async with httpx.AsyncClient(timeout=timeout or 30.0) as client:
-            response = await client.post(url, headers=self._headers(), json=payload)
-
-        _raise_for_status(response.status_code, response.text)
-        return _parse_response(response.json())
+        response = await self._ahttp().post(
+            url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or 30.0
+        )
+        _raise_for_status(response.status_code, response.text, headers=response.headers)
+        return _parse_response(jsonlib.loads(response.content))
 
     async def agenerate_image(self, req: ImageRequest, *, timeout: Optional[float] = None) -> Result:
         chat_req = ChatRequest(
@@ -138,27 +150,32 @@ class GoogleAsyncProvider(Provider):
         payload = _payload(req, tools=tools)
         url = f"{self.base_url}/{_model_path(req.model)}:streamGenerateContent?alt=sse"
 
-        async with httpx.AsyncClient(timeout=timeout or 30.0) as client:
-            async with client.stream("POST", url, headers=self._headers(), json=payload) as response:
-                body = ""
-                if response.status_code >= 400:
-                    raw = await response.aread()
-                    body = raw.decode("utf-8", errors="replace")
-                _raise_for_status(response.status_code, body)
+        usage = None
+        async with self._ahttp().stream(
+            "POST", url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or 30.0
+        ) as response:
+            body = ""
+            if response.status_code >= 400:
+                raw = await response.aread()
+                body = raw.decode("utf-8", errors="replace")
+            _raise_for_status(response.status_code, body, headers=response.headers)
+
+            async for chunk in aiter_sse_data(response.aiter_bytes()):
+                if not chunk or chunk == "[DONE]":
+                    continue
 
-                async for chunk in aiter_sse_data(response.aiter_bytes()):
-                    if not chunk or chunk == "[DONE]":
-                        continue
+                try:
+                    data = jsonlib.loads(chunk)
+                except Exception:
+                    continue
 
-                    try:
-                        data = json.loads(chunk)
-                    except Exception:
-                        continue
+                if data.get("usageMetadata"):  # running totals; the last chunk's are final
+                    usage = _parse_usage(data)
 
-                    for text in _extract_text_parts(data):
-                        yield StreamEvent.text_delta(text, raw=data)
+                for text in _extract_text_parts(data):
+                    yield StreamEvent.text_delta(text, raw=data)
 
-                    for tool_call in _extract_tool_calls(data):
-                        yield StreamEvent.tool(tool_call, raw=data)
+                for tool_call in _extract_tool_calls(data):
+                    yield StreamEvent.tool(tool_call, raw=data)
 
-        yield StreamEvent.done()
\ No newline at end of file
+        yield StreamEvent.done(usage=usage)
\ No newline at end of file
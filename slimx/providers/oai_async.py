@@ -4,6 +4,7 @@ import os
 from dataclasses import replace
 
 from ..errors import ProviderAuthError
+from ..transport import pool_for
 from .openai_async import OpenAIAsyncProvider
 
 
@@ -36,4 +37,8 @@ class OAIAsyncProvider(OpenAIAsyncProvider):
         )
         if not base_url:
             raise ProviderAuthError("SLIMX_OAI_BASE_URL or OAI_BASE_URL is not set")
-        return cls(api_key=api_key, base_url=base_url)
+        return cls(
+            api_key=api_key,
+            base_url=base_url,
+            pool=pool_for(cls.name, base_url, api_key, overrides),
+        )
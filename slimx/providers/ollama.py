@@ -7,13 +7,19 @@ import httpx
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from ..content import ImagePart, TextPart, guard_modalities, to_base64
-from ..errors import ProviderError
+from ..errors import ProviderError, ProviderServerError, ProviderTimeoutError
 from ..messages import Message
 from ..tooling import ToolSpec
+from ..transport import pool_for
 from ..types import InspectedRequest, Result, StreamEvent, ToolCall, Usage
+from ..utils import jsonlib
 from ..utils.ndjson import iter_ndjson
+from ._http import HTTPPool
 from .base import Provider, ProviderCapabilities
 
+# Bodies are posted pre-encoded (`jsonlib.dumps`), so the type is set explicitly.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class OllamaProvider(Provider):
     name = "ollama"
@@ -24,8 +30,15 @@ class OllamaProvider(Provider):
         vision=True,
     )
 
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        *,
+        limits: Optional[httpx.Limits] = None,
+        pool: Optional[HTTPPool] = None,
+    ):
         self.base_url = base_url.rstrip("/")
+        self._pool = pool or HTTPPool(limits=limits)
 
     @classmethod
     def from_env(cls, **overrides):
@@ -34,14 +47,13 @@ class OllamaProvider(Provider):
         base_url = overrides.get("base_url") or os.environ.get(
             "OLLAMA_BASE_URL", "http://localhost:11434"
         )
-        return cls(base_url=base_url)
+        return cls(base_url=base_url, pool=pool_for(cls.name, base_url, None, overrides))
 
     def list_models(self, *, timeout: Optional[float] = None) -> list:
         url = f"{self.base_url}/api/tags"
-        with httpx.Client(timeout=_timeout(timeout)) as client:
-            response = client.get(url)
+        response = self._http().get(url, timeout=_timeout(timeout))
         if response.status_code >= 400:
-            raise ProviderError(f"Ollama error {response.status_code}: {_read_response_text(response)}")
+            _raise_for_status(response.status_code, _read_response_text(response))
         data = response.json()
         return [m.get("name") for m in (data.get("models") or []) if m.get("name")]
 
@@ -62,30 +74,31 @@ class OllamaProvider(Provider):
         data: Dict[str, Any] = {}
 
         try:
-            with httpx.Client(timeout=_timeout(timeout)) as client:
-                with client.stream("POST", url, json=payload) as response:
-                    if response.status_code >= 400:
-                        body = _read_response_text(response)
-                        raise ProviderError(f"Ollama error {response.status_code}: {body}")
-
-                    for obj in iter_ndjson(response.iter_bytes()):
-                        data = obj
-                        message = obj.get("message") or {}
-                        chunk = message.get("content") or ""
-                        if chunk:
-                            text_parts.append(chunk)
-                        raw_tool_calls.extend(message.get("tool_calls") or [])
-
-                        if obj.get("done") is True:
-                            break
+            with self._http().stream(
+                "POST",
+                url,
+                headers=_JSON_HEADERS,
+                content=jsonlib.dumps(payload),
+                timeout=_timeout(timeout),
+            ) as response:
+                if response.status_code >= 400:
+                    _raise_for_status(response.status_code, _read_response_text(response))
+
+                for obj in iter_ndjson(response.iter_bytes()):
+                    data = obj
+                    message = obj.get("message") or {}
+                    chunk = message.get("content") or ""
+                    if chunk:
+                        text_parts.append(chunk)
+                    raw_tool_calls.extend(message.get("tool_calls") or [])
+
+                    if obj.get("done") is True:
+                        break
 
         except httpx.TimeoutException as e:
-            raise ProviderError(_timeout_message(req.model, url, streaming=False)) from e
+            raise ProviderTimeoutError(_timeout_message(req.model, url, streaming=False)) from e
 
-        usage = Usage(
-            prompt_tokens=data.get("prompt_eval_count"),
-            completion_tokens=data.get("eval_count"),
-        )
+        usage = _parse_usage(data)
         return Result(
             text="".join(text_parts),
             raw=data,
@@ -102,29 +115,35 @@ class OllamaProvider(Provider):
     ) -> Iterable[StreamEvent]:
         payload = _payload(req, stream=True, tools=tools)
         url = f"{self.base_url}/api/chat"
+        usage = None
 
         try:
-            with httpx.Client(timeout=_timeout(timeout)) as client:
-                with client.stream("POST", url, json=payload) as response:
-                    if response.status_code >= 400:
-                        body = _read_response_text(response)
-                        raise ProviderError(f"Ollama error {response.status_code}: {body}")
-
-                    for obj in iter_ndjson(response.iter_bytes()):
-                        message = obj.get("message") or {}
-                        chunk = message.get("content") or ""
-                        if chunk:
-                            yield StreamEvent(type="text_delta", text=chunk, raw=obj)
-                        for call in _parse_tool_calls(message.get("tool_calls") or []):
-                            yield StreamEvent.tool(call, raw=obj)
-
-                        if obj.get("done") is True:
-                            break
+            with self._http().stream(
+                "POST",
+                url,
+                headers=_JSON_HEADERS,
+                content=jsonlib.dumps(payload),
+                timeout=_timeout(timeout),
+            ) as response:
+                if response.status_code >= 400:
+                    _raise_for_status(response.status_code, _read_response_text(response))
+
+                for obj in iter_ndjson(response.iter_bytes()):
+                    message = obj.get("message") or {}
+                    chunk = message.get("content") or ""
+                    if chunk:
+                        yield StreamEvent(type="text_delta", text=chunk, raw=obj)
+                    for call in _parse_tool_calls(message.get("tool_calls") or []):
+                        yield StreamEvent.tool(call, raw=obj)
+
+                    if obj.get("done") is True:
+                        usage = _parse_usage(obj)
+                        break
 
         except httpx.TimeoutException as e:
-            raise ProviderError(_timeout_message(req.model, url, streaming=True)) from e
+            raise ProviderTimeoutError(_timeout_message(req.model, url, streaming=True)) from e
 
-        yield StreamEvent(type="done")
+        yield StreamEvent.done(usage=usage)
 
 
 # --------------------------------------------------------------------------
@@ -138,12 +157,27 @@ def _read_response_text(response: httpx.Response) -> str:
         return ""
 
 
+def _raise_for_status(status_code: int, body: str) -> None:
+    # 5xx (an overloaded or crashed server) is what retries and the breaker act on.
+    if status_code >= 500:
+        raise ProviderServerError(f"Ollama error {status_code}: {body}")
+    raise ProviderError(f"Ollama error {status_code}: {body}")
+
+
 def _timeout(timeout: Optional[float]) -> httpx.Timeout:
     if timeout is None:
         return httpx.Timeout(None, connect=10.0)
     return httpx.Timeout(timeout, connect=min(float(timeout), 10.0))
 
 
+def _parse_usage(data: Dict[str, Any]) -> Usage:
+    """Token counts from the final (``done``) object of a chat response."""
+    return Usage(
+        prompt_tokens=data.get("prompt_eval_count"),
+        completion_tokens=data.get("eval_count"),
+    )
+
+
 def _timeout_message(model: str, url: str, *, streaming: bool) -> str:
     kind = "stream" if streaming else "request"
     return (
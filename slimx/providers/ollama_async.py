@@ -3,14 +3,25 @@
 import os
 
 import httpx
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 
-from ..errors import ProviderError
+from ..errors import ProviderTimeoutError
 from ..tooling import ToolSpec
-from ..types import InspectedRequest, Result, StreamEvent, Usage
+from ..transport import pool_for
+from ..types import InspectedRequest, Result, StreamEvent
+from ..utils import jsonlib
 from ..utils.ndjson import aiter_ndjson
+from ._http import HTTPPool
 from .base import Provider, ProviderCapabilities
-from .ollama import _parse_tool_calls, _payload, _timeout, _timeout_message
+from .ollama import (
+    _JSON_HEADERS,
+    _parse_tool_calls,
+    _parse_usage,
+    _payload,
+    _raise_for_status,
+    _timeout,
+    _timeout_message,
+)
 
 
 class OllamaAsyncProvider(Provider):
@@ -24,8 +35,15 @@ class OllamaAsyncProvider(Provider):
         vision=True,
     )
 
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        *,
+        limits: Optional[httpx.Limits] = None,
+        pool: Optional[HTTPPool] = None,
+    ):
         self.base_url = base_url.rstrip("/")
+        self._pool = pool or HTTPPool(limits=limits)
 
     @classmethod
     def from_env(cls, **overrides):
@@ -33,7 +51,7 @@ class OllamaAsyncProvider(Provider):
         base_url = overrides.get("base_url") or os.environ.get(
             "OLLAMA_BASE_URL", "http://localhost:11434"
         )
-        return cls(base_url=base_url)
+        return cls(base_url=base_url, pool=pool_for(cls.name, base_url, None, overrides))
 
     def chat(self, req, *, tools: Sequence[ToolSpec] = (), timeout=None):
         raise NotImplementedError
@@ -58,30 +76,31 @@ class OllamaAsyncProvider(Provider):
         data: Dict[str, Any] = {}
 
         try:
-            async with httpx.AsyncClient(timeout=_timeout(timeout)) as client:
-                async with client.stream("POST", url, json=payload) as response:
-                    if response.status_code >= 400:
-                        body = await _aread_response_text(response)
-                        raise ProviderError(f"Ollama error {response.status_code}: {body}")
-
-                    async for obj in aiter_ndjson(response.aiter_bytes()):
-                        data = obj
-                        message = obj.get("message") or {}
-                        chunk = message.get("content") or ""
-                        if chunk:
-                            text_parts.append(chunk)
-                        raw_tool_calls.extend(message.get("tool_calls") or [])
-
-                        if obj.get("done") is True:
-                            break
+            async with self._ahttp().stream(
+                "POST",
+                url,
+                headers=_JSON_HEADERS,
+                content=jsonlib.dumps(payload),
+                timeout=_timeout(timeout),
+            ) as response:
+                if response.status_code >= 400:
+                    _raise_for_status(response.status_code, await _aread_response_text(response))
+
+                async for obj in aiter_ndjson(response.aiter_bytes()):
+                    data = obj
+                    message = obj.get("message") or {}
+                    chunk = message.get("content") or ""
+                    if chunk:
+                        text_parts.append(chunk)
+                    raw_tool_calls.extend(message.get("tool_calls") or [])
+
+                    if obj.get("done") is True:
+                        break
 
         except httpx.TimeoutException as e:
-            raise ProviderError(_timeout_message(req.model, url, streaming=False)) from e
+            raise ProviderTimeoutError(_timeout_message(req.model, url, streaming=False)) from e
 
-        usage = Usage(
-            prompt_tokens=data.get("prompt_eval_count"),
-            completion_tokens=data.get("eval_count"),
-        )
+        usage = _parse_usage(data)
         return Result(
             text="".join(text_parts),
             raw=data,
@@ -92,29 +111,35 @@ class OllamaAsyncProvider(Provider):
     async def astream(self, req, *, tools: Sequence[ToolSpec] = (), timeout=None):
         payload = _payload(req, stream=True, tools=tools)
         url = f"{self.base_url}/api/chat"
+        usage = None
 
         try:
-            async with httpx.AsyncClient(timeout=_timeout(timeout)) as client:
-                async with client.stream("POST", url, json=payload) as response:
-                    if response.status_code >= 400:
-                        body = await _aread_response_text(response)
-                        raise ProviderError(f"Ollama error {response.status_code}: {body}")
-
-                    async for obj in aiter_ndjson(response.aiter_bytes()):
-                        message = obj.get("message") or {}
-                        chunk = message.get("content") or ""
-                        if chunk:
-                            yield StreamEvent(type="text_delta", text=chunk, raw=obj)
-                        for call in _parse_tool_calls(message.get("tool_calls") or []):
-                            yield StreamEvent.tool(call, raw=obj)
-
-                        if obj.get("done") is True:
-                            break
+            async with self._ahttp().stream(
+                "POST",
+                url,
+                headers=_JSON_HEADERS,
+                content=jsonlib.dumps(payload),
+                timeout=_timeout(timeout),
+            ) as response:
+                if response.status_code >= 400:
+                    _raise_for_status(response.status_code, await _aread_response_text(response))
+
+                async for obj in aiter_ndjson(response.aiter_bytes()):
+                    message = obj.get("message") or {}
+                    chunk = message.get("content") or ""
+                    if chunk:
+                        yield StreamEvent(type="text_delta", text=chunk, raw=obj)
+                    for call in _parse_tool_calls(message.get("tool_calls") or []):
+                        yield StreamEvent.tool(call, raw=obj)
+
+                    if obj.get("done") is True:
+                        usage = _parse_usage(obj)
+                        break
 
         except httpx.TimeoutException as e:
-            raise ProviderError(_timeout_message(req.model, url, streaming=True)) from e
+            raise ProviderTimeoutError(_timeout_message(req.model, url, streaming=True)) from e
 
-        yield StreamEvent(type="done")
+        yield StreamEvent.done(usage=usage)
 
 
 async def _aread_response_text(response: httpx.Response) -> str:
@@ -1,4 +1,3 @@
-import json
 import os
 from typing import Dict, Iterable, Optional, Sequence
 
@@ -7,7 +6,9 @@ import httpx
 from ..errors import ProviderAuthError
 from ..low.types import ImageEditRequest, ImageRequest
 from ..tooling import ToolSpec
+from ..transport import pool_for
 from ..types import InspectedRequest, StreamEvent, redact_headers
+from ..utils import jsonlib
 from ..utils.sse import iter_sse_data
 from ._openai_responses import (
     ResponsesStreamTranslator,
@@ -23,7 +24,9 @@ from ._openai_shape import (
     parse_image_response,
     raise_for_status,
     text_delta_from_chunk,
+    usage_from_chunk,
 )
+from ._http import HTTPPool, http2_from_env
 from .base import Provider, ProviderCapabilities
 
 # A hosted-image-tool request goes to the Responses API, which can run an image
@@ -46,9 +49,18 @@ class OpenAIProvider(Provider):
         image_partial_streaming=True,
     )
 
-    def __init__(self, api_key: str, base_url: str = "https://api.openai.com/v1"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.openai.com/v1",
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        pool: Optional[HTTPPool] = None,
+    ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._pool = pool or HTTPPool(limits=limits, http2=http2)
 
     @classmethod
     def from_env(cls, **overrides):
@@ -63,16 +75,19 @@ class OpenAIProvider(Provider):
         base_url = overrides.get("base_url") or os.environ.get(
             "OPENAI_BASE_URL", "https://api.openai.com/v1"
         )
-        return cls(api_key=api_key, base_url=base_url)
+        return cls(
+            api_key=api_key,
+            base_url=base_url,
+            pool=pool_for(cls.name, base_url, api_key, overrides, http2=http2_from_env(overrides)),
+        )
 
     def _headers(self) -> Dict[str, str]:
         return {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
 
     def list_models(self, *, timeout: Optional[float] = None) -> list:
         url = f"{self.base_url}/models"
-        with httpx.Client(timeout=timeout or 10.0) as c:
-            r = c.get(url, headers=self._headers())
-        raise_for_status(r.status_code, r.text)
+        r = self._http().get(url, headers=self._headers(), timeout=timeout or 10.0)
+        raise_for_status(r.status_code, r.text, headers=r.headers)
         data = r.json()
         return [m.get("id") for m in (data.get("data") or []) if m.get("id")]
 
@@ -106,20 +121,20 @@ class OpenAIProvider(Provider):
 
     def generate_image(self, req: ImageRequest, *, timeout: Optional[float] = None):
         url = f"{self.base_url}/images/generations"
-        with httpx.Client(timeout=timeout or 60.0) as c:
-            r = c.post(url, headers=self._headers(), json=req.to_dict())
-        raise_for_status(r.status_code, r.text)
-        return parse_image_response(r.json())
+        r = self._http().post(url, headers=self._headers(), content=jsonlib.dumps(req.to_dict()), timeout=timeout or 60.0)
+        raise_for_status(r.status_code, r.text, headers=r.headers)
+        return parse_image_response(jsonlib.loads(r.content))
 
     def edit_image(self, req: ImageEditRequest, *, timeout: Optional[float] = None):
         """Edit/refine source image(s) via the Responses API (forced image tool)."""
         payload = build_edit_payload(req)
         url = f"{self.base_url}/responses"
-        with httpx.Client(timeout=timeout or RESPONSES_DEFAULT_TIMEOUT) as c:
-            r = c.post(url, headers=self._headers(), json=payload)
-        raise_for_status(r.status_code, r.text)
+        r = self._http().post(
+            url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or RESPONSES_DEFAULT_TIMEOUT
+        )
+        raise_for_status(r.status_code, r.text, headers=r.headers)
         return parse_responses_response(
-            r.json(), provider=self.name, model=req.model, operation="edit"
+            jsonlib.loads(r.content), provider=self.name, model=req.model, operation="edit"
         )
 
     def chat(self, req, *, tools: Sequence[ToolSpec] = (), timeout: Optional[float] = None):
@@ -127,21 +142,21 @@ class OpenAIProvider(Provider):
         if getattr(req, "image_generation", None) is not None:
             payload = build_responses_payload(req, tools, caps=self.capabilities, provider=self.name)
             url = f"{self.base_url}/responses"
-            with httpx.Client(timeout=timeout or RESPONSES_DEFAULT_TIMEOUT) as c:
-                r = c.post(url, headers=self._headers(), json=payload)
-            raise_for_status(r.status_code, r.text)
+            r = self._http().post(
+                url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or RESPONSES_DEFAULT_TIMEOUT
+            )
+            raise_for_status(r.status_code, r.text, headers=r.headers)
             return parse_responses_response(
-                r.json(),
+                jsonlib.loads(r.content),
                 provider=self.name,
                 model=req.model,
                 operation=operation_for_options(req.image_generation),
             )
         payload = build_payload(req, tools, caps=self.capabilities, provider=self.name)
         url = f"{self.base_url}/chat/completions"
-        with httpx.Client(timeout=timeout or 30.0) as c:
-            r = c.post(url, headers=self._headers(), json=payload)
-        raise_for_status(r.status_code, r.text)
-        return parse_chat_response(r.json())
+        r = self._http().post(url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or 30.0)
+        raise_for_status(r.status_code, r.text, headers=r.headers)
+        return parse_chat_response(jsonlib.loads(r.content))
 
     def stream(
         self, req, *, tools: Sequence[ToolSpec] = (), timeout: Optional[float] = None
@@ -155,26 +170,29 @@ class OpenAIProvider(Provider):
     def _chat_stream(self, req, tools, timeout) -> Iterable[StreamEvent]:
         payload = build_payload(req, tools, stream=True, caps=self.capabilities, provider=self.name)
         url = f"{self.base_url}/chat/completions"
-        with httpx.Client(timeout=timeout) as c:
-            with c.stream("POST", url, headers=self._headers(), json=payload) as r:
-                if r.status_code >= 400:
-                    # Body must be read before access on a streamed response.
-                    body = r.read().decode("utf-8", errors="replace")
-                    raise_for_status(r.status_code, body)
-                acc = StreamToolAccumulator()
-                for chunk in iter_sse_data(r.iter_bytes()):
-                    if chunk == "[DONE]":
-                        break
-                    try:
-                        obj = json.loads(chunk)
-                    except Exception:
-                        continue
-                    event = text_delta_from_chunk(obj, acc)
-                    if event is not None:
-                        yield event
-                for event in acc.events():
+        with self._http().stream(
+            "POST", url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout
+        ) as r:
+            if r.status_code >= 400:
+                # Body must be read before access on a streamed response.
+                body = r.read().decode("utf-8", errors="replace")
+                raise_for_status(r.status_code, body, headers=r.headers)
+            acc = StreamToolAccumulator()
+            usage = None
+            for chunk in iter_sse_data(r.iter_bytes()):
+                if chunk == "[DONE]":
+                    break
+                try:
+                    obj = jsonlib.loads(chunk)
+                except Exception:
+                    continue
+                usage = usage_from_chunk(obj) or usage
+                event = text_delta_from_chunk(obj, acc)
+                if event is not None:
                     yield event
-        yield StreamEvent.done()
+            for event in acc.events():
+                yield event
+        yield StreamEvent.done(usage=usage)
 
     def _responses_stream(self, req, tools, timeout) -> Iterable[StreamEvent]:
         payload = build_responses_payload(
@@ -184,19 +202,20 @@ class OpenAIProvider(Provider):
         translator = ResponsesStreamTranslator(
             provider=self.name, model=req.model, operation=operation_for_options(req.image_generation)
         )
-        with httpx.Client(timeout=timeout) as c:
-            with c.stream("POST", url, headers=self._headers(), json=payload) as r:
-                if r.status_code >= 400:
-                    body = r.read().decode("utf-8", errors="replace")
-                    raise_for_status(r.status_code, body)
-                for chunk in iter_sse_data(r.iter_bytes()):
-                    if chunk == "[DONE]":
-                        break
-                    try:
-                        obj = json.loads(chunk)
-                    except Exception:
-                        continue
-                    for event in translator.feed(obj):
-                        yield event
+        with self._http().stream(
+            "POST", url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout
+        ) as r:
+            if r.status_code >= 400:
+                body = r.read().decode("utf-8", errors="replace")
+                raise_for_status(r.status_code, body, headers=r.headers)
+            for chunk in iter_sse_data(r.iter_bytes()):
+                if chunk == "[DONE]":
+                    break
+                try:
+                    obj = jsonlib.loads(chunk)
+                except Exception:
+                    continue
+                for event in translator.feed(obj):
+                    yield event
         for event in translator.finish():
             yield event
@@ -1,4 +1,3 @@
-import json
 import os
 from typing import Dict, Optional, Sequence
 
@@ -7,7 +6,9 @@ import httpx
 from ..errors import ProviderAuthError
 from ..low.types import ImageEditRequest, ImageRequest
 from ..tooling import ToolSpec
+from ..transport import pool_for
 from ..types import InspectedRequest, StreamEvent, redact_headers
+from ..utils import jsonlib
 from ..utils.sse_async import aiter_sse_data
 from ._openai_responses import (
     ResponsesStreamTranslator,
@@ -23,7 +24,9 @@ from ._openai_shape import (
     parse_image_response,
     raise_for_status,
     text_delta_from_chunk,
+    usage_from_chunk,
 )
+from ._http import HTTPPool, http2_from_env
 from .base import Provider, ProviderCapabilities
 
 RESPONSES_DEFAULT_TIMEOUT = 120.0
@@ -46,9 +49,18 @@ class OpenAIAsyncProvider(Provider):
         image_partial_streaming=True,
     )
 
-    def __init__(self, api_key: str, base_url: str = "https://api.openai.com/v1"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.openai.com/v1",
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        pool: Optional[HTTPPool] = None,
+    ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._pool = pool or HTTPPool(limits=limits, http2=http2)
 
     @classmethod
     def from_env(cls, **overrides):
@@ -59,7 +71,11 @@ class OpenAIAsyncProvider(Provider):
         base_url = overrides.get("base_url") or os.environ.get(
             "OPENAI_BASE_URL", "https://api.openai.com/v1"
         )
-        return cls(api_key=api_key, base_url=base_url)
+        return cls(
+            api_key=api_key,
+            base_url=base_url,
+            pool=pool_for(cls.name, base_url, api_key, overrides, http2=http2_from_env(overrides)),
+        )
 
     def _headers(self) -> Dict[str, str]:
         return {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
@@ -84,19 +100,21 @@ class OpenAIAsyncProvider(Provider):
 
     async def agenerate_image(self, req: ImageRequest, *, timeout: Optional[float] = None):
         url = f"{self.base_url}/images/generations"
-        async with httpx.AsyncClient(timeout=timeout or 60.0) as c:
-            r = await c.post(url, headers=self._headers(), json=req.to_dict())
-        raise_for_status(r.status_code, r.text)
-        return parse_image_response(r.json())
+        r = await self._ahttp().post(
+            url, headers=self._headers(), content=jsonlib.dumps(req.to_dict()), timeout=timeout or 60.0
+        )
+        raise_for_status(r.status_code, r.text, headers=r.headers)
+        return parse_image_response(jsonlib.loads(r.content))
 
     async def aedit_image(self, req: ImageEditRequest, *, timeout: Optional[float] = None):
         payload = build_edit_payload(req)
         url = f"{self.base_url}/responses"
-        async with httpx.AsyncClient(timeout=timeout or RESPONSES_DEFAULT_TIMEOUT) as c:
-            r = await c.post(url, headers=self._headers(), json=payload)
-        raise_for_status(r.status_code, r.text)
+        r = await self._ahttp().post(
+            url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or RESPONSES_DEFAULT_TIMEOUT
+        )
+        raise_for_status(r.status_code, r.text, headers=r.headers)
         return parse_responses_response(
-            r.json(), provider=self.name, model=req.model, operation="edit"
+            jsonlib.loads(r.content), provider=self.name, model=req.model, operation="edit"
         )
 
     def chat(self, req, *, tools: Sequence[ToolSpec] = (), timeout: Optional[float] = None):
@@ -109,21 +127,21 @@ class OpenAIAsyncProvider(Provider):
         if getattr(req, "image_generation", None) is not None:
             payload = build_responses_payload(req, tools, caps=self.capabilities, provider=self.name)
             url = f"{self.base_url}/responses"
-            async with httpx.AsyncClient(timeout=timeout or RESPONSES_DEFAULT_TIMEOUT) as c:
-                r = await c.post(url, headers=self._headers(), json=payload)
-            raise_for_status(r.status_code, r.text)
+            r = await self._ahttp().post(
+                url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or RESPONSES_DEFAULT_TIMEOUT
+            )
+            raise_for_status(r.status_code, r.text, headers=r.headers)
             return parse_responses_response(
-                r.json(),
+                jsonlib.loads(r.content),
                 provider=self.name,
                 model=req.model,
                 operation=operation_for_options(req.image_generation),
             )
         payload = build_payload(req, tools, caps=self.capabilities, provider=self.name)
         url = f"{self.base_url}/chat/completions"
-        async with httpx.AsyncClient(timeout=timeout or 30.0) as c:
-            r = await c.post(url, headers=self._headers(), json=payload)
-        raise_for_status(r.status_code, r.text)
-        return parse_chat_response(r.json())
+        r = await self._ahttp().post(url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout or 30.0)
+        raise_for_status(r.status_code, r.text, headers=r.headers)
+        return parse_chat_response(jsonlib.loads(r.content))
 
     async def astream(self, req, *, tools: Sequence[ToolSpec] = (), timeout: Optional[float] = None):
         if getattr(req, "image_generation", None) is not None:
@@ -133,24 +151,27 @@ class OpenAIAsyncProvider(Provider):
         payload = build_payload(req, tools, stream=True, caps=self.capabilities, provider=self.name)
         url = f"{self.base_url}/chat/completions"
         acc = StreamToolAccumulator()
-        async with httpx.AsyncClient(timeout=timeout) as c:
-            async with c.stream("POST", url, headers=self._headers(), json=payload) as r:
-                if r.status_code >= 400:
-                    body = (await r.aread()).decode("utf-8", errors="replace")
-                    raise_for_status(r.status_code, body)
-                async for chunk in aiter_sse_data(r.aiter_bytes()):
-                    if chunk == "[DONE]":
-                        break
-                    try:
-                        obj = json.loads(chunk)
-                    except Exception:
-                        continue
-                    event = text_delta_from_chunk(obj, acc)
-                    if event is not None:
-                        yield event
+        usage = None
+        async with self._ahttp().stream(
+            "POST", url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout
+        ) as r:
+            if r.status_code >= 400:
+                body = (await r.aread()).decode("utf-8", errors="replace")
+                raise_for_status(r.status_code, body, headers=r.headers)
+            async for chunk in aiter_sse_data(r.aiter_bytes()):
+                if chunk == "[DONE]":
+                    break
+                try:
+                    obj = jsonlib.loads(chunk)
+                except Exception:
+                    continue
+                usage = usage_from_chunk(obj) or usage
+                event = text_delta_from_chunk(obj, acc)
+                if event is not None:
+                    yield event
         for event in acc.events():
             yield event
-        yield StreamEvent.done()
+        yield StreamEvent.done(usage=usage)
 
     async def _aresponses_stream(self, req, tools, timeout):
         payload = build_responses_payload(
@@ -160,19 +181,20 @@ class OpenAIAsyncProvider(Provider):
         translator = ResponsesStreamTranslator(
             provider=self.name, model=req.model, operation=operation_for_options(req.image_generation)
         )
-        async with httpx.AsyncClient(timeout=timeout) as c:
-            async with c.stream("POST", url, headers=self._headers(), json=payload) as r:
-                if r.status_code >= 400:
-                    body = (await r.aread()).decode("utf-8", errors="replace")
-                    raise_for_status(r.status_code, body)
-                async for chunk in aiter_sse_data(r.aiter_bytes()):
-                    if chunk == "[DONE]":
-                        break
-                    try:
-                        obj = json.loads(chunk)
-                    except Exception:
-                        continue
-                    for event in translator.feed(obj):
-                        yield event
+        async with self._ahttp().stream(
+            "POST", url, headers=self._headers(), content=jsonlib.dumps(payload), timeout=timeout
+        ) as r:
+            if r.status_code >= 400:
+                body = (await r.aread()).decode("utf-8", errors="replace")
+                raise_for_status(r.status_code, body, headers=r.headers)
+            async for chunk in aiter_sse_data(r.aiter_bytes()):
+                if chunk == "[DONE]":
+                    break
+                try:
+                    obj = jsonlib.loads(chunk)
+                except Exception:
+                    continue
+                for event in translator.feed(obj):
+                    yield event
         for event in translator.finish():
             yield event
@@ -80,6 +80,29 @@ class CallRecord:
     @classmethod
     def load(cls, path: str) -> "CallRecord":
         with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CallRecord":
+        """The inverse of ``to_dict`` (elided media stays elided)."""
         known = {f_.name for f_ in cls.__dataclass_fields__.values()}  # type: ignore[attr-defined]
         return cls(**{k: v for k, v in data.items() if k in known})
+
+    def to_result(self) -> "Result":
+        """Rebuild the ``Result`` this record was made from (text, tool calls, usage,
+        data, raw payload, trace and request)."""
+        from .types import Result, ToolCall, Usage
+
+        response = self.response
+        return Result(
+            text=response.get("text") or "",
+            raw=self.raw,
+            usage=Usage(**(response.get("usage") or {})),
+            tool_calls=[
+                ToolCall(id=tc["id"], name=tc["name"], arguments=tc.get("arguments") or {}, extra=tc.get("extra") or {})
+                for tc in response.get("tool_calls") or []
+            ],
+            data=response.get("data"),
+            trace=dict(self.trace),
+            request=dict(self.request) or None,
+        )
@@ -0,0 +1,156 @@
+"""In-process latency and health statistics per model, for adaptive routing.
+
+Every chat attempt made through a ``Client`` is recorded here, keyed by
+``(provider, base_url, model)``:
+
+- ``latency_ms``: an exponentially weighted moving average (EWMA) of successful
+  request latency.
+- ``ttfb_ms``: the EWMA of time to the first streamed event (streams only).
+- ``error_rate``: the EWMA of failures, where a failed attempt counts as 1 and a
+  success as 0, starting from 0. It takes about four failures in a row to cross
+  ``UNHEALTHY``.
+
+Each new sample carries weight ``ALPHA``, so the averages follow recent behavior
+and forget old incidents within a few dozen calls.
+
+``parallel(mode="race", top_k=...)`` and ``fallback(..., adaptive=True)`` route by
+these numbers. ``snapshot()`` shows what they saw:
+
+    >>> slimx.stats.snapshot()
+    [{'provider': 'openai', 'model': 'gpt-4.1-nano', 'latency_ms': 412.5, 'error_rate': 0.0, ...}]
+
+``reset()`` forgets everything (useful between tests).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+ALPHA = 0.2
+# A model whose recent error rate is at least this is unhealthy and routed last.
+UNHEALTHY = 0.5
+# Cap on the error rate used for scoring, so a dead model scores high, not infinite.
+_MAX_ERROR_RATE = 0.95
+
+Key = Tuple[str, str, str]
+
+
+@dataclass
+class ModelStats:
+    provider: str
+    base_url: str
+    model: str
+    calls: int = 0
+    errors: int = 0
+    latency_ms: Optional[float] = None
+    ttfb_ms: Optional[float] = None
+    error_rate: float = 0.0
+    last_error: Optional[str] = None
+    updated_at: Optional[float] = None  # time.time() of the last sample
+
+    @property
+    def healthy(self) -> bool:
+        return self.error_rate < UNHEALTHY
+
+    def score(self) -> Optional[float]:
+        """Expected milliseconds to a successful answer (lower is better): the mean
+        latency stretched by the retries its error rate implies. ``None`` until a
+        call has succeeded."""
+        if self.latency_ms is None:
+            return None
+        return self.latency_ms / (1.0 - min(self.error_rate, _MAX_ERROR_RATE))
+
+
+def _ewma(old: Optional[float], sample: float) -> float:
+    return sample if old is None else old + ALPHA * (sample - old)
+
+
+_STATS: Dict[Key, ModelStats] = {}
+_LOCK = threading.Lock()
+
+
+def _key(provider: str, base_url: str, model: str) -> Key:
+    return (provider, base_url.rstrip("/"), model)
+
+
+def record(
+    provider: str,
+    base_url: str,
+    model: str,
+    *,
+    latency_ms: Optional[float] = None,
+    ttfb_ms: Optional[float] = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    """Record one attempt: its latency on success, or the ``error`` it raised."""
+    key = _key(provider, base_url, model)
+    with _LOCK:
+        s = _STATS.get(key)
+        if s is None:
+            s = _STATS[key] = ModelStats(provider, key[1], model)
+        s.calls += 1
+        s.updated_at = time.time()
+        s.error_rate = _ewma(s.error_rate, 1.0 if error is not None else 0.0)
+        if error is not None:
+            s.errors += 1
+            s.last_error = f"{type(error).__name__}: {error}"
+            return
+        if latency_ms is not None:
+            s.latency_ms = _ewma(s.latency_ms, latency_ms)
+        if ttfb_ms is not None:
+            s.ttfb_ms = _ewma(s.ttfb_ms, ttfb_ms)
+
+
+def get(provider: str, base_url: str, model: str) -> Optional[ModelStats]:
+    """A copy of one model's stats, or ``None`` if it has never been called."""
+    with _LOCK:
+        s = _STATS.get(_key(provider, base_url, model))
+        return None if s is None else ModelStats(**asdict(s))
+
+
+def snapshot() -> List[Dict[str, Any]]:
+    """Every tracked model, with its ``score`` and ``healthy`` flag, best score first."""
+    with _LOCK:
+        items = [ModelStats(**asdict(s)) for s in _STATS.values()]
+    out = [{**asdict(s), "score": s.score(), "healthy": s.healthy} for s in items]
+    return sorted(out, key=lambda d: (d["score"] is None, d["score"] or 0.0))
+
+
+def reset() -> None:
+    with _LOCK:
+        _STATS.clear()
+
+
+def key_of(model: Any) -> Key:
+    """The stats key of a ``Model`` / ``AsyncModel``."""
+    client = model._client
+    return _key(client.provider_name, client._endpoint, model._model)
+
+
+def rank_fastest(keys: Sequence[Key]) -> List[int]:
+    """Indices of ``keys``, lowest expected latency first. Models without a score
+    yet come first, so they get measured; ties keep their given order."""
+    scores = [_score(k) for k in keys]
+    return sorted(range(len(keys)), key=lambda i: (scores[i] is not None, scores[i] or 0.0))
+
+
+def rank_healthy(keys: Sequence[Key]) -> List[int]:
+    """Indices of ``keys`` with unhealthy models moved to the back; the given order
+    is otherwise kept (it expresses preference, e.g. cost)."""
+    unhealthy = [_unhealthy(k) for k in keys]
+    return sorted(range(len(keys)), key=lambda i: unhealthy[i])
+
+
+def _score(key: Key) -> Optional[float]:
+    with _LOCK:
+        s = _STATS.get(key)
+        return None if s is None else s.score()
+
+
+def _unhealthy(key: Key) -> bool:
+    with _LOCK:
+        s = _STATS.get(key)
+        return s is not None and not s.healthy
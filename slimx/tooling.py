@@ -1,8 +1,17 @@
+import asyncio
+import contextvars
 import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, get_type_hints
-from .errors import ToolExecutionError
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union, get_type_hints, overload
+from .errors import ToolExecutionError, ToolTimeoutError
 from .schema import _schema_for_type
+from .utils.executor import helper_pool, submit_started
+
+# Tool calls of one model turn that the auto tool runtime runs at once.
+DEFAULT_TOOL_CONCURRENCY = 8
 
 @dataclass(frozen=True)
 class ToolSpec:
@@ -10,8 +19,27 @@ class ToolSpec:
     description: str
     parameters: Dict[str, Any]
     fn: Callable[..., Any]
+    # Seconds the tool may run before it fails with ToolTimeoutError.
+    timeout: Optional[float] = None
+    # Async path only: run a sync tool on a worker thread (False: on the event loop).
+    thread: bool = True
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.fn)
 
-def tool(fn: Callable[..., Any]) -> ToolSpec:
+@overload
+def tool(fn: Callable[..., Any], *, timeout: Optional[float] = None, thread: bool = True) -> ToolSpec: ...
+@overload
+def tool(*, timeout: Optional[float] = None, thread: bool = True) -> Callable[[Callable[..., Any]], ToolSpec]: ...
+
+def tool(
+    fn: Optional[Callable[..., Any]] = None, *, timeout: Optional[float] = None, thread: bool = True
+) -> Union[ToolSpec, Callable[[Callable[..., Any]], ToolSpec]]:
+    """Declare a tool: ``@tool`` or ``@tool(timeout=5.0)``. ``async def`` tools are
+    awaited natively on the async path."""
+    if fn is None:
+        return lambda f: tool(f, timeout=timeout, thread=thread)
     name = fn.__name__
     desc = (inspect.getdoc(fn) or "").strip() or f"Tool: {name}"
     sig = inspect.signature(fn)
@@ -24,11 +52,141 @@ def tool(fn: Callable[..., Any]) -> ToolSpec:
         props[p.name] = _schema_for_type(hints.get(p.name, Any))
         if p.default is inspect.Parameter.empty:
             required.append(p.name)
+    if timeout is not None and timeout <= 0:
+        raise ValueError(f"tool timeout must be > 0, got {timeout}")
+    if timeout is not None and not thread and not inspect.iscoroutinefunction(fn):
+        raise ValueError("a sync tool with a timeout needs thread=True: it cannot be cut off on the event loop")
     schema = {"type":"object","properties":props,"required":required,"additionalProperties":False}
-    return ToolSpec(name=name, description=desc, parameters=schema, fn=fn)
+    return ToolSpec(name=name, description=desc, parameters=schema, fn=fn, timeout=timeout, thread=thread)
+
+def _timed_out(spec: ToolSpec) -> ToolTimeoutError:
+    return ToolTimeoutError(f"Tool '{spec.name}' timed out after {spec.timeout:g}s")
+
+def _run_coroutine(spec: ToolSpec, arguments: Dict[str, Any]) -> Any:
+    """An async tool, called from sync code: run it on a fresh event loop (on a
+    helper thread if this one already runs a loop)."""
+    async def bounded() -> Any:
+        if spec.timeout is None:
+            return await spec.fn(**arguments)
+        try:
+            return await asyncio.wait_for(spec.fn(**arguments), spec.timeout)
+        except asyncio.TimeoutError:
+            raise _timed_out(spec) from None
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(bounded())
+    return helper_pool("tool").submit(contextvars.copy_context().run, asyncio.run, bounded()).result()
+
+def _run_with_timeout(spec: ToolSpec, arguments: Dict[str, Any]) -> Any:
+    # The tool cannot be interrupted: past its timeout it is abandoned in its thread.
+    # The timeout counts from when it starts, not from its wait for a free worker.
+    fut, started = submit_started(helper_pool("tool"), contextvars.copy_context().run, spec.fn, **arguments)
+    started.wait()
+    try:
+        return fut.result(timeout=spec.timeout)
+    except FutureTimeout:
+        if fut.done():  # the tool itself raised a TimeoutError
+            raise
+        raise _timed_out(spec) from None
 
 def execute_tool(spec: ToolSpec, arguments: Dict[str, Any]) -> Any:
     try:
+        if spec.is_async:
+            return _run_coroutine(spec, arguments)
+        if spec.timeout is not None:
+            return _run_with_timeout(spec, arguments)
         return spec.fn(**arguments)
+    except ToolTimeoutError:
+        raise
+    except Exception as e:
+        raise ToolExecutionError(f"Tool '{spec.name}' failed: {e}") from e
+
+async def aexecute_tool(spec: ToolSpec, arguments: Dict[str, Any]) -> Any:
+    """``execute_tool`` for the async path: an ``async def`` tool is awaited on the
+    running loop; a sync one runs on a worker thread unless it set ``thread=False``."""
+    try:
+        aw: Awaitable[Any]
+        if spec.is_async:
+            aw = spec.fn(**arguments)
+        elif spec.thread:
+            aw = asyncio.to_thread(spec.fn, **arguments)
+        else:
+            return spec.fn(**arguments)
+        if spec.timeout is None:
+            return await aw
+        try:
+            return await asyncio.wait_for(aw, spec.timeout)
+        except asyncio.TimeoutError:
+            raise _timed_out(spec) from None
+    except ToolTimeoutError:
+        raise
     except Exception as e:
         raise ToolExecutionError(f"Tool '{spec.name}' failed: {e}") from e
+
+@dataclass
+class ToolRun:
+    """The outcome of one tool call made by the auto tool runtime."""
+    name: str
+    output: Any = None
+    error: Optional[ToolExecutionError] = None
+    elapsed_ms: int = 0
+
+ToolJob = Tuple[ToolSpec, Dict[str, Any]]
+
+def _run(spec: ToolSpec, arguments: Dict[str, Any]) -> ToolRun:
+    started = time.perf_counter()
+    try:
+        out, err = execute_tool(spec, arguments), None
+    except ToolExecutionError as e:
+        out, err = None, e
+    return ToolRun(spec.name, out, err, int((time.perf_counter() - started) * 1000))
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError(f"tool_concurrency must be >= 1, got {concurrency}")
+
+def execute_tools(jobs: Sequence[ToolJob], *, concurrency: int = DEFAULT_TOOL_CONCURRENCY) -> List[ToolRun]:
+    """Run the tool calls of one model turn, up to ``concurrency`` at a time on worker
+    threads. Runs come back in the order of ``jobs``; a failure is kept on its run,
+    not raised. With ``concurrency=1`` they run one by one in the calling thread and
+    stop at the first failure."""
+    _check_concurrency(concurrency)
+    if concurrency == 1 or len(jobs) <= 1:
+        runs: List[ToolRun] = []
+        for spec, arguments in jobs:
+            runs.append(_run(spec, arguments))
+            if runs[-1].error is not None:
+                break
+        return runs
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs)), thread_name_prefix="slimx-tool") as pool:
+        futures = [pool.submit(contextvars.copy_context().run, _run, spec, arguments) for spec, arguments in jobs]
+        return [f.result() for f in futures]
+
+async def _arun(spec: ToolSpec, arguments: Dict[str, Any]) -> ToolRun:
+    started = time.perf_counter()
+    try:
+        out, err = await aexecute_tool(spec, arguments), None
+    except ToolExecutionError as e:
+        out, err = None, e
+    return ToolRun(spec.name, out, err, int((time.perf_counter() - started) * 1000))
+
+async def aexecute_tools(jobs: Sequence[ToolJob], *, concurrency: int = DEFAULT_TOOL_CONCURRENCY) -> List[ToolRun]:
+    """Async ``execute_tools``: the calls are gathered (``concurrency=1``: awaited in
+    turn, stopping at the first failure), each run by ``aexecute_tool``."""
+    _check_concurrency(concurrency)
+    if concurrency == 1 or len(jobs) <= 1:
+        runs: List[ToolRun] = []
+        for spec, arguments in jobs:
+            runs.append(await _arun(spec, arguments))
+            if runs[-1].error is not None:
+                break
+        return runs
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one(spec: ToolSpec, arguments: Dict[str, Any]) -> ToolRun:
+        async with limit:
+            return await _arun(spec, arguments)
+
+    return list(await asyncio.gather(*(one(spec, arguments) for spec, arguments in jobs)))
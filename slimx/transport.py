@@ -0,0 +1,129 @@
+"""Process-wide registry of pooled HTTP transports.
+
+Providers built through the factory (``llm(...)``, ``get_provider(...)``,
+``Provider.from_env(...)``) draw their connection pool from this registry instead of
+opening a private one, so every ``Model`` pointed at the same endpoint with the same
+credentials shares one set of warm keep-alive connections:
+
+    >>> a = llm("openai:gpt-4.1-mini")
+    >>> b = llm("openai:gpt-4.1-nano")      # same host + key -> same pool
+    >>> slimx.transport.stats()["pools"]
+    1
+
+Pools are keyed by ``(provider, base_url, credentials hash)`` plus the transport
+options that shape the client (``http2``, ``limits``); credentials are only ever
+stored as a SHA-256 digest. Pass ``provider_kwargs={"shared_pool": False}`` to give a
+model its own private pool.
+
+Closing a provider (or the ``Model`` around it) releases its hold on a shared
+pool; the pool itself is closed only when the last provider that used it closes,
+so ``b.close()`` never cuts off a request still running on ``a``.
+
+``reset()`` closes and forgets every pool — useful between tests. The registry is
+also cleared automatically in a forked child (whose pools have already dropped the
+sockets inherited from the parent).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import httpx
+
+from .providers._http import HTTPPool
+
+_PoolKey = Tuple[str, str, str, bool, str]
+
+_POOLS: Dict[_PoolKey, HTTPPool] = {}
+_LOCK = threading.Lock()
+
+
+def _credentials_hash(credentials: Optional[str]) -> str:
+    if not credentials:
+        return ""
+    return hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+
+
+def get_pool(
+    provider: str,
+    base_url: str,
+    credentials: Optional[str] = None,
+    *,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
+) -> HTTPPool:
+    """Return the shared pool for this endpoint, creating it on first use."""
+    key = (provider, base_url.rstrip("/"), _credentials_hash(credentials), http2, repr(limits))
+    with _LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = HTTPPool(limits=limits, http2=http2)
+            pool.shared = True
+        return pool
+
+
+def pool_for(
+    provider: str,
+    base_url: str,
+    credentials: Optional[str],
+    overrides: Mapping[str, Any],
+    *,
+    http2: bool = False,
+) -> HTTPPool:
+    """The pool a provider's ``from_env`` should use: shared unless
+    ``shared_pool=False`` is among the overrides."""
+    limits = overrides.get("limits")
+    if overrides.get("shared_pool", True) is False:
+        return HTTPPool(limits=limits, http2=http2)
+    return get_pool(provider, base_url, credentials, limits=limits, http2=http2)
+
+
+def stats() -> Dict[str, Any]:
+    """Counts for every registered pool, plus totals.
+
+    Each entry reports ``provider``, ``base_url``, a short credentials fingerprint,
+    and the pool's ``requests`` / ``opened`` / ``reused`` / ``http2`` counters.
+    """
+    with _LOCK:
+        items = list(_POOLS.items())
+    entries = []
+    totals = {"requests": 0, "opened": 0, "reused": 0}
+    for (provider, base_url, cred, _http2, _limits), pool in items:
+        pool_stats = pool.stats()
+        for name in totals:
+            totals[name] += pool_stats[name]
+        entries.append({
+            "provider": provider,
+            "base_url": base_url,
+            "credentials": cred[:12] or None,
+            **pool_stats,
+        })
+    return {"pools": len(entries), **totals, "entries": entries}
+
+
+def reset() -> None:
+    """Close every shared pool and empty the registry.
+
+    Sync clients are closed; async clients are bound to their event loop and are
+    simply dropped. Providers that still hold a reset pool keep working — their
+    pool reopens lazily — but no longer share it with newly built providers.
+    """
+    with _LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _forget_after_fork() -> None:
+    # Closing inherited pools would disturb the parent's connections; only drop them.
+    global _LOCK
+    _LOCK = threading.Lock()
+    _POOLS.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_after_fork)
@@ -151,6 +151,14 @@ class StreamEvent:
     image_partial_b64: Optional[str] = None
     image_index: Optional[int] = None
 
+    # Set by parallel streams (``Parallel.stream``): the ``provider:model`` string
+    # that produced the event. ``None`` for a single model's stream.
+    model: Optional[str] = None
+
+    # Set on the final ``done`` event when the provider reported token usage for
+    # the stream; ``None`` otherwise.
+    usage: Optional[Usage] = None
+
     @staticmethod
     def text_delta(delta: str, *, raw: Any = None) -> "StreamEvent":
         return StreamEvent(type="text_delta", text=delta, raw=raw)
@@ -160,8 +168,8 @@ class StreamEvent:
         return StreamEvent(type="tool_call", tool_call=call, raw=raw)
 
     @staticmethod
-    def done(*, raw: Any = None) -> "StreamEvent":
-        return StreamEvent(type="done", raw=raw)
+    def done(*, raw: Any = None, usage: Optional[Usage] = None) -> "StreamEvent":
+        return StreamEvent(type="done", raw=raw, usage=usage)
 
     @staticmethod
     def err(message: str, *, raw: Any = None) -> "StreamEvent":
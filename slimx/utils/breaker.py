@@ -0,0 +1,182 @@
+"""Circuit breakers: stop sending requests to an endpoint that keeps failing.
+
+When a provider is down, every call would otherwise wait out its timeout (and its
+retries) before failing, and worker threads pile up behind the dead endpoint. A
+``CircuitBreaker`` tracks each ``(provider, base_url)`` separately:
+
+- ``closed``    — calls go through; consecutive failures are counted.
+- ``open``      — after ``failure_threshold`` consecutive failures, calls fail at
+  once with ``CircuitOpenError`` (no request is sent) for ``recovery_timeout`` seconds.
+- ``half_open`` — then up to ``half_open_max_calls`` trial calls are let through; a
+  success closes the circuit, a failure opens it again.
+
+Only failures that say something about the endpoint count: 5xx responses,
+timeouts and transport errors. A 400, a bad key or a 429 means the endpoint
+answered, so those count as the endpoint being up. Errors raised on our side
+before or instead of an answer (a cancelled call, a spent deadline, a client-side
+rate limit) count neither way.
+
+Every ``Client`` uses ``DEFAULT_BREAKER`` unless given its own (or ``None``), so all
+models pointed at one endpoint share what they learn about it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import httpx
+
+from ..errors import (
+    CallCancelled,
+    CircuitOpenError,
+    DeadlineExceeded,
+    ProviderServerError,
+    ProviderTimeoutError,
+    RateLimitExceeded,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Exception types that count against an endpoint.
+BREAKER_ERRORS: Tuple[Type[BaseException], ...] = (
+    ProviderServerError,
+    ProviderTimeoutError,
+    httpx.TimeoutException,
+    httpx.TransportError,
+)
+
+# Exception types that never reached the endpoint: neither failure nor success.
+NEUTRAL_ERRORS: Tuple[Type[BaseException], ...] = (
+    CallCancelled,
+    CircuitOpenError,
+    DeadlineExceeded,
+    RateLimitExceeded,
+)
+
+_Key = Tuple[str, str]
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "trials", "opens")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0      # consecutive counted failures
+        self.opened_at = 0.0   # monotonic time of the last trip
+        self.trials = 0        # half-open calls in flight
+        self.opens = 0         # times this circuit has tripped
+
+
+@dataclass
+class CircuitBreaker:
+    """Per-endpoint closed/open/half-open state plus the thresholds that drive it.
+
+    ``admit`` is called before each attempt (it raises ``CircuitOpenError`` while
+    open) and ``record`` after it; both return the state transition they caused, if
+    any, as ``(old, new)``.
+    """
+
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    _circuits: Dict[_Key, _Circuit] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _lock: Any = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def admit(self, provider: str, base_url: str = "") -> Optional[Tuple[str, str]]:
+        key = (provider, base_url.rstrip("/"))
+        with self._lock:
+            c = self._circuits.get(key)
+            if c is None:
+                c = self._circuits[key] = _Circuit()
+            change = None
+            if c.state == OPEN:
+                waited = time.monotonic() - c.opened_at
+                if waited < self.recovery_timeout:
+                    raise CircuitOpenError(
+                        f"circuit open for {provider} ({key[1] or 'default endpoint'}) after "
+                        f"{c.failures} consecutive failures; next trial in "
+                        f"{self.recovery_timeout - waited:.1f}s",
+                        provider=provider,
+                        base_url=key[1],
+                        retry_in=self.recovery_timeout - waited,
+                    )
+                c.state, c.trials = HALF_OPEN, 0
+                change = (OPEN, HALF_OPEN)
+            if c.state == HALF_OPEN:
+                if c.trials >= self.half_open_max_calls:
+                    raise CircuitOpenError(
+                        f"circuit half-open for {provider} ({key[1] or 'default endpoint'}); "
+                        "a trial call is already in flight",
+                        provider=provider,
+                        base_url=key[1],
+                        retry_in=0.0,
+                    )
+                c.trials += 1
+            return change
+
+    def record(
+        self, provider: str, base_url: str = "", exc: Optional[BaseException] = None
+    ) -> Optional[Tuple[str, str]]:
+        """Record the outcome of an admitted attempt (``exc=None`` for success)."""
+        key = (provider, base_url.rstrip("/"))
+        failed = isinstance(exc, BREAKER_ERRORS)
+        with self._lock:
+            c = self._circuits.get(key)
+            if c is None:
+                c = self._circuits[key] = _Circuit()
+            old = c.state
+            if c.state == HALF_OPEN:
+                c.trials = max(0, c.trials - 1)
+            if exc is not None and (not isinstance(exc, Exception) or isinstance(exc, NEUTRAL_ERRORS)):
+                return None  # cancelled / interrupted / never sent: says nothing about the endpoint
+            if not failed:
+                c.failures = 0
+                c.state = CLOSED
+            else:
+                c.failures += 1
+                if c.state == HALF_OPEN or c.failures >= self.failure_threshold:
+                    c.state = OPEN
+                    c.opened_at = time.monotonic()
+                    c.opens += 1
+            return (old, c.state) if c.state != old else None
+
+    def state(self, provider: str, base_url: str = "") -> str:
+        """The current state, with an open circuit past its timeout reported as
+        ``half_open`` (that is what the next call will see)."""
+        with self._lock:
+            c = self._circuits.get((provider, base_url.rstrip("/")))
+            return CLOSED if c is None else self._state_of(c)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """One entry per endpoint seen: ``provider``, ``base_url``, ``state``,
+        ``failures`` (consecutive), ``opens`` (times tripped)."""
+        with self._lock:
+            return [
+                {
+                    "provider": provider,
+                    "base_url": base_url,
+                    "state": self._state_of(c),
+                    "failures": c.failures,
+                    "opens": c.opens,
+                }
+                for (provider, base_url), c in self._circuits.items()
+            ]
+
+    def _state_of(self, c: _Circuit) -> str:
+        if c.state == OPEN and time.monotonic() - c.opened_at >= self.recovery_timeout:
+            return HALF_OPEN
+        return c.state
+
+    def reset(self) -> None:
+        """Forget every endpoint (all circuits closed)."""
+        with self._lock:
+            self._circuits.clear()
+
+
+# The breaker every Client shares unless given its own (or ``circuit_breaker=None``).
+DEFAULT_BREAKER = CircuitBreaker()
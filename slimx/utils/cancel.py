@@ -0,0 +1,237 @@
+"""Cancelling calls that are already on the wire.
+
+A sync HTTP request blocks its thread inside a socket read, so abandoning the thread
+leaves the request running: the socket stays open, the provider keeps generating
+(and billing) tokens, and interpreter shutdown waits for the thread. ``CancelScope``
+fixes that for the pooled providers. Requests made inside ``with cancel_scope(scope):``
+register their connection with the scope while they read or write, and
+``scope.cancel()`` — from any thread — shuts those sockets down. The blocked read
+returns at once and the call raises ``CallCancelled``, which is never retried.
+
+Only HTTP/1.1 connections are aborted this way: an HTTP/2 connection is shared by
+concurrent requests, so cancelling one of them only stops new work (the flag is
+still checked before every read and write) and lets the in-flight exchange finish.
+
+A scope made with ``nested_scope()`` is also cancelled with the scope that was
+current when it was made, so code that splits one call into several (hedging, a
+fallback attempt cut off at its SLO) can cancel its own requests without cutting
+them loose from an outer ``parallel`` race.
+
+Async calls need none of this: cancelling the task closes the request.
+``first_success`` races awaitables that way.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from ..errors import CallCancelled
+
+T = TypeVar("T")
+
+_CURRENT: ContextVar[Optional["CancelScope"]] = ContextVar("slimx_cancel_scope", default=None)
+
+
+class CancelScope:
+    """A cancellation handle for the requests made inside it (see module docs)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._active: Set[Any] = set()  # network streams mid read/write
+        self._children: "weakref.WeakSet[CancelScope]" = weakref.WeakSet()
+        self.aborted = 0  # in-flight connections shut down by cancel(), nested scopes' too
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> int:
+        """Cancel the scope; returns how many in-flight connections were shut down."""
+        with self._lock:
+            if self._cancelled:
+                return 0
+            self._cancelled = True
+            streams = list(self._active)
+            children = list(self._children)
+        for stream in streams:
+            _shutdown(stream)
+        self.aborted = len(streams) + sum(child.cancel() for child in children)
+        return self.aborted
+
+    def child(self) -> "CancelScope":
+        """A new scope that is cancelled along with this one."""
+        scope = CancelScope()
+        with self._lock:
+            if not self._cancelled:
+                self._children.add(scope)
+                return scope
+        scope.cancel()
+        return scope
+
+    def check(self) -> None:
+        if self._cancelled:
+            raise CallCancelled("call cancelled")
+
+    def enter(self, stream: Any) -> None:
+        with self._lock:
+            if self._cancelled:
+                raise CallCancelled("call cancelled")
+            self._active.add(stream)
+
+    def leave(self, stream: Any) -> None:
+        with self._lock:
+            self._active.discard(stream)
+
+
+def current_scope() -> Optional[CancelScope]:
+    return _CURRENT.get()
+
+
+def nested_scope() -> CancelScope:
+    """A new scope, cancelled along with the current one (if any)."""
+    parent = _CURRENT.get()
+    return CancelScope() if parent is None else parent.child()
+
+
+def run_in_scope(scope: CancelScope, fn: Callable[[], T]) -> T:
+    """``fn()`` with ``scope`` current."""
+    with cancel_scope(scope):
+        return fn()
+
+
+@contextmanager
+def cancel_scope(scope: Optional[CancelScope] = None) -> Iterator[CancelScope]:
+    """Make ``scope`` (or a new one) current for requests made in this block."""
+    scope = scope or CancelScope()
+    token = _CURRENT.set(scope)
+    try:
+        yield scope
+    finally:
+        _CURRENT.reset(token)
+
+
+def _shutdown(stream: Any) -> None:
+    sock = stream.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # already closed
+
+
+# ---- httpcore network backend -------------------------------------------
+
+
+class CancellableStream:
+    """A network stream whose blocking calls register with the current scope."""
+
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        scope = _CURRENT.get()
+        if scope is None:
+            return getattr(self._stream, method)(*args, **kwargs)
+        scope.enter(self._stream)
+        try:
+            out = getattr(self._stream, method)(*args, **kwargs)
+        except Exception:
+            if scope.cancelled:
+                raise CallCancelled("call cancelled while the request was in flight") from None
+            raise
+        finally:
+            scope.leave(self._stream)
+        if scope.cancelled:
+            raise CallCancelled("call cancelled while the request was in flight")
+        return out
+
+    def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        return self._call("read", max_bytes, timeout)
+
+    def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        self._call("write", buffer, timeout)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def start_tls(self, *args: Any, **kwargs: Any) -> "CancellableStream":
+        return CancellableStream(self._stream.start_tls(*args, **kwargs))
+
+    def get_extra_info(self, info: str) -> Any:
+        return self._stream.get_extra_info(info)
+
+
+class CancellableBackend:
+    """Wraps an httpcore sync network backend so new connections are cancellable."""
+
+    def __init__(self, backend: Any) -> None:
+        self._backend = backend
+
+    def connect_tcp(self, *args: Any, **kwargs: Any) -> CancellableStream:
+        scope = _CURRENT.get()
+        if scope is not None:
+            scope.check()
+        return CancellableStream(self._backend.connect_tcp(*args, **kwargs))
+
+    def connect_unix_socket(self, *args: Any, **kwargs: Any) -> CancellableStream:
+        return CancellableStream(self._backend.connect_unix_socket(*args, **kwargs))
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+def install(transport: Any) -> bool:
+    """Route ``transport``'s new connections through ``CancellableBackend``.
+
+    Returns False (and leaves the transport alone) when it is not an httpx
+    ``HTTPTransport`` over an httpcore pool.
+    """
+    pool = getattr(transport, "_pool", None)
+    backend = getattr(pool, "_network_backend", None)
+    if pool is None or backend is None or isinstance(backend, CancellableBackend):
+        return False
+    pool._network_backend = CancellableBackend(backend)
+    return True
+
+
+# ---- asyncio -------------------------------------------------------------
+
+
+async def first_success(
+    aws: Sequence[Awaitable[T]],
+) -> Tuple[Optional[int], Optional[T], Dict[int, BaseException], Dict[str, Any]]:
+    """Run ``aws`` concurrently; return the index and value of the first to succeed,
+    every failure by index, and ``stats``. The rest are cancelled (their HTTP
+    requests closed) and awaited, so nothing is left running.
+
+    ``stats``: ``abandoned`` (still running when the winner arrived, now cancelled).
+    """
+    tasks: List[asyncio.Future] = [asyncio.ensure_future(aw) for aw in aws]
+    index_of = {task: i for i, task in enumerate(tasks)}
+    errors: Dict[int, BaseException] = {}
+    winner: Optional[int] = None
+    value: Optional[T] = None
+    pending = set(tasks)
+    try:
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=index_of.__getitem__):
+                exc = task.exception()
+                if exc is not None:
+                    errors[index_of[task]] = exc
+                elif winner is None:
+                    winner, value = index_of[task], task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    return winner, value, errors, {"abandoned": len(pending)}
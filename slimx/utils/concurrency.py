@@ -0,0 +1,222 @@
+"""Adaptive concurrency: find how many calls an endpoint takes at once, and keep to it.
+
+A fixed ``max_workers`` is either too low (idle quota) or too high (429s and queueing
+at the provider), and the right value moves with the provider, the account tier and
+the time of day. ``AdaptiveConcurrency`` adjusts a concurrency limit the way TCP
+adjusts its window (AIMD, additive increase / multiplicative decrease):
+
+- increase: each successful call that ends while the limit is full (or callers are
+  waiting) adds ``1 / limit``, so a limit in use grows by about one per ``limit``
+  successes while latency holds steady;
+- decrease: a ``ProviderRateLimitError`` (429), a timeout, or a latency spike (the
+  recent average latency above ``latency_tolerance`` times the long-run average)
+  multiplies the limit by ``backoff``. Calls that started before a cut report the
+  same overload, so they do not cut again.
+
+Every ``Client`` given the controller (``concurrency_limiter=``) takes a slot before
+each chat attempt and gives it back when the attempt ends. Callers over the limit
+wait in arrival order. Share one controller between every client that calls the
+same endpoint; it is thread-safe and serves sync and async callers alike.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+import httpx
+
+from ..errors import ProviderRateLimitError, ProviderTimeoutError
+
+# Errors that mean "too much load": each cuts the limit.
+OVERLOAD_ERRORS = (ProviderRateLimitError, ProviderTimeoutError, httpx.TimeoutException)
+
+# EWMA weights of the recent and the long-run latency averages.
+FAST_ALPHA = 0.3
+SLOW_ALPHA = 0.05
+# Successes seen before the latency signal is trusted.
+WARMUP = 10
+
+
+@dataclass
+class Slot:
+    """One call's hold on the limit, returned to ``release``."""
+
+    epoch: int  # the limit's decrease count when the slot was taken
+    waited_s: float
+    started: float
+
+
+class AdaptiveConcurrency:
+    """An AIMD concurrency limit (see module docs).
+
+    Args:
+        initial: Starting limit.
+        min_limit: The limit never drops below this.
+        max_limit: The limit never grows past this.
+        backoff: Factor applied to the limit on overload (``0 < backoff < 1``).
+        latency_tolerance: A latency spike is a recent average above this multiple
+            of the long-run average (``None``: ignore latency, react to errors only).
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: Optional[float] = 2.0,
+    ) -> None:
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("need 1 <= min_limit <= initial <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        if latency_tolerance is not None and latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be > 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self._lock = threading.Lock()
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._waiters: Deque[Callable[[], None]] = deque()
+        self._epoch = 0
+        self._fast_ms: Optional[float] = None
+        self._slow_ms: Optional[float] = None
+        self._samples = 0
+        self._stats = {"increases": 0, "decreases": 0}
+
+    @property
+    def limit(self) -> int:
+        """Calls allowed in flight at once, now."""
+        return int(self._limit)
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[Slot]:
+        """Take a slot, waiting up to ``timeout`` seconds (``None``: forever).
+        Returns ``None`` if none came free in time."""
+        started = time.monotonic()
+        granted = threading.Event()
+        with self._lock:
+            if self._try_take():
+                return self._slot(started)
+            self._waiters.append(granted.set)
+        if granted.wait(timeout):
+            return self._slot(started)
+        with self._lock:
+            try:
+                self._waiters.remove(granted.set)
+            except ValueError:  # granted just as we gave up
+                return self._slot(started)
+        return None
+
+    async def aacquire(self, timeout: Optional[float] = None) -> Optional[Slot]:
+        """Async ``acquire``: waits without blocking the event loop."""
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        granted: "asyncio.Future[None]" = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(lambda: granted.done() or granted.set_result(None))
+
+        with self._lock:
+            if self._try_take():
+                return self._slot(started)
+            self._waiters.append(wake)
+        try:
+            await asyncio.wait_for(asyncio.shield(granted), timeout)
+            return self._slot(started)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            with self._lock:
+                try:
+                    self._waiters.remove(wake)
+                    granted_anyway = False
+                except ValueError:
+                    granted_anyway = True
+            if isinstance(e, asyncio.CancelledError):
+                if granted_anyway:
+                    self._give_back()
+                raise
+            return self._slot(started) if granted_anyway else None
+
+    def release(
+        self, slot: Slot, *, latency_ms: Optional[float] = None, error: Optional[BaseException] = None
+    ) -> Optional[Tuple[int, int]]:
+        """Return ``slot`` and adjust the limit from how the call went: ``latency_ms``
+        of a success, or its ``error``. Returns ``(old, new)`` if the limit changed."""
+        with self._lock:
+            old = self.limit
+            if isinstance(error, OVERLOAD_ERRORS):
+                self._decrease(slot)
+            elif error is None and latency_ms is not None:
+                if self._spike(latency_ms):
+                    self._decrease(slot)
+                elif self._waiters or self._in_flight >= self.limit:  # grow only a limit in use
+                    self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            new = self.limit
+            if new > old:
+                self._stats["increases"] += 1
+            self._in_flight -= 1
+            self._hand_over()
+        return (old, new) if new != old else None
+
+    def stats(self) -> Dict[str, Any]:
+        """The limit, calls in flight and waiting, adjustment counts, and the
+        long-run latency average."""
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "waiting": len(self._waiters),
+                **self._stats,
+                "latency_ms": None if self._slow_ms is None else round(self._slow_ms, 1),
+            }
+
+    def _try_take(self) -> bool:
+        if self._waiters or self._in_flight >= self.limit:
+            return False
+        self._in_flight += 1
+        return True
+
+    def _slot(self, started: float) -> Slot:
+        now = time.monotonic()
+        return Slot(self._epoch, now - started, now)
+
+    def _give_back(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._hand_over()
+
+    def _hand_over(self) -> None:
+        # Slots pass straight to waiters, in arrival order, while there is room.
+        while self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._waiters.popleft()()
+
+    def _decrease(self, slot: Slot) -> None:
+        if slot.epoch != self._epoch:
+            return  # started before the last cut: same overload, already answered
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        self._epoch += 1
+        self._stats["decreases"] += 1
+        self._fast_ms = self._slow_ms  # judge latency afresh at the new limit
+
+    def _spike(self, ms: float) -> bool:
+        fast, slow = self._fast_ms, self._slow_ms
+        if fast is None or slow is None:
+            fast = slow = ms
+        else:
+            fast += FAST_ALPHA * (ms - fast)
+            slow += SLOW_ALPHA * (ms - slow)
+        self._fast_ms, self._slow_ms = fast, slow
+        self._samples += 1
+        return (
+            self.latency_tolerance is not None
+            and self._samples >= WARMUP
+            and fast > self.latency_tolerance * slow
+        )
@@ -0,0 +1,187 @@
+"""A long-lived, bounded thread pool for fanning model calls out.
+
+``parallel(...)`` used to build (and tear down) a ``ThreadPoolExecutor`` per call:
+thread start-up on every request, and no bound on how many threads a busy process
+runs. ``FanoutExecutor`` is created once and reused. It holds at most
+``max_workers`` threads, and ``provider_limits`` caps how many calls to one
+provider run at a time. Calls over a cap wait in a per-provider queue and do not
+hold a worker, so a saturated provider never starves the others.
+
+Every ``Parallel`` uses the process-wide executor (``shared_executor()``, sized by
+``SLIMX_PARALLEL_WORKERS``, default 64) unless it is given its own. Replace the
+process-wide one with ``set_shared_executor(...)``; ``reset()`` drops it (tests).
+
+``helper_pool(name)`` hands out one long-lived plain pool per helper (hedging,
+fallback SLO cut-offs, tool timeouts). Each helper gets its own, so a job never
+waits on a job queued behind it in the same pool. ``submit_started`` tells a caller
+when its job leaves the queue, so a time limit bounds the run, not the wait.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Mapping, Optional, Tuple
+
+DEFAULT_WORKERS = 64
+
+_Job = Tuple[Future, Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]
+
+
+class FanoutExecutor:
+    """Bounded worker threads with optional per-provider concurrency caps.
+
+    Args:
+        max_workers: Worker threads, shared by every provider.
+        provider_limits: Per-provider caps, e.g. ``{"ollama": 2, "openai": 16}``.
+        default_provider_limit: Cap for providers not in ``provider_limits``
+            (``None``: only ``max_workers`` applies).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        *,
+        provider_limits: Optional[Mapping[str, int]] = None,
+        default_provider_limit: Optional[int] = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self.max_workers = max_workers
+        self.provider_limits: Dict[str, int] = dict(provider_limits or {})
+        self.default_provider_limit = default_provider_limit
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="slimx-fanout")
+        self._lock = threading.Lock()
+        self._running: Dict[str, int] = defaultdict(int)
+        self._waiting: Dict[str, Deque[_Job]] = defaultdict(deque)
+
+    def limit_for(self, provider: str) -> Optional[int]:
+        return self.provider_limits.get(provider, self.default_provider_limit)
+
+    def submit(self, provider: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Schedule ``fn(*args, **kwargs)`` as a call to ``provider``.
+
+        The returned future can be cancelled until the call starts.
+        """
+        fut: Future = Future()
+        job: _Job = (fut, fn, args, kwargs)
+        limit = self.limit_for(provider)
+        with self._lock:
+            if limit is not None and self._running[provider] >= limit:
+                self._waiting[provider].append(job)
+                return fut
+            self._running[provider] += 1
+        self._start(provider, job)
+        return fut
+
+    def stats(self) -> Dict[str, Any]:
+        """Running and queued calls per provider."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "running": {p: n for p, n in self._running.items() if n},
+                "waiting": {p: len(q) for p, q in self._waiting.items() if q},
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            waiting = [job for queue in self._waiting.values() for job in queue]
+            self._waiting.clear()
+        for fut, *_ in waiting:
+            fut.cancel()
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _start(self, provider: str, job: _Job) -> None:
+        try:
+            self._pool.submit(self._run, provider, job)
+        except RuntimeError:  # shut down
+            job[0].cancel()
+            self._release(provider)
+
+    def _run(self, provider: str, job: _Job) -> None:
+        fut, fn, args, kwargs = job
+        try:
+            if fut.set_running_or_notify_cancel():
+                try:
+                    fut.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    fut.set_exception(e)
+        finally:
+            self._release(provider)
+
+    def _release(self, provider: str) -> None:
+        with self._lock:
+            queue = self._waiting.get(provider)
+            if not queue:
+                self._running[provider] -= 1
+                return
+            job = queue.popleft()  # the slot passes straight to the next queued call
+        self._start(provider, job)
+
+
+_SHARED: Optional[FanoutExecutor] = None
+_LOCK = threading.Lock()
+
+
+def shared_executor() -> FanoutExecutor:
+    """The process-wide executor, created on first use."""
+    global _SHARED
+    with _LOCK:
+        if _SHARED is None:
+            workers = int(os.environ.get("SLIMX_PARALLEL_WORKERS") or DEFAULT_WORKERS)
+            _SHARED = FanoutExecutor(workers)
+        return _SHARED
+
+
+def set_shared_executor(executor: Optional[FanoutExecutor]) -> Optional[FanoutExecutor]:
+    """Install ``executor`` process-wide; returns the previous one (not shut down)."""
+    global _SHARED
+    with _LOCK:
+        previous, _SHARED = _SHARED, executor
+    return previous
+
+
+def reset() -> None:
+    """Shut down and forget the process-wide executor."""
+    previous = set_shared_executor(None)
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+_HELPERS: Dict[str, ThreadPoolExecutor] = {}
+
+
+def helper_pool(name: str, workers: int = DEFAULT_WORKERS) -> ThreadPoolExecutor:
+    """The long-lived pool of helper ``name``, created on first use."""
+    with _LOCK:
+        pool = _HELPERS.get(name)
+        if pool is None:
+            pool = _HELPERS[name] = ThreadPoolExecutor(workers, thread_name_prefix=f"slimx-{name}")
+        return pool
+
+
+def submit_started(
+    pool: ThreadPoolExecutor, fn: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Tuple["Future[Any]", threading.Event]:
+    """Submit ``fn(*args, **kwargs)`` to ``pool``; the event is set as it starts running."""
+    started = threading.Event()
+
+    def run() -> Any:
+        started.set()
+        return fn(*args, **kwargs)
+
+    return pool.submit(run), started
+
+
+def _forget_after_fork() -> None:
+    # The parent's worker threads do not exist in the child.
+    global _LOCK, _SHARED
+    _LOCK = threading.Lock()
+    _SHARED = None
+    _HELPERS.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_after_fork)
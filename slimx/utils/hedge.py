@@ -0,0 +1,218 @@
+"""Hedged requests: send a duplicate when the first is slow, keep the faster one.
+
+A few slow upstream requests dominate tail latency. Hedging waits ``after`` seconds
+for the first attempt; if it has not answered, a second, identical request is sent
+(to the same model, or to ``hedge_model``) and whichever succeeds first wins. A
+failure on one side waits for the other; only when both fail is the primary's error
+raised. The loser is cancelled: an async task is cancelled, and a sync request runs
+in its own ``CancelScope`` (``slimx.utils.cancel``), whose socket is shut down. A
+sync primary runs on a small long-lived pool and the hedge on the caller's thread,
+so no threads are started per call.
+
+``hedge_after_ms="auto"`` hedges at the observed p95 latency of the model, taken from
+a sliding window of recent successful requests (``observed_ms``). Until the window
+holds ``MIN_SAMPLES`` requests there is no estimate yet, so nothing is hedged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar, Union
+
+from .cancel import nested_scope, run_in_scope
+from .executor import helper_pool, submit_started
+
+T = TypeVar("T")
+
+AUTO = "auto"
+AUTO_QUANTILE = 0.95
+MIN_SAMPLES = 20
+WINDOW = 256
+
+HedgeAfter = Union[float, int, str, None]
+
+_Key = Tuple[str, str, str]
+
+
+class LatencyWindow:
+    """The last ``size`` latencies (ms) of one model, for quantile estimates."""
+
+    def __init__(self, size: int = WINDOW) -> None:
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, ms: float) -> None:
+        with self._lock:
+            self._samples.append(ms)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+_WINDOWS: Dict[_Key, LatencyWindow] = {}
+_LOCK = threading.Lock()
+
+
+def _window(provider: str, base_url: str, model: str) -> LatencyWindow:
+    key = (provider, base_url.rstrip("/"), model)
+    with _LOCK:
+        window = _WINDOWS.get(key)
+        if window is None:
+            window = _WINDOWS[key] = LatencyWindow()
+        return window
+
+
+def record_latency(provider: str, base_url: str, model: str, ms: float) -> None:
+    _window(provider, base_url, model).add(ms)
+
+
+def observed_ms(
+    provider: str, base_url: str, model: str, q: float = AUTO_QUANTILE
+) -> Optional[float]:
+    """The ``q`` quantile of recent latencies, or ``None`` below ``MIN_SAMPLES``."""
+    window = _window(provider, base_url, model)
+    if len(window) < MIN_SAMPLES:
+        return None
+    return window.quantile(q)
+
+
+def resolve_delay(
+    hedge_after_ms: HedgeAfter, provider: str, base_url: str, model: str
+) -> Optional[float]:
+    """Seconds to wait before hedging, or ``None`` for no hedge on this attempt."""
+    if hedge_after_ms is None:
+        return None
+    if hedge_after_ms == AUTO:
+        ms = observed_ms(provider, base_url, model)
+        return None if ms is None else ms / 1000.0
+    return max(0.0, float(hedge_after_ms)) / 1000.0
+
+
+def check_hedge_after(hedge_after_ms: HedgeAfter) -> HedgeAfter:
+    if isinstance(hedge_after_ms, str) and hedge_after_ms != AUTO:
+        raise ValueError(f"hedge_after_ms must be a number of milliseconds or 'auto', got {hedge_after_ms!r}")
+    return hedge_after_ms
+
+
+def reset() -> None:
+    """Forget every latency window."""
+    with _LOCK:
+        _WINDOWS.clear()
+
+
+def hedged_call(
+    primary: Callable[[], T],
+    hedge: Callable[[], T],
+    after: float,
+    stats: Dict[str, Any],
+) -> T:
+    """Run ``primary``; if it is still running after ``after`` seconds, also run
+    ``hedge`` and return the first success. ``stats`` counts ``sent`` and ``won``."""
+    primary_scope, hedge_scope = nested_scope(), nested_scope()
+    # copy_context keeps the per-call connection counters (and other context) visible.
+    first, started = submit_started(
+        helper_pool("hedge"), contextvars.copy_context().run, run_in_scope, primary_scope, primary
+    )
+    started.wait()  # a wait for a free helper thread is not a slow primary
+    done, _ = wait([first], timeout=after)
+    if done:
+        return first.result()
+    stats["sent"] += 1
+    # A primary that succeeds while the hedge runs cuts the hedge short.
+    first.add_done_callback(lambda f: f.cancelled() or f.exception() is not None or hedge_scope.cancel())
+    try:
+        value = run_in_scope(hedge_scope, hedge)
+    except Exception:
+        # The hedge failed, or lost to the primary: the primary's outcome stands.
+        return first.result()
+    first.cancel()
+    primary_scope.cancel()
+    stats["won"] += 1
+    return value
+
+
+async def ahedged_call(
+    primary: Callable[[], Awaitable[T]],
+    hedge: Callable[[], Awaitable[T]],
+    after: float,
+    stats: Dict[str, Any],
+) -> T:
+    """Async ``hedged_call``; the losing request is cancelled."""
+    first = asyncio.ensure_future(primary())
+    tasks = [first]
+    try:
+        done, _ = await asyncio.wait({first}, timeout=after)
+        if done:
+            return first.result()
+        second = asyncio.ensure_future(hedge())
+        tasks.append(second)
+        stats["sent"] += 1
+        pending = {first, second}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is second:
+                        stats["won"] += 1
+                    return task.result()
+        return first.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+def new_hedge_stats() -> Dict[str, Any]:
+    return {"after_ms": None, "sent": 0, "won": 0}
+
+
+def timed(
+    fn: Callable[[], T],
+    on_success: Callable[[float], None],
+    on_error: Optional[Callable[[Exception], None]] = None,
+) -> Callable[[], T]:
+    """Wrap ``fn`` to report its latency (ms) when it succeeds, or its error."""
+
+    def run() -> T:
+        start = time.perf_counter()
+        try:
+            out = fn()
+        except Exception as e:
+            if on_error is not None:
+                on_error(e)
+            raise
+        on_success((time.perf_counter() - start) * 1000)
+        return out
+
+    return run
+
+
+def atimed(
+    fn: Callable[[], Awaitable[T]],
+    on_success: Callable[[float], None],
+    on_error: Optional[Callable[[Exception], None]] = None,
+) -> Callable[[], Awaitable[T]]:
+    async def run() -> T:
+        start = time.perf_counter()
+        try:
+            out = await fn()
+        except Exception as e:
+            if on_error is not None:
+                on_error(e)
+            raise
+        on_success((time.perf_counter() - start) * 1000)
+        return out
+
+    return run
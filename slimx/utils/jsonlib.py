@@ -0,0 +1,81 @@
+"""Pluggable JSON backend for request bodies and response/stream decoding.
+
+Uses ``orjson`` when installed, else ``msgspec``, else the stdlib ``json`` module —
+all optional, never required (``pip install 'slimx[fastjson]'`` pulls in orjson).
+Set ``SLIMX_JSON=json|orjson|msgspec`` to pin one; the choice is made once, at import.
+
+The contract is the same whichever backend is active:
+
+- ``dumps(obj)`` returns compact UTF-8 ``bytes`` (no ASCII escaping), ready to post.
+  Non-string dict keys are written as strings, as ``json.dumps`` does.
+- ``loads(data)`` accepts ``bytes``/``bytearray``/``str`` and raises ``ValueError``
+  on malformed input.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Callable, Tuple, Union
+
+JSON_ENV = "SLIMX_JSON"
+
+_Loads = Callable[[Union[bytes, bytearray, str]], Any]
+_Dumps = Callable[[Any], bytes]
+
+
+def _stdlib() -> Tuple[str, _Dumps, _Loads]:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def dumps(obj: Any) -> bytes:
+        return encoder.encode(obj).encode("utf-8")
+
+    return "json", dumps, json.loads
+
+
+def _orjson() -> Tuple[str, _Dumps, _Loads]:
+    import orjson
+
+    _, fallback, _ = _stdlib()
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:  # e.g. an int past 64 bits: the stdlib takes what orjson won't
+            return fallback(obj)
+
+    return "orjson", dumps, orjson.loads  # JSONDecodeError is a ValueError
+
+
+def _msgspec() -> Tuple[str, _Dumps, _Loads]:
+    import msgspec  # type: ignore[import]
+
+    decode = msgspec.json.decode
+
+    def loads(data: Union[bytes, bytearray, str]) -> Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    return "msgspec", msgspec.json.encode, loads
+
+
+_BACKENDS = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+
+def _select() -> Tuple[str, _Dumps, _Loads]:
+    pinned = os.environ.get(JSON_ENV, "").strip().lower()
+    if pinned:
+        if pinned not in _BACKENDS:
+            raise ValueError(f"{JSON_ENV} must be one of {sorted(_BACKENDS)}, got {pinned!r}")
+        return _BACKENDS[pinned]()
+    for name in ("orjson", "msgspec"):
+        try:
+            return _BACKENDS[name]()
+        except ImportError:
+            continue
+    return _stdlib()
+
+
+BACKEND, dumps, loads = _select()
@@ -2,51 +2,102 @@
 
 Malformed lines are skipped rather than aborting the whole stream: a single bad
 frame from a provider should not kill an otherwise-valid response.
+
+``NDJSONDecoder`` keeps one ``bytearray`` with a read offset, so each byte is
+appended and scanned once however small the chunks are, and decodes every line
+exactly once (UTF-8 straight into the JSON scanner, or into ``orjson``/``msgspec``
+when ``jsonlib`` picked one). The sync and async iterators
+both drive it.
 """
 
+from __future__ import annotations
+
 import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+from . import jsonlib
+
 
+# `raw_decode` skips `json.loads`' whitespace regex passes; `_loads` checks the
+# trailing text itself.
+_raw_decode = json.JSONDecoder().raw_decode
 
-def _loads(line: str):
+
+def _loads(line):
+    if jsonlib.BACKEND != "json":
+        # orjson/msgspec read UTF-8 bytes directly; fall through on bad frames
+        # (including invalid UTF-8, which the text path decodes leniently).
+        try:
+            return jsonlib.loads(line)
+        except ValueError:
+            pass
+    text = line.decode("utf-8", errors="replace")
     try:
-        return json.loads(line)
-    except Exception:
+        obj, end = _raw_decode(text)
+    except ValueError:
+        # Leading whitespace or a malformed frame: take the strict path.
+        try:
+            return json.loads(text)
+        except Exception:
+            return None
+    if end != len(text) and text[end:].strip():
         return None
+    return obj
 
 
-def iter_ndjson(byte_iter):
-    buf = b""
-    for chunk in byte_iter:
+class NDJSONDecoder:
+    """Incremental NDJSON decoder: ``feed()`` byte chunks, then ``close()``."""
+
+    __slots__ = ("_buf", "_pos", "_scan")
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._pos = 0   # start of the first unconsumed line
+        self._scan = 0  # bytes before this offset hold no newline
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        buf = self._buf
+        if self._pos:
+            # Drop consumed lines; only the (partial) last line is moved.
+            del buf[: self._pos]
+            self._scan -= self._pos
+            self._pos = 0
         buf += chunk
-        while b"\n" in buf:
-            line, buf = buf.split(b"\n", 1)
-            s = line.strip()
-            if not s:
-                continue
-            obj = _loads(s.decode("utf-8", errors="replace"))
-            if obj is not None:
-                yield obj
-    tail = buf.strip()
-    if tail:
-        obj = _loads(tail.decode("utf-8", errors="replace"))
-        if obj is not None:
-            yield obj
+        out: List[Any] = []
+        pos = 0
+        nl = buf.find(b"\n", self._scan)
+        while nl != -1:
+            if nl > pos:
+                obj = _loads(buf[pos:nl])
+                if obj is not None:
+                    out.append(obj)
+            pos = nl + 1
+            nl = buf.find(b"\n", pos)
+        self._pos = pos
+        self._scan = len(buf)
+        return out
 
+    def close(self) -> List[Any]:
+        tail = bytes(self._buf[self._pos :])
+        self._buf = bytearray()
+        self._pos = self._scan = 0
+        if not tail.strip():
+            return []
+        obj = _loads(tail)
+        return [] if obj is None else [obj]
 
-async def aiter_ndjson(byte_iter):
-    buf = b""
+
+def iter_ndjson(byte_iter: Iterable[bytes]) -> Iterator[Any]:
+    decoder = NDJSONDecoder()
+    for chunk in byte_iter:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def aiter_ndjson(byte_iter: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    decoder = NDJSONDecoder()
     async for chunk in byte_iter:
-        buf += chunk
-        while b"\n" in buf:
-            line, buf = buf.split(b"\n", 1)
-            s = line.strip()
-            if not s:
-                continue
-            obj = _loads(s.decode("utf-8", errors="replace"))
-            if obj is not None:
-                yield obj
-    tail = buf.strip()
-    if tail:
-        obj = _loads(tail.decode("utf-8", errors="replace"))
-        if obj is not None:
+        for obj in decoder.feed(chunk):
             yield obj
+    for obj in decoder.close():
+        yield obj
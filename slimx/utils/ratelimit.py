@@ -0,0 +1,208 @@
+"""Client-side rate limiting: stay inside a known quota instead of collecting 429s.
+
+A ``RateLimiter`` holds token buckets for requests per minute (``rpm``) and tokens
+per minute (``tpm``). Each bucket holds up to one minute's allowance and refills
+continuously. Buckets are kept per ``(provider, base_url, model)`` by default
+(``per="model"``), or per ``(provider, base_url)`` with ``per="provider"``. Share
+one limiter between every ``Client`` / ``Model`` that draws on the same quota; it
+is thread-safe and serves sync and async callers alike.
+
+Before each HTTP attempt the client reserves one request and an estimate of the
+tokens it will use: the prompt's characters / 4, plus ``max_tokens`` (or
+``completion_estimate`` when the request sets none); an image request counts its
+prompt or instruction plus ``completion_estimate``. Afterwards the estimate is
+corrected from ``Result.usage.total_tokens`` (for a stream, from the usage on its
+final ``done`` event), so the bucket tracks real usage; a failed attempt gives its
+tokens back (the request still counts).
+
+When the buckets have no room, the caller waits for it, sleeping outside the lock
+so other callers are not held up. A reservation is taken up front (the bucket may
+go negative), so waiting callers are served in arrival order. If the wait would
+exceed ``max_wait`` (``0``: fail fast), or the rest of the call's deadline, the call
+fails at once with ``RateLimitExceeded`` and its ``retry_in``. Nothing is sent,
+and the error is not retried.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from ..errors import RateLimitExceeded
+
+# Rough characters per token, for estimates made before a call.
+CHARS_PER_TOKEN = 4
+
+_Key = Tuple[str, ...]
+
+
+class _Bucket:
+    __slots__ = ("capacity", "level", "updated")
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)  # a full minute's allowance to start
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        if now > self.updated:
+            self.level = min(self.capacity, self.level + (now - self.updated) * self.capacity / 60.0)
+            self.updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until ``amount`` fits (after ``refill``)."""
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing * 60.0 / self.capacity)
+
+
+@dataclass
+class Ticket:
+    """A reservation: what ``acquire`` took, to be settled after the call."""
+
+    key: _Key
+    tokens: int
+    waited_s: float
+
+
+class RateLimiter:
+    """Requests- and tokens-per-minute buckets (see module docs).
+
+    Args:
+        rpm: Requests per minute (``None``: unlimited).
+        tpm: Tokens per minute, prompt plus completion (``None``: unlimited).
+        per: ``"model"`` (a quota per model) or ``"provider"`` (one per endpoint).
+        max_wait: Longest a call may wait for room, in seconds (``None``: as long
+            as it takes; ``0``: never wait, fail fast).
+        completion_estimate: Completion tokens assumed for requests without
+            ``max_tokens``.
+    """
+
+    def __init__(
+        self,
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        *,
+        per: str = "model",
+        max_wait: Optional[float] = None,
+        completion_estimate: int = 256,
+    ) -> None:
+        if rpm is None and tpm is None:
+            raise ValueError("RateLimiter needs rpm and/or tpm")
+        if (rpm is not None and rpm <= 0) or (tpm is not None and tpm <= 0):
+            raise ValueError("rpm and tpm must be > 0")
+        if per not in ("model", "provider"):
+            raise ValueError(f"per must be 'model' or 'provider', got {per!r}")
+        self.rpm = rpm
+        self.tpm = tpm
+        self.per = per
+        self.max_wait = max_wait
+        self.completion_estimate = completion_estimate
+        self._lock = threading.Lock()
+        self._requests: Dict[_Key, _Bucket] = {}
+        self._tokens: Dict[_Key, _Bucket] = {}
+
+    def key_for(self, provider: str, base_url: str, model: str) -> _Key:
+        base_url = base_url.rstrip("/")
+        return (provider, base_url, model) if self.per == "model" else (provider, base_url)
+
+    def estimate(self, req: Any) -> int:
+        """Tokens ``req`` (a chat or image request) is expected to use, prompt and completion."""
+        if not hasattr(req, "messages"):  # ImageRequest / ImageEditRequest
+            text = getattr(req, "prompt", None) or getattr(req, "instruction", None) or ""
+            return len(text) // CHARS_PER_TOKEN + self.completion_estimate
+        chars = 0
+        for m in req.messages:
+            chars += len(m.content or "") + 16  # role and framing
+            for tc in m.tool_calls or ():
+                chars += len(str(tc))
+        completion = req.max_tokens if req.max_tokens is not None else self.completion_estimate
+        return chars // CHARS_PER_TOKEN + completion
+
+    def acquire(self, key: _Key, tokens: int, *, max_wait: Optional[float] = None) -> Ticket:
+        """Reserve one request and ``tokens``, sleeping until they fit.
+
+        ``max_wait`` tightens the limiter's own ``max_wait`` for this call.
+        """
+        wait = self._reserve(key, tokens, max_wait)
+        if wait > 0:
+            time.sleep(wait)
+        return Ticket(key, tokens, wait)
+
+    async def aacquire(self, key: _Key, tokens: int, *, max_wait: Optional[float] = None) -> Ticket:
+        """Async ``acquire``: waits with ``asyncio.sleep``."""
+        wait = self._reserve(key, tokens, max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return Ticket(key, tokens, wait)
+
+    def settle(self, ticket: Ticket, used: Optional[int]) -> None:
+        """Correct the reservation to the tokens actually ``used`` (``None``: unknown,
+        keep the estimate)."""
+        if used is not None:
+            self._adjust(ticket.key, ticket.tokens - used)
+
+    def refund(self, ticket: Ticket) -> None:
+        """Give back the tokens of an attempt that failed (the request still counts)."""
+        self._adjust(ticket.key, ticket.tokens)
+
+    def stats(self) -> Dict[Any, Dict[str, Optional[float]]]:
+        """Room left in each bucket, by key."""
+        now = time.monotonic()
+        out: Dict[Any, Dict[str, Optional[float]]] = {}
+        with self._lock:
+            for key in set(self._requests) | set(self._tokens):
+                row: Dict[str, Optional[float]] = {"requests": None, "tokens": None}
+                for name, buckets in (("requests", self._requests), ("tokens", self._tokens)):
+                    bucket = buckets.get(key)
+                    if bucket is not None:
+                        bucket.refill(now)
+                        row[name] = bucket.level
+                out[key] = row
+        return out
+
+    def _buckets(self, key: _Key) -> Tuple[Optional[_Bucket], Optional[_Bucket]]:
+        requests = tokens = None
+        if self.rpm is not None:
+            requests = self._requests.get(key)
+            if requests is None:
+                requests = self._requests[key] = _Bucket(self.rpm)
+        if self.tpm is not None:
+            tokens = self._tokens.get(key)
+            if tokens is None:
+                tokens = self._tokens[key] = _Bucket(self.tpm)
+        return requests, tokens
+
+    def _reserve(self, key: _Key, tokens: int, max_wait: Optional[float]) -> float:
+        limit = self.max_wait
+        if max_wait is not None:
+            limit = max_wait if limit is None else min(limit, max_wait)
+        with self._lock:
+            requests, bucket = self._buckets(key)
+            now = time.monotonic()
+            wait = 0.0
+            for b, amount in ((requests, 1), (bucket, tokens)):
+                if b is not None:
+                    b.refill(now)
+                    wait = max(wait, b.wait_for(amount))
+            if limit is not None and wait > limit:
+                raise RateLimitExceeded(
+                    f"rate limit for {'/'.join(k for k in key if k)}: no room for "
+                    f"{tokens} tokens within {limit:g}s (retry in {wait:.2f}s)",
+                    key=key,
+                    retry_in=wait,
+                )
+            # Reserve now, even below zero: later callers queue up behind this one.
+            if requests is not None:
+                requests.level -= 1
+            if bucket is not None:
+                bucket.level -= min(tokens, bucket.capacity)
+        return wait
+
+    def _adjust(self, key: _Key, tokens: int) -> None:
+        with self._lock:
+            bucket = self._tokens.get(key)
+            if bucket is not None:
+                bucket.level = min(bucket.capacity, bucket.level + tokens)
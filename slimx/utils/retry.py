@@ -4,13 +4,28 @@ Only *transient* failures are retried (timeouts, rate limits, transport/network
 errors). Deterministic failures — bad API keys (``ProviderAuthError``), schema
 errors, tool-execution errors — are raised immediately so callers fail fast
 instead of waiting through pointless backoff.
+
+``RetryPolicy`` decides *how long* to wait between attempts:
+
+- exponential backoff with full jitter, so a fleet of workers hit by the same
+  rate-limit storm spreads out instead of retrying in lockstep;
+- the server's own hint when it sent one (``ProviderRateLimitError.retry_after``,
+  parsed from ``Retry-After`` / ``x-ratelimit-reset-*`` / ``anthropic-ratelimit-*``);
+- a cap on the total time one call may spend sleeping;
+- a process-wide ``RetryBudget`` so retries cannot multiply load during an outage.
 """
 
 from __future__ import annotations
 
 import asyncio
+import random
+import re
+import threading
 import time
-from typing import Awaitable, Callable, Tuple, Type, TypeVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple, Type, TypeVar
 
 import httpx
 
@@ -31,30 +46,261 @@ def _is_transient(exc: BaseException) -> bool:
     return isinstance(exc, TRANSIENT_ERRORS)
 
 
-def retry(fn: Callable[[], T], retries: int = 2, base_delay: float = 0.5) -> T:
-    last: BaseException | None = None
-    for i in range(retries + 1):
+# ---- server rate-limit hints ---------------------------------------------
+
+# (reset header, remaining header) pairs, OpenAI then Anthropic.
+_RESET_HEADERS = (
+    ("x-ratelimit-reset-requests", "x-ratelimit-remaining-requests"),
+    ("x-ratelimit-reset-tokens", "x-ratelimit-remaining-tokens"),
+) + tuple(
+    (f"anthropic-ratelimit-{kind}-reset", f"anthropic-ratelimit-{kind}-remaining")
+    for kind in ("requests", "tokens", "input-tokens", "output-tokens")
+)
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """OpenAI-style durations: ``"20ms"``, ``"1s"``, ``"6m0s"``, ``"1h2m3.5s"``."""
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value.strip():
+        return None
+    return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+
+def _parse_reset(value: str, now: float) -> Optional[float]:
+    value = value.strip()
+    seconds = _parse_duration(value)
+    if seconds is not None:
+        return seconds
+    try:  # RFC 3339 timestamp (Anthropic)
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - now)
+
+
+def _parse_retry_after(value: str, now: float) -> Optional[float]:
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:  # HTTP-date
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def retry_after_from_headers(
+    headers: Optional[Mapping[str, str]], *, now: Optional[float] = None
+) -> Optional[float]:
+    """Seconds the server asked us to wait, or ``None`` if it gave no hint.
+
+    ``retry-after-ms`` / ``Retry-After`` win. Otherwise the latest reset among the
+    limits that are exhausted (remaining ``0``, or not reported) is used.
+    """
+    if not headers:
+        return None
+    h = {k.lower(): v for k, v in headers.items()}
+    now = time.time() if now is None else now
+    if "retry-after-ms" in h:
         try:
-            return fn()
-        except Exception as e:
-            last = e
-            if not _is_transient(e) or i >= retries:
-                raise
-            time.sleep(base_delay * (2 ** i))
-    # Unreachable: the loop always returns or raises. Kept for the type-checker.
-    assert last is not None
-    raise last
+            return max(0.0, float(h["retry-after-ms"]) / 1000.0)
+        except ValueError:
+            pass
+    if "retry-after" in h:
+        seconds = _parse_retry_after(h["retry-after"], now)
+        if seconds is not None:
+            return seconds
+    resets = []
+    for reset_key, remaining_key in _RESET_HEADERS:
+        if reset_key not in h:
+            continue
+        remaining = h.get(remaining_key)
+        if remaining is not None and remaining.strip() != "0":
+            continue
+        seconds = _parse_reset(h[reset_key], now)
+        if seconds is not None:
+            resets.append(seconds)
+    return max(resets) if resets else None
+
+
+def rate_limit_headers(headers: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    """Just the retry/rate-limit headers (never auth or cookies)."""
+    if not headers:
+        return {}
+    return {
+        k.lower(): v
+        for k, v in headers.items()
+        if k.lower().startswith(("retry-after", "x-ratelimit-", "anthropic-ratelimit-"))
+    }
+
+
+def rate_limit_error(message: str, headers: Optional[Mapping[str, str]] = None) -> ProviderRateLimitError:
+    """Build a ``ProviderRateLimitError`` carrying the server's parsed reset hints."""
+    return ProviderRateLimitError(
+        message,
+        retry_after=retry_after_from_headers(headers),
+        headers=rate_limit_headers(headers),
+    )
+
+
+# ---- policy --------------------------------------------------------------
+
+
+class RetryBudget:
+    """Process-wide cap on retries, shared by every policy that uses it.
+
+    Each first attempt earns ``ratio`` retry tokens and the budget refills at
+    ``min_per_second`` regardless of traffic, up to ``burst``. A retry spends one
+    token; when none is left the error is raised instead of retried. With the
+    defaults, sustained retries are held to roughly 10% of calls.
+    """
+
+    def __init__(self, *, ratio: float = 0.1, min_per_second: float = 1.0, burst: float = 20.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def record_call(self) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+# The budget every RetryPolicy draws on unless given its own (or ``budget=None``).
+DEFAULT_BUDGET = RetryBudget()
+
+
+@dataclass
+class RetryPolicy:
+    """How transient failures are retried.
+
+    ``delay(attempt)`` is a uniform draw from ``[0, min(max_delay, base_delay * 2**attempt)]``
+    ("full jitter"). A server hint (``retry_after``) replaces the backoff, plus up
+    to 10% jitter so clients released by the same reset don't stampede. A call
+    stops retrying once its next sleep would push it past ``max_total_sleep``.
+    """
+
+    retries: int = 2
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    max_total_sleep: Optional[float] = 60.0
+    budget: Optional[RetryBudget] = DEFAULT_BUDGET
+
+    def delay(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        hint = getattr(exc, "retry_after", None) if self.respect_retry_after else None
+        if hint is not None:
+            return hint * (1.0 + random.random() * 0.1) if self.jitter else hint
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0.0, cap) if self.jitter else cap
+
+    def _next_sleep(
+        self, attempt: int, exc: BaseException, stats: Dict[str, Any], deadline: Optional[float] = None
+    ) -> Optional[float]:
+        """The sleep before the next attempt, or None to give up and re-raise."""
+        if not _is_transient(exc) or attempt >= self.retries:
+            return None
+        sleep = self.delay(attempt, exc)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                stats["gave_up"] = "deadline"
+                return None
+            # Leave the next attempt at least half of what is left.
+            sleep = min(sleep, remaining / 2)
+        if self.max_total_sleep is not None and stats["sleep_s"] + sleep > self.max_total_sleep:
+            stats["gave_up"] = "max_total_sleep"
+            return None
+        if self.budget is not None and not self.budget.try_spend():
+            stats["gave_up"] = "budget"
+            return None
+        stats["retries"] += 1
+        stats["sleep_s"] += sleep
+        stats["last_error"] = type(exc).__name__
+        return sleep
+
+    def call(
+        self,
+        fn: Callable[[], T],
+        *,
+        stats: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> T:
+        """Call ``fn``, retrying transient failures. ``deadline`` (a ``time.monotonic()``
+        value) stops retrying once reached and shortens sleeps to fit before it."""
+        stats = new_retry_stats() if stats is None else stats
+        if self.budget is not None:
+            self.budget.record_call()
+        attempt = 0
+        while True:
+            stats["attempts"] += 1
+            try:
+                return fn()
+            except Exception as e:
+                sleep = self._next_sleep(attempt, e, stats, deadline)
+                if sleep is None:
+                    raise
+            time.sleep(sleep)
+            attempt += 1
+
+    async def acall(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        stats: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> T:
+        stats = new_retry_stats() if stats is None else stats
+        if self.budget is not None:
+            self.budget.record_call()
+        attempt = 0
+        while True:
+            stats["attempts"] += 1
+            try:
+                return await fn()
+            except Exception as e:
+                sleep = self._next_sleep(attempt, e, stats, deadline)
+                if sleep is None:
+                    raise
+            await asyncio.sleep(sleep)
+            attempt += 1
+
+
+def new_retry_stats() -> Dict[str, Any]:
+    """Counters a policy fills in: attempts, retries, total sleep, why it gave up."""
+    return {"attempts": 0, "retries": 0, "sleep_s": 0.0, "last_error": None, "gave_up": None}
+
+
+def retry(fn: Callable[[], T], retries: int = 2, base_delay: float = 0.5) -> T:
+    return RetryPolicy(retries=retries, base_delay=base_delay).call(fn)
 
 
 async def async_retry(fn: Callable[[], Awaitable[T]], retries: int = 2, base_delay: float = 0.5) -> T:
-    last: BaseException | None = None
-    for i in range(retries + 1):
-        try:
-            return await fn()
-        except Exception as e:
-            last = e
-            if not _is_transient(e) or i >= retries:
-                raise
-            await asyncio.sleep(base_delay * (2 ** i))
-    assert last is not None
-    raise last
+    return await RetryPolicy(retries=retries, base_delay=base_delay).acall(fn)
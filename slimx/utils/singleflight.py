@@ -0,0 +1,167 @@
+"""Single-flight: identical requests in flight at the same time share one call.
+
+When many threads or tasks send the same request at once (a cold cache after a
+deploy, a popular prompt), each would otherwise reach the provider separately and
+spend its rate limit. ``SingleFlight.do(key, fn)`` runs ``fn`` for the first caller
+(the leader); callers that arrive with the same ``key`` while it runs (followers)
+wait for it and get its result, or its exception. Once the call ends the key is
+free again: this is coalescing, not caching.
+
+A follower never inherits the leader's cancellation: if the leader's call ends in
+``CallCancelled`` (sync) or its task is cancelled (async), each follower starts over
+and one of them leads a new call. Nor does it wait past its own limits: given a
+``deadline`` it gives up with ``DeadlineExceeded`` once that passes, and a sync
+follower raises ``CallCancelled`` once its cancel scope is cancelled (an async one
+is cancelled with its task). The leader's call runs on for the others.
+
+Sync and async callers are coalesced separately, async ones per event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from ..errors import CallCancelled, DeadlineExceeded
+from .cancel import current_scope
+
+T = TypeVar("T")
+
+_GROUPS: "weakref.WeakSet[SingleFlight]" = weakref.WeakSet()
+
+# How often a sync follower in a cancel scope checks it while it waits.
+_CANCEL_POLL_S = 0.05
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """A group of coalesced calls (see module docs)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._acalls: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+        self._stats = {"leaders": 0, "followers": 0}
+        _GROUPS.add(self)
+
+    def do(
+        self, key: Hashable, fn: Callable[[], T], *, deadline: Optional[float] = None
+    ) -> Tuple[T, bool]:
+        """Run ``fn`` once for every concurrent caller with ``key``. Returns its value
+        and whether it was shared (``True``: another caller's call). ``deadline`` (a
+        ``time.monotonic()`` value) bounds a follower's wait."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            self._stats["leaders" if leader else "followers"] += 1
+        if not leader:
+            _follow(call, deadline)
+            if isinstance(call.error, CallCancelled):
+                return self.do(key, fn, deadline=deadline)
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+        try:
+            call.value = fn()
+            return call.value, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(
+        self, key: Hashable, fn: Callable[[], Awaitable[T]], *, deadline: Optional[float] = None
+    ) -> Tuple[T, bool]:
+        """Async ``do``: ``fn`` is awaited once for every concurrent task with ``key``
+        on this event loop."""
+        loop_key = (id(asyncio.get_running_loop()), key)
+        fut = self._acalls.get(loop_key)
+        if fut is not None:
+            with self._lock:
+                self._stats["followers"] += 1
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            await asyncio.wait({fut}, timeout=timeout)  # the leader's cancellation is not ours
+            if not fut.done():
+                raise _timed_out()
+            if fut.cancelled():
+                return await self.ado(key, fn, deadline=deadline)
+            return fut.result(), True
+        fut = asyncio.get_running_loop().create_future()
+        self._acalls[loop_key] = fut
+        with self._lock:
+            self._stats["leaders"] += 1
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # retrieved: no "never retrieved" warning without followers
+            raise
+        finally:
+            del self._acalls[loop_key]
+        fut.set_result(value)
+        return value, False
+
+    def stats(self) -> Dict[str, int]:
+        """Calls led and joined since creation, and the keys in flight now."""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls) + len(self._acalls)}
+
+    def _forget(self) -> None:
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._acalls = {}
+
+
+def _timed_out() -> DeadlineExceeded:
+    return DeadlineExceeded("deadline exceeded while waiting on an identical call in flight")
+
+
+def _follow(call: _Call, deadline: Optional[float]) -> None:
+    """Wait for the leader's ``call`` to end, within ``deadline`` and the current
+    cancel scope."""
+    scope = current_scope()
+    while not call.done.is_set():
+        if scope is not None:
+            scope.check()
+        timeout = None
+        if deadline is not None:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                raise _timed_out()
+        if scope is not None:
+            timeout = _CANCEL_POLL_S if timeout is None else min(timeout, _CANCEL_POLL_S)
+        call.done.wait(timeout)
+
+
+# Process-wide group used by ``Client(coalesce=True)``.
+DEFAULT_GROUP = SingleFlight()
+
+
+def _forget_after_fork() -> None:
+    # The parent's in-flight calls never finish in the child.
+    for group in list(_GROUPS):
+        group._forget()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_after_fork)
@@ -1,17 +1,158 @@
-def iter_sse_lines(byte_iter):
-    buf=b""
-    for chunk in byte_iter:
+"""Incremental Server-Sent Events parsing (the WHATWG ``text/event-stream`` format).
+
+``SSEParser`` is fed raw byte chunks and returns complete ``SSEEvent``s. It keeps one
+``bytearray`` with a read offset: each byte is appended once, scanned for a line
+ending once, and copied out once with its line, so the cost per byte stays constant
+however many small chunks a long stream arrives in. The sync helpers here and the
+async ones in ``sse_async`` both drive this parser, so the two paths cannot drift.
+
+Spec coverage: ``\\r\\n``/``\\r``/``\\n`` line endings (also split across chunks), a
+leading BOM, ``:`` comment lines, the ``event``/``data``/``id``/``retry`` fields,
+multi-line ``data`` joined with ``\\n``, a single space stripped after the colon, and
+the last event id carried onto later events. Deliberately lenient in one place: an
+event left pending when the stream ends without a blank line is still delivered,
+since some servers omit the final separator.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional
+
+_EOL = re.compile(rb"\r\n|\r|\n")
+_BOM = "\ufeff"
+
+
+@dataclass
+class SSEEvent:
+    data: str
+    event: str = "message"
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+
+class SSELineBuffer:
+    """Split a byte stream into decoded lines, each byte handled once."""
+
+    __slots__ = ("_buf", "_pos", "_scan")
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._pos = 0   # start of the first unconsumed line
+        self._scan = 0  # bytes before this offset hold no line ending
+
+    def feed(self, chunk: bytes) -> List[str]:
+        buf = self._buf
+        if self._pos:
+            # Drop consumed lines; only the (partial) last line is moved.
+            del buf[: self._pos]
+            self._scan -= self._pos
+            self._pos = 0
         buf += chunk
-        while b"\n" in buf:
-            line, buf = buf.split(b"\n", 1)
-            yield line.decode("utf-8", errors="replace")
-    if buf:
-        yield buf.decode("utf-8", errors="replace")
-
-def iter_sse_data(byte_iter):
-    for line in iter_sse_lines(byte_iter):
-        line=line.strip()
-        if not line:
-            continue
-        if line.startswith("data:"):
-            yield line[len("data:"):].strip()
+        lines: List[str] = []
+        pos = 0
+        end = len(buf)
+        for m in _EOL.finditer(buf, self._scan):
+            if m.end() == end and m.end() - m.start() == 1 and buf[m.start()] == 0x0D:
+                # A trailing "\r" may be the first half of "\r\n": wait for more.
+                break
+            lines.append(buf[pos : m.start()].decode("utf-8", errors="replace"))
+            pos = m.end()
+        self._pos = pos
+        self._scan = max(pos, end - 1 if end and buf[end - 1] == 0x0D else end)
+        return lines
+
+    def flush(self) -> List[str]:
+        """End of stream: the unterminated last line, if any."""
+        rest = bytes(self._buf[self._pos :])
+        self._buf = bytearray()
+        self._pos = self._scan = 0
+        if rest.endswith(b"\r"):
+            rest = rest[:-1]
+        return [rest.decode("utf-8", errors="replace")] if rest else []
+
+
+class SSEParser:
+    """Incremental event-stream parser: ``feed()`` chunks, then ``close()``."""
+
+    def __init__(self) -> None:
+        self._lines = SSELineBuffer()
+        self._data: List[str] = []
+        self._event = ""
+        self._last_id: Optional[str] = None
+        self._retry: Optional[int] = None
+        self._started = False
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        return self._process(self._lines.feed(chunk))
+
+    def close(self) -> List[SSEEvent]:
+        events = self._process(self._lines.flush())
+        pending = self._dispatch()
+        if pending is not None:
+            events.append(pending)
+        return events
+
+    def _process(self, lines: List[str]) -> List[SSEEvent]:
+        events: List[SSEEvent] = []
+        for line in lines:
+            if not self._started:
+                self._started = True
+                if line.startswith(_BOM):
+                    line = line[1:]
+            if not line:
+                event = self._dispatch()
+                if event is not None:
+                    events.append(event)
+                continue
+            if line.startswith("data:"):  # fast path: the bulk of any stream
+                self._data.append(line[6:] if line.startswith(" ", 5) else line[5:])
+                continue
+            if line[0] == ":":
+                continue
+            field, sep, value = line.partition(":")
+            if sep and value[:1] == " ":
+                value = value[1:]
+            if field == "data":
+                self._data.append(value)
+            elif field == "event":
+                self._event = value
+            elif field == "id":
+                if "\0" not in value:
+                    self._last_id = value
+            elif field == "retry":
+                if value.isascii() and value.isdigit():
+                    self._retry = int(value)
+        return events
+
+    def _dispatch(self) -> Optional[SSEEvent]:
+        data, event = self._data, self._event
+        self._data, self._event = [], ""
+        if not data:
+            return None
+        return SSEEvent(
+            data="\n".join(data),
+            event=event or "message",
+            id=self._last_id,
+            retry=self._retry,
+        )
+
+
+def iter_sse_events(byte_iter: Iterable[bytes]) -> Iterator[SSEEvent]:
+    parser = SSEParser()
+    for chunk in byte_iter:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def iter_sse_lines(byte_iter: Iterable[bytes]) -> Iterator[str]:
+    lines = SSELineBuffer()
+    for chunk in byte_iter:
+        yield from lines.feed(chunk)
+    yield from lines.flush()
+
+
+def iter_sse_data(byte_iter: Iterable[bytes]) -> Iterator[str]:
+    for event in iter_sse_events(byte_iter):
+        yield event.data
@@ -1,17 +1,30 @@
-async def aiter_sse_lines(aiter):
-    buf=b""
+"""Async counterparts of the `sse` helpers, driving the same `SSEParser`."""
+
+from __future__ import annotations
+
+from typing import AsyncIterable, AsyncIterator
+
+from .sse import SSEEvent, SSELineBuffer, SSEParser
+
+
+async def aiter_sse_events(aiter: AsyncIterable[bytes]) -> AsyncIterator[SSEEvent]:
+    parser = SSEParser()
     async for chunk in aiter:
-        buf += chunk
-        while b"\n" in buf:
-            line, buf = buf.split(b"\n", 1)
-            yield line.decode("utf-8", errors="replace")
-    if buf:
-        yield buf.decode("utf-8", errors="replace")
-
-async def aiter_sse_data(aiter):
-    async for line in aiter_sse_lines(aiter):
-        line=line.strip()
-        if not line:
-            continue
-        if line.startswith("data:"):
-            yield line[len("data:"):].strip()
+        for event in parser.feed(chunk):
+            yield event
+    for event in parser.close():
+        yield event
+
+
+async def aiter_sse_lines(aiter: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    lines = SSELineBuffer()
+    async for chunk in aiter:
+        for line in lines.feed(chunk):
+            yield line
+    for line in lines.flush():
+        yield line
+
+
+async def aiter_sse_data(aiter: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    async for event in aiter_sse_events(aiter):
+        yield event.data
@@ -8,6 +8,7 @@ opting into conformance.
 from __future__ import annotations
 
 import asyncio
+from typing import Any, Dict
 
 import pytest
 from contract import (
@@ -35,9 +36,9 @@ from slimx.providers.ollama_async import OllamaAsyncProvider
 from slimx.providers.openai import OpenAIProvider
 from slimx.providers.openai_async import OpenAIAsyncProvider
 
-_KW = {"api_key": "x", "base_url": "http://api.test/v1"}
-_ANTHRO = {"api_key": "x", "base_url": "http://api.test"}
-_GOOGLE = {"api_key": "x", "base_url": "http://api.test/v1beta"}
+_KW: Dict[str, Any] = {"api_key": "x", "base_url": "http://api.test/v1"}
+_ANTHRO: Dict[str, Any] = {"api_key": "x", "base_url": "http://api.test"}
+_GOOGLE: Dict[str, Any] = {"api_key": "x", "base_url": "http://api.test/v1beta"}
 
 # name -> (build_sync, build_async)
 BUILTINS = {
@@ -72,6 +73,8 @@ def test_builtin_sync_contract(name):
         check_chat(provider)
         if provider.capabilities.streaming:
             check_stream(provider)
+    # The provider pools its client; close it so the next transport is picked up.
+    provider.close()
 
     with transport_installed(make_transport(name, error_status=500)):
         check_error(provider)
@@ -91,6 +94,7 @@ def test_builtin_async_contract(name):
                 await check_achat(provider)
             if caps.async_streaming:
                 await check_astream(provider)
+        await provider.aclose()
         if caps.async_chat:
             with transport_installed(make_transport(name, error_status=500)):
                 await check_aerror(provider)
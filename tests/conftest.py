@@ -0,0 +1,32 @@
+import pytest
+
+import slimx.transport
+from slimx import stats
+from slimx.utils import hedge
+from slimx.utils.breaker import DEFAULT_BREAKER
+
+
+@pytest.fixture(autouse=True)
+def _fresh_transport_registry():
+    # Shared pools cache their httpx clients; tests swap httpx.Client/transports,
+    # so every test starts from an empty registry.
+    slimx.transport.reset()
+    yield
+    slimx.transport.reset()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_circuit_breaker():
+    # The default breaker is process-wide; one test's failures must not trip the next.
+    DEFAULT_BREAKER.reset()
+    yield
+    DEFAULT_BREAKER.reset()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_latency_windows():
+    hedge.reset()
+    stats.reset()
+    yield
+    hedge.reset()
+    stats.reset()
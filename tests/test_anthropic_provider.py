@@ -9,6 +9,8 @@ from slimx.errors import ProviderAuthError, ProviderError, ProviderRateLimitErro
 from slimx.low import ChatRequest
 from slimx.providers.anthropic import AnthropicProvider
 from slimx.providers.anthropic_async import AnthropicAsyncProvider
+from slimx.types import Usage
+from slimx.utils import jsonlib
 
 captured = {}
 
@@ -27,17 +29,22 @@ def add(a: int, b: int) -> int:
 class FakeResponse:
     def __init__(self, status_code=200, data=None, text=""):
         self.status_code = status_code
+        self.headers = {}
         self._data = data or {}
         self.text = text
 
     def json(self):
         return self._data
 
+    @property
+    def content(self):
+        return jsonlib.dumps(self.json())
+
 
 def make_client(response, *, is_async=False):
     class _Client:
-        def __init__(self, *, timeout=None):
-            self.timeout = timeout
+        def __init__(self, **kwargs):
+            pass
 
         def __enter__(self):
             return self
@@ -51,26 +58,26 @@ def make_client(response, *, is_async=False):
         async def __aexit__(self, *args):
             return None
 
-        def post(self, url, *, headers, json):
+        def post(self, url, *, headers, content, timeout=None):
             captured["url"] = url
             captured["headers"] = headers
-            captured["json"] = json
+            captured["json"] = jsonlib.loads(content)
             return response
 
-        def get(self, url, *, headers):
+        def get(self, url, *, headers, timeout=None):
             captured["url"] = url
             captured["headers"] = headers
             return response
 
-        async def apost(self, url, *, headers, json):
-            return self.post(url, headers=headers, json=json)
+        async def apost(self, url, *, headers, content):
+            return self.post(url, headers=headers, content=content)
 
     if is_async:
         class _AsyncClient(_Client):
-            async def post(self, url, *, headers, json):  # type: ignore[override]
+            async def post(self, url, *, headers, content, timeout=None):  # type: ignore[override]
                 captured["url"] = url
                 captured["headers"] = headers
-                captured["json"] = json
+                captured["json"] = jsonlib.loads(content)
                 return response
 
         return _AsyncClient
@@ -238,6 +245,7 @@ def test_anthropic_async_chat_parses_tool_use(monkeypatch):
 class FakeStreamResponse:
     def __init__(self, status_code=200, chunks=None, body=b""):
         self.status_code = status_code
+        self.headers = {}
         self._chunks = chunks or []
         self._body = body
 
@@ -269,7 +277,7 @@ class FakeStreamResponse:
 
 def make_stream_client(response):
     class _Client:
-        def __init__(self, *, timeout=None):
+        def __init__(self, **kwargs):
             pass
 
         def __enter__(self):
@@ -284,8 +292,8 @@ def make_stream_client(response):
         async def __aexit__(self, *a):
             return None
 
-        def stream(self, method, url, *, headers, json):
-            captured["json"] = json
+        def stream(self, method, url, *, headers, content, timeout=None):
+            captured["json"] = jsonlib.loads(content)
             captured["url"] = url
             return response
 
@@ -301,7 +309,7 @@ def _sse(*events):
 
 
 _STREAM = _sse(
-    {"type": "message_start", "message": {}},
+    {"type": "message_start", "message": {"usage": {"input_tokens": 12, "output_tokens": 1}}},
     {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
     {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hel"}},
     {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "lo"}},
@@ -311,6 +319,7 @@ _STREAM = _sse(
     {"type": "content_block_delta", "index": 1, "delta": {"type": "input_json_delta", "partial_json": '{"a":'}},
     {"type": "content_block_delta", "index": 1, "delta": {"type": "input_json_delta", "partial_json": '2,"b":3}'}},
     {"type": "content_block_stop", "index": 1},
+    {"type": "message_delta", "delta": {"stop_reason": "tool_use"}, "usage": {"output_tokens": 7}},
     {"type": "message_stop"},
 )
 
@@ -328,7 +337,7 @@ def test_anthropic_streams_text_and_tool_use(monkeypatch):
     call = tool_events[0].tool_call
     assert call is not None
     assert call.id == "toolu_1" and call.name == "add" and call.arguments == {"a": 2, "b": 3}
-    assert events[-1].type == "done"
+    assert events[-1].type == "done" and events[-1].usage == Usage(12, 7)
     assert captured["json"]["stream"] is True
 
 
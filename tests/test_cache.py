@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from fakes import FakeProvider
+from slimx import Message, ResponseCache, tool
+from slimx.cache import request_key
+from slimx.content import ImagePart
+from slimx.low import ChatRequest, Client
+from slimx.types import GeneratedImage, ImageGenerationOptions
+
+
+@tool
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+class _AsyncFake(FakeProvider):
+    async def achat(self, req, *, tools=(), timeout=None):
+        return self.chat(req, tools=tools, timeout=timeout)
+
+
+def _req(text: str = "hello", **kw) -> ChatRequest:
+    return ChatRequest(model="demo", messages=[Message.user(text)], **kw)
+
+
+def test_repeat_request_is_served_from_memory():
+    provider = FakeProvider()
+    client = Client(provider, cache=ResponseCache())
+    first = client.chat(_req(temperature=0))
+    second = client.chat(_req(temperature=0))
+
+    assert len(provider.calls) == 1
+    assert second.text == first.text == "fake:hello"
+    assert first.trace["cache"] == "miss" and second.trace["cache"] == "hit"
+    assert second.trace["cache_hits"] == 1 and second.trace["cache_misses"] == 0
+    assert second is not first and second.request == first.request
+
+    client.chat(_req(temperature=0.5))  # a different request
+    assert len(provider.calls) == 2
+
+
+def test_no_cache_no_trace_keys():
+    res = Client(FakeProvider()).chat(_req())
+    assert "cache" not in res.trace
+
+
+def test_tool_loop_steps_are_cached_but_tools_still_run():
+    calls = []
+
+    @tool
+    def counted(a: int, b: int) -> int:
+        calls.append((a, b))
+        return a + b
+
+    cache = ResponseCache()
+    for expected in ("miss", "hit"):
+        provider = FakeProvider()
+        res = Client(provider, cache=cache).chat(_req("2+3?"), tools=[counted], tool_runtime="auto")
+        assert res.text == "fake:5" and res.trace["cache"] == expected
+    assert len(calls) == 2 and len(provider.calls) == 0  # second run: no model calls
+    assert res.tool_calls == [] and res.trace["cache_hits"] == 2
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("slimx.cache.time.time", lambda: clock[0])
+    provider = FakeProvider()
+    cache = ResponseCache(maxsize=2, ttl=60)
+    client = Client(provider, cache=cache)
+    for text in ("a", "b", "a", "c", "a"):  # "b" is evicted by "c"; "a" stays recent
+        client.chat(_req(text))
+    assert [m.messages[-1].content for m in provider.calls] == ["a", "b", "c"]
+    assert cache.stats()["size"] == 2
+
+    clock[0] += 61
+    client.chat(_req("a"))
+    assert len(provider.calls) == 4  # expired
+
+
+def test_sqlite_tier_outlives_the_memory_tier(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    Client(FakeProvider(), cache=ResponseCache(path=path)).chat(_req())
+
+    provider = FakeProvider()
+    cache = ResponseCache(path=path)  # a fresh process, as far as memory goes
+    res = Client(provider, cache=cache).chat(_req())
+    assert res.text == "fake:hello" and res.trace["cache"] == "hit"
+    assert provider.calls == [] and cache.stats()["disk_hits"] == 1
+    cache.clear()
+    assert res.request is not None
+    assert ResponseCache(path=path).get(request_key(res.request)) is None
+
+
+def test_key_covers_media_tools_and_endpoint():
+    def key(**kw):
+        img = ImagePart(data=kw.pop("image", b"\x89PNG1"), mime_type="image/png")
+        req = ChatRequest(model="demo", messages=[Message.user("look", images=[img])])
+        return request_key(Client(FakeProvider())._request_snapshot(req), **kw)
+
+    assert key() == key()
+    assert key() != key(image=b"\x89PNG2")
+    assert key() != key(tools=[add])
+    assert key() != key(base_url="http://other/v1")
+
+
+def test_key_covers_tool_choice_and_response_chaining():
+    provider = FakeProvider()
+    client = Client(provider, cache=ResponseCache())
+    client.chat(_req())
+    client.chat(_req(tool_choice="required"))
+    client.chat(_req(previous_response_id="resp_1"))
+    client.chat(_req(image_generation=ImageGenerationOptions(size="1024x1024")))
+    client.chat(_req(image_generation=ImageGenerationOptions(size="512x512")))
+    assert len(provider.calls) == 5
+
+    res = client.chat(_req(tool_choice="required"))
+    assert res.request is not None
+    assert res.trace["cache"] == "hit" and res.request["tool_choice"] == "required"
+    unset = client.chat(_req()).request
+    assert unset is not None and "tool_choice" not in unset  # unset fields stay out
+
+
+def test_async_client_uses_the_cache(tmp_path):
+    provider = _AsyncFake()
+    client = Client(provider, cache=ResponseCache(path=str(tmp_path / "c.sqlite")))
+
+    async def go():
+        await client.achat(_req())
+        return await client.achat(_req())
+
+    res = asyncio.run(go())
+    assert res.trace["cache"] == "hit" and len(provider.calls) == 1
+
+
+def test_maxsize_is_checked():
+    with pytest.raises(ValueError):
+        ResponseCache(maxsize=0)
+
+
+def test_responses_with_images_are_not_stored():
+    class _ImageFake(FakeProvider):
+        def chat(self, req, *, tools=(), timeout=None):
+            res = super().chat(req, tools=tools, timeout=timeout)
+            res.images = [GeneratedImage(mime_type="image/png", data=b"\x89PNG")]
+            return res
+
+    provider = _ImageFake()
+    cache = ResponseCache()
+    client = Client(provider, cache=cache)
+    first = client.chat(_req())
+    second = client.chat(_req())
+    assert len(provider.calls) == 2
+    assert second.images == first.images and cache.stats()["stores"] == 0
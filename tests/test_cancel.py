@@ -0,0 +1,197 @@
+"""In-flight cancellation: aborted sockets for sync calls, cancelled tasks for async."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import select
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from slimx import Message, fallback, parallel
+from slimx.errors import CallCancelled
+from slimx.low import ChatRequest, Client
+from slimx.providers.openai import OpenAIProvider
+from slimx.utils import hedge
+from slimx.utils.cancel import CancelScope, cancel_scope, first_success, nested_scope
+
+DISCONNECTS: list = []
+ARRIVED = threading.Event()  # a ``slow`` request reached the server
+
+
+def _hung_up(conn: socket.socket) -> bool:
+    try:
+        return conn.recv(1, socket.MSG_PEEK) == b""
+    except OSError:
+        return True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """``slow`` holds the request open until the client hangs up (or 5s pass);
+    ``medium`` answers after 0.2s; anything else at once."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+        model = body["model"]
+        if model == "slow":
+            ARRIVED.set()
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                readable, _, _ = select.select([self.connection], [], [], 0.02)
+                if readable and _hung_up(self.connection):
+                    DISCONNECTS.append(model)
+                    return
+        if model == "medium":
+            time.sleep(0.2)
+        out = json.dumps({"choices": [{"message": {"content": f"answer:{model}"}}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    DISCONNECTS.clear()
+    ARRIVED.clear()
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}/v1"
+    srv.shutdown()
+    srv.server_close()
+
+
+def _wait_for_disconnect(n: int = 1) -> None:
+    deadline = time.monotonic() + 2
+    while len(DISCONNECTS) < n and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _once_slow_arrives(fn) -> None:
+    threading.Thread(target=lambda: (ARRIVED.wait(2), fn()), daemon=True).start()
+
+
+def test_scope_cancel_aborts_a_blocked_request(server):
+    client = Client(OpenAIProvider(api_key="x", base_url=server), timeout=10)
+    scope = CancelScope()
+    _once_slow_arrives(scope.cancel)
+
+    started = time.perf_counter()
+    with pytest.raises(CallCancelled), cancel_scope(scope):
+        client.chat(ChatRequest(model="slow", messages=[Message.user("hi")]))
+    assert time.perf_counter() - started < 1.0
+    assert scope.aborted == 1
+    _wait_for_disconnect()
+    assert DISCONNECTS == ["slow"]  # the provider saw the connection drop
+
+    with pytest.raises(CallCancelled), cancel_scope(scope):  # a cancelled scope starts nothing
+        client.chat(ChatRequest(model="fast", messages=[Message.user("hi")]))
+    client.close()
+
+
+def test_race_closes_the_losing_connection(server):
+    for _ in range(hedge.MIN_SAMPLES):
+        hedge.record_latency("openai", server, "slow", 3000.0)
+    kwargs = {"provider_kwargs": {"api_key": "x", "base_url": server}, "timeout": 10}
+    p = parallel(["openai:slow", "openai:medium"], mode="race", **kwargs)
+
+    res = p("hi")
+    assert res.text == "answer:medium"
+    trace = res.trace
+    assert trace["abandoned_count"] == 1 and trace["connections_closed"] == 1
+    assert 2000 < trace["time_saved_ms"] < 3000
+    _wait_for_disconnect()
+    assert DISCONNECTS == ["slow"]
+
+
+def test_sync_hedge_closes_the_losing_connection(server):
+    client = Client(OpenAIProvider(api_key="x", base_url=server), timeout=10, hedge_after_ms=200, hedge_model="fast")
+    started = time.perf_counter()
+    res = client.chat(ChatRequest(model="slow", messages=[Message.user("hi")]))
+    assert res.text == "answer:fast" and res.trace["hedge_wins"] == 1
+    assert time.perf_counter() - started < 1.0 and ARRIVED.is_set()
+    _wait_for_disconnect()
+    assert DISCONNECTS == ["slow"]
+    client.close()
+
+
+def test_fallback_slo_overrun_closes_the_connection(server):
+    kwargs = {"provider_kwargs": {"api_key": "x", "base_url": server}, "timeout": 10}
+    res = fallback(["openai:slow", "openai:fast"], slo_ms=100, **kwargs)("hi")
+    assert res.text == "answer:fast" and res.trace["answered_by"] == "openai:fast"
+    _wait_for_disconnect()
+    assert DISCONNECTS == ["slow"]
+
+
+def test_nested_scopes_are_cancelled_with_their_parent():
+    outer = CancelScope()
+    with cancel_scope(outer):
+        inner = nested_scope()
+    assert nested_scope() is not inner and not inner.cancelled
+    outer.cancel()
+    assert inner.cancelled and outer.child().cancelled  # a late child starts cancelled
+
+
+def test_cancel_event_aborts_in_flight_calls(server):
+    kwargs = {"provider_kwargs": {"api_key": "x", "base_url": server}, "timeout": 10}
+    evt = threading.Event()
+    _once_slow_arrives(evt.set)
+
+    started = time.perf_counter()
+    res = parallel(["openai:slow"], **kwargs)("hi", cancel_event=evt)
+    assert time.perf_counter() - started < 1.0
+    assert res.results[0].cancelled and "CallCancelled" in (res.results[0].error or "")
+    assert res.trace["abandoned_count"] == 1 and res.trace["time_saved_ms"] == 0  # no history
+    _wait_for_disconnect()
+    assert DISCONNECTS == ["slow"]
+
+
+@pytest.mark.parametrize("mode", ["race", "consensus"])
+def test_cancel_event_aborts_races_and_votes_in_flight(server, mode):
+    kwargs = {"provider_kwargs": {"api_key": "x", "base_url": server}, "timeout": 10}
+    evt = threading.Event()
+    _once_slow_arrives(evt.set)
+
+    started = time.perf_counter()
+    res = parallel(["openai:slow", "openai:slow"], mode=mode, **kwargs)("hi", cancel_event=evt)
+    assert time.perf_counter() - started < 1.0
+    assert res.winner is None and len(res.results) == 2
+    assert all(it.cancelled for it in res.results)
+    assert res.trace["abandoned_count"] >= 1
+    _wait_for_disconnect()
+    assert DISCONNECTS and set(DISCONNECTS) == {"slow"}
+
+
+def test_first_success_cancels_the_rest():
+    cancelled = []
+
+    async def answer(value, delay, fail=False):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(value)
+            raise
+        if fail:
+            raise RuntimeError(value)
+        return value
+
+    async def go():
+        return await first_success([answer("a", 0.0, fail=True), answer("b", 0.02), answer("c", 5)])
+
+    started = time.perf_counter()
+    winner, value, errors, stats = asyncio.run(go())
+    assert time.perf_counter() - started < 1.0
+    assert (winner, value) == (1, "b")
+    assert isinstance(errors[0], RuntimeError)
+    assert stats == {"abandoned": 1} and cancelled == ["c"]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from fakes import FakeProvider
+from slimx.errors import (
+    CallCancelled,
+    CircuitOpenError,
+    DeadlineExceeded,
+    ProviderAuthError,
+    ProviderError,
+    ProviderServerError,
+    ProviderTimeoutError,
+    RateLimitExceeded,
+)
+from slimx.low import ChatRequest, CircuitBreaker, Client
+from slimx.messages import Message
+from slimx.providers._openai_shape import raise_for_status
+from slimx.utils import breaker as breaker_mod
+from slimx.utils.retry import RetryPolicy
+
+REQ = ChatRequest(model="m", messages=[Message.user("hi")])
+NO_RETRY = RetryPolicy(retries=0, budget=None)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock()
+    monkeypatch.setattr(breaker_mod.time, "monotonic", c)
+    return c
+
+
+def test_opens_after_threshold_then_half_opens_and_closes(clock):
+    b = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    for _ in range(2):
+        b.admit("p", "https://x")
+        change = b.record("p", "https://x", ProviderTimeoutError("t"))
+    assert change == ("closed", "open")
+    with pytest.raises(CircuitOpenError) as ei:
+        b.admit("p", "https://x/")  # trailing slash: same endpoint
+    assert ei.value.retry_in == pytest.approx(10) and ei.value.provider == "p"
+
+    clock.now += 10
+    assert b.state("p", "https://x") == "half_open"
+    assert b.admit("p", "https://x") == ("open", "half_open")
+    with pytest.raises(CircuitOpenError):
+        b.admit("p", "https://x")  # only one trial at a time
+    assert b.record("p", "https://x") == ("half_open", "closed")
+    assert b.snapshot() == [
+        {"provider": "p", "base_url": "https://x", "state": "closed", "failures": 0, "opens": 1}
+    ]
+
+
+def test_failed_trial_reopens_and_non_endpoint_errors_do_not_count(clock):
+    b = CircuitBreaker(failure_threshold=1, recovery_timeout=5)
+    b.admit("p")
+    b.record("p", exc=ProviderServerError("503"))
+    clock.now += 5
+    b.admit("p")
+    assert b.record("p", exc=ProviderServerError("503")) == ("half_open", "open")
+
+    other = CircuitBreaker(failure_threshold=1)
+    for exc in (ProviderAuthError("401"), ProviderError("400"), ValueError("bad schema")):
+        other.admit("q")
+        assert other.record("q", exc=exc) is None
+    assert other.state("q") == "closed"
+
+
+def test_errors_that_never_reached_the_endpoint_leave_a_trial_open(clock):
+    b = CircuitBreaker(failure_threshold=1, recovery_timeout=5)
+    b.admit("p")
+    b.record("p", exc=ProviderServerError("503"))
+    clock.now += 5
+    for exc in (DeadlineExceeded("spent"), RateLimitExceeded("quota"), CallCancelled("lost")):
+        b.admit("p")
+        assert b.record("p", exc=exc) is None
+        assert b.state("p") == "half_open"  # neither closed by a "success" nor reopened
+
+
+def test_spent_deadline_does_not_take_the_half_open_trial(clock):
+    b = CircuitBreaker(failure_threshold=1, recovery_timeout=5)
+    b.admit("fake")
+    b.record("fake", exc=ProviderServerError("503"))
+    clock.now += 5
+    provider = FakeProvider()
+    client = Client(provider, circuit_breaker=b, retry_policy=NO_RETRY)
+    with pytest.raises(DeadlineExceeded):
+        client.chat(REQ, deadline=time.monotonic() - 1)
+    assert provider.calls == [] and b.state("fake") == "half_open"
+    client.chat(REQ)  # the trial is still free
+    assert b.state("fake") == "closed"
+
+
+@pytest.mark.parametrize("status,expected", [(500, ProviderServerError), (529, ProviderServerError), (400, ProviderError)])
+def test_status_mapping_separates_server_errors(status, expected):
+    with pytest.raises(expected) as ei:
+        raise_for_status(status, "boom")
+    assert (type(ei.value) is ProviderServerError) == (status >= 500)
+
+
+def test_client_fails_fast_while_open_and_reports_state():
+    events, changes = [], []
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    provider = FakeProvider(fail_times=99)
+    client = Client(
+        provider,
+        retry_policy=NO_RETRY,
+        circuit_breaker=breaker,
+        hooks={"after_call": events.append, "circuit": changes.append},
+    )
+    for _ in range(2):
+        with pytest.raises(ProviderTimeoutError):
+            client.chat(REQ)
+    assert events[-1]["circuit_state"] == "open"
+    assert changes == [{"phase": "circuit", "provider": "fake", "base_url": "", "from": "closed", "to": "open"}]
+
+    with pytest.raises(CircuitOpenError):
+        client.chat(REQ)
+    assert len(provider.calls) == 2  # no request sent while open
+    assert events[-1]["ok"] is False and events[-1]["circuit_state"] == "open"
+
+    # Another client on the same endpoint sees the same circuit.
+    with pytest.raises(CircuitOpenError):
+        Client(FakeProvider(), circuit_breaker=breaker).chat(REQ)
+
+
+def test_open_circuit_stops_retries_mid_call(monkeypatch):
+    monkeypatch.setattr("slimx.utils.retry.time.sleep", lambda s: None)
+    provider = FakeProvider(fail_times=99)
+    policy = RetryPolicy(retries=5, base_delay=0, budget=None)
+    client = Client(provider, retry_policy=policy, circuit_breaker=CircuitBreaker(failure_threshold=2))
+    with pytest.raises(CircuitOpenError):
+        client.chat(REQ)
+    assert len(provider.calls) == 2
+
+
+def test_success_trace_and_disabled_breaker():
+    res = Client(FakeProvider(), circuit_breaker=CircuitBreaker()).chat(REQ)
+    assert res.trace["circuit_state"] == "closed"
+
+    provider = FakeProvider(fail_times=99)
+    client = Client(provider, retry_policy=NO_RETRY, circuit_breaker=None)
+    for _ in range(8):
+        with pytest.raises(ProviderTimeoutError):
+            client.chat(REQ)
+    assert len(provider.calls) == 8
+
+
+def test_async_stream_is_guarded():
+    class _AsyncDead(FakeProvider):
+        async def astream(self, req, *, tools=(), timeout=None):
+            raise ProviderTimeoutError("down")
+            yield  # pragma: no cover
+
+    client = Client(_AsyncDead(), circuit_breaker=CircuitBreaker(failure_threshold=1))
+
+    async def drain():
+        async for _ in client.astream(REQ):
+            pass
+
+    with pytest.raises(ProviderTimeoutError):
+        asyncio.run(drain())
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(drain())
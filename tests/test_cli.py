@@ -9,6 +9,7 @@ class _Resp:
     def __init__(self, data, status_code=200, text=""):
         self._data = data
         self.status_code = status_code
+        self.headers = {}
         self.text = text
 
     def json(self):
@@ -29,6 +30,9 @@ def _client_returning(resp):
         def get(self, url, *a, **k):
             return resp
 
+        def close(self):
+            pass
+
     return _Client
 
 
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from slimx import AdaptiveConcurrency, Message
+from slimx.errors import DeadlineExceeded, ProviderAuthError, ProviderRateLimitError
+from slimx.low import ChatRequest, Client, ImageRequest
+from slimx.providers.base import Provider, ProviderCapabilities
+from slimx.types import Result, StreamEvent
+from slimx.utils.concurrency import Slot
+
+
+class _LoadProvider(Provider):
+    """Answers after ``delay`` seconds (or raises ``error``), tracking peak concurrency."""
+
+    name = "loadfake"
+    capabilities = ProviderCapabilities()
+
+    def __init__(self, delay: float = 0.01, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.running = self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def _exit(self):
+        with self._lock:
+            self.running -= 1
+
+    def chat(self, req, *, tools=(), timeout=None):
+        self._enter()
+        try:
+            time.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+            return Result(text="ok")
+        finally:
+            self._exit()
+
+    async def achat(self, req, *, tools=(), timeout=None):
+        self._enter()
+        try:
+            await asyncio.sleep(self.delay)
+            return Result(text="ok")
+        finally:
+            self._exit()
+
+    def stream(self, req, *, tools=(), timeout=None):
+        self._enter()
+        try:
+            time.sleep(self.delay)
+            yield StreamEvent.done()
+        finally:
+            self._exit()
+
+    def generate_image(self, req, *, timeout=None):
+        self._enter()
+        try:
+            time.sleep(self.delay)
+            return Result(text="")
+        finally:
+            self._exit()
+
+
+def _take(limiter: AdaptiveConcurrency) -> Slot:
+    slot = limiter.acquire()
+    assert slot is not None
+    return slot
+
+
+def _req() -> ChatRequest:
+    return ChatRequest(model="m", messages=[Message.user("hi")])
+
+
+def test_limit_grows_while_saturated_and_caps_in_flight_calls():
+    limiter = AdaptiveConcurrency(2, max_limit=5, latency_tolerance=None)
+    provider = _LoadProvider()
+    events = []
+    client = Client(provider, concurrency_limiter=limiter, hooks={"concurrency": events.append})
+    with ThreadPoolExecutor(16) as pool:
+        results = list(pool.map(lambda _: client.chat(_req()), range(60)))
+
+    assert limiter.limit == 5 and provider.peak <= 5
+    assert [(e["from"], e["to"]) for e in events] == [(2, 3), (3, 4), (4, 5)]
+    assert events[0]["reason"] == "increase" and events[0]["provider"] == "loadfake"
+    assert results[-1].trace["concurrency_limit"] <= 5
+    assert sum(r.trace["concurrency_wait_ms"] for r in results) > 0
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_streams_and_image_calls_hold_a_slot():
+    limiter = AdaptiveConcurrency(2, max_limit=2, latency_tolerance=None)
+    provider = _LoadProvider(delay=0.02)
+    client = Client(provider, concurrency_limiter=limiter)
+
+    def call(i):
+        if i % 2:
+            return list(client.stream(_req()))
+        return client.generate_image(ImageRequest(model="m", prompt="a red cube"))
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(call, range(16)))
+    assert provider.peak == 2
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_unsaturated_limit_does_not_grow():
+    limiter = AdaptiveConcurrency(4, latency_tolerance=None)
+    client = Client(_LoadProvider(delay=0), concurrency_limiter=limiter)
+    for _ in range(20):
+        client.chat(_req())
+    assert limiter.limit == 4
+
+
+def test_429s_cut_the_limit_once_per_overload():
+    limiter = AdaptiveConcurrency(8)
+    slots = [_take(limiter) for _ in range(8)]
+    for slot in slots:  # all started before the cut: one overload, one cut
+        limiter.release(slot, error=ProviderRateLimitError("429"))
+    assert limiter.limit == 4 and limiter.stats()["decreases"] == 1
+
+    limiter.release(_take(limiter), error=ProviderAuthError("bad key"))  # not load
+    assert limiter.limit == 4
+    limiter.release(_take(limiter), error=ProviderRateLimitError("429"))
+    assert limiter.limit == 2
+
+
+def test_client_reports_the_cut_through_hooks():
+    events = []
+    limiter = AdaptiveConcurrency(4)
+    client = Client(
+        _LoadProvider(error=ProviderRateLimitError("429")),
+        concurrency_limiter=limiter,
+        retries=0,
+        circuit_breaker=None,
+        hooks={"concurrency": events.append},
+    )
+    with pytest.raises(ProviderRateLimitError):
+        client.chat(_req())
+    assert limiter.limit == 2
+    assert events == [{
+        "phase": "concurrency", "provider": "loadfake", "base_url": "",
+        "from": 4, "to": 2, "reason": "ProviderRateLimitError",
+    }]
+
+
+def test_latency_spike_cuts_the_limit():
+    limiter = AdaptiveConcurrency(4, latency_tolerance=2.0)
+    for _ in range(20):
+        limiter.release(_take(limiter), latency_ms=100)
+    assert limiter.limit == 4
+    for _ in range(5):
+        limiter.release(_take(limiter), latency_ms=1000)
+    assert limiter.limit == 2 and limiter.stats()["latency_ms"] > 100
+
+
+def test_waiters_time_out_or_get_the_next_free_slot():
+    limiter = AdaptiveConcurrency(1, latency_tolerance=None)
+    held = _take(limiter)
+    assert limiter.acquire(timeout=0.02) is None
+
+    with ThreadPoolExecutor(1) as pool:
+        waiting = pool.submit(limiter.acquire, 1.0)
+        time.sleep(0.02)
+        limiter.release(held)
+        slot = waiting.result()
+    assert slot is not None and slot.waited_s >= 0.015
+    assert limiter.stats()["in_flight"] == 1
+
+
+def test_slot_wait_is_bounded_by_the_call_deadline():
+    limiter = AdaptiveConcurrency(1)
+    limiter.acquire()
+    client = Client(_LoadProvider(), concurrency_limiter=limiter, total_timeout=0.05)
+    with pytest.raises(DeadlineExceeded):
+        client.chat(_req())
+
+
+def test_async_calls_share_the_limit():
+    limiter = AdaptiveConcurrency(2, max_limit=2)
+    provider = _LoadProvider(delay=0.02)
+    client = Client(provider, concurrency_limiter=limiter)
+
+    async def go():
+        return await asyncio.gather(*(client.achat(_req()) for _ in range(8)))
+
+    results = asyncio.run(go())
+    assert provider.peak == 2 and {r.text for r in results} == {"ok"}
+    assert max(r.trace["concurrency_wait_ms"] for r in results) >= 40
+
+
+def test_cancelled_async_waiter_leaves_no_slot_behind():
+    limiter = AdaptiveConcurrency(1)
+
+    async def go():
+        held = await limiter.aacquire()
+        assert held is not None
+        waiter = asyncio.ensure_future(limiter.aacquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release(held)
+        assert await limiter.aacquire(timeout=0.1) is not None
+
+    asyncio.run(go())
+    assert limiter.stats()["in_flight"] == 1 and limiter.stats()["waiting"] == 0
+
+
+def test_options_are_checked():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(0)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(4, max_limit=2)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(backoff=1)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(latency_tolerance=0.5)
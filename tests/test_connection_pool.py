@@ -0,0 +1,194 @@
+"""Providers own pooled keep-alive clients instead of one client per call."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from slimx import Message
+from slimx.high.api import AsyncModel, Model
+from slimx.low import ChatRequest, Client
+from slimx.providers.openai import OpenAIProvider
+from slimx.providers.anthropic import AnthropicProvider
+from slimx.providers._http import HTTPPool
+from slimx.providers.openai_async import OpenAIAsyncProvider
+
+_REQ = ChatRequest(model="m", messages=[Message.user("hi")])
+
+
+def _pool(provider) -> HTTPPool:
+    assert provider._pool is not None
+    return provider._pool
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+
+def _counting_client(monkeypatch, built: list):
+    real = httpx.Client
+
+    def factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(_handler)
+        client = real(*args, **kwargs)
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "Client", factory)
+
+
+def test_provider_reuses_one_client_across_calls(monkeypatch):
+    built: list = []
+    _counting_client(monkeypatch, built)
+    provider = OpenAIProvider(api_key="x", base_url="http://api.test/v1")
+
+    for _ in range(3):
+        assert provider.chat(_REQ).text == "ok"
+
+    assert len(built) == 1
+    assert not built[0].is_closed
+
+
+def test_pool_limits_are_configurable(monkeypatch):
+    built: list = []
+    _counting_client(monkeypatch, built)
+    limits = httpx.Limits(max_connections=3, max_keepalive_connections=1)
+    provider = OpenAIProvider.from_env(api_key="x", base_url="http://api.test/v1", limits=limits)
+
+    provider.chat(_REQ)
+
+    assert provider._pool is not None and provider._pool.limits is limits
+
+
+def test_close_releases_and_lazily_reopens(monkeypatch):
+    built: list = []
+    _counting_client(monkeypatch, built)
+    provider = OpenAIProvider(api_key="x", base_url="http://api.test/v1")
+
+    provider.chat(_REQ)
+    provider.close()
+    provider.close()  # idempotent
+    assert built[0].is_closed
+
+    provider.chat(_REQ)
+    assert len(built) == 2 and not built[1].is_closed
+
+
+def test_client_and_model_context_managers_close_the_provider(monkeypatch):
+    built: list = []
+    _counting_client(monkeypatch, built)
+
+    with Client(OpenAIProvider(api_key="x", base_url="http://api.test/v1")) as client:
+        client.chat(_REQ)
+    assert built[-1].is_closed
+
+    with Model("openai:m", provider_kwargs={"api_key": "x", "base_url": "http://api.test/v1"}) as m:
+        assert m("hi").text == "ok"
+    assert built[-1].is_closed
+
+
+def _counting_async_client(monkeypatch, built: list):
+    real = httpx.AsyncClient
+
+    def factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(_handler)
+        client = real(*args, **kwargs)
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "AsyncClient", factory)
+
+
+def test_async_provider_shares_one_client_per_event_loop(monkeypatch):
+    built: list = []
+    _counting_async_client(monkeypatch, built)
+    provider = OpenAIAsyncProvider(api_key="x", base_url="http://api.test/v1")
+
+    async def fan_out():
+        results = await asyncio.gather(*(provider.achat(_REQ) for _ in range(5)))
+        assert [r.text for r in results] == ["ok"] * 5
+        assert len(built) == 1
+        await provider.aclose()
+        assert built[0].is_closed
+
+    asyncio.run(fan_out())
+    # A new event loop gets its own client; the closed one is never reused.
+    asyncio.run(provider.achat(_REQ))
+    assert len(built) == 2
+
+
+def test_async_model_context_manager_closes_the_pool(monkeypatch):
+    built: list = []
+    _counting_async_client(monkeypatch, built)
+
+    async def run():
+        async with AsyncModel(
+            "openai:m", provider_kwargs={"api_key": "x", "base_url": "http://api.test/v1"}
+        ) as m:
+            assert (await m("hi")).text == "ok"
+        assert built[-1].is_closed
+
+    asyncio.run(run())
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        body = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def test_trace_reports_opened_then_reused_connections(local_server):
+    with Client(OpenAIProvider(api_key="x", base_url=local_server)) as client:
+        first = client.chat(_REQ)
+        second = client.chat(_REQ)
+        stats = _pool(client.provider).stats()
+
+    assert first.trace["connections"] == {
+        "requests": 1, "opened": 1, "reused": 0, "http_version": "HTTP/1.1",
+    }
+    assert second.trace["connections"]["opened"] == 0
+    assert second.trace["connections"]["reused"] == 1
+    assert stats == {"requests": 2, "opened": 1, "reused": 1, "http2": False}
+
+
+def test_http2_is_opt_in_via_kwarg_or_env(monkeypatch):
+    pytest.importorskip("h2")
+    built: list = []
+    _counting_client(monkeypatch, built)
+    monkeypatch.delenv("SLIMX_HTTP2", raising=False)
+
+    assert _pool(AnthropicProvider.from_env(api_key="x")).http2 is False
+    assert _pool(AnthropicProvider.from_env(api_key="x", http2=True)).http2 is True
+    monkeypatch.setenv("SLIMX_HTTP2", "1")
+    provider = OpenAIProvider.from_env(api_key="x", base_url="http://api.test/v1")
+    assert _pool(provider).http2 is True
+    # An explicit kwarg wins over the environment.
+    assert _pool(OpenAIProvider.from_env(api_key="x", http2=False)).http2 is False
+
+    res = provider.chat(_REQ)
+    assert res.text == "ok" and _pool(provider).stats()["requests"] == 1
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from fakes import FakeProvider
+from slimx.errors import DeadlineExceeded
+from slimx.low import ChatRequest, Client, RetryPolicy
+from slimx.messages import Message
+from slimx.tooling import tool
+from slimx.types import Result, ToolCall
+
+REQ = ChatRequest(model="m", messages=[Message.user("hi")])
+
+
+class _Slow(FakeProvider):
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def chat(self, req, *, tools=(), timeout=None):
+        self.calls.append(req)
+        self.timeouts.append(timeout)
+        time.sleep(self.delay)
+        return Result(text="late")
+
+    async def achat(self, req, *, tools=(), timeout=None):
+        await asyncio.sleep(self.delay)
+        return Result(text="late")
+
+
+def test_attempt_timeout_is_cut_to_the_remaining_budget():
+    provider = FakeProvider()
+    res = Client(provider, timeout=30, total_timeout=2).chat(REQ)
+    sent = provider.timeouts[0]
+    assert sent is not None and 0 < sent <= 2
+    assert res.trace["deadline_ms"] == 2000
+
+    provider = FakeProvider()
+    Client(provider, timeout=0.5).chat(REQ, total_timeout=5)
+    assert provider.timeouts[0] == 0.5
+
+
+def test_retries_stop_at_the_deadline_with_partial_trace():
+    policy = RetryPolicy(retries=10, base_delay=5.0, jitter=False, budget=None, max_total_sleep=None)
+    provider = FakeProvider(fail_times=99)
+    events = []
+    client = Client(provider, retry_policy=policy, circuit_breaker=None, hooks={"after_call": events.append})
+
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded) as ei:
+        client.chat(REQ, total_timeout=0.1)
+    assert time.perf_counter() - started < 1.0  # 5s backoffs shortened to fit the budget
+    trace = ei.value.trace
+    assert trace["retry_count"] >= 2 and trace["retry_sleep_ms"] <= 100
+    assert trace.get("retry_gave_up") in (None, "deadline")  # out of time mid-backoff or at an attempt
+    assert trace["deadline_ms"] == 100 and trace["model"] == "m"
+    assert events[-1]["ok"] is False and "DeadlineExceeded" in events[-1]["error"]
+
+
+def test_deadline_spans_tool_loop_steps():
+    @tool
+    def slow_add(a: int, b: int) -> int:
+        time.sleep(0.06)
+        return a + b
+
+    class _Looping(FakeProvider):
+        def chat(self, req, *, tools=(), timeout=None):
+            self.calls.append(req)
+            return Result(text="", tool_calls=[ToolCall(id="c", name="slow_add", arguments={"a": 1, "b": 2})])
+
+    with pytest.raises(DeadlineExceeded) as ei:
+        Client(_Looping()).chat(REQ, tools=[slow_add], tool_runtime="auto", total_timeout=0.1)
+    assert 1 <= ei.value.trace["tool_steps"] < 6
+
+
+def test_async_attempt_is_cancelled_at_the_deadline():
+    client = Client(_Slow(5.0), total_timeout=0.05)
+
+    async def go():
+        started = time.perf_counter()
+        with pytest.raises(DeadlineExceeded):
+            await client.achat(REQ)
+        return time.perf_counter() - started
+
+    assert asyncio.run(go()) < 1.0
+
+
+def test_model_accepts_per_call_deadline():
+    from slimx.providers import register
+    from slimx import llm
+
+    register("dtest", lambda **kw: FakeProvider())
+    m = llm("dtest:m")
+    res = m("hi", total_timeout=3)
+    assert res.trace["deadline_ms"] <= 3000
+    res = m("hi", deadline=time.monotonic() + 1)
+    assert res.trace["deadline_ms"] <= 1000
+    assert "deadline_ms" not in m("hi").trace
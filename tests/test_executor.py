@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from slimx import FanoutExecutor, parallel
+from slimx.providers import register
+from slimx.providers.base import Provider, ProviderCapabilities
+from slimx.types import Result, StreamEvent, Usage
+from slimx.utils import executor as executor_mod
+
+THREADS: list = []
+
+
+class _XTestProvider(Provider):
+    name = "xtest"
+    capabilities = ProviderCapabilities()
+
+    def chat(self, req, *, tools=(), timeout=None):
+        THREADS.append(threading.current_thread().name)
+        if req.model.startswith("slow"):
+            time.sleep(0.2)
+        return Result(text=f"answer:{req.model}", usage=Usage())
+
+    def stream(self, req, *, tools=(), timeout=None):
+        yield StreamEvent.done()
+
+
+@pytest.fixture(autouse=True)
+def _register_xtest():
+    register("xtest", lambda **kw: _XTestProvider())
+    THREADS.clear()
+    yield
+    executor_mod.reset()
+
+
+class _Gauge:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.now = 0
+        self.peak = 0
+
+    def work(self, seconds: float):
+        with self.lock:
+            self.now += 1
+            self.peak = max(self.peak, self.now)
+        time.sleep(seconds)
+        with self.lock:
+            self.now -= 1
+
+
+def test_provider_limit_caps_concurrency_without_holding_workers():
+    ex = FanoutExecutor(4, provider_limits={"capped": 1})
+    capped, free = _Gauge(), _Gauge()
+    futures = [ex.submit("capped", capped.work, 0.05) for _ in range(3)]
+    futures += [ex.submit("free", free.work, 0.05) for _ in range(3)]
+    assert ex.stats()["waiting"] == {"capped": 2}
+    for f in futures:
+        f.result(timeout=2)
+    ex.shutdown()  # waits for the workers to release their slots
+    assert capped.peak == 1 and free.peak == 3
+    assert ex.stats()["running"] == {} and ex.stats()["waiting"] == {}
+
+
+def test_queued_calls_can_be_cancelled():
+    ex = FanoutExecutor(2, default_provider_limit=1)
+    gauge = _Gauge()
+    first = ex.submit("p", gauge.work, 0.05)
+    queued = ex.submit("p", gauge.work, 0.05)
+    assert queued.cancel()
+    first.result(timeout=2)
+    ex.shutdown()
+    assert gauge.peak == 1 and ex.stats()["running"] == {}
+
+
+def test_parallel_runs_on_the_shared_executor_across_calls():
+    p = parallel(["xtest:a", "xtest:b"])
+    p("hi")
+    p("hi")
+    assert len(THREADS) == 4 and all(name.startswith("slimx-fanout") for name in THREADS)
+    assert executor_mod.shared_executor().stats()["max_workers"] == executor_mod.DEFAULT_WORKERS
+
+
+def test_queue_delay_is_reported_apart_from_call_latency():
+    ex = FanoutExecutor(4, provider_limits={"xtest": 1})
+    res = parallel(["xtest:slow-1", "xtest:slow-2"], executor=ex)("hi")
+    first, second = res.results
+    assert first.queue_ms is not None and second.queue_ms is not None and second.elapsed_ms is not None
+    assert first.queue_ms < 100 and 150 <= second.queue_ms < 400
+    assert second.elapsed_ms < 400  # the wait is not counted as call latency
+    assert res.trace["queue_ms"] == second.queue_ms
+    ex.shutdown()
+
+
+def test_max_workers_gives_a_private_executor():
+    with parallel(["xtest:a"], max_workers=1) as p:
+        assert p._executor is not None and p._executor is not executor_mod.shared_executor()
+        assert p("hi").results[0].ok
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from slimx import afallback, fallback
+from slimx.errors import (
+    DeadlineExceeded,
+    FallbackError,
+    ProviderAuthError,
+    ProviderServerError,
+    ProviderTimeoutError,
+)
+from slimx.providers import register
+from slimx.providers.base import Provider, ProviderCapabilities
+from slimx.types import Result, StreamEvent, Usage
+from slimx.utils import executor
+
+CALLS: list = []
+
+
+class _FTestProvider(Provider):
+    """Model names pick the behavior: ``down`` 5xx, ``auth`` 401, ``deadline`` out of
+    budget, ``slow`` sleeps."""
+
+    name = "ftest"
+    capabilities = ProviderCapabilities(streaming=True, async_chat=True)
+
+    def _behave(self, model):
+        CALLS.append(model)
+        if model == "down":
+            raise ProviderServerError("503")
+        if model == "timeout":
+            raise ProviderTimeoutError("upstream timeout")
+        if model == "auth":
+            raise ProviderAuthError("bad key")
+        if model == "deadline":
+            raise DeadlineExceeded("deadline passed before the call was sent")
+
+    def chat(self, req, *, tools=(), timeout=None):
+        self._behave(req.model)
+        if req.model == "slow":
+            time.sleep(0.5)
+        if "json" in req.messages[-1].content:
+            return Result(text='{"ok": true}', usage=Usage())
+        return Result(text=f"answer:{req.model}", usage=Usage())
+
+    async def achat(self, req, *, tools=(), timeout=None):
+        self._behave(req.model)
+        if req.model == "slow":
+            await asyncio.sleep(5)
+        return Result(text=f"answer:{req.model}", usage=Usage())
+
+    def build_request(self, req, *, tools=(), stream=False):
+        return {"model": req.model, "stream": stream}
+
+    def stream(self, req, *, tools=(), timeout=None):
+        self._behave(req.model)
+        yield StreamEvent.text_delta(req.model)
+        yield StreamEvent.done()
+
+
+@pytest.fixture(autouse=True)
+def _register_ftest():
+    register("ftest", lambda **kw: _FTestProvider())
+    CALLS.clear()
+    yield
+
+
+def test_primary_answers_with_one_call():
+    res = fallback(["ftest:a", "ftest:b"])("hi")
+    assert res.text == "answer:a" and CALLS == ["a"]
+    assert res.trace["answered_by"] == "ftest:a"
+    assert [a["model"] for a in res.trace["fallback_attempts"]] == ["ftest:a"]
+
+
+def test_fails_over_on_transient_errors_and_records_attempts():
+    res = fallback(["ftest:down", "ftest:timeout", "ftest:c"], retries=0)("hi")
+    assert res.text == "answer:c"
+    attempts = res.trace["fallback_attempts"]
+    assert [a["ok"] for a in attempts] == [False, False, True]
+    assert "ProviderServerError" in attempts[0]["error"]
+    assert all(isinstance(a["elapsed_ms"], int) for a in attempts)
+
+
+def test_deterministic_errors_do_not_fail_over():
+    with pytest.raises(ProviderAuthError):
+        fallback(["ftest:auth", "ftest:b"])("hi")
+    assert CALLS == ["auth"]
+
+
+def test_slo_moves_on_but_never_cuts_off_the_last_model():
+    started = time.perf_counter()
+    res = fallback(["ftest:slow", "ftest:b"], slo_ms=50)("hi")
+    assert time.perf_counter() - started < 0.4
+    assert res.trace["answered_by"] == "ftest:b" and res.trace["slo_ms"] == 50
+    assert "slo_ms=50" in res.trace["fallback_attempts"][0]["error"]
+
+    res = fallback(["ftest:down", "ftest:slow"], slo_ms=50, retries=0)("hi")
+    assert res.text == "answer:slow"
+
+
+def test_slo_counts_from_the_start_of_the_attempt(monkeypatch):
+    pool = ThreadPoolExecutor(1)
+    monkeypatch.setitem(executor._HELPERS, "fallback", pool)
+    pool.submit(time.sleep, 0.1)  # the attempt waits 0.1s for the only helper thread
+    res = fallback(["ftest:a", "ftest:b"], slo_ms=50)("hi")
+    assert res.trace["answered_by"] == "ftest:a" and CALLS == ["a"]
+    pool.shutdown()
+
+
+def test_an_attempt_out_of_its_deadline_fails_over():
+    res = fallback(["ftest:deadline", "ftest:b"], retries=0)("hi")
+    assert res.text == "answer:b"
+    assert "DeadlineExceeded" in res.trace["fallback_attempts"][0]["error"]
+
+
+def test_a_stream_given_up_on_is_closed(monkeypatch):
+    closed = threading.Event()
+    opened = []
+
+    def slow_stream(prompt, **overrides):
+        try:
+            time.sleep(0.2)
+            yield StreamEvent.text_delta("late")
+            yield StreamEvent.done()
+        finally:
+            closed.set()
+
+    def stream(prompt, **overrides):
+        opened.append(slow_stream(prompt))  # held here, so only an explicit close ends it
+        return opened[-1]
+
+    m = fallback(["ftest:a", "ftest:b"], slo_ms=50)
+    monkeypatch.setattr(m._models[0][1], "stream", stream)
+    assert [ev.text for ev in m.stream("hi") if ev.type == "text_delta"] == ["b"]
+    assert closed.wait(2.0)
+
+
+def test_exhausted_chain_raises_with_attempts():
+    with pytest.raises(FallbackError) as ei:
+        fallback(["ftest:down", "ftest:timeout"], retries=0)("hi")
+    assert [a["model"] for a in ei.value.attempts] == ["ftest:down", "ftest:timeout"]
+    assert isinstance(ei.value.__cause__, ProviderTimeoutError)
+
+
+def test_stream_json_and_inspect_behave_like_model():
+    m = fallback(["ftest:down", "ftest:b"], retries=0)
+    assert [ev.text for ev in m.stream("hi") if ev.type == "text_delta"] == ["b"]
+    assert m.inspect("hi", stream=True) == {"model": "down", "stream": True}  # the primary
+    assert m.capabilities.streaming
+
+    res = m.json("give json", schema={"type": "object"})
+    assert res.trace["answered_by"] == "ftest:b" and CALLS[-2:] == ["down", "b"]
+
+
+def test_async_chain_cancels_slow_attempt():
+    m = afallback(["ftest:slow", "ftest:b"], slo_ms=50)
+
+    async def go():
+        started = time.perf_counter()
+        res = await m("hi")
+        return res, time.perf_counter() - started
+
+    res, elapsed = asyncio.run(go())
+    assert res.text == "answer:b" and elapsed < 1.0
+    assert res.trace["fallback_attempts"][0]["ok"] is False
@@ -8,11 +8,14 @@ from slimx.errors import ProviderAuthError, ProviderError, ProviderRateLimitErro
 from slimx.low import ChatRequest
 from slimx.providers.google import GoogleProvider
 from slimx.providers.google_async import GoogleAsyncProvider
+from slimx.types import Usage
+from slimx.utils import jsonlib
 
 
 class FakeResponse:
     def __init__(self, status_code=200, data=None, text="", chunks=None):
         self.status_code = status_code
+        self.headers = {}
         self._data = data or {}
         self.text = text
         self._chunks = chunks or []
@@ -20,6 +23,10 @@ class FakeResponse:
     def json(self):
         return self._data
 
+    @property
+    def content(self):
+        return jsonlib.dumps(self.json())
+
     def iter_bytes(self):
         for chunk in self._chunks:
             yield chunk
@@ -32,8 +39,8 @@ class FakeResponse:
 
 
 class FakeClient:
-    def __init__(self, *, timeout):
-        self.timeout = timeout
+    def __init__(self, **kwargs):
+        pass
 
     def __enter__(self):
         return self
@@ -41,10 +48,10 @@ class FakeClient:
     def __exit__(self, *args):
         return None
 
-    def post(self, url, *, headers, json):
+    def post(self, url, *, headers, content, timeout=None):
         captured["url"] = url
         captured["headers"] = headers
-        captured["json"] = json
+        captured["json"] = jsonlib.loads(content)
         return FakeResponse(
             data={
                 "candidates": [
@@ -64,15 +71,16 @@ class FakeClient:
             }
         )
 
-    def stream(self, method, url, *, headers, json):
+    def stream(self, method, url, *, headers, content, timeout=None):
         captured["method"] = method
         captured["url"] = url
         captured["headers"] = headers
-        captured["json"] = json
+        captured["json"] = jsonlib.loads(content)
         return FakeResponse(
             chunks=[
                 b'data: {"candidates":[{"content":{"parts":[{"text":"Hel"}]}}]}\n\n',
-                b'data: {"candidates":[{"content":{"parts":[{"text":"lo"}]}}]}\n\n',
+                b'data: {"candidates":[{"content":{"parts":[{"text":"lo"}]}}],'
+                b'"usageMetadata":{"promptTokenCount":2,"candidatesTokenCount":3,"totalTokenCount":5}}\n\n',
             ]
         )
 
@@ -80,6 +88,7 @@ class FakeClient:
 class AsyncFakeResponse:
     def __init__(self, status_code=200, data=None, text="", chunks=None):
         self.status_code = status_code
+        self.headers = {}
         self._data = data or {}
         self.text = text
         self._chunks = chunks or []
@@ -87,6 +96,10 @@ class AsyncFakeResponse:
     def json(self):
         return self._data
 
+    @property
+    def content(self):
+        return jsonlib.dumps(self.json())
+
     async def aread(self):
         return self.text.encode("utf-8")
 
@@ -102,8 +115,8 @@ class AsyncFakeResponse:
 
 
 class AsyncFakeClient:
-    def __init__(self, *, timeout):
-        self.timeout = timeout
+    def __init__(self, **kwargs):
+        pass
 
     async def __aenter__(self):
         return self
@@ -111,10 +124,10 @@ class AsyncFakeClient:
     async def __aexit__(self, *args):
         return None
 
-    async def post(self, url, *, headers, json):
+    async def post(self, url, *, headers, content, timeout=None):
         captured["url"] = url
         captured["headers"] = headers
-        captured["json"] = json
+        captured["json"] = jsonlib.loads(content)
         return AsyncFakeResponse(
             data={
                 "candidates": [
@@ -134,11 +147,11 @@ class AsyncFakeClient:
             }
         )
 
-    def stream(self, method, url, *, headers, json):
+    def stream(self, method, url, *, headers, content, timeout=None):
         captured["method"] = method
         captured["url"] = url
         captured["headers"] = headers
-        captured["json"] = json
+        captured["json"] = jsonlib.loads(content)
         return AsyncFakeResponse(
             chunks=[
                 b'data: {"candidates":[{"content":{"parts":[{"text":"As"}]}}]}\n\n',
@@ -241,10 +254,10 @@ def test_google_tools_map_to_function_declarations(monkeypatch):
 
 def test_google_parses_function_call(monkeypatch):
     class FunctionCallClient(FakeClient):
-        def post(self, url, *, headers, json):
+        def post(self, url, *, headers, content, timeout=None):
             captured["url"] = url
             captured["headers"] = headers
-            captured["json"] = json
+            captured["json"] = jsonlib.loads(content)
             return FakeResponse(
                 data={
                     "candidates": [
@@ -327,9 +340,9 @@ def test_google_round_trips_thought_signature(monkeypatch):
     # Gemini 3+ requires the functionCall's thoughtSignature to be echoed back,
     # or the follow-up request fails with "missing a thought_signature".
     class SigClient(FakeClient):
-        def post(self, url, *, headers, json):
+        def post(self, url, *, headers, content, timeout=None):
             captured["url"] = url
-            captured["json"] = json
+            captured["json"] = jsonlib.loads(content)
             return FakeResponse(
                 data={
                     "candidates": [
@@ -400,6 +413,7 @@ def test_google_stream_emits_text_delta_and_done(monkeypatch):
 
     assert [event.type for event in events] == ["text_delta", "text_delta", "done"]
     assert "".join(event.text or "" for event in events) == "Hello"
+    assert events[-1].usage == Usage(2, 3, 5)
     assert captured["url"] == (
         "https://generativelanguage.googleapis.com/v1beta/"
         "models/gemini-3.5-flash:streamGenerateContent?alt=sse"
@@ -417,7 +431,7 @@ def test_google_stream_emits_text_delta_and_done(monkeypatch):
 )
 def test_google_error_mapping(monkeypatch, status_code, error_type):
     class ErrorClient(FakeClient):
-        def post(self, url, *, headers, json):
+        def post(self, url, *, headers, content, timeout=None):
             return FakeResponse(status_code=status_code, text="provider error")
 
     monkeypatch.setattr("slimx.providers.google.httpx.Client", ErrorClient)
@@ -438,6 +452,7 @@ def test_google_stream_error_reads_body_before_raising(monkeypatch):
     # httpx raises ResponseNotRead and masks the real provider error.
     class ErrorStreamResponse:
         status_code = 500
+        headers: dict = {}
 
         def __enter__(self):
             return self
@@ -452,7 +467,7 @@ def test_google_stream_error_reads_body_before_raising(monkeypatch):
             yield b""
 
     class ErrorStreamClient(FakeClient):
-        def stream(self, method, url, *, headers, json):
+        def stream(self, method, url, *, headers, content, timeout=None):
             return ErrorStreamResponse()
 
     monkeypatch.setattr("slimx.providers.google.httpx.Client", ErrorStreamClient)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fakes import FakeProvider
+from slimx.errors import ProviderTimeoutError
+from slimx.low import ChatRequest, Client
+from slimx.messages import Message
+from slimx.types import Result
+from slimx.utils import executor, hedge
+
+REQ = ChatRequest(model="m", messages=[Message.user("hi")])
+
+
+class _SlowFirst(FakeProvider):
+    """The first request hangs for `slow` seconds; later ones answer at once."""
+
+    def __init__(self, slow: float = 0.5, *, fail_first: bool = False):
+        super().__init__()
+        self.slow = slow
+        self.fail_first = fail_first
+        self._lock = threading.Lock()
+
+    def _nth(self, req):
+        with self._lock:
+            self.calls.append(req)
+            return len(self.calls)
+
+    def chat(self, req, *, tools=(), timeout=None):
+        n = self._nth(req)
+        if n == 1:
+            time.sleep(self.slow)
+            if self.fail_first:
+                raise ProviderTimeoutError("slow and dead")
+        return Result(text=f"{req.model}#{n}")
+
+    async def achat(self, req, *, tools=(), timeout=None):
+        n = self._nth(req)
+        if n == 1:
+            await asyncio.sleep(self.slow)
+        return Result(text=f"{req.model}#{n}")
+
+
+def test_hedge_wins_when_primary_is_slow():
+    provider = _SlowFirst(slow=0.5)
+    started = time.perf_counter()
+    res = Client(provider, hedge_after_ms=20, hedge_model="m-alt").chat(REQ)
+    assert time.perf_counter() - started < 0.4
+    assert res.text == "m-alt#2"
+    assert [r.model for r in provider.calls] == ["m", "m-alt"]
+    assert res.trace["hedge_after_ms"] == 20
+    assert res.trace["hedges_sent"] == 1 and res.trace["hedge_wins"] == 1
+
+
+def test_no_hedge_when_primary_is_fast():
+    provider = _SlowFirst(slow=0.0)
+    res = Client(provider, hedge_after_ms=200).chat(REQ)
+    assert res.text == "m#1" and len(provider.calls) == 1
+    assert res.trace["hedges_sent"] == 0
+
+
+def test_a_busy_helper_pool_is_not_a_slow_primary(monkeypatch):
+    pool = ThreadPoolExecutor(1)
+    monkeypatch.setitem(executor._HELPERS, "hedge", pool)
+    pool.submit(time.sleep, 0.1)  # the primary waits 0.1s for the only helper thread
+    provider = _SlowFirst(slow=0.0)
+    res = Client(provider, hedge_after_ms=50).chat(REQ)
+    assert res.text == "m#1" and res.trace["hedges_sent"] == 0
+    pool.shutdown()
+
+def test_failed_hedge_pair_raises_primary_error():
+    class _Dead(FakeProvider):
+        def chat(self, req, *, tools=(), timeout=None):
+            time.sleep(0.05)
+            raise ProviderTimeoutError("down")
+
+    client = Client(_Dead(), hedge_after_ms=1, retries=0)
+    with pytest.raises(ProviderTimeoutError):
+        client.chat(REQ)
+
+
+def test_async_hedge_cancels_the_loser():
+    provider = _SlowFirst(slow=5.0)
+    client = Client(provider, hedge_after_ms=20)
+
+    async def go():
+        started = time.perf_counter()
+        res = await client.achat(REQ)
+        return res, time.perf_counter() - started
+
+    res, elapsed = asyncio.run(go())
+    assert res.text == "m#2" and elapsed < 1.0
+    assert res.trace["hedge_wins"] == 1
+
+
+def test_auto_uses_observed_p95_once_warm():
+    client = Client(FakeProvider(), hedge_after_ms="auto")
+    res = client.chat(REQ)
+    assert res.trace["hedge_after_ms"] is None  # no estimate yet: not hedged
+
+    for ms in range(1, 101):
+        hedge.record_latency("fake", "", "m", float(ms))
+    p95 = hedge.observed_ms("fake", "", "m")
+    assert p95 is not None and 94.0 <= p95 <= 96.0  # plus the first call's own sample
+    res = client.chat(REQ)
+    assert res.trace["hedge_after_ms"] == int(p95)
+
+
+def test_rejects_unknown_hedge_setting():
+    with pytest.raises(ValueError):
+        Client(FakeProvider(), hedge_after_ms="p99")
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import importlib
+
+import httpx
+import pytest
+
+from slimx.utils import jsonlib
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend(request, monkeypatch):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    monkeypatch.setenv("SLIMX_JSON", request.param)
+    yield importlib.reload(jsonlib)
+    monkeypatch.delenv("SLIMX_JSON")
+    importlib.reload(jsonlib)
+
+
+def test_backends_share_one_contract(backend):
+    body = backend.dumps({"text": "héllo ✓", "n": [1, 2.5, None, True]})
+    assert isinstance(body, bytes)
+    assert b" " not in body.replace("héllo ✓".encode(), b"")  # compact
+    assert "héllo ✓".encode() in body  # no ASCII escaping
+    assert backend.loads(body) == backend.loads(body.decode()) == {
+        "text": "héllo ✓", "n": [1, 2.5, None, True],
+    }
+    assert backend.loads(bytearray(b'{"a":1}')) == {"a": 1}
+    with pytest.raises(ValueError):
+        backend.loads(b"{not json")
+
+
+def test_backends_write_non_string_keys_as_strings(backend):
+    assert backend.loads(backend.dumps({1: "a", "b": {2: None}})) == {"1": "a", "b": {"2": None}}
+
+
+def test_orjson_hands_what_it_rejects_to_the_stdlib(monkeypatch):
+    pytest.importorskip("orjson")
+    monkeypatch.setenv("SLIMX_JSON", "orjson")
+    backend = importlib.reload(jsonlib)
+    try:
+        assert backend.loads(backend.dumps({"n": 2**70})) == {"n": 2**70}
+        with pytest.raises(TypeError):
+            backend.dumps({"x": object()})
+    finally:
+        monkeypatch.delenv("SLIMX_JSON")
+        importlib.reload(jsonlib)
+
+
+def test_unknown_backend_is_rejected(monkeypatch):
+    monkeypatch.setenv("SLIMX_JSON", "yaml")
+    with pytest.raises(ValueError, match="SLIMX_JSON"):
+        importlib.reload(jsonlib)
+    monkeypatch.delenv("SLIMX_JSON")
+    importlib.reload(jsonlib)
+
+
+def test_providers_post_pre_encoded_bytes(monkeypatch):
+    from slimx import Message
+    from slimx.low import ChatRequest
+    from slimx.providers.openai import OpenAIProvider
+
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["type"] = request.headers["content-type"]
+        seen["body"] = request.content
+        return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+    real = httpx.Client
+    monkeypatch.setattr(
+        httpx, "Client", lambda **kw: real(**{**kw, "transport": httpx.MockTransport(handler)})
+    )
+    provider = OpenAIProvider(api_key="x", base_url="http://api.test/v1")
+    provider.chat(ChatRequest(model="m", messages=[Message.user("é")]))
+
+    assert seen["type"] == "application/json"
+    assert "é".encode() in seen["body"]  # encoded by jsonlib, not httpx's ASCII json=
+    assert jsonlib.loads(seen["body"])["messages"][0]["content"] == "é"
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from slimx import Message, RateLimiter, allm, llm
+from slimx.content import ImagePart
+from slimx.errors import ProviderAuthError
+from slimx.providers import register
+from slimx.providers.base import Provider, ProviderCapabilities
+from slimx.types import Result, StreamEvent, Usage
+
+
+class _MapProvider(Provider):
+    """Echoes the prompt; ``boom`` fails, ``slow`` takes 0.1s. Tracks peak concurrency."""
+
+    name = "maptest"
+    capabilities = ProviderCapabilities()
+
+    def __init__(self):
+        self.calls: list = []
+        self.running = self.peak = 0
+        self._lock = threading.Lock()
+
+    def _answer(self, req) -> Result:
+        prompt = req.messages[-1].content
+        self.calls.append(prompt)
+        if prompt == "boom":
+            raise ProviderAuthError("bad key")
+        return Result(text=f"answer:{prompt}", usage=Usage(3, 2, 5))
+
+    def chat(self, req, *, tools=(), timeout=None):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(0.1 if req.messages[-1].content == "slow" else 0.01)
+            return self._answer(req)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    async def achat(self, req, *, tools=(), timeout=None):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.1 if req.messages[-1].content == "slow" else 0.01)
+            return self._answer(req)
+        finally:
+            self.running -= 1
+
+    def stream(self, req, *, tools=(), timeout=None):
+        yield StreamEvent.done()
+
+
+@pytest.fixture
+def provider():
+    p = _MapProvider()
+    register("maptest", lambda **kw: p)
+    return p
+
+
+def test_map_keeps_input_order_and_attaches_errors(provider):
+    m = llm("maptest:m", retries=0)
+    prompts = ["slow", "a", "boom", "b", [Message.system("be brief"), Message.user("c")]]
+    items = list(m.map(prompts, concurrency=3))
+
+    assert [it.index for it in items] == [0, 1, 2, 3, 4]
+    assert [it.result.text if it.result is not None else None for it in items] == [
+        "answer:slow", "answer:a", None, "answer:b", "answer:c",
+    ]
+    assert items[2].error == "ProviderAuthError: bad key"
+    assert isinstance(items[2].exception, ProviderAuthError)
+    assert provider.peak <= 3
+
+
+def test_unordered_map_yields_as_calls_complete(provider):
+    m = llm("maptest:m")
+    items = list(m.map(["slow", "a", "b"], concurrency=3, ordered=False))
+    assert [it.prompt for it in items][-1] == "slow"
+
+
+def test_map_reads_prompts_lazily_and_reports_progress(provider):
+    pulled = []
+
+    def prompts():
+        for i in range(20):
+            pulled.append(i)
+            yield f"p{i}"
+
+    progress = []
+    run = llm("maptest:m").map(prompts(), concurrency=4, on_progress=lambda it, done, total: progress.append((done, total)))
+    first = next(run)
+    assert first.result is not None and first.result.text == "answer:p0"
+    assert len(pulled) <= 5  # a window of concurrency calls, not the whole input
+    rest = list(run)
+    assert len(rest) == 19 and progress[-1] == (20, None)
+
+
+def test_ordered_map_holds_at_most_a_window_behind_a_slow_item(provider):
+    run = llm("maptest:m").map(["slow"] + ["a"] * 20, concurrency=2)
+    assert next(run).prompt == "slow"
+    assert len(provider.calls) <= 4  # the slow call, two held answers, one more at most
+    assert len(list(run)) == 20
+
+
+def test_checkpoint_resumes_without_repeating_calls(provider, tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    m = llm("maptest:m", retries=0)
+    first = list(m.map(["a", "boom", "b"], checkpoint=path))
+    assert [it.ok for it in first] == [True, False, True]
+    assert len(open(path).read().splitlines()) == 2  # failures are not recorded
+
+    provider.calls.clear()
+    again = list(m.map(["a", "fixed", "b", "c"], checkpoint=path))
+    assert provider.calls == ["fixed", "c"]  # "fixed" differs from the recorded index 1
+    assert [it.resumed for it in again] == [True, False, True, False]
+    resumed = again[0].result
+    assert resumed is not None and resumed.text == "answer:a" and resumed.usage.total_tokens == 5
+    assert json.loads(open(path).read().splitlines()[-1])["index"] in (1, 3)
+
+
+def test_checkpoint_keys_a_prompt_by_its_media_too(provider, tmp_path):
+    path = str(tmp_path / "run.jsonl")
+
+    def prompt(data: bytes):
+        return [Message.user("describe", parts=[ImagePart(data=data, mime_type="image/png")])]
+
+    m = llm("maptest:m")
+    assert [it.ok for it in m.map([prompt(b"one")], checkpoint=path)] == [True]
+    again = list(m.map([prompt(b"two")], checkpoint=path))
+    assert [it.resumed for it in again] == [False]  # same text, another image
+    assert [it.resumed for it in m.map([prompt(b"two")], checkpoint=path)] == [True]
+
+def test_map_goes_through_the_client_machinery(provider):
+    limiter = RateLimiter(rpm=2, max_wait=0)
+    items = list(llm("maptest:m", rate_limiter=limiter).map(["a", "b", "c"], concurrency=1))
+    assert [it.ok for it in items] == [True, True, False]
+    assert items[2].error is not None and items[2].error.startswith("RateLimitExceeded")
+    assert items[0].result is not None and items[0].result.trace["rate_limit_wait_ms"] == 0
+
+
+def test_stopping_early_cancels_queued_calls(provider):
+    run = llm("maptest:m").map(["slow"] * 2 + ["a"] * 50, concurrency=2)
+    next(run)
+    run.close()
+    time.sleep(0.15)
+    assert len(provider.calls) <= 4
+
+
+def test_amap_streams_or_collects(provider):
+    am = allm("maptest:m", retries=0)
+
+    async def go():
+        streamed = [it async for it in am.amap(["slow", "a", "boom"], concurrency=2, ordered=False)]
+        collected = await am.amap(["x", "y"], temperature=0)
+        return streamed, collected
+
+    streamed, collected = asyncio.run(go())
+    assert [it.prompt for it in streamed][-1] == "slow"
+    assert streamed[1].error == "ProviderAuthError: bad key"
+    assert [it.result.text if it.result is not None else None for it in collected] == ["answer:x", "answer:y"]
+    assert provider.peak <= 2
+
+
+def test_amap_checkpoint_and_early_exit(provider, tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    am = allm("maptest:m")
+
+    async def go():
+        await am.amap(["a", "b"], checkpoint=path)
+        provider.calls.clear()
+        resumed = await am.amap(["a", "b", "c"], checkpoint=path)
+        run = am.amap(["slow"] * 10, concurrency=3)
+        async for _ in run:
+            break
+        await run.aclose()
+        return resumed
+
+    resumed = asyncio.run(go())
+    assert [it.resumed for it in resumed] == [True, True, False]
+    assert provider.calls[0] == "c" and len(provider.calls) <= 4
+
+
+def test_concurrency_is_checked(provider):
+    with pytest.raises(ValueError):
+        llm("maptest:m").map(["a"], concurrency=0)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from slimx.utils.ndjson import iter_ndjson
+import asyncio
+
+from slimx.utils.ndjson import NDJSONDecoder, aiter_ndjson, iter_ndjson
 
 
 def _bytes(*lines):
@@ -24,5 +26,32 @@ def test_iter_ndjson_handles_split_chunks_and_tail():
     assert objs == [{"a": 1}, {"b": 2}]
 
 
+def test_iter_ndjson_bytewise_chunks_crlf_and_blank_lines():
+    stream = '{"t":"hé"}\r\n\n  \n{"t":"✓"}\n'.encode()
+    objs = list(_iter(*(stream[i : i + 1] for i in range(len(stream)))))
+    assert objs == [{"t": "hé"}, {"t": "✓"}]
+
+
+def test_iter_ndjson_tolerates_invalid_utf8():
+    assert list(_iter(b'{"a":"\xff"}\n')) == [{"a": "\ufffd"}]
+
+
+def test_decoder_is_incremental_and_async_matches():
+    decoder = NDJSONDecoder()
+    assert decoder.feed(b'{"a":') == []
+    assert decoder.feed(b'1}\n{"b"') == [{"a": 1}]
+    assert decoder.feed(b":2}") == []
+    assert decoder.close() == [{"b": 2}]
+
+    async def agen():
+        for c in (b'{"a":', b'1}\n{"b":2}'):
+            yield c
+
+    async def collect():
+        return [o async for o in aiter_ndjson(agen())]
+
+    assert asyncio.run(collect()) == [{"a": 1}, {"b": 2}]
+
+
 def _iter(*chunks):
     return iter_ndjson(_bytes(*chunks))
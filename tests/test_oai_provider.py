@@ -8,6 +8,7 @@ from slimx.low import ChatRequest
 from slimx.providers import get_provider, list_providers
 from slimx.providers.oai import OAIProvider
 from slimx.providers.oai_async import OAIAsyncProvider
+from slimx.utils import jsonlib
 
 
 def test_oai_provider_is_registered(monkeypatch):
@@ -80,6 +81,7 @@ def test_oai_chat_uses_openai_compatible_chat_completions_payload(monkeypatch):
 
     class FakeResponse:
         status_code = 200
+        headers: dict = {}
         text = ""
 
         def json(self):
@@ -98,9 +100,13 @@ def test_oai_chat_uses_openai_compatible_chat_completions_payload(monkeypatch):
                 },
             }
 
+        @property
+        def content(self):
+            return jsonlib.dumps(self.json())
+
     class FakeClient:
-        def __init__(self, *, timeout):
-            captured["timeout"] = timeout
+        def __init__(self, **kwargs):
+            pass
 
         def __enter__(self):
             return self
@@ -108,10 +114,11 @@ def test_oai_chat_uses_openai_compatible_chat_completions_payload(monkeypatch):
         def __exit__(self, *args):
             return None
 
-        def post(self, url, *, headers, json):
+        def post(self, url, *, headers, content, timeout=None):
+            captured["timeout"] = timeout
             captured["url"] = url
             captured["headers"] = headers
-            captured["json"] = json
+            captured["json"] = jsonlib.loads(content)
             return FakeResponse()
 
     monkeypatch.setattr("slimx.providers.openai.httpx.Client", FakeClient)
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import asyncio
 
+import httpx
+import pytest
+
 from slimx import Message, tool
+from slimx.errors import ProviderServerError, ProviderTimeoutError
 from slimx.low import ChatRequest
 from slimx.providers.ollama import OllamaProvider
 from slimx.providers.ollama_async import OllamaAsyncProvider
+from slimx.types import Usage
+from slimx.utils import jsonlib
 
 
 @tool
@@ -53,8 +59,8 @@ def _make_client(chunks, captured):
         async def __aexit__(self, *args):
             return None
 
-        def stream(self, method, url, *, json):
-            captured["json"] = json
+        def stream(self, method, url, *, headers=None, content, timeout=None):
+            captured["json"] = jsonlib.loads(content)
             captured["url"] = url
             return FakeResponse()
 
@@ -80,8 +86,8 @@ def test_ollama_chat_streams_and_maps_max_tokens(monkeypatch):
             yield b'{"done":true,"prompt_eval_count":3,"eval_count":2}\n'
 
     class FakeClient:
-        def __init__(self, *, timeout):
-            captured["timeout"] = timeout
+        def __init__(self, **kwargs):
+            pass
 
         def __enter__(self):
             return self
@@ -89,10 +95,11 @@ def test_ollama_chat_streams_and_maps_max_tokens(monkeypatch):
         def __exit__(self, *args):
             return None
 
-        def stream(self, method, url, *, json):
+        def stream(self, method, url, *, headers=None, content, timeout=None):
+            captured["timeout"] = timeout
             captured["method"] = method
             captured["url"] = url
-            captured["json"] = json
+            captured["json"] = jsonlib.loads(content)
             return FakeResponse()
 
     monkeypatch.setattr("slimx.providers.ollama.httpx.Client", FakeClient)
@@ -116,6 +123,8 @@ def test_ollama_chat_streams_and_maps_max_tokens(monkeypatch):
     assert captured["json"]["stream"] is True
     assert captured["json"]["options"]["temperature"] == 0.2
     assert captured["json"]["options"]["num_predict"] == 42
+    # The timeout travels with the request; the pooled client is timeout-agnostic.
+    assert captured["timeout"].read == 123
 
 
 def test_ollama_sends_tools_and_parses_tool_calls(monkeypatch):
@@ -185,6 +194,18 @@ def test_ollama_json_mode_maps_to_format(monkeypatch):
     assert captured["json"]["format"] == "json"
 
 
+def test_ollama_stream_reports_usage_on_done(monkeypatch):
+    chunks = [
+        b'{"message":{"content":"Hi"}}\n',
+        b'{"done":true,"prompt_eval_count":5,"eval_count":3}\n',
+    ]
+    monkeypatch.setattr("slimx.providers.ollama.httpx.Client", _make_client(chunks, {}))
+
+    events = list(OllamaProvider("http://x").stream(ChatRequest(model="m", messages=[Message.user("hi")])))
+    assert [e.type for e in events] == ["text_delta", "done"]
+    assert events[-1].usage == Usage(5, 3)
+
+
 def test_ollama_async_parses_tool_calls(monkeypatch):
     captured = {}
     chunks = [
@@ -207,3 +228,34 @@ def test_ollama_capabilities_now_advertise_tools_and_json():
     info = describe_provider("ollama")
     assert info["tools"] is True
     assert info["structured_output"] is True
+
+
+def test_ollama_maps_server_errors_and_timeouts(monkeypatch):
+    class FailingResponse:
+        status_code = 503
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return None
+
+        def read(self):
+            return b"model is loading"
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            pass
+
+        def stream(self, method, url, *, headers=None, content, timeout=None):
+            if jsonlib.loads(content)["model"] == "slow":
+                raise httpx.ReadTimeout("timed out")
+            return FailingResponse()
+
+    monkeypatch.setattr("slimx.providers.ollama.httpx.Client", FakeClient)
+    provider = OllamaProvider("http://ollama.local")
+
+    with pytest.raises(ProviderServerError, match="Ollama error 503: model is loading"):
+        provider.chat(ChatRequest(model="m", messages=[Message.user("Hi")]))
+    with pytest.raises(ProviderTimeoutError, match="timed out for model 'slow'"):
+        provider.chat(ChatRequest(model="slow", messages=[Message.user("Hi")]))
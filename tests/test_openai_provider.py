@@ -8,6 +8,7 @@ from slimx import Message, tool
 from slimx.errors import ProviderAuthError, ProviderError, ProviderRateLimitError
 from slimx.low import ChatRequest
 from slimx.providers.openai import OpenAIProvider
+from slimx.types import Usage
 
 
 @tool
@@ -19,6 +20,7 @@ def add(a: int, b: int) -> int:
 class FakeStreamResponse:
     def __init__(self, status_code=200, chunks=None, body=b""):
         self.status_code = status_code
+        self.headers = {}
         self._chunks = chunks or []
         self._body = body
 
@@ -37,8 +39,8 @@ class FakeStreamResponse:
 
 def make_client(response):
     class FakeClient:
-        def __init__(self, *, timeout=None):
-            self.timeout = timeout
+        def __init__(self, **kwargs):
+            pass
 
         def __enter__(self):
             return self
@@ -46,7 +48,7 @@ def make_client(response):
         def __exit__(self, *args):
             return None
 
-        def stream(self, method, url, *, headers, json):
+        def stream(self, method, url, *, headers, content, timeout=None):
             return response
 
     return FakeClient
@@ -105,6 +107,25 @@ def test_streaming_text_deltas(monkeypatch):
     assert [e.type for e in events] == ["text_delta", "text_delta", "done"]
 
 
+def test_streaming_asks_for_usage_and_reports_it_on_done(monkeypatch):
+    chunks = _sse(
+        {"choices": [{"delta": {"content": "Hi"}}]},
+        {"choices": [], "usage": {"prompt_tokens": 8, "completion_tokens": 1, "total_tokens": 9}},
+    )
+    monkeypatch.setattr(
+        "slimx.providers.openai.httpx.Client",
+        make_client(FakeStreamResponse(chunks=chunks)),
+    )
+
+    provider = OpenAIProvider(api_key="x")
+    req = ChatRequest(model="m", messages=[Message.user("hi")])
+    events = list(provider.stream(req))
+
+    assert [e.type for e in events] == ["text_delta", "done"]
+    assert events[-1].usage == Usage(8, 1, 9)
+    assert provider.build_request(req, stream=True).payload["stream_options"] == {"include_usage": True}
+
+
 @pytest.mark.parametrize(
     ("status_code", "error_type"),
     [(401, ProviderAuthError), (429, ProviderRateLimitError), (500, ProviderError)],
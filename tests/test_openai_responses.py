@@ -287,6 +287,7 @@ def test_stream_translator_text_partial_and_final():
         "image_completed",
         "done",
     ]
+    assert events[-1].usage is not None and events[-1].usage.total_tokens == 15
     partial = next(e for e in events if e.type == "image_partial")
     assert partial.image_partial_b64 == B64 and partial.image is None
     completed = next(e for e in events if e.type == "image_completed")
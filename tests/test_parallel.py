@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import time
 
 import pytest
 
-from slimx import parallel
+from slimx import _parallel, aparallel, parallel
 from slimx.errors import ProviderError
 from slimx.providers import register
 from slimx.providers.base import Provider, ProviderCapabilities
 from slimx.types import Result, StreamEvent, Usage
 
 
+ACANCELLED: list = []
+
+
+def _answer(model: str) -> str:
+    # "vote-<text>-<n>" answers <text>, so several models can agree.
+    if model.startswith("vote-"):
+        return model.split("-")[1]
+    return f"answer:{model}"
+STREAMED: list = []
+
+
 class _PTestProvider(Provider):
     name = "ptest"
     capabilities = ProviderCapabilities()
@@ -18,11 +30,44 @@ class _PTestProvider(Provider):
     def chat(self, req, *, tools=(), timeout=None):
         if req.model == "boom":
             raise ProviderError("synthetic failure")
-        if req.model.startswith("slow"):
+        if req.model.startswith("slow") or req.model.endswith("-slow"):
             time.sleep(0.3)
-        return Result(text=f"answer:{req.model}", usage=Usage())
+        return Result(text=_answer(req.model), usage=Usage())
+
+    async def achat(self, req, *, tools=(), timeout=None):
+        if req.model == "boom":
+            raise ProviderError("synthetic failure")
+        if req.model.startswith("slow"):
+            try:
+                await asyncio.sleep(5 if req.model == "slow-hang" else 0.3)
+            except asyncio.CancelledError:
+                ACANCELLED.append(req.model)
+                raise
+        if req.model.endswith("-slow"):
+            await asyncio.sleep(0.3)
+        return Result(text=_answer(req.model), usage=Usage())
 
     def stream(self, req, *, tools=(), timeout=None):
+        if req.model == "boom":
+            raise ProviderError("synthetic failure")
+        if req.model.startswith("slow"):
+            time.sleep(0.3)
+        for part in ("x", "y"):
+            STREAMED.append(req.model)
+            yield StreamEvent.text_delta(f"{req.model}:{part}")
+        yield StreamEvent.done()
+
+    async def astream(self, req, *, tools=(), timeout=None):
+        if req.model == "boom":
+            raise ProviderError("synthetic failure")
+        if req.model.startswith("slow"):
+            try:
+                await asyncio.sleep(5 if req.model == "slow-hang" else 0.3)
+            except asyncio.CancelledError:
+                ACANCELLED.append(req.model)
+                raise
+        for part in ("x", "y"):
+            yield StreamEvent.text_delta(f"{req.model}:{part}")
         yield StreamEvent.done()
 
 
@@ -85,6 +130,20 @@ def test_race_all_fail_returns_no_winner():
     assert len(res.errors) == 2
 
 
+def test_race_records_every_call_that_finished_with_the_winner(monkeypatch):
+    real_wait = _parallel.wait
+
+    def late_wait(fs, **kw):  # let every call finish, so they arrive in one batch
+        time.sleep(0.05)
+        return real_wait(fs, **kw)
+
+    monkeypatch.setattr(_parallel, "wait", late_wait)
+    res = parallel(["ptest:boom", "ptest:a", "ptest:b"], mode="race")("hi")
+    assert res.winner is not None and res.winner.model == "ptest:a"
+    assert [it.model for it in res.results] == ["ptest:boom", "ptest:a", "ptest:b"]
+    assert [it.model for it in res.errors] == ["ptest:boom"]
+
+
 def test_compare_mode_builds_side_by_side_text():
     res = parallel(["ptest:a", "ptest:b"], mode="compare")("hi")
     assert res.trace["mode"] == "compare"
@@ -180,3 +239,191 @@ def test_cancel_event_kwarg_never_leaks_into_model_calls():
     item = res.results[0]
     assert item.ok and item.result is not None
     assert item.result.text == "answer:a"
+
+
+# ---- aparallel ------------------------------------------------------------
+
+
+def test_aparallel_all_and_compare_match_the_sync_shape():
+    async def go():
+        res = await aparallel(["ptest:a", "ptest:boom", "ptest:b"])("hi")
+        cmp = await aparallel(["ptest:a", "ptest:b"], mode="compare")("hi")
+        return res, cmp
+
+    res, cmp = asyncio.run(go())
+    assert [it.model for it in res.results] == ["ptest:a", "ptest:boom", "ptest:b"]
+    assert res.text is None and [it.model for it in res.errors] == ["ptest:boom"]
+    assert res.trace["mode"] == "all" and res.trace["ok_count"] == 2
+    assert cmp.text is not None and "### ptest:a" in cmp.text and "answer:b" in cmp.text
+
+
+def test_aparallel_race_cancels_the_losers():
+    ACANCELLED.clear()
+
+    async def go():
+        started = time.perf_counter()
+        res = await aparallel(["ptest:slow-hang", "ptest:boom", "ptest:fast"], mode="race")("hi")
+        return res, time.perf_counter() - started
+
+    res, elapsed = asyncio.run(go())
+    assert elapsed < 1.0
+    assert res.text == "answer:fast" and res.winner is not None and res.winner.model == "ptest:fast"
+    assert ACANCELLED == ["slow-hang"]  # cancelled, not left running
+    assert res.trace["abandoned_count"] == 1
+    assert [it.model for it in res.results] == ["ptest:boom", "ptest:fast"]
+
+
+def test_aparallel_model_timeout_turns_slow_calls_into_errors():
+    async def go():
+        return await aparallel(
+            ["ptest:a", "ptest:slow-hang"], model_timeout={"ptest:slow-hang": 0.05}
+        )("hi")
+
+    res = asyncio.run(go())
+    assert res.results[0].ok
+    error = res.results[1].error
+    assert error is not None and "ProviderTimeoutError" in error and "model_timeout=0.05s" in error
+
+
+def test_aparallel_judge_and_cancel_event():
+    async def go():
+        judged = await aparallel(["ptest:a", "ptest:b"], mode="judge", judge="ptest:judgeX")("hi")
+        evt = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.05, evt.set)
+        cancelled = await aparallel(["ptest:a", "ptest:slow-hang"], mode="judge", judge="ptest:j")(
+            "hi", cancel_event=evt
+        )
+        return judged, cancelled
+
+    started = time.perf_counter()
+    judged, cancelled = asyncio.run(go())
+    assert time.perf_counter() - started < 1.0
+    assert judged.text == "answer:judgeX" and len(judged.candidates) == 2
+    assert cancelled.results[0].ok and cancelled.results[1].cancelled
+    assert cancelled.trace["judge_cancelled"] is True and cancelled.trace["abandoned_count"] == 1
+
+
+def test_aparallel_validates_like_parallel():
+    with pytest.raises(ValueError):
+        aparallel([])
+    with pytest.raises(ValueError):
+        aparallel(["ptest:a"], mode="judge")
+
+
+# ---- streaming --------------------------------------------------------------
+
+
+def test_stream_merges_every_model_tagged_by_source():
+    events = list(parallel(["ptest:a", "ptest:boom", "ptest:b"]).stream("hi"))
+    by_model = {}
+    for ev in events:
+        by_model.setdefault(ev.model, []).append(ev.type)
+    assert by_model["ptest:a"] == ["text_delta", "text_delta", "done"]
+    assert by_model["ptest:b"] == ["text_delta", "text_delta", "done"]
+    assert by_model["ptest:boom"] == ["error"]
+    error = next(ev.error for ev in events if ev.type == "error")
+    assert error is not None and "synthetic failure" in error
+
+
+def test_stream_race_keeps_the_first_token_and_drops_the_rest():
+    STREAMED.clear()
+    started = time.perf_counter()
+    events = list(parallel(["ptest:slow-1", "ptest:fast"], mode="race").stream("hi"))
+    assert time.perf_counter() - started < 0.25  # the slow stream is not waited for
+    assert {ev.model for ev in events} == {"ptest:fast"}
+    assert [ev.text for ev in events if ev.type == "text_delta"] == ["fast:x", "fast:y"]
+    time.sleep(0.4)
+    assert STREAMED.count("slow-1") <= 1  # its worker stopped instead of streaming on
+
+
+def test_astream_races_and_cancels_the_losers():
+    ACANCELLED.clear()
+
+    async def go():
+        merged = [ev async for ev in aparallel(["ptest:slow-1", "ptest:a"]).astream("hi")]
+        raced = [ev async for ev in aparallel(["ptest:slow-hang", "ptest:a"]).astream("hi", race=True)]
+        return merged, raced
+
+    started = time.perf_counter()
+    merged, raced = asyncio.run(go())
+    assert time.perf_counter() - started < 1.0
+    assert [ev.model for ev in merged if ev.type == "done"] == ["ptest:a", "ptest:slow-1"]
+    assert {ev.model for ev in raced} == {"ptest:a"} and ACANCELLED == ["slow-hang"]
+
+
+# ---- consensus ----------------------------------------------------------------
+
+
+def test_consensus_returns_once_the_quorum_agrees():
+    started = time.perf_counter()
+    res = parallel(["ptest:vote-Yes-1", "ptest:vote-no-slow", "ptest:vote-yes.-3"], mode="consensus")("hi")
+    assert time.perf_counter() - started < 0.25  # the slow dissenter is not waited for
+    assert res.text == "Yes" and res.winner is not None and res.winner.model == "ptest:vote-Yes-1"
+    assert [it.model for it in res.results] == ["ptest:vote-Yes-1", "ptest:vote-yes.-3"]
+    trace = res.trace
+    assert trace["mode"] == "consensus" and trace["consensus"] is True
+    assert trace["quorum"] == 2 and trace["votes"] == 2 and trace["agreement"] == 1.0
+    assert trace["calls_saved"] == 1
+
+
+def test_consensus_key_function_and_no_agreement():
+    res = parallel(["ptest:vote-alpha-1", "ptest:vote-apple-2"], mode="consensus", key=lambda t: t[0])("hi")
+    assert res.trace["consensus"] is True and res.text == "alpha"
+
+    res = parallel(["ptest:vote-a-1", "ptest:vote-b-2", "ptest:vote-c-3"], mode="consensus")("hi")
+    assert res.winner is None and res.text is None
+    assert res.trace["consensus"] is False and res.trace["agreement"] == 0.333
+
+
+def test_consensus_stops_when_the_quorum_is_out_of_reach():
+    started = time.perf_counter()
+    res = parallel(["ptest:vote-a-1", "ptest:vote-b-2", "ptest:vote-c-slow"], mode="consensus", quorum=3)("hi")
+    assert time.perf_counter() - started < 0.25
+    assert res.trace["consensus"] is False and res.trace["calls_saved"] == 1
+
+
+def test_aconsensus_cancels_the_remaining_calls():
+    async def go():
+        ens = aparallel(["ptest:vote-x-1", "ptest:vote-x-2", "ptest:slow-hang"], mode="consensus")
+        return await ens("hi")
+
+    started = time.perf_counter()
+    res = asyncio.run(go())
+    assert time.perf_counter() - started < 1.0
+    assert res.text == "x" and res.trace["calls_saved"] == 1 and res.trace["abandoned_count"] == 1
+
+
+def test_aconsensus_cancel_event_stops_the_vote():
+    async def go():
+        evt = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.05, evt.set)
+        ens = aparallel(["ptest:vote-x-1", "ptest:slow-hang", "ptest:slow-hang"], mode="consensus")
+        return await ens("hi", cancel_event=evt)
+
+    started = time.perf_counter()
+    res = asyncio.run(go())
+    assert time.perf_counter() - started < 1.0
+    assert res.winner is None and [it.cancelled for it in res.results] == [False, True, True]
+    assert res.trace["abandoned_count"] == 2
+
+
+def test_arace_cancel_event_stops_the_race_mid_flight():
+    ACANCELLED.clear()
+
+    async def go():
+        evt = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.05, evt.set)
+        race = aparallel(["ptest:slow-hang", "ptest:slow-hang"], mode="race")
+        return await race("hi", cancel_event=evt)
+
+    started = time.perf_counter()
+    res = asyncio.run(go())
+    assert time.perf_counter() - started < 1.0
+    assert res.winner is None and res.text is None
+    assert [it.cancelled for it in res.results] == [True, True]
+    assert res.trace["abandoned_count"] == 2 and ACANCELLED == ["slow-hang", "slow-hang"]
+
+
+def test_consensus_rejects_an_impossible_quorum():
+    with pytest.raises(ValueError):
+        parallel(["ptest:a", "ptest:b"], mode="consensus", quorum=3)
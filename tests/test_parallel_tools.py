@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from slimx import Message, tool
+from slimx.errors import ToolExecutionError
+from slimx.low import ChatRequest, Client
+from slimx.providers.base import Provider, ProviderCapabilities
+from slimx.types import Result, StreamEvent, ToolCall
+
+_LOCK = threading.Lock()
+RUNNING = {"now": 0, "peak": 0}
+
+
+@tool
+def lookup(key: str) -> str:
+    """Look a key up (slowly)."""
+    with _LOCK:
+        RUNNING["now"] += 1
+        RUNNING["peak"] = max(RUNNING["peak"], RUNNING["now"])
+    try:
+        time.sleep(0.1)
+        if key == "bad":
+            raise KeyError(key)
+        return f"value:{key}"
+    finally:
+        with _LOCK:
+            RUNNING["now"] -= 1
+
+
+class _TurnProvider(Provider):
+    """Asks for ``lookup`` of every key in one turn, then answers."""
+
+    name = "turns"
+    capabilities = ProviderCapabilities(tools=True)
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.calls: list = []
+
+    def chat(self, req, *, tools=(), timeout=None):
+        self.calls.append(req)
+        if len(self.calls) == 1:
+            return Result(
+                text="",
+                tool_calls=[ToolCall(id=f"c{i}", name="lookup", arguments={"key": k}) for i, k in enumerate(self.keys)],
+            )
+        return Result(text="done")
+
+    async def achat(self, req, *, tools=(), timeout=None):
+        return self.chat(req, tools=tools, timeout=timeout)
+
+    def stream(self, req, *, tools=(), timeout=None):
+        yield StreamEvent.done()
+
+
+@pytest.fixture(autouse=True)
+def _reset_gauge():
+    RUNNING.update(now=0, peak=0)
+
+
+def _req() -> ChatRequest:
+    return ChatRequest(model="m", messages=[Message.user("look these up")])
+
+
+def test_tool_calls_of_one_turn_run_concurrently_in_order():
+    provider = _TurnProvider(["a", "b", "c", "d"])
+    started = time.perf_counter()
+    res = Client(provider).chat(_req(), tools=[lookup], tool_runtime="auto")
+    assert time.perf_counter() - started < 0.3  # not 4 x 0.1s
+    assert RUNNING["peak"] == 4
+
+    results = provider.calls[1].messages[-4:]
+    assert [m.tool_call_id for m in results] == ["c0", "c1", "c2", "c3"]
+    assert [m.content for m in results] == ['"value:a"', '"value:b"', '"value:c"', '"value:d"']
+    runs = res.trace["tool_runs"]
+    assert [r["id"] for r in runs] == ["c0", "c1", "c2", "c3"]
+    assert all(r["ok"] and r["step"] == 1 and r["elapsed_ms"] >= 90 for r in runs)
+
+
+def test_tool_concurrency_caps_the_calls_in_flight():
+    Client(_TurnProvider(["a", "b", "c", "d"])).chat(_req(), tools=[lookup], tool_runtime="auto", tool_concurrency=2)
+    assert RUNNING["peak"] == 2
+
+
+def test_tool_concurrency_one_runs_in_turn_and_stops_at_a_failure():
+    provider = _TurnProvider(["bad", "a"])
+    with pytest.raises(ToolExecutionError, match="lookup"):
+        Client(provider).chat(_req(), tools=[lookup], tool_runtime="auto", tool_concurrency=1)
+    assert RUNNING["peak"] == 1
+
+
+def test_a_failed_tool_is_raised_after_the_turn_completes():
+    provider = _TurnProvider(["a", "bad", "c"])
+    with pytest.raises(ToolExecutionError, match="lookup"):
+        Client(provider).chat(_req(), tools=[lookup], tool_runtime="auto")
+    assert RUNNING["peak"] == 3 and len(provider.calls) == 1
+
+
+def test_async_tool_calls_are_gathered_off_the_loop():
+    provider = _TurnProvider(["a", "b", "c"])
+    ticks = []
+
+    async def go():
+        async def tick():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        try:
+            return await Client(provider).achat(_req(), tools=[lookup], tool_runtime="auto")
+        finally:
+            ticker.cancel()
+
+    started = time.perf_counter()
+    res = asyncio.run(go())
+    assert time.perf_counter() - started < 0.25
+    assert res.text == "done" and RUNNING["peak"] == 3
+    assert [r["id"] for r in res.trace["tool_runs"]] == ["c0", "c1", "c2"]
+    assert len(ticks) > 5  # the loop kept running while the tools did
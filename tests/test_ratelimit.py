@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fakes import FakeProvider
+from slimx import Message, RateLimiter
+from slimx.errors import CircuitOpenError, ProviderServerError, RateLimitExceeded
+from slimx.low import ChatRequest, CircuitBreaker, Client, ImageRequest
+from slimx.types import Result, StreamEvent, Usage
+
+
+class _UsageFake(FakeProvider):
+    """Reports 10 tokens used, whatever the request."""
+
+    def chat(self, req, *, tools=(), timeout=None):
+        res = super().chat(req, tools=tools, timeout=timeout)
+        res.usage = Usage(6, 4, 10)
+        return res
+
+    async def achat(self, req, *, tools=(), timeout=None):
+        return self.chat(req, tools=tools, timeout=timeout)
+
+    def stream(self, req, *, tools=(), timeout=None):
+        yield StreamEvent.text_delta("hi")
+        yield StreamEvent.done(usage=Usage(6, 4, 10))
+
+    def generate_image(self, req, *, timeout=None):
+        return Result(text="", usage=Usage(6, 4, 10))
+
+
+def _req(text: str = "hello", **kw) -> ChatRequest:
+    return ChatRequest(model="demo", messages=[Message.user(text)], **kw)
+
+
+def test_fail_fast_reports_the_time_to_wait():
+    provider = FakeProvider()
+    client = Client(provider, rate_limiter=RateLimiter(rpm=2, max_wait=0))
+    client.chat(_req())
+    res = client.chat(_req())
+    assert res.trace["rate_limit_wait_ms"] == 0
+
+    with pytest.raises(RateLimitExceeded) as info:
+        client.chat(_req())
+    assert 29 < info.value.retry_in <= 30  # one request refills every 30s
+    assert info.value.key == ("fake", "", "demo")
+    assert len(provider.calls) == 2  # nothing sent, nothing retried
+
+
+def test_acquire_blocks_until_the_bucket_refills():
+    limiter = RateLimiter(tpm=6000)  # 100 tokens a second
+    key = limiter.key_for("p", "", "m")
+    limiter.acquire(key, 6000)
+    started = time.monotonic()
+    ticket = limiter.acquire(key, 10)
+    assert 0.08 <= time.monotonic() - started < 0.5
+    assert ticket.waited_s == pytest.approx(0.1, abs=0.02)
+
+
+def test_estimate_is_corrected_from_usage():
+    limiter = RateLimiter(tpm=1000, max_wait=0)
+    client = Client(_UsageFake(), rate_limiter=limiter)
+    for _ in range(5):  # each reserves ~900 tokens but uses 10
+        client.chat(_req(max_tokens=900))
+    tokens = limiter.stats()[("fake", "", "demo")]["tokens"]
+    assert tokens is not None and tokens > 900
+
+    with pytest.raises(RateLimitExceeded):
+        client.chat(_req(max_tokens=5000))  # larger than the bucket: waits for a full one
+
+
+def test_failed_attempts_give_their_tokens_back():
+    limiter = RateLimiter(tpm=1000, max_wait=0)
+    client = Client(FakeProvider(fail_times=1), rate_limiter=limiter)
+    client.chat(_req(max_tokens=600))  # the first attempt fails, the retry succeeds
+    assert limiter.stats()[("fake", "", "demo")]["tokens"] == pytest.approx(400, abs=5)
+
+
+def test_stream_refused_by_an_open_circuit_gives_its_tokens_back():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.admit("fake")
+    breaker.record("fake", exc=ProviderServerError("503"))
+    limiter = RateLimiter(tpm=1000, max_wait=0)
+    client = Client(FakeProvider(), rate_limiter=limiter, circuit_breaker=breaker)
+    with pytest.raises(CircuitOpenError):
+        list(client.stream(_req(max_tokens=600)))
+    assert limiter.stats()[("fake", "", "demo")]["tokens"] == pytest.approx(1000, abs=5)
+
+
+def test_stream_estimate_is_corrected_from_its_done_event():
+    limiter = RateLimiter(tpm=1000, max_wait=0)
+    client = Client(_UsageFake(), rate_limiter=limiter)
+    for _ in range(5):  # each reserves ~900 tokens but reports 10 on its done event
+        assert [ev.type for ev in client.stream(_req(max_tokens=900))] == ["text_delta", "done"]
+    tokens = limiter.stats()[("fake", "", "demo")]["tokens"]
+    assert tokens is not None and tokens > 900
+
+
+def test_image_calls_take_room_from_the_limiter():
+    limiter = RateLimiter(rpm=1, max_wait=0)
+    client = Client(_UsageFake(), rate_limiter=limiter)
+    client.generate_image(ImageRequest(model="demo", prompt="a red cube"))
+    with pytest.raises(RateLimitExceeded):
+        client.generate_image(ImageRequest(model="demo", prompt="a red cube"))
+
+
+def test_one_limiter_is_shared_across_clients_and_threads():
+    limiter = RateLimiter(rpm=3, max_wait=0)
+    clients = [Client(FakeProvider(), rate_limiter=limiter) for _ in range(2)]
+
+    def call(i):
+        try:
+            return clients[i % 2].chat(_req()).text
+        except RateLimitExceeded:
+            return "limited"
+
+    with ThreadPoolExecutor(4) as pool:
+        outcomes = list(pool.map(call, range(4)))
+    assert sorted(outcomes) == ["fake:hello"] * 3 + ["limited"]
+
+
+def test_per_provider_buckets_span_models():
+    limiter = RateLimiter(rpm=1, per="provider", max_wait=0)
+    client = Client(FakeProvider(), rate_limiter=limiter)
+    client.chat(_req())
+    with pytest.raises(RateLimitExceeded):
+        client.chat(ChatRequest(model="other", messages=[Message.user("hi")]))
+
+
+def test_wait_is_capped_by_the_call_deadline():
+    limiter = RateLimiter(rpm=1)  # no max_wait: would wait a minute
+    client = Client(FakeProvider(), rate_limiter=limiter, total_timeout=0.1)
+    limiter.acquire(limiter.key_for("fake", "", "demo"), 0)
+    started = time.monotonic()
+    with pytest.raises(RateLimitExceeded):
+        client.chat(_req())
+    assert time.monotonic() - started < 0.1
+
+
+def test_async_calls_wait_without_blocking_the_loop():
+    limiter = RateLimiter(tpm=6000)
+    client = Client(_UsageFake(), rate_limiter=limiter)
+    limiter.acquire(limiter.key_for("fake", "", "demo"), 6000)
+
+    async def go():
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        res, _ = await asyncio.gather(client.achat(_req(max_tokens=10)), ticker())
+        return res, ticks
+
+    res, ticks = asyncio.run(go())
+    assert res.trace["rate_limit_wait_ms"] >= 50
+    assert len(ticks) == 5
+
+
+def test_options_are_checked():
+    with pytest.raises(ValueError):
+        RateLimiter()
+    with pytest.raises(ValueError):
+        RateLimiter(rpm=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rpm=1, per="region")
@@ -5,7 +5,14 @@ import asyncio
 import pytest
 
 from slimx.errors import ProviderAuthError, ProviderRateLimitError
-from slimx.utils.retry import async_retry, retry
+from slimx.utils.retry import (
+    RetryBudget,
+    RetryPolicy,
+    async_retry,
+    new_retry_stats,
+    retry,
+    retry_after_from_headers,
+)
 
 
 def test_retry_recovers_from_transient_error():
@@ -66,3 +73,137 @@ def test_async_retry_matches_sync_policy():
     with pytest.raises(ProviderAuthError):
         asyncio.run(async_retry(boom, retries=2, base_delay=0))
     assert auth_calls["n"] == 1
+
+
+# ---- server hints -----------------------------------------------------------
+
+NOW = 1_700_000_000.0
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"Retry-After": "7"}, 7.0),
+        ({"retry-after-ms": "1500", "Retry-After": "7"}, 1.5),
+        ({"Retry-After": "Tue, 14 Nov 2023 22:13:30 GMT"}, 10.0),
+        # OpenAI: only the exhausted limit's reset counts.
+        ({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "6m0s",
+          "x-ratelimit-remaining-tokens": "900", "x-ratelimit-reset-tokens": "20ms"}, 360.0),
+        # Anthropic: RFC 3339 reset timestamps.
+        ({"anthropic-ratelimit-tokens-remaining": "0",
+          "anthropic-ratelimit-tokens-reset": "2023-11-14T22:13:32Z"}, 12.0),
+        ({"x-ratelimit-reset-requests": "soon"}, None),
+        ({}, None),
+    ],
+)
+def test_retry_after_from_headers(headers, expected):
+    assert retry_after_from_headers(headers, now=NOW) == expected
+
+
+def test_rate_limit_errors_carry_parsed_hints():
+    import httpx
+
+    from slimx.low import ChatRequest
+    from slimx.messages import Message
+    from slimx.providers.google import _raise_for_status as google_raise
+    from slimx.providers.openai import OpenAIProvider
+
+    def handler(request):
+        return httpx.Response(
+            429, text="slow down",
+            headers={"retry-after": "3", "x-ratelimit-remaining-requests": "0", "authorization": "x"},
+        )
+
+    provider = OpenAIProvider(api_key="x", base_url="http://api.test/v1")
+    assert provider._pool is not None
+    provider._pool._client = httpx.Client(transport=httpx.MockTransport(handler))
+    with pytest.raises(ProviderRateLimitError) as info:
+        provider.chat(ChatRequest(model="m", messages=[Message.user("hi")]))
+    assert info.value.retry_after == 3.0
+    assert info.value.headers == {"retry-after": "3", "x-ratelimit-remaining-requests": "0"}
+
+    with pytest.raises(ProviderRateLimitError) as info:
+        google_raise(429, '{"error": {"details": [{"retryDelay": "12s"}]}}', {})
+    assert info.value.retry_after == 12.0
+
+
+# ---- policy -----------------------------------------------------------------
+
+
+def _always(exc):
+    calls = {"n": 0}
+
+    def fn():
+        calls["n"] += 1
+        raise exc
+
+    return fn, calls
+
+
+def test_policy_uses_the_server_hint_and_reports_stats(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("slimx.utils.retry.time.sleep", sleeps.append)
+    fn, calls = _always(ProviderRateLimitError("429", retry_after=2.0))
+    policy = RetryPolicy(retries=2, jitter=False, budget=None)
+    stats = new_retry_stats()
+
+    with pytest.raises(ProviderRateLimitError):
+        policy.call(fn, stats=stats)
+
+    assert sleeps == [2.0, 2.0] and calls["n"] == 3
+    assert stats == {"attempts": 3, "retries": 2, "sleep_s": 4.0,
+                     "last_error": "ProviderRateLimitError", "gave_up": None}
+
+
+def test_policy_jitter_stays_within_the_backoff_cap():
+    policy = RetryPolicy(base_delay=1.0, max_delay=3.0)
+    delays = [policy.delay(attempt) for attempt in range(5) for _ in range(50)]
+    assert all(0.0 <= d <= 3.0 for d in delays)
+    assert len({round(d, 6) for d in delays}) > 1  # actually jittered
+
+
+def test_policy_stops_at_max_total_sleep(monkeypatch):
+    monkeypatch.setattr("slimx.utils.retry.time.sleep", lambda s: None)
+    fn, calls = _always(ProviderRateLimitError("429", retry_after=40.0))
+    stats = new_retry_stats()
+    with pytest.raises(ProviderRateLimitError):
+        RetryPolicy(retries=5, jitter=False, max_total_sleep=60.0, budget=None).call(fn, stats=stats)
+    assert calls["n"] == 2 and stats["gave_up"] == "max_total_sleep"
+
+
+def test_retry_budget_is_shared_and_caps_retries(monkeypatch):
+    monkeypatch.setattr("slimx.utils.retry.time.sleep", lambda s: None)
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0, burst=2.0)
+    policy = RetryPolicy(retries=5, base_delay=0, budget=budget)
+    fn, calls = _always(ProviderRateLimitError("429"))
+    stats = new_retry_stats()
+    with pytest.raises(ProviderRateLimitError):
+        policy.call(fn, stats=stats)
+    assert calls["n"] == 3 and stats["gave_up"] == "budget"
+
+    # A second policy on the same budget gets no retries at all.
+    fn, calls = _always(ProviderRateLimitError("429"))
+    with pytest.raises(ProviderRateLimitError):
+        RetryPolicy(retries=5, base_delay=0, budget=budget).call(fn)
+    assert calls["n"] == 1
+
+
+def test_client_records_retries_in_trace_and_error_events(monkeypatch):
+    from fakes import FakeProvider
+    from slimx.low import ChatRequest, Client
+    from slimx.messages import Message
+
+    monkeypatch.setattr("slimx.utils.retry.time.sleep", lambda s: None)
+    policy = RetryPolicy(retries=3, base_delay=0.25, jitter=False, budget=None)
+    req = ChatRequest(model="m", messages=[Message.user("hi")])
+
+    res = Client(FakeProvider(fail_times=2), retry_policy=policy).chat(req)
+    assert res.trace["retries"] == 3
+    assert res.trace["retry_count"] == 2 and res.trace["retry_sleep_ms"] == 750
+
+    events = []
+    client = Client(FakeProvider(fail_times=9), retries=1, hooks={"after_call": events.append})
+    client.retry_policy.base_delay = 0
+    with pytest.raises(Exception):
+        client.chat(req)
+    assert events[-1]["ok"] is False and events[-1]["retry_count"] == 1
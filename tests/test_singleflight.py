@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from slimx import Message
+from slimx.errors import CallCancelled, DeadlineExceeded, ProviderAuthError
+from slimx.low import ChatRequest, Client
+from slimx.providers.base import Provider, ProviderCapabilities
+from slimx.types import Result, StreamEvent, Usage
+from slimx.utils.cancel import CancelScope, cancel_scope
+from slimx.utils.singleflight import SingleFlight
+
+
+class _SlowProvider(Provider):
+    """Answers after 0.1s and counts the requests that reached it."""
+
+    name = "slowfake"
+    capabilities = ProviderCapabilities()
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def chat(self, req, *, tools=(), timeout=None):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.1)
+        if self.fail:
+            raise ProviderAuthError("bad key")
+        return Result(text=f"answer:{req.messages[-1].content}", usage=Usage(1, 1, 2))
+
+    async def achat(self, req, *, tools=(), timeout=None):
+        self.calls += 1
+        await asyncio.sleep(0.1)
+        return Result(text=f"answer:{req.messages[-1].content}", usage=Usage(1, 1, 2))
+
+    def stream(self, req, *, tools=(), timeout=None):
+        yield StreamEvent.done()
+
+
+def _req(text: str = "hi") -> ChatRequest:
+    return ChatRequest(model="m", messages=[Message.user(text)])
+
+
+def test_identical_concurrent_requests_share_one_call():
+    provider = _SlowProvider()
+    seen = []
+    client = Client(provider, coalesce=SingleFlight(), hooks={"after_call": seen.append})
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda text: client.chat(_req(text)), ["hi"] * 6 + ["other"] * 2))
+
+    assert provider.calls == 2
+    assert [r.text for r in results] == ["answer:hi"] * 6 + ["answer:other"] * 2
+    assert sorted(r.trace["coalesced"] for r in results) == [0, 0] + [1] * 6
+    assert len({id(r) for r in results}) == 8 and len({id(r.trace) for r in results}) == 8
+    assert len(seen) == 8  # every caller's hooks fired
+
+
+def test_followers_get_the_leaders_error():
+    provider = _SlowProvider(fail=True)
+    client = Client(provider, coalesce=SingleFlight(), retries=0)
+
+    def call(_):
+        with pytest.raises(ProviderAuthError):
+            client.chat(_req())
+
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(call, range(4)))
+    assert provider.calls == 1
+
+
+def test_coalesce_true_uses_the_process_wide_group():
+    a, b = Client(_SlowProvider(), coalesce=True), Client(_SlowProvider(), coalesce=True)
+    assert a.single_flight is b.single_flight is not None
+    assert Client(_SlowProvider()).single_flight is None
+
+
+def test_followers_do_not_inherit_a_cancelled_leader():
+    group = SingleFlight()
+    started = threading.Event()
+    runs = []
+
+    def cancelled():
+        runs.append("leader")
+        started.set()
+        time.sleep(0.05)
+        raise CallCancelled("leader cancelled")
+
+    def follower():
+        started.wait(1)
+        return group.do("k", lambda: runs.append("follower") or "mine")
+
+    with ThreadPoolExecutor(2) as pool:
+        lead = pool.submit(group.do, "k", cancelled)
+        follow = pool.submit(follower)
+        with pytest.raises(CallCancelled):
+            lead.result()
+        assert follow.result() == ("mine", False)
+    assert runs == ["leader", "follower"]
+    assert group.stats()["in_flight"] == 0
+
+
+def test_async_requests_are_coalesced():
+    provider = _SlowProvider()
+    client = Client(provider, coalesce=SingleFlight())
+
+    async def go():
+        return await asyncio.gather(*(client.achat(_req()) for _ in range(5)))
+
+    results = asyncio.run(go())
+    assert provider.calls == 1 and {r.text for r in results} == {"answer:hi"}
+    assert sorted(r.trace["coalesced"] for r in results) == [0, 1, 1, 1, 1]
+
+
+def test_async_followers_survive_a_cancelled_leader():
+    group = SingleFlight()
+
+    async def go():
+        async def slow(value):
+            await asyncio.sleep(0.1)
+            return value
+
+        leader = asyncio.ensure_future(group.ado("k", lambda: slow("leader")))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(group.ado("k", lambda: slow("follower")))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(go()) == ("follower", False)
+
+
+def test_followers_stop_waiting_at_their_deadline_or_cancel_scope():
+    group = SingleFlight()
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        time.sleep(0.3)
+        return "leader"
+
+    def follow(**kw):
+        started.wait(1)
+        began = time.monotonic()
+        with pytest.raises(kw.pop("raises")):
+            group.do("k", lambda: "mine", **kw)
+        return time.monotonic() - began
+
+    scope = CancelScope()
+
+    def in_scope():
+        with cancel_scope(scope):
+            return follow(raises=CallCancelled)
+
+    with ThreadPoolExecutor(3) as pool:
+        lead = pool.submit(group.do, "k", slow)
+        timed = pool.submit(follow, raises=DeadlineExceeded, deadline=time.monotonic() + 0.05)
+        cut = pool.submit(in_scope)
+        started.wait(1)
+        time.sleep(0.05)
+        scope.cancel()
+        assert timed.result() < 0.2 and cut.result() < 0.2
+        assert lead.result() == ("leader", False)  # the leader ran on
+
+
+def test_async_followers_stop_waiting_at_their_deadline():
+    provider = _SlowProvider()
+    client = Client(provider, coalesce=SingleFlight())
+
+    async def go():
+        leader = asyncio.ensure_future(client.achat(_req()))
+        await asyncio.sleep(0.01)
+        with pytest.raises(DeadlineExceeded):
+            await client.achat(_req(), total_timeout=0.03)
+        return await leader
+
+    assert asyncio.run(go()).text == "answer:hi" and provider.calls == 1
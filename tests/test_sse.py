@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+
+from slimx.utils.sse import SSEEvent, SSEParser, iter_sse_data, iter_sse_events
+from slimx.utils.sse_async import aiter_sse_events
+
+
+def _events(*chunks):
+    return list(iter_sse_events(iter(chunks)))
+
+
+def test_parses_fields_and_joins_multiline_data():
+    events = _events(
+        b": keep-alive comment\n"
+        b"event: delta\nid: 7\nretry: 1500\ndata: line one\ndata:line two\n\n"
+        b"data: {\"x\": 1}\n\n"
+    )
+    assert events == [
+        SSEEvent(data="line one\nline two", event="delta", id="7", retry=1500),
+        # The last event id (and retry) carry over; the event type resets.
+        SSEEvent(data='{"x": 1}', event="message", id="7", retry=1500),
+    ]
+
+
+def test_handles_every_line_ending_split_across_chunks():
+    stream = b"data: a\r\n\r\ndata: b\r\rdata: c\n\n"
+    whole = _events(stream)
+    bytewise = _events(*(stream[i : i + 1] for i in range(len(stream))))
+    assert [e.data for e in whole] == [e.data for e in bytewise] == ["a", "b", "c"]
+
+
+def test_ignores_bom_invalid_fields_and_empty_events():
+    events = _events(
+        b"\xef\xbb\xbfdata: first\n\n",
+        b"event: ping\n\n",             # no data: not dispatched
+        b"retry: soon\nid: a\x00b\nfoo: bar\ndata\n\n",
+    )
+    assert events == [SSEEvent(data="first"), SSEEvent(data="")]
+
+
+def test_multibyte_characters_split_across_chunks():
+    payload = "data: héllo ✓\n\n".encode()
+    assert list(iter_sse_data(payload[i : i + 1] for i in range(len(payload)))) == ["héllo ✓"]
+
+
+def test_pending_event_is_delivered_at_end_of_stream():
+    assert list(iter_sse_data([b"data: [DONE]"])) == ["[DONE]"]
+
+
+def test_parser_is_incremental():
+    parser = SSEParser()
+    assert parser.feed(b"data: par") == []
+    assert parser.feed(b"tial\n") == []
+    assert parser.feed(b"\n") == [SSEEvent(data="partial")]
+    assert parser.close() == []
+
+
+def test_async_events_match_sync():
+    chunks = [b"event: a\ndata: 1\n", b"\ndata: 2\r\n", b"\r\n"]
+
+    async def agen():
+        for c in chunks:
+            yield c
+
+    async def collect():
+        return [e async for e in aiter_sse_events(agen())]
+
+    assert asyncio.run(collect()) == _events(*chunks)
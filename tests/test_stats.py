@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from slimx import Message, aparallel, fallback, llm, parallel, stats
+from slimx.errors import CircuitOpenError, DeadlineExceeded, ProviderServerError
+from slimx.low import ChatRequest, CircuitBreaker, Client
+from slimx.providers import register
+from slimx.providers.base import Provider, ProviderCapabilities
+from slimx.types import Result, StreamEvent, Usage
+
+from fakes import FakeProvider
+
+CALLED: list = []
+
+
+def _answer(model: str) -> Result:
+    CALLED.append(model)
+    if model == "down":
+        raise ProviderServerError("down")
+    if model == "slow":
+        time.sleep(0.3)
+    return Result(text=f"answer:{model}", usage=Usage())
+
+
+class _STestProvider(Provider):
+    """``down`` fails, ``slow`` takes 0.3s, anything else answers at once."""
+
+    name = "stest"
+    capabilities = ProviderCapabilities(streaming=True)
+
+    def chat(self, req, *, tools=(), timeout=None):
+        return _answer(req.model)
+
+    async def achat(self, req, *, tools=(), timeout=None):
+        if req.model == "slow":
+            CALLED.append(req.model)
+            await asyncio.sleep(0.3)
+            return Result(text="answer:slow", usage=Usage())
+        return _answer(req.model)
+
+    def stream(self, req, *, tools=(), timeout=None):
+        time.sleep(0.02)
+        yield StreamEvent.text_delta("a")
+        time.sleep(0.02)
+        yield StreamEvent.done()
+
+
+@pytest.fixture(autouse=True)
+def _register_stest():
+    register("stest", lambda **kw: _STestProvider())
+    CALLED.clear()
+
+
+def _seed(model: str, *, latency_ms: float = 0.0, errors: int = 0) -> None:
+    key = stats.key_of(llm(model))
+    if errors:
+        for _ in range(errors):
+            stats.record(*key, error=ProviderServerError("down"))
+    else:
+        stats.record(*key, latency_ms=latency_ms)
+
+
+def test_client_records_latency_and_errors():
+    client = Client(FakeProvider(fail_times=1), retries=1)
+    client.chat(ChatRequest(model="m", messages=[Message.user("hi")]))
+    (s,) = [s for s in stats.snapshot() if s["provider"] == "fake"]
+    assert (s["provider"], s["model"], s["calls"], s["errors"]) == ("fake", "m", 2, 1)
+    assert s["error_rate"] == pytest.approx(0.16)  # 0.2 after the failure, then decays
+    assert s["latency_ms"] is not None and s["last_error"] == "ProviderTimeoutError: transient"
+    assert s["healthy"] and s["score"] == pytest.approx(s["latency_ms"] / 0.84)
+
+
+def test_calls_refused_before_sending_are_not_model_errors():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.admit("fake")
+    breaker.record("fake", exc=ProviderServerError("503"))
+    req = ChatRequest(model="m", messages=[Message.user("hi")])
+    with pytest.raises(CircuitOpenError):
+        Client(FakeProvider(), circuit_breaker=breaker, retries=0).chat(req)
+    with pytest.raises(DeadlineExceeded):
+        Client(FakeProvider(), retries=0).chat(req, deadline=time.monotonic() - 1)
+    assert [s for s in stats.snapshot() if s["provider"] == "fake"] == []
+
+def test_stream_records_time_to_first_event():
+    list(llm("stest:x").stream("hi"))
+    s = stats.get(*stats.key_of(llm("stest:x")))
+    assert s is not None and s.calls == 1
+    assert s.ttfb_ms is not None and s.latency_ms is not None
+    assert 15 < s.ttfb_ms < s.latency_ms
+
+
+def test_ewma_follows_recent_samples():
+    stats.record("p", "", "m", latency_ms=100.0)
+    stats.record("p", "", "m", latency_ms=200.0)
+    s = stats.get("p", "", "m")
+    assert s is not None and s.latency_ms == pytest.approx(120.0)
+    for _ in range(4):
+        stats.record("p", "", "m", error=RuntimeError("boom"))
+    s = stats.get("p", "", "m")
+    assert s is not None and not s.healthy
+    assert stats.get("p", "", "nope") is None
+
+
+def test_ranking():
+    keys = [("p", "", "slow"), ("p", "", "new"), ("p", "", "fast"), ("p", "", "flaky")]
+    stats.record("p", "", "slow", latency_ms=900.0)
+    stats.record("p", "", "fast", latency_ms=100.0)
+    stats.record("p", "", "flaky", latency_ms=50.0)
+    for _ in range(4):
+        stats.record("p", "", "flaky", error=RuntimeError("boom"))
+    assert stats.rank_fastest(keys) == [1, 2, 3, 0]  # unmeasured first; flaky's errors cost it
+    assert stats.rank_healthy(keys) == [0, 1, 2, 3]  # only flaky is unhealthy, and already last
+    stats.record("p", "", "slow", error=RuntimeError("boom"))
+    assert stats.rank_healthy(list(reversed(keys))) == [1, 2, 3, 0]
+
+
+def test_race_top_k_starts_only_the_fastest():
+    _seed("stest:slow", latency_ms=500.0)
+    _seed("stest:fast", latency_ms=10.0)
+    res = parallel(["stest:slow", "stest:fast"], mode="race", top_k=1)("hi")
+    assert res.text == "answer:fast" and CALLED == ["fast"]
+    assert res.trace["race_order"] == ["stest:fast", "stest:slow"]
+    assert res.trace["race_started"] == 1
+
+
+def test_race_starts_a_reserve_when_a_leader_fails():
+    _seed("stest:down", latency_ms=5.0)
+    _seed("stest:fast", latency_ms=10.0)
+    res = parallel(["stest:fast", "stest:down"], mode="race", top_k=1, retries=0)("hi")
+    assert res.text == "answer:fast" and CALLED == ["down", "fast"]
+    assert res.trace["race_started"] == 2 and len(res.errors) == 1
+
+
+def test_race_stagger_starts_the_next_model_when_the_leader_is_slow():
+    _seed("stest:slow", latency_ms=10.0)  # was fast; is slow now
+    _seed("stest:fast", latency_ms=100.0)
+    started = time.perf_counter()
+    res = parallel(["stest:fast", "stest:slow"], mode="race", stagger_ms=50)("hi")
+    assert res.text == "answer:fast" and CALLED[0] == "slow"
+    assert time.perf_counter() - started < 0.25
+    assert res.trace["race_order"] == ["stest:slow", "stest:fast"] and res.trace["race_started"] == 2
+
+
+def test_async_race_stagger():
+    _seed("stest:slow", latency_ms=10.0)
+    _seed("stest:fast", latency_ms=100.0)
+    _seed("stest:other", latency_ms=900.0)
+
+    async def go():
+        return await aparallel(["stest:fast", "stest:slow", "stest:other"], mode="race", stagger_ms=50)("hi")
+
+    res = asyncio.run(go())
+    assert res.text == "answer:fast" and CALLED == ["slow", "fast"]
+    assert res.trace["race_started"] == 2 and res.trace["abandoned_count"] == 1
+
+
+def test_race_start_options_are_checked():
+    with pytest.raises(ValueError, match="only apply to mode='race'"):
+        parallel(["stest:a"], top_k=1)
+    with pytest.raises(ValueError, match="top_k"):
+        parallel(["stest:a"], mode="race", top_k=0)
+
+
+def test_adaptive_fallback_tries_unhealthy_models_last():
+    _seed("stest:down", errors=4)
+    chain = fallback(["stest:down", "stest:fast"], adaptive=True, retries=0)
+    res = chain("hi")
+    assert res.text == "answer:fast" and CALLED == ["fast"]
+    assert res.trace["fallback_order"] == ["stest:fast", "stest:down"]
+
+    CALLED.clear()
+    assert fallback(["stest:down", "stest:fast"], retries=0)("hi").text == "answer:fast"
+    assert CALLED == ["down", "fast"]  # the static chain keeps its order
@@ -1,5 +1,17 @@
-from slimx import tool
-from slimx.tooling import execute_tool
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from slimx import Message, tool
+from slimx.errors import ToolExecutionError, ToolTimeoutError
+from slimx.low import ChatRequest, Client
+from slimx.providers.base import Provider, ProviderCapabilities
+from slimx.tooling import aexecute_tool, execute_tool
+from slimx.types import Result, StreamEvent, ToolCall
+from slimx.utils import executor
 
 @tool
 def add(a: int, b: int) -> int:
@@ -7,3 +19,111 @@ def add(a: int, b: int) -> int:
 
 def test_tool_exec():
     assert execute_tool(add, {"a": 2, "b": 3}) == 5
+
+
+@tool
+async def fetch(url: str) -> str:
+    """Fetch a URL."""
+    await asyncio.sleep(0.1)
+    return f"page:{url}"
+
+
+@tool(timeout=0.05)
+def stuck(seconds: float) -> str:
+    time.sleep(seconds)
+    return "late"
+
+
+@tool(timeout=0.05)
+async def astuck(seconds: float) -> str:
+    await asyncio.sleep(seconds)
+    return "late"
+
+
+def test_async_tool_schema_and_sync_execution():
+    assert fetch.is_async and fetch.name == "fetch"
+    assert fetch.parameters["required"] == ["url"]
+    assert execute_tool(fetch, {"url": "a"}) == "page:a"  # run on its own loop
+
+
+def test_tool_timeouts():
+    with pytest.raises(ToolTimeoutError, match="'stuck' timed out after 0.05s"):
+        execute_tool(stuck, {"seconds": 0.5})
+    assert execute_tool(stuck, {"seconds": 0.0}) == "late"
+    with pytest.raises(ToolTimeoutError):
+        execute_tool(astuck, {"seconds": 0.5})
+    with pytest.raises(ToolTimeoutError):
+        asyncio.run(aexecute_tool(astuck, {"seconds": 0.5}))
+    assert issubclass(ToolTimeoutError, ToolExecutionError)
+
+
+def test_tool_timeout_counts_from_the_start_of_the_run(monkeypatch):
+    pool = ThreadPoolExecutor(1)
+    monkeypatch.setitem(executor._HELPERS, "tool", pool)
+    busy = pool.submit(time.sleep, 0.1)  # the only helper thread is taken
+    assert execute_tool(stuck, {"seconds": 0.0}) == "late"  # queued 0.1s, ran at once
+    assert busy.done()
+    pool.shutdown()
+
+def test_tool_options_are_checked():
+    with pytest.raises(ValueError, match="thread=True"):
+        tool(timeout=1.0, thread=False)(add.fn)
+    with pytest.raises(ValueError, match="> 0"):
+        tool(timeout=0)(add.fn)
+
+
+def test_async_tools_are_awaited_on_the_loop():
+    class _Calls(Provider):
+        name = "calls"
+        capabilities = ProviderCapabilities(tools=True)
+
+        def __init__(self):
+            self.calls = []
+
+        def chat(self, req, *, tools=(), timeout=None):
+            raise AssertionError("sync path not used")
+
+        async def achat(self, req, *, tools=(), timeout=None):
+            self.calls.append(req)
+            if len(self.calls) > 1:
+                return Result(text="done")
+            return Result(text="", tool_calls=[
+                ToolCall(id="f1", name="fetch", arguments={"url": "a"}),
+                ToolCall(id="f2", name="fetch", arguments={"url": "b"}),
+                ToolCall(id="s1", name="stuck", arguments={"seconds": 0.5}),
+            ])
+
+        def stream(self, req, *, tools=(), timeout=None):
+            yield StreamEvent.done()
+
+    provider = _Calls()
+    req = ChatRequest(model="m", messages=[Message.user("go")])
+
+    async def timed_out():
+        started = time.perf_counter()
+        with pytest.raises(ToolTimeoutError, match="stuck"):
+            await Client(provider).achat(req, tools=[fetch, stuck], tool_runtime="auto")
+        return time.perf_counter() - started
+
+    assert asyncio.run(timed_out()) < 0.3  # both fetches ran alongside the timeout
+
+    provider.calls.clear()
+    res = asyncio.run(Client(provider).achat(req, tools=[fetch], tool_runtime="auto"))
+    assert res.text == "done"
+    assert [m.content for m in provider.calls[1].messages[-2:]] == ['"page:a"', '"page:b"']
+    assert [(r["id"], r["ok"]) for r in res.trace["tool_runs"]] == [("f1", True), ("f2", True)]
+    assert all(r["elapsed_ms"] >= 90 for r in res.trace["tool_runs"])
+
+
+def test_async_path_runs_sync_tools_on_a_worker_thread_unless_told_not_to():
+    def where() -> str:
+        return threading.current_thread().name
+
+    async def go():
+        loop_thread = threading.current_thread().name
+        threaded = await aexecute_tool(tool(where), {})
+        inline = await aexecute_tool(tool(thread=False)(where), {})
+        return loop_thread, threaded, inline
+
+    loop_thread, threaded, inline = asyncio.run(go())
+    assert threaded != loop_thread and inline == loop_thread
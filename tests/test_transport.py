@@ -0,0 +1,82 @@
+"""Factory-built providers share pooled transports through `slimx.transport`."""
+
+from __future__ import annotations
+
+import httpx
+
+import slimx
+from slimx.high.api import Model
+from slimx.providers.registry import get_provider
+
+_KW = {"api_key": "sk-secret", "base_url": "http://api.test/v1"}
+
+
+def _mock_clients(monkeypatch, built: list):
+    real = httpx.Client
+
+    def factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+        )
+        client = real(*args, **kwargs)
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "Client", factory)
+
+
+def test_models_on_the_same_endpoint_share_one_pool(monkeypatch):
+    built: list = []
+    _mock_clients(monkeypatch, built)
+
+    a = Model("openai:gpt-a", provider_kwargs=_KW)
+    b = Model("openai:gpt-b", provider_kwargs={**_KW, "base_url": "http://api.test/v1/"})
+    assert a("hi").text == b("hi").text == "ok"
+
+    assert a._client.provider._pool is b._client.provider._pool
+    assert len(built) == 1
+    stats = slimx.transport.stats()
+    assert stats["pools"] == 1 and stats["requests"] == 2
+    entry = stats["entries"][0]
+    assert entry["provider"] == "openai" and entry["base_url"] == "http://api.test/v1"
+    assert "sk-secret" not in repr(stats)
+
+
+def test_pools_are_keyed_by_endpoint_credentials_and_options():
+    base = get_provider("openai", **_KW)._pool
+    assert get_provider("openai", **{**_KW, "api_key": "other"})._pool is not base
+    assert get_provider("openai", **{**_KW, "base_url": "http://other.test/v1"})._pool is not base
+    assert get_provider("oai", **_KW)._pool is not base
+    assert get_provider("openai", **_KW, limits=httpx.Limits(max_connections=2))._pool is not base
+    assert get_provider("openai", **_KW, shared_pool=False)._pool is not base
+    assert slimx.transport.stats()["pools"] == 5
+
+
+def test_reset_closes_and_forgets_every_pool(monkeypatch):
+    built: list = []
+    _mock_clients(monkeypatch, built)
+    provider = get_provider("openai", **_KW)
+    provider.chat(slimx.ChatRequest(model="m", messages=[slimx.Message.user("hi")]))
+
+    slimx.transport.reset()
+
+    assert built[0].is_closed
+    assert slimx.transport.stats() == {"pools": 0, "requests": 0, "opened": 0, "reused": 0, "entries": []}
+    assert get_provider("openai", **_KW)._pool is not provider._pool
+
+
+def test_closing_one_model_leaves_the_shared_pool_open_for_the_others(monkeypatch):
+    built: list = []
+    _mock_clients(monkeypatch, built)
+    a = Model("openai:gpt-a", provider_kwargs=_KW)
+    b = Model("openai:gpt-b", provider_kwargs=_KW)
+    a("hi")
+    b("hi")
+
+    b.close()
+    assert not built[0].is_closed  # still in use by `a`
+    assert a("again").text == "ok" and len(built) == 1
+
+    a.close()
+    assert built[0].is_closed  # the last holder closes it
+    assert b("reopened").text == "ok" and len(built) == 2